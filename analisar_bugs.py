@@ -4,13 +4,14 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 import numpy as np
+from leitura_excel import ler_excel, DTYPES_BUGS
 
 def carregar_planilha_bugs(caminho_arquivo):
     """
     Carrega e analisa a planilha de bugs
     """
     try:
-        df_bugs = pd.read_excel(caminho_arquivo)
+        df_bugs = ler_excel(caminho_arquivo, dtypes=DTYPES_BUGS)
         return df_bugs
     except Exception as e:
         st.error(f"Erro ao carregar planilha de bugs: {e}")
@@ -0,0 +1,691 @@
+import io
+import os
+import json
+import sys
+import time
+import logging
+import tempfile
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+# Silenciar avisos do Streamlit ao importar o dashboard fora do `streamlit run`
+logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+import dashboard
+
+
+def gerar_dados_qa(n_linhas, seed=42):
+    """
+    Gera uma planilha sintética de QA com a mesma estrutura da planilha real
+    """
+    rng = np.random.default_rng(seed)
+
+    times = ['Pagamentos', 'Cartões', 'Onboarding', 'Crédito', 'Core Bancário', 'Investimentos']
+    devs = [f'Dev {i}' for i in range(40)]
+    motivos = ['Erro de layout', 'Regra de negócio', 'Erro de API', 'Validação de campo',
+               'Performance', 'Texto incorreto', ' Erro de layout ', 'aprovada', 'Sem recusa', '']
+    status = np.array(['APROVADA', 'REJEITADA', 'PRONTO PARA PUBLICAÇÃO'])
+
+    n_tarefas = max(1, n_linhas // 3)
+    status_linhas = status[rng.choice(3, n_linhas, p=[0.5, 0.3, 0.2])]
+
+    df = pd.DataFrame({
+        'Data': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 600, n_linhas), unit='D'),
+        'Sprint': rng.integers(1, 60, n_linhas).astype(str),
+        'Time': np.array(times)[rng.integers(0, len(times), n_linhas)],
+        'Nome da Task': [f'Task {i}' for i in rng.integers(0, n_tarefas, n_linhas)],
+        'Link da Task': 'https://exemplo.local/task',
+        'Status': status_linhas,
+        'Responsável': np.array(devs)[rng.integers(0, len(devs), n_linhas)],
+        'Ambiente': np.array(['Homologação', 'Produção', 'Dev', None], dtype=object)[rng.integers(0, 4, n_linhas)],
+        'Responsavel pelo teste': np.array(['Eduardo', 'Wilson'])[rng.integers(0, 2, n_linhas)],
+        'Descrição': 'Descrição da tarefa',
+    })
+    df['ID'] = df['Nome da Task'].str.replace('Task ', 'ID-', regex=False)
+
+    rejeitada = status_linhas == 'REJEITADA'
+    for i, col in enumerate(dashboard.MOTIVOS_COLS):
+        preenchido = rejeitada & (rng.random(n_linhas) < 0.8 / (i + 1))
+        valores = np.array(motivos, dtype=object)[rng.integers(0, len(motivos), n_linhas)]
+        df[col] = np.where(preenchido, valores, None)
+
+    # Coluna Erros só existe nos dados mais recentes (metade vazia)
+    erros = rng.integers(0, 5, n_linhas).astype(float)
+    erros[rng.random(n_linhas) < 0.5] = np.nan
+    df['Erros'] = erros
+
+    return df
+
+
+# ===== IMPLEMENTAÇÕES ANTIGAS (iterrows), mantidas apenas para comparação =====
+
+def _motivos_validos_legado(row):
+    total = 0
+    for col in dashboard.MOTIVOS_COLS:
+        if col in row and pd.notna(row[col]) and str(row[col]).strip() != '':
+            motivo = str(row[col]).strip().lower()
+            if motivo not in ['aprovada', 'sem recusa']:
+                total += 1
+    return total
+
+
+def _historico_legado(df_filtrado):
+    df_sem_erros_coluna = df_filtrado[
+        (~df_filtrado['Erros'].notna()) |
+        (pd.to_numeric(df_filtrado['Erros'], errors='coerce').fillna(0) == 0)
+    ] if 'Erros' in df_filtrado.columns else df_filtrado
+    return df_sem_erros_coluna[df_sem_erros_coluna['Status'] == 'REJEITADA']
+
+
+def contar_bugs_por_time_legado(df_rejeitadas):
+    bugs_por_time = {}
+    for _, row in df_rejeitadas.iterrows():
+        time_dev = row.get('Time', 'Desconhecido')
+        bugs_por_time[time_dev] = bugs_por_time.get(time_dev, 0) + _motivos_validos_legado(row)
+    return pd.Series(bugs_por_time).sort_values(ascending=False)
+
+
+def contar_total_bugs_legado(df_rejeitadas):
+    return sum(_motivos_validos_legado(row) for _, row in df_rejeitadas.iterrows())
+
+
+def _erros_por_legado(df_filtrado, coluna):
+    erros_por = {}
+    if 'Erros' in df_filtrado.columns:
+        df_temp = df_filtrado.copy()
+        df_temp['Erros'] = pd.to_numeric(df_temp['Erros'], errors='coerce').fillna(0)
+        for _, row in df_temp[df_temp['Erros'] > 0].iterrows():
+            chave = row.get(coluna, 'Desconhecido')
+            erros_por[chave] = erros_por.get(chave, 0) + row['Erros']
+    for _, row in _historico_legado(df_filtrado).iterrows():
+        chave = row.get(coluna, 'Desconhecido')
+        erros_por[chave] = erros_por.get(chave, 0) + _motivos_validos_legado(row)
+    return pd.Series(erros_por).sort_values(ascending=False) if erros_por else pd.Series(dtype=int)
+
+
+def contar_erros_por_time_legado(df_filtrado):
+    return _erros_por_legado(df_filtrado, 'Time')
+
+
+def contar_erros_por_testador_legado(df_filtrado):
+    return _erros_por_legado(df_filtrado, 'Responsavel pelo teste')
+
+
+def contar_total_erros_legado(df_filtrado):
+    total_erros = pd.to_numeric(df_filtrado['Erros'], errors='coerce').fillna(0).sum()
+    for _, row in _historico_legado(df_filtrado).iterrows():
+        total_erros += _motivos_validos_legado(row)
+    return int(total_erros)
+
+
+def analisar_distribuicao_erros_legado(df_filtrado):
+    erros = pd.to_numeric(df_filtrado['Erros'], errors='coerce').fillna(0)
+    total_erros = erros[erros > 0].sum()
+    testes_com_erro = int((erros > 0).sum())
+    for _, row in _historico_legado(df_filtrado).iterrows():
+        n = _motivos_validos_legado(row)
+        if n > 0:
+            total_erros += n
+            testes_com_erro += 1
+    return {'testes_com_erro': testes_com_erro, 'total_erros': total_erros}
+
+
+def analisar_historico_retestes_legado(df):
+    identificador = 'ID' if 'ID' in df.columns and df['ID'].notna().any() else 'Nome da Task'
+    df_sorted = df.sort_values([identificador, 'Data']).copy()
+    historico_tarefas = []
+    tarefas_retestadas = set()
+    tarefas_aprovadas_apos_reteste = set()
+    for task_id, group in df_sorted.groupby(identificador):
+        if len(group) > 1:
+            group_sorted = group.sort_values('Data')
+            status_sequence = group_sorted['Status'].tolist()
+            if 'REJEITADA' in status_sequence:
+                tarefas_retestadas.add(task_id)
+                for i, status in enumerate(status_sequence):
+                    if status == 'REJEITADA' and i < len(status_sequence) - 1:
+                        if any(s in ['APROVADA', 'PRONTO PARA PUBLICAÇÃO'] for s in status_sequence[i+1:]):
+                            tarefas_aprovadas_apos_reteste.add(task_id)
+                            break
+                historico_tarefas.append({
+                    'Identificador': task_id,
+                    'Nome_Tarefa': group_sorted['Nome da Task'].iloc[0],
+                    'Total_Testes': len(group_sorted),
+                    'Sequencia_Status': ' → '.join(status_sequence),
+                    'Aprovada_Apos_Reteste': task_id in tarefas_aprovadas_apos_reteste,
+                    'Primeira_Data': group_sorted['Data'].iloc[0],
+                    'Ultima_Data': group_sorted['Data'].iloc[-1],
+                    'Time': group_sorted['Time'].iloc[0],
+                    'Responsavel': group_sorted['Responsável'].iloc[0]
+                })
+    total_retestadas = len(tarefas_retestadas)
+    total_aprovadas = len(tarefas_aprovadas_apos_reteste)
+    return {
+        'total_tarefas_retestadas': total_retestadas,
+        'tarefas_aprovadas_apos_reteste': total_aprovadas,
+        'taxa_aprovacao_apos_reteste': (total_aprovadas / total_retestadas * 100) if total_retestadas > 0 else 0,
+        'detalhes_retestes': pd.DataFrame(historico_tarefas)
+    }
+
+
+def _cronometrar(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def _comparar(nome, legado, novo):
+    if isinstance(novo, pd.Series):
+        iguais = legado.to_dict() == novo.to_dict() and list(legado.index) == list(novo.index)
+    elif isinstance(novo, dict):
+        iguais = all(legado[chave] == novo[chave] for chave in legado)
+    else:
+        iguais = legado == novo
+    if not iguais:
+        raise AssertionError(f"Resultado divergente em {nome}: {legado!r} != {novo!r}")
+
+
+def benchmark_motivos(tamanhos=(10_000, 100_000, 1_000_000)):
+    """
+    Compara os contadores de bugs/erros antigos (iterrows) com o motor vetorizado de motivos
+    """
+    print("=== BENCHMARK: CONTADORES DE MOTIVOS ===")
+    for n_linhas in tamanhos:
+        df = gerar_dados_qa(n_linhas)
+        df_rejeitadas = df[df['Status'] == 'REJEITADA']
+        casos = [
+            ('contar_bugs_por_time', contar_bugs_por_time_legado, dashboard.contar_bugs_por_time, df_rejeitadas),
+            ('contar_total_bugs', contar_total_bugs_legado, dashboard.contar_total_bugs, df_rejeitadas),
+            ('contar_erros_por_time', contar_erros_por_time_legado, dashboard.contar_erros_por_time, df),
+            ('contar_total_erros', contar_total_erros_legado, dashboard.contar_total_erros, df),
+            ('contar_erros_por_testador', contar_erros_por_testador_legado, dashboard.contar_erros_por_testador, df),
+            ('analisar_distribuicao_erros', analisar_distribuicao_erros_legado, dashboard.calcular_distribuicao_erros, df),
+        ]
+        print(f"\n{n_linhas:,} linhas ({len(df_rejeitadas):,} rejeitadas)")
+        for nome, funcao_legado, funcao_nova, dados in casos:
+            resultado_legado, tempo_legado = _cronometrar(funcao_legado, dados)
+            resultado_novo, tempo_novo = _cronometrar(funcao_nova, dados)
+            _comparar(nome, resultado_legado, resultado_novo)
+            print(f"  {nome:<30} legado {tempo_legado:8.3f}s | vetorizado {tempo_novo:7.3f}s | {tempo_legado / tempo_novo:7.1f}x")
+
+
+def benchmark_schema(tamanhos=(100_000, 1_000_000)):
+    """
+    Mede memória e tempo das operações mais comuns antes/depois do schema categórico
+    """
+    print("=== BENCHMARK: SCHEMA CATEGÓRICO ===")
+    for n_linhas in tamanhos:
+        df = gerar_dados_qa(n_linhas)
+        memoria_antes = df.memory_usage(deep=True)
+        df_schema, tempo_schema = _cronometrar(dashboard.aplicar_schema, df.copy())
+        relatorio = dashboard.relatorio_memoria(memoria_antes, df_schema.memory_usage(deep=True))
+
+        total_antes = relatorio['Antes (KB)'].sum() / 1024
+        total_depois = relatorio['Depois (KB)'].sum() / 1024
+        print(f"\n{n_linhas:,} linhas | schema aplicado em {tempo_schema:.3f}s")
+        print(f"  memória: {total_antes:8.1f} MB -> {total_depois:7.1f} MB ({total_antes / total_depois:.1f}x menor)")
+
+        operacoes = [
+            ("Status == 'REJEITADA'", lambda d: d['Status'] == 'REJEITADA'),
+            ("value_counts(Responsável)", lambda d: dashboard.contar_ocorrencias(d['Responsável'])),
+            ("groupby(Time).size()", lambda d: d.groupby('Time', observed=True).size()),
+        ]
+        for nome, operacao in operacoes:
+            _, tempo_objeto = _cronometrar(operacao, df)
+            _, tempo_categoria = _cronometrar(operacao, df_schema)
+            print(f"  {nome:<30} object {tempo_objeto:7.3f}s | category {tempo_categoria:7.3f}s | {tempo_objeto / tempo_categoria:6.1f}x")
+
+
+
+def _filtrar_legado(df, selecoes, periodo):
+    df_filtrado = df.copy()
+    for coluna, valor in selecoes.items():
+        if valor != 'Todos':
+            df_filtrado = df_filtrado[df_filtrado[coluna] == valor]
+    return df_filtrado[(df_filtrado['Data'].dt.date >= periodo[0]) & (df_filtrado['Data'].dt.date <= periodo[1])]
+
+
+def benchmark_filtros(tamanhos=(100_000, 1_000_000)):
+    """
+    Compara os filtros avançados encadeados (df.copy + .dt.date) com o índice de máscaras
+    """
+    print("=== BENCHMARK: FILTROS AVANÇADOS ===")
+    for n_linhas in tamanhos:
+        df = dashboard.aplicar_schema(gerar_dados_qa(n_linhas))
+        indice, tempo_indice = _cronometrar(dashboard.construir_indice_filtros, df)
+        periodo = (pd.Timestamp('2024-03-01').date(), pd.Timestamp('2024-09-30').date())
+        cenarios = [
+            ('só período', {'Sprint': 'Todos', 'Status': 'Todos', 'Time': 'Todos', 'Responsável': 'Todos'}),
+            ('time + status', {'Sprint': 'Todos', 'Status': 'REJEITADA', 'Time': 'Pagamentos', 'Responsável': 'Todos'}),
+            ('todos os filtros', {'Sprint': '10', 'Status': 'APROVADA', 'Time': 'Crédito', 'Responsável': 'Dev 3'}),
+        ]
+        print(f"\n{n_linhas:,} linhas | índice construído em {tempo_indice:.3f}s")
+        for nome, selecoes in cenarios:
+            resultado_legado, tempo_legado = _cronometrar(_filtrar_legado, df, selecoes, periodo)
+            resultado_novo, tempo_novo = _cronometrar(dashboard.aplicar_filtros, df, indice, selecoes, periodo)
+            if not resultado_legado.index.equals(resultado_novo.index):
+                raise AssertionError(f"Resultado divergente no cenário {nome}")
+            print(f"  {nome:<30} encadeado {tempo_legado:7.3f}s | índice {tempo_novo:7.3f}s | {tempo_legado / tempo_novo:6.1f}x")
+
+
+
+def benchmark_retestes(tamanhos=(10_000, 100_000)):
+    """
+    Compara o histórico de retestes antigo (loop por grupo) com a versão vetorizada
+    """
+    print("=== BENCHMARK: HISTÓRICO DE RETESTES ===")
+    for n_linhas in tamanhos:
+        # Datas únicas por linha: sem empates, a ordem dentro de cada tarefa é determinística nas duas versões
+        df = gerar_dados_qa(n_linhas)
+        df['Data'] = pd.Timestamp('2024-01-01') + pd.to_timedelta(np.random.default_rng(7).permutation(n_linhas), unit='min')
+
+        resultado_legado, tempo_legado = _cronometrar(analisar_historico_retestes_legado, df)
+        resultado_novo, tempo_novo = _cronometrar(dashboard.calcular_historico_retestes, df)
+        _comparar('historico_retestes', {k: v for k, v in resultado_legado.items() if k != 'detalhes_retestes'}, resultado_novo)
+        pd.testing.assert_frame_equal(resultado_legado['detalhes_retestes'], resultado_novo['detalhes_retestes'], check_dtype=False)
+
+        tarefas = df['ID'].nunique()
+        print(f"\n{n_linhas:,} linhas ({tarefas:,} tarefas, {resultado_novo['total_tarefas_retestadas']:,} retestadas)")
+        print(f"  {'calcular_historico_retestes':<30} legado {tempo_legado:8.3f}s | vetorizado {tempo_novo:7.3f}s | {tempo_legado / tempo_novo:7.1f}x")
+
+
+
+def benchmark_sync(n_linhas=50_000, novas_linhas=200):
+    """
+    Compara a sincronização completa (get_all_records) com a incremental usando a planilha local
+    """
+    from google_sheets_integration import IncrementalSheetSync
+    from google_sheets_local import local_worksheet_from_frame
+
+    print("=== BENCHMARK: SINCRONIZAÇÃO DO GOOGLE SHEETS ===")
+    dados = gerar_dados_qa(n_linhas + novas_linhas)
+    worksheet = local_worksheet_from_frame(dados.iloc[:n_linhas])
+    spreadsheet = worksheet.spreadsheet
+
+    with tempfile.TemporaryDirectory() as pasta:
+        sync = IncrementalSheetSync(worksheet, cache_key='benchmark', cache_dir=pasta)
+        _, tempo_inicial = _cronometrar(sync.sync, spreadsheet.get_lastUpdateTime())
+
+        # Planilha cresce: só as linhas novas devem ser buscadas
+        linhas_novas = local_worksheet_from_frame(dados.iloc[n_linhas:]).values[1:]
+        worksheet.append_rows(linhas_novas)
+        worksheet.cells_read = 0
+        incremental, tempo_incremental = _cronometrar(sync.sync, spreadsheet.get_lastUpdateTime())
+        celulas_incremental = worksheet.cells_read
+        modo_incremental = sync.last_mode
+
+        worksheet.cells_read = 0
+        completo, tempo_completo = _cronometrar(lambda: pd.DataFrame(worksheet.get_all_records()))
+        celulas_completo = worksheet.cells_read
+        pd.testing.assert_frame_equal(completo, incremental)
+
+        # Reinício do processo: a cópia local é lida do disco, sem tocar na planilha
+        inicio = time.perf_counter()
+        reinicio = IncrementalSheetSync(worksheet, cache_key='benchmark', cache_dir=pasta)
+        reinicio.sync(spreadsheet.get_lastUpdateTime())
+        tempo_reinicio = time.perf_counter() - inicio
+        modo_reinicio = reinicio.last_mode
+
+        # Edição de uma linha antiga: revisão muda sem linhas novas, volta ao download completo
+        worksheet.update_cell(10, 2, 'editado')
+        editado = sync.sync(spreadsheet.get_lastUpdateTime())
+        pd.testing.assert_frame_equal(pd.DataFrame(worksheet.get_all_records()), editado)
+        modo_edicao = sync.last_mode
+
+    print(f"\n{n_linhas:,} linhas + {novas_linhas} novas")
+    print(f"  {'primeira sincronização (completa)':<42} {tempo_inicial:7.3f}s")
+    print(f"  {'get_all_records completo':<42} {tempo_completo:7.3f}s | {celulas_completo:>9,} células")
+    print(f"  {'sincronização ' + modo_incremental:<42} {tempo_incremental:7.3f}s | {celulas_incremental:>9,} células | {tempo_completo / tempo_incremental:6.1f}x")
+    print(f"  {'reinício com cópia local (' + modo_reinicio + ')':<42} {tempo_reinicio:7.3f}s")
+    print(f"  após edição de linha antiga: sincronização {modo_edicao}")
+
+
+def benchmark_colunas(n_linhas=50_000, colunas_extras=20):
+    """
+    Compara a leitura por linhas (get_all_records -> DataFrame) com a leitura por colunas
+    (batch_get das colunas do dashboard) numa planilha larga com colunas que o dashboard não usa
+    """
+    from google_sheets_integration import fetch_frame
+    from google_sheets_local import local_worksheet_from_frame
+
+    print("=== BENCHMARK: LEITURA POR LINHAS x POR COLUNAS DO GOOGLE SHEETS ===")
+    dados = gerar_dados_qa(n_linhas)
+    rng = np.random.default_rng(7)
+    for i in range(colunas_extras):
+        dados[f'Observação {i + 1}'] = rng.choice(['', 'ok', 'revisar', 'pendente de validação'], n_linhas)
+    worksheet = local_worksheet_from_frame(dados)
+    colunas = dashboard.COLUNAS_PLANILHA
+
+    worksheet.cells_read = 0
+    por_linhas, tempo_linhas = _cronometrar(lambda: pd.DataFrame(worksheet.get_all_records()))
+    celulas_linhas = worksheet.cells_read
+    worksheet.cells_read = 0
+    por_colunas, tempo_colunas = _cronometrar(fetch_frame, worksheet, colunas)
+    celulas_colunas = worksheet.cells_read
+
+    selecionadas = [c for c in por_linhas.columns if c in colunas]
+    pd.testing.assert_frame_equal(por_linhas[selecionadas], por_colunas)
+    pd.testing.assert_frame_equal(pd.DataFrame(worksheet.get_all_records()), fetch_frame(worksheet))
+
+    tracemalloc.start()
+    pd.DataFrame(worksheet.get_all_records())
+    pico_linhas = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    fetch_frame(worksheet, colunas)
+    pico_colunas = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"\n{n_linhas:,} linhas x {len(dados.columns)} colunas ({len(selecionadas)} usadas pelo dashboard)")
+    print(f"  {'get_all_records (dicionários por linha)':<42} {tempo_linhas:7.3f}s | {celulas_linhas:>10,} células | pico {pico_linhas / 1024 ** 2:7.1f} MB")
+    print(f"  {'batch_get por colunas':<42} {tempo_colunas:7.3f}s | {celulas_colunas:>10,} células | pico {pico_colunas / 1024 ** 2:7.1f} MB | {tempo_linhas / tempo_colunas:5.1f}x")
+
+
+def benchmark_snapshot(n_linhas=20_000):
+    """
+    Compara o boot a partir do Excel (openpyxl + processamento) com o boot a partir do snapshot Parquet
+    """
+    from snapshots import SnapshotStore
+
+    print("=== BENCHMARK: BOOT PELO EXCEL x PELO SNAPSHOT PARQUET ===")
+    dados = gerar_dados_qa(n_linhas)
+    with tempfile.TemporaryDirectory() as pasta:
+        planilha = f"{pasta}/dados.xlsx"
+        dados.to_excel(planilha, index=False)
+
+        def boot_excel():
+            df = pd.read_excel(planilha)
+            df['Data'] = pd.to_datetime(df['Data'], errors='coerce')
+            return dashboard.aplicar_schema(df)
+
+        processado, tempo_excel = _cronometrar(boot_excel)
+        store = SnapshotStore(f"{pasta}/snapshots")
+        _, tempo_gravacao = _cronometrar(store.salvar, processado, 'excel')
+        snapshot, tempo_snapshot = _cronometrar(store.carregar, 'excel')
+        pd.testing.assert_frame_equal(processado, snapshot)
+
+    print(f"\n{n_linhas:,} linhas")
+    print(f"  {'read_excel (openpyxl) + schema':<42} {tempo_excel:7.3f}s")
+    print(f"  {'gravação do snapshot':<42} {tempo_gravacao:7.3f}s")
+    print(f"  {'leitura do snapshot Parquet':<42} {tempo_snapshot:7.3f}s | {tempo_excel / tempo_snapshot:6.1f}x")
+
+
+PASTA_PLANILHAS = os.path.join('.cache', 'benchmarks')
+
+
+def _planilha_excel(tamanho_mb, colunas_extras=12):
+    """
+    Workbook de QA com colunas que o dashboard não usa, dimensionado para ~tamanho_mb MB.
+    Os dados saem de sementes fixas e o arquivo fica em PASTA_PLANILHAS, então o mesmo workbook
+    é reaproveitado entre execuções (gravar 50 MB com openpyxl leva minutos).
+    """
+    def gerar(n_linhas):
+        df = gerar_dados_qa(n_linhas)
+        rng = np.random.default_rng(11)
+        for i in range(colunas_extras):
+            df[f'Campo extra {i + 1}'] = rng.choice(['', 'ok', 'revisar', 'pendente de validação'], n_linhas)
+        buffer = io.BytesIO()
+        df.to_excel(buffer, index=False)
+        return buffer.getvalue()
+
+    amostra = 5_000
+    n_linhas = max(amostra, int(amostra * tamanho_mb * 1024 ** 2 / len(gerar(amostra))))
+    arquivo = os.path.join(PASTA_PLANILHAS, f'qa_{n_linhas}_linhas_{colunas_extras}_extras.xlsx')
+    if not os.path.exists(arquivo):
+        os.makedirs(PASTA_PLANILHAS, exist_ok=True)
+        with open(arquivo + '.tmp', 'wb') as saida:
+            saida.write(gerar(n_linhas))
+        os.replace(arquivo + '.tmp', arquivo)
+    with open(arquivo, 'rb') as entrada:
+        return entrada.read(), n_linhas
+
+
+def benchmark_excel(tamanhos_mb=(10, 50)):
+    """
+    Compara o pd.read_excel direto (openpyxl, todas as colunas) com a leitura compartilhada
+    (só as colunas do dashboard e dicas de tipo), com openpyxl e com calamine lado a lado
+    """
+    import leitura_excel
+
+    print("=== BENCHMARK: LEITURA DE EXCEL ===")
+    print(f"Motores disponíveis: {[motor or 'padrão' for motor in leitura_excel.MOTORES_EXCEL]}")
+    colunas = dashboard.COLUNAS_PLANILHA
+    motores = leitura_excel.MOTORES_EXCEL
+    calamine = 'calamine' in motores
+    if not calamine:
+        print("python-calamine não instalado: só o openpyxl é medido (pip install python-calamine)")
+
+    def ler_com(motor):
+        leitura_excel.MOTORES_EXCEL = [motor]
+        try:
+            return leitura_excel.ler_excel(conteudo, colunas, leitura_excel.DTYPES_QA)
+        finally:
+            leitura_excel.MOTORES_EXCEL = motores
+
+    for tamanho_mb in tamanhos_mb:
+        conteudo, n_linhas = _planilha_excel(tamanho_mb)
+
+        legado, tempo_legado = _cronometrar(lambda: pd.read_excel(io.BytesIO(conteudo), engine='openpyxl'))
+        selecionadas = [c for c in legado.columns if c in colunas]
+        tempos = [('read_excel (openpyxl, todas as colunas)', tempo_legado)]
+        leituras = []
+        motores_medidos = [None] + (['calamine'] if calamine else [])
+        for motor in motores_medidos:
+            nome = motor or 'openpyxl'
+            if motor:
+                completo, tempo = _cronometrar(lambda: pd.read_excel(io.BytesIO(conteudo), engine=motor))
+                pd.testing.assert_frame_equal(legado, completo, check_dtype=False)
+                tempos.append((f'read_excel ({nome}, todas as colunas)', tempo))
+            podado, tempo = _cronometrar(ler_com, motor)
+            leituras.append(podado)
+            tempos.append((f'{nome} + usecols + dtypes', tempo))
+
+        for df in leituras:
+            pd.testing.assert_frame_equal(legado[selecionadas], df, check_dtype=False)
+
+        print(f"\n{len(conteudo) / 1024 ** 2:.1f} MB ({n_linhas:,} linhas x {len(legado.columns)} colunas, {len(selecionadas)} usadas)")
+        for nome, tempo in tempos:
+            print(f"  {nome:<44} {tempo:7.3f}s | {tempo_legado / tempo:5.1f}x")
+        if calamine:
+            tempo_openpyxl, tempo_calamine = tempos[1][1], tempos[-1][1]
+            print(f"  calamine vs openpyxl (mesma leitura podada): {tempo_openpyxl / tempo_calamine:.1f}x")
+
+
+def _pico_memoria(funcao, *args):
+    tracemalloc.start()
+    try:
+        resultado, tempo = _cronometrar(funcao, *args)
+        return resultado, tempo, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_streaming(tamanhos=(200_000, 1_000_000), tamanho_bloco=50_000):
+    """
+    Compara o resumo executivo com o CSV inteiro em memória (read_csv + schema + métricas) com a
+    leitura em blocos do modo streaming (ResumoIncremental)
+    """
+    from leitura_blocos import ler_csv_em_blocos
+
+    print("=== BENCHMARK: RESUMO EXECUTIVO COMPLETO x EM BLOCOS ===")
+    for n_linhas in tamanhos:
+        conteudo = gerar_dados_qa(n_linhas).to_csv(index=False, sep=';').encode('utf-8')
+
+        def completo():
+            df = pd.read_csv(io.BytesIO(conteudo), sep=';')
+            df['Data'] = pd.to_datetime(df['Data'], errors='coerce')
+            com_teste, sem_teste = dashboard.separar_dados_sem_teste(dashboard.aplicar_schema(df))
+            return dashboard.calcular_metricas_resumo(com_teste, sem_teste)
+
+        def em_blocos():
+            resumo = dashboard.ResumoIncremental()
+            for bloco in ler_csv_em_blocos(io.BytesIO(conteudo), dashboard.COLUNAS_PLANILHA, tamanho_bloco):
+                resumo.atualizar(bloco)
+            return resumo.metricas()
+
+        legado, tempo_legado, pico_legado = _pico_memoria(completo)
+        novo, tempo_novo, pico_novo = _pico_memoria(em_blocos)
+        for chave, valor in novo.items():
+            if isinstance(valor, pd.Series):
+                _comparar(chave, legado[chave].astype('int64').rename(None), valor.rename(None))
+            elif isinstance(valor, dict):
+                _comparar(chave, {k: int(legado[chave][k]) for k in valor}, valor)
+            else:
+                _comparar(chave, legado[chave], valor)
+
+        print(f"\n{n_linhas:,} linhas ({len(conteudo) / 1024 ** 2:.1f} MB de CSV, blocos de {tamanho_bloco:,})")
+        print(f"  {'completo':<10} {tempo_legado:7.3f}s | pico {pico_legado / 1024 ** 2:8.1f} MB")
+        print(f"  {'em blocos':<10} {tempo_novo:7.3f}s | pico {pico_novo / 1024 ** 2:8.1f} MB | {pico_legado / pico_novo:5.1f}x menos memória")
+
+
+def benchmark_figuras(n_linhas=100_000):
+    """
+    Compara montar todos os gráficos grafico_* do zero com servi-los do cache de figuras
+    (mesmo recorte, como num rerun em que os filtros não mudaram)
+    """
+    from cache_figuras import CacheFiguras
+
+    print("=== BENCHMARK: GRÁFICOS MONTADOS x CACHE DE FIGURAS ===")
+    df = gerar_dados_qa(n_linhas)
+    df['Data'] = pd.to_datetime(df['Data'], errors='coerce')
+    df = dashboard.aplicar_schema(df)
+    df.attrs['chave_conteudo'] = 'benchmark'
+    com_teste, _ = dashboard.separar_dados_sem_teste(df)
+    funcoes = [getattr(dashboard, nome) for nome in dir(dashboard)
+               if nome.startswith('grafico_') and hasattr(getattr(dashboard, nome), '__wrapped__')
+               and not nome.startswith('grafico_bugs_') and nome != 'grafico_evolucao_bugs']
+
+    def executar(montar):
+        # Cada medição é um rerun: contexto de análise novo (fingerprints e resultados descartados)
+        dashboard.iniciar_contexto_analise()
+        return [montar(funcao) for funcao in funcoes]
+
+    cache = dashboard.obter_cache_figuras()
+    cache.limpar()
+    montadas, tempo_montagem = _cronometrar(executar, lambda funcao: funcao.__wrapped__(com_teste))
+    _, tempo_primeira = _cronometrar(executar, lambda funcao: funcao(com_teste))
+    servidas, tempo_cache = _cronometrar(executar, lambda funcao: funcao(com_teste))
+    for funcao, montada, servida in zip(funcoes, montadas, servidas):
+        if (montada is None) != (servida is None) or \
+                (montada is not None and json.loads(montada.to_json()) != json.loads(servida.to_json())):
+            raise AssertionError(f"Figura divergente em {funcao.__name__}")
+
+    estatisticas = cache.estatisticas()
+    print(f"\n{len(funcoes)} gráficos, {n_linhas:,} linhas ({estatisticas['mb']:.2f} MB de JSON em cache)")
+    print(f"  {'montagem (sem cache)':<28} {tempo_montagem:7.3f}s")
+    print(f"  {'primeira execução (falta)':<28} {tempo_primeira:7.3f}s")
+    print(f"  {'rerun (acerto)':<28} {tempo_cache:7.3f}s | {tempo_montagem / tempo_cache:5.1f}x")
+
+
+def benchmark_renderizacao(n_graficos=12, processos=(1, 2, 4)):
+    """
+    Compara fig.to_image por gráfico (um navegador novo a cada chamada no Kaleido 1.x) com o
+    renderizador persistente em lote. Precisa de Chrome/Chromium no ambiente.
+    """
+    from renderizador_graficos import RenderizadorGraficos
+
+    print("=== BENCHMARK: to_image POR GRÁFICO x RENDERIZADOR PERSISTENTE ===")
+    df = gerar_dados_qa(5_000)
+    df['Data'] = pd.to_datetime(df['Data'], errors='coerce')
+    com_teste, _ = dashboard.separar_dados_sem_teste(dashboard.aplicar_schema(df))
+    nomes = [nome for nome in dir(dashboard) if nome.startswith('grafico_') and not nome.startswith('grafico_bugs_')
+             and hasattr(getattr(dashboard, nome), '__wrapped__') and nome != 'grafico_evolucao_bugs']
+    figuras = [(nome, dashboard.preparar_figura_pdf(getattr(dashboard, nome)(com_teste))) for nome in nomes]
+    figuras = [(nome, fig) for nome, fig in figuras if fig is not None][:n_graficos]
+
+    amostra = figuras[:3]
+    try:
+        _, tempo_to_image = _cronometrar(lambda: [fig.to_image(format='png', width=700, height=450) for _, fig in amostra])
+    except Exception as e:
+        print(f"Chrome/Kaleido indisponível: {e}")
+        return
+    print(f"\n{len(figuras)} gráficos")
+    print(f"  {'to_image por gráfico (estimado)':<36} {tempo_to_image / len(amostra) * len(figuras):7.2f}s")
+
+    for n in processos:
+        renderizador = RenderizadorGraficos(processos=n)
+        renderizador.renderizar_lote(figuras[:1])
+        resultados, tempo_lote = _cronometrar(renderizador.renderizar_lote, figuras)
+        estatisticas = renderizador.estatisticas()
+        renderizador.fechar()
+        falhas = sum(1 for resultado in resultados if resultado['png'] is None)
+        print(f"  {f'renderizador, {n} aba(s) (aquecido)':<36} {tempo_lote:7.2f}s | abertura {estatisticas['tempo_inicio']:.2f}s | "
+              f"latência média {estatisticas['latencia_media'] or 0:.2f}s | falhas {falhas}")
+
+
+def benchmark_formato_pdf():
+    """
+    Relatório detalhado com os gráficos como PNG e como desenho vetorial (SVG via svglib):
+    tempo de geração e tamanho do arquivo. Precisa de Chrome/Chromium e do svglib.
+    """
+    print("=== BENCHMARK: GRÁFICOS DO PDF EM PNG x SVG ===")
+    if not dashboard.SVG_DISPONIVEL:
+        print("svglib não instalado")
+        return
+    df = gerar_dados_qa(5_000)
+    df['Data'] = pd.to_datetime(df['Data'], errors='coerce')
+    df = dashboard.aplicar_schema(df)
+    com_teste, sem_teste = dashboard.separar_dados_sem_teste(df)
+
+    # Cache de imagens numa pasta temporária: os dois formatos são renderizados de verdade
+    with tempfile.TemporaryDirectory() as pasta:
+        cache_original = dashboard.obter_cache_png
+        cache_temporario = dashboard.CachePNG(pasta)
+        dashboard.obter_cache_png = lambda: cache_temporario
+        try:
+            for formato in ('png', 'svg'):
+                pdf, tempo = _cronometrar(lambda: dashboard.criar_pdf_relatorio_detalhado(com_teste, df, sem_teste, formato=formato))
+                print(f"  {formato.upper():<4} {tempo:7.2f}s | {len(pdf.getvalue()) / 1024:8.1f} KB")
+        finally:
+            dashboard.obter_cache_png = cache_original
+
+
+def benchmark_graficos_nativos():
+    """Gráficos de barras e pizza desenhados direto no ReportLab, sem navegador: tempo por gráfico"""
+    from reportlab.lib.units import inch
+    from graficos_reportlab import desenhar_figura
+
+    print("=== BENCHMARK: GRÁFICOS NATIVOS DO REPORTLAB ===")
+    df = gerar_dados_qa(5_000)
+    df['Data'] = pd.to_datetime(df['Data'], errors='coerce')
+    com_teste, _ = dashboard.separar_dados_sem_teste(dashboard.aplicar_schema(df))
+    nomes = [nome for nome in dir(dashboard) if nome.startswith('grafico_') and hasattr(getattr(dashboard, nome), '__wrapped__')]
+
+    desenhados, sem_suporte = [], []
+    for nome in nomes:
+        try:
+            figura = getattr(dashboard, nome)(com_teste)
+        except Exception:
+            continue
+        if figura is None:
+            continue
+        desenho, tempo = _cronometrar(desenhar_figura, figura, 6 * inch, 4 * inch)
+        (desenhados if desenho is not None else sem_suporte).append((nome, tempo))
+
+    for nome, tempo in desenhados:
+        print(f"  {nome:<40} {tempo * 1000:7.2f}ms")
+    print(f"\n{len(desenhados)} gráficos desenhados em {sum(t for _, t in desenhados) * 1000:.1f}ms no total")
+    print(f"Sem desenho nativo (seguem pelo Kaleido): {', '.join(nome for nome, _ in sem_suporte)}")
+
+
+BENCHMARKS = {
+    'motivos': benchmark_motivos,
+    'schema': benchmark_schema,
+    'filtros': benchmark_filtros,
+    'retestes': benchmark_retestes,
+    'sync': benchmark_sync,
+    'colunas': benchmark_colunas,
+    'snapshot': benchmark_snapshot,
+    'excel': benchmark_excel,
+    'streaming': benchmark_streaming,
+    'figuras': benchmark_figuras,
+    'renderizacao': benchmark_renderizacao,
+    'formato_pdf': benchmark_formato_pdf,
+    'graficos_nativos': benchmark_graficos_nativos,
+}
+
+if __name__ == "__main__":
+    selecionados = sys.argv[1:] or list(BENCHMARKS)
+    for nome in selecionados:
+        BENCHMARKS[nome]()
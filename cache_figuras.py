@@ -0,0 +1,187 @@
+"""
+Caches dos gráficos do dashboard.
+
+CacheFiguras: figuras Plotly em memória, compartilhadas pelas sessões do processo, guardadas
+como JSON (texto imutável) com descarte LRU por quantidade de entradas e por memória; cada
+acerto devolve uma figura nova, porque quem chama costuma ajustar cores e layout na figura.
+
+CachePNG: imagens renderizadas para os PDFs (PNG ou SVG), em disco, endereçadas pelo conteúdo
+da figura (hash do JSON + tamanho + formato), com descarte LRU por tamanho total da pasta.
+Reexportar um PDF com os mesmos filtros não passa pelo Chromium.
+"""
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+from collections import OrderedDict
+
+import plotly.io as pio
+
+FIGURAS_MAX_ENTRADAS = 256
+FIGURAS_MAX_MB = 64
+
+PNG_CACHE_DIR = os.path.join('.cache', 'graficos')
+PNG_CACHE_MAX_MB = 100
+
+
+class CacheFiguras:
+    """
+    LRU de figuras em JSON. A chave é montada por quem chama (função, fingerprint do recorte,
+    parâmetros); None também é guardado, para gráficos sem dados no recorte.
+    """
+    def __init__(self, max_entradas=FIGURAS_MAX_ENTRADAS, max_bytes=FIGURAS_MAX_MB * 1024 ** 2):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.entradas = OrderedDict()
+        self.bytes = 0
+        self.acertos = 0
+        self.faltas = 0
+        self.descartes = 0
+        self._lock = threading.Lock()
+
+    def obter(self, chave, construir):
+        """Figura da chave: reconstruída a partir do JSON guardado ou montada por construir()"""
+        with self._lock:
+            encontrada = chave in self.entradas
+            if encontrada:
+                self.entradas.move_to_end(chave)
+                self.acertos += 1
+                texto = self.entradas[chave]
+            else:
+                self.faltas += 1
+
+        if encontrada:
+            return None if texto is None else pio.from_json(texto)
+
+        figura = construir()
+        self._guardar(chave, None if figura is None else figura.to_json())
+        return figura
+
+    def _guardar(self, chave, texto):
+        tamanho = len(texto) if texto is not None else 0
+        if tamanho > self.max_bytes:
+            return
+        with self._lock:
+            if chave in self.entradas:
+                return
+            self.entradas[chave] = texto
+            self.bytes += tamanho
+            while len(self.entradas) > self.max_entradas or self.bytes > self.max_bytes:
+                _, antigo = self.entradas.popitem(last=False)
+                self.bytes -= len(antigo) if antigo is not None else 0
+                self.descartes += 1
+
+    def limpar(self):
+        with self._lock:
+            self.entradas.clear()
+            self.bytes = 0
+
+    def estatisticas(self):
+        with self._lock:
+            return {
+                'entradas': len(self.entradas),
+                'mb': self.bytes / 1024 ** 2,
+                'acertos': self.acertos,
+                'faltas': self.faltas,
+                'descartes': self.descartes
+            }
+
+
+def chave_png(figura, largura, altura, escala=1, formato='png'):
+    """Hash do conteúdo da figura (JSON com chaves ordenadas), do tamanho e do formato da imagem"""
+    # Chaves ordenadas: a mesma figura reconstruída do JSON (CacheFiguras) serializa em outra ordem
+    conteudo = json.dumps(json.loads(figura.to_json()), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(f"{conteudo}|{largura}x{altura}@{escala}|{formato}".encode()).hexdigest()
+
+
+class CachePNG:
+    """
+    Pasta de imagens nomeadas pelo hash do conteúdo, com a extensão do formato. O mtime marca o
+    último uso (atualizado a cada acerto); ao passar do limite de tamanho, os menos usados
+    recentemente são apagados.
+    """
+    FORMATOS = ('png', 'svg')
+
+    def __init__(self, pasta=PNG_CACHE_DIR, max_mb=PNG_CACHE_MAX_MB):
+        self.pasta = Path(pasta)
+        self.max_bytes = int(max_mb * 1024 ** 2)
+        self.acertos = 0
+        self.faltas = 0
+        self.descartes = 0
+        self._lock = threading.Lock()
+
+    def _arquivo(self, chave, formato):
+        return self.pasta / f"{chave}.{formato}"
+
+    def obter(self, chave, formato='png'):
+        """Bytes da imagem da chave ou None"""
+        arquivo = self._arquivo(chave, formato)
+        try:
+            png = arquivo.read_bytes()
+            os.utime(arquivo)
+        except OSError:
+            with self._lock:
+                self.faltas += 1
+            return None
+        with self._lock:
+            self.acertos += 1
+        return png
+
+    def guardar(self, chave, png, formato='png'):
+        """Grava a imagem (troca atômica, várias sessões podem gravar a mesma chave) e aplica o limite"""
+        if not png or len(png) > self.max_bytes:
+            return
+        arquivo = self._arquivo(chave, formato)
+        temporario = arquivo.with_suffix(f'.{threading.get_ident()}.tmp')
+        try:
+            self.pasta.mkdir(parents=True, exist_ok=True)
+            temporario.write_bytes(png)
+            os.replace(temporario, arquivo)
+        except OSError:
+            # Cache é só otimização: sem disco gravável o PDF continua sendo gerado
+            temporario.unlink(missing_ok=True)
+            return
+        self._aplicar_limite()
+
+    def _entradas(self):
+        entradas = []
+        try:
+            with os.scandir(self.pasta) as itens:
+                for item in itens:
+                    if item.name.rpartition('.')[2] in self.FORMATOS:
+                        try:
+                            info = item.stat()
+                        except OSError:
+                            continue
+                        entradas.append((info.st_mtime, info.st_size, item.path))
+        except OSError:
+            pass
+        return entradas
+
+    def _aplicar_limite(self):
+        entradas = self._entradas()
+        total = sum(tamanho for _, tamanho, _ in entradas)
+        if total <= self.max_bytes:
+            return
+        for _, tamanho, caminho in sorted(entradas):
+            try:
+                os.unlink(caminho)
+            except OSError:
+                continue
+            total -= tamanho
+            with self._lock:
+                self.descartes += 1
+            if total <= self.max_bytes:
+                break
+
+    def estatisticas(self):
+        entradas = self._entradas()
+        with self._lock:
+            return {
+                'arquivos': len(entradas),
+                'mb': sum(tamanho for _, tamanho, _ in entradas) / 1024 ** 2,
+                'acertos': self.acertos,
+                'faltas': self.faltas,
+                'descartes': self.descartes
+            }
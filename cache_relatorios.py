@@ -0,0 +1,87 @@
+"""
+Cache dos PDFs exportados pelo dashboard, em memória e compartilhado pelas sessões do processo.
+
+A chave é montada por quem chama (relatório, função geradora, versão dos dados e recorte
+filtrado); o mesmo pedido feito de qualquer sessão devolve os bytes já gerados, sem renderizar
+gráficos nem montar o documento ReportLab de novo. Descarte LRU por quantidade de entradas e
+por memória, e validade curta para que a data de geração impressa no PDF não fique antiga.
+"""
+import time
+import threading
+from collections import OrderedDict
+
+PDF_MAX_ENTRADAS = 32
+PDF_MAX_MB = 128
+PDF_VALIDADE_SEGUNDOS = 15 * 60
+
+
+class CachePDF:
+    """LRU de PDFs (bytes) com validade por entrada"""
+    def __init__(self, max_entradas=PDF_MAX_ENTRADAS, max_bytes=PDF_MAX_MB * 1024 ** 2,
+                 validade=PDF_VALIDADE_SEGUNDOS):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.validade = validade
+        self.entradas = OrderedDict()
+        self.bytes = 0
+        self.acertos = 0
+        self.faltas = 0
+        self.descartes = 0
+        self.segundos_gerando = 0.0
+        self._lock = threading.Lock()
+
+    def obter(self, chave, gerar):
+        """
+        Bytes do PDF da chave: os guardados ou os devolvidos por gerar(). Se gerar() devolver
+        None (erro ou bibliotecas ausentes), nada é guardado.
+        """
+        with self._lock:
+            entrada = self.entradas.get(chave)
+            if entrada is not None and time.monotonic() - entrada[0] > self.validade:
+                self._remover(chave)
+                entrada = None
+            if entrada is not None:
+                self.entradas.move_to_end(chave)
+                self.acertos += 1
+                return entrada[1]
+            self.faltas += 1
+
+        inicio = time.perf_counter()
+        pdf = gerar()
+        with self._lock:
+            self.segundos_gerando += time.perf_counter() - inicio
+        if pdf:
+            self._guardar(chave, pdf)
+        return pdf
+
+    def _remover(self, chave):
+        _, pdf = self.entradas.pop(chave)
+        self.bytes -= len(pdf)
+
+    def _guardar(self, chave, pdf):
+        if len(pdf) > self.max_bytes:
+            return
+        with self._lock:
+            if chave in self.entradas:
+                self._remover(chave)
+            self.entradas[chave] = (time.monotonic(), pdf)
+            self.bytes += len(pdf)
+            while len(self.entradas) > self.max_entradas or self.bytes > self.max_bytes:
+                self._remover(next(iter(self.entradas)))
+                self.descartes += 1
+
+    def limpar(self):
+        with self._lock:
+            self.entradas.clear()
+            self.bytes = 0
+
+    def estatisticas(self):
+        with self._lock:
+            return {
+                'entradas': len(self.entradas),
+                'mb': self.bytes / 1024 ** 2,
+                'acertos': self.acertos,
+                'faltas': self.faltas,
+                'descartes': self.descartes,
+                'segundos_gerando': self.segundos_gerando
+            }
@@ -10,6 +10,13 @@ from pathlib import Path
 import os
 import io
 import base64
+import hashlib
+import time
+import inspect
+import functools
+import threading
+import weakref
+from collections import Counter
 from datetime import date
 
 # Configurações DEFINITIVAS para produção
@@ -32,12 +39,22 @@ try:
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch
     from reportlab.lib import colors
+    from graficos_reportlab import desenhar_figura, valores_trace
     import kaleido
     PDF_AVAILABLE = True
 except ImportError as e:
     PDF_AVAILABLE = False
     print(f"Aviso: Bibliotecas PDF não disponíveis: {e}")
 
+# Gráficos vetoriais nos PDFs (opcional): o SVG do Kaleido vira um Drawing do ReportLab
+try:
+    from svglib.svglib import svg2rlg
+    SVG_DISPONIVEL = PDF_AVAILABLE
+except ImportError:
+    SVG_DISPONIVEL = False
+
+FORMATOS_GRAFICOS_PDF = {'Imagem (PNG)': 'png', 'Vetorial (SVG)': 'svg'}
+
 # Importar módulo de sustentação
 try:
     from sustentacao import main_sustentacao
@@ -45,9 +62,21 @@ except ImportError:
     st.error("Módulo de sustentação não encontrado. Certifique-se de que o arquivo sustentacao.py está no mesmo diretório.")
     main_sustentacao = None
 
+# Snapshots Parquet locais dos dados processados
+from snapshots import SnapshotStore, SNAPSHOT_DIR, SNAPSHOT_RETENCAO
+
+# Leitura de Excel compartilhada (colunas necessárias, dicas de tipo, motor mais rápido disponível)
+from leitura_excel import ler_excel, ler_upload_excel, hash_conteudo, DTYPES_QA, DTYPES_BUGS
+from leitura_blocos import ler_em_blocos
+from cache_figuras import CacheFiguras, CachePNG, chave_png
+from cache_relatorios import CachePDF
+from tarefas_pdf import FilaPDF, CONCLUIDA
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from renderizador_graficos import RenderizadorGraficos, RENDER_LARGURA, RENDER_ALTURA
+
 # Importar integração com Google Sheets
 try:
-    from google_sheets_integration import load_google_sheets_data_automatically
+    from google_sheets_integration import load_google_sheets_data_automatically, prefixo_snapshot_planilha
     GOOGLE_SHEETS_AVAILABLE = True
 except ImportError:
     GOOGLE_SHEETS_AVAILABLE = False
@@ -101,200 +130,233 @@ def diagnosticar_ambiente_pdf():
     
     return diagnostico
 
-def exportar_grafico_para_pdf(fig, titulo, largura=800, altura=600):
+@st.cache_resource(show_spinner=False)
+def obter_renderizador():
+    """Renderizador de gráficos do processo: um Chromium (Kaleido) aberto e reaproveitado por todos os PDFs"""
+    return RenderizadorGraficos()
+
+@st.cache_resource(show_spinner=False)
+def obter_cache_png():
+    """Cache em disco dos PNGs dos gráficos exportados, compartilhado por todas as sessões"""
+    return CachePNG()
+
+@st.cache_resource(show_spinner=False)
+def obter_cache_pdf():
+    """Cache dos PDFs gerados, compartilhado por todas as sessões"""
+    return CachePDF()
+
+@st.cache_resource(show_spinner=False)
+def obter_fila_pdf():
+    """Fila de geração de PDFs em segundo plano, compartilhada por todas as sessões"""
+    return FilaPDF()
+
+def preparar_figura_pdf(fig, largura=RENDER_LARGURA, altura=RENDER_ALTURA):
+    """Cópia da figura com fundo branco e texto preto para impressão (a figura da tela não é alterada)"""
+    fig_pdf = go.Figure(fig)
+    fig_pdf.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(color='black', size=12),
+        width=largura,
+        height=altura,
+        margin=dict(l=60, r=60, t=80, b=60)
+    )
+    return fig_pdf
+
+def figura_simplificada(fig, titulo):
+    """Primeira série do gráfico (até 10 pontos) em barras/linhas simples, para figuras que o Kaleido não renderiza"""
+    if not getattr(fig, 'data', None):
+        return None
+    trace = fig.data[0]
+    if getattr(trace, 'x', None) is None or getattr(trace, 'y', None) is None:
+        return None
+    
+    x, y = valores_trace(trace.x)[:10], valores_trace(trace.y)[:10]
+    fig_simples = go.Figure()
+    if trace.type == 'bar':
+        fig_simples.add_trace(go.Bar(x=x, y=y, name=getattr(trace, 'name', None) or 'Dados'))
+    else:
+        fig_simples.add_trace(go.Scatter(x=x, y=y, mode='lines+markers', name=getattr(trace, 'name', None) or 'Dados'))
+    fig_simples.update_layout(title=f"Gráfico: {titulo}", plot_bgcolor='white', paper_bgcolor='white', font=dict(size=10))
+    return fig_simples
+
+def exportar_graficos_para_pdf(graficos, ao_renderizar=None, formato='png'):
+    """
+    Renderiza um lote {titulo: figura} de uma vez no renderizador persistente e devolve
+    {titulo: Image/Drawing do ReportLab ou None}. Com formato='svg' (e o svglib instalado) os
+    gráficos vão como desenhos vetoriais; os que o svglib não converter vão como PNG.
+    Gráficos de barras e pizza que o navegador não renderizar (ou todos eles, quando já se sabe
+    que o Chromium não abre) são desenhados direto no ReportLab; os demais que falharem são
+    tentados mais uma vez na versão simplificada.
+    ao_renderizar(titulo) é chamado uma vez por gráfico pronto (do cache, do navegador, nativo ou
+    simplificado); os que falham no navegador só contam quando um dos caminhos seguintes der certo.
+    """
+    graficos = {titulo: fig for titulo, fig in graficos.items() if fig is not None}
+    if not graficos:
+        return {}
+    if formato == 'svg' and not SVG_DISPONIVEL:
+        formato = 'png'
+    converter = desenho_pdf if formato == 'svg' else imagem_pdf
+    renderizador = obter_renderizador()
+    
+    # Cada gráfico conta uma vez no progresso, mesmo passando por mais de um caminho (SVG sem conversão)
+    contados = set()
+    def avisar(titulo):
+        if ao_renderizar and titulo not in contados:
+            contados.add(titulo)
+            ao_renderizar(titulo)
+    
+    resultado = {}
+    if renderizador.indisponivel:
+        resultado = desenhar_graficos_nativos(graficos, avisar)
+    pendentes = {titulo: fig for titulo, fig in graficos.items() if titulo not in resultado}
+    if pendentes:
+        imagens = renderizar_imagens_pdf(pendentes, avisar, formato)
+        resultado.update({titulo: converter(dados, titulo) for titulo, dados in imagens.items()})
+        sem_conversao = {titulo: graficos[titulo] for titulo, dados in imagens.items() if dados and resultado[titulo] is None}
+        if formato == 'svg' and sem_conversao:
+            resultado.update(exportar_graficos_para_pdf(sem_conversao, avisar))
+    
+    falhas = {titulo: graficos[titulo] for titulo, imagem in resultado.items() if imagem is None}
+    resultado.update(desenhar_graficos_nativos(falhas, avisar))
+    
+    # Com o navegador indisponível não adianta simplificar: todas as figuras falhariam do mesmo jeito.
+    # A versão simplificada não vai para o cache, para a próxima exportação tentar o gráfico completo.
+    restantes = [titulo for titulo, imagem in resultado.items() if imagem is None]
+    if restantes and renderizador.ativo:
+        simplificadas = [(titulo, figura_simplificada(graficos[titulo], titulo)) for titulo in restantes]
+        simplificadas = [(titulo, fig) for titulo, fig in simplificadas if fig is not None]
+        for r in renderizador.renderizar_lote(simplificadas, largura=500, altura=350, formato=formato):
+            resultado[r['titulo']] = converter(r['png'], r['titulo'])
+            if resultado[r['titulo']] is not None:
+                avisar(r['titulo'])
+    return resultado
+
+def desenhar_graficos_nativos(graficos, ao_renderizar=None):
+    """{titulo: Drawing} dos gráficos que o ReportLab desenha sozinho (barras e pizza), sem navegador"""
+    desenhos = {}
+    for titulo, fig in graficos.items():
+        desenho = desenhar_figura(fig, 6*inch, 4*inch)
+        if desenho is None:
+            continue
+        desenho.hAlign = 'CENTER'
+        desenhos[titulo] = desenho
+        if ao_renderizar:
+            ao_renderizar(titulo)
+    return desenhos
+
+def renderizar_imagens_pdf(graficos, ao_renderizar, formato):
+    """
+    Bytes das imagens {titulo: png/svg ou None}. Imagens já renderizadas com o mesmo conteúdo
+    vêm do cache em disco, sem passar pelo Chromium. ao_renderizar só é chamado para as imagens
+    obtidas (as falhas seguem para o desenho nativo ou a versão simplificada).
     """
-    Versão ULTRA-ROBUSTA para Streamlit Cloud
-    Implementa múltiplas estratégias de fallback para garantir funcionamento
+    cache_png = obter_cache_png()
+    preparadas = {titulo: preparar_figura_pdf(fig) for titulo, fig in graficos.items()}
+    chaves = {titulo: chave_png(fig, RENDER_LARGURA, RENDER_ALTURA, formato=formato) for titulo, fig in preparadas.items()}
+    imagens = {titulo: cache_png.obter(chave, formato) for titulo, chave in chaves.items()}
+    pendentes = [(titulo, preparadas[titulo]) for titulo, png in imagens.items() if png is None]
+    if ao_renderizar:
+        for titulo, png in imagens.items():
+            if png is not None:
+                ao_renderizar(titulo)
+    if not pendentes:
+        return imagens
+    
+    def avisar_pronto(r):
+        if r['png']:
+            ao_renderizar(r['titulo'])
+    
+    resultados = obter_renderizador().renderizar_lote(
+        pendentes, formato=formato, ao_concluir=avisar_pronto if ao_renderizar else None
+    )
+    for r in resultados:
+        imagens[r['titulo']] = r['png']
+        if r['png']:
+            cache_png.guardar(chaves[r['titulo']], r['png'], formato)
+        else:
+            print(f"⚠️ Falha ao renderizar '{r['titulo']}': {r['erro']}")
+    return imagens
+
+def desenho_pdf(svg, titulo):
+    """
+    SVG renderizado como Drawing do ReportLab (vetorial: texto e linhas nítidos em qualquer zoom
+    e arquivo menor que o PNG), no mesmo tamanho das imagens. None se o svglib não converter.
     """
+    if not svg:
+        return None
+    try:
+        desenho = svg2rlg(io.BytesIO(svg))
+    except Exception as e:
+        print(f"⚠️ SVG inválido para '{titulo}': {e}")
+        return None
+    if desenho is None or not desenho.width or not desenho.height:
+        print(f"⚠️ SVG vazio para '{titulo}'")
+        return None
+    desenho.scale(6*inch / desenho.width, 4*inch / desenho.height)
+    desenho.width, desenho.height = 6*inch, 4*inch
+    desenho.hAlign = 'CENTER'
+    return desenho
+
+def imagem_pdf(png, titulo):
+    """PNG renderizado como Image do ReportLab (None se não houver imagem ou ela for inválida)"""
+    if not png:
+        return None
+    try:
+        imagem = Image(io.BytesIO(png), width=6*inch, height=4*inch)
+    except Exception as e:
+        print(f"⚠️ Imagem inválida para '{titulo}': {e}")
+        return None
+    return imagem
+
+def exportar_grafico_para_pdf(fig, titulo, largura=800, altura=600):
+    """Imagem do ReportLab de um único gráfico (lote de um), ou None se não for possível renderizar"""
     if fig is None:
         print(f"❌ Gráfico '{titulo}' é None")
         return None
+    return exportar_graficos_para_pdf({titulo: fig}).get(titulo)
+
+def renderizar_graficos_relatorio(df_filtrado, graficos, progresso=None, formato='png'):
+    """
+    Primeira fase dos PDFs: monta todas as figuras do relatório e renderiza todas em um único
+    lote, antes de montar a story. graficos = {titulo: (funcao, kwargs)}; formato 'png' ou 'svg'.
+    Devolve ({titulo: Image ou None}, {titulo: erro}). progresso(fracao, etapa), se informado,
+    vai de 0 a 0.8 nesta fase (montagem das figuras até 0.2, renderização até 0.8).
+    """
+    informar = progresso or (lambda fracao, etapa=None: None)
+    figuras, erros = {}, {}
+    for posicao, (titulo, (funcao, kwargs)) in enumerate(graficos.items()):
+        informar(0.2 * posicao / len(graficos), f"Montando gráfico: {titulo}")
+        try:
+            figuras[titulo] = funcao(df_filtrado, **kwargs)
+        except Exception as e:
+            erros[titulo] = e
     
-    print(f"🔄 Iniciando conversão: {titulo}")
+    total = max(sum(1 for fig in figuras.values() if fig is not None), 1)
+    prontos = []
+    def ao_renderizar(titulo):
+        prontos.append(titulo)
+        informar(0.2 + 0.6 * len(prontos) / total, f"Gráfico pronto: {titulo} ({len(prontos)}/{total})")
     
+    informar(0.2, f"Renderizando {total} gráfico(s)")
     try:
-        import plotly.io as pio
-        import plotly.graph_objects as go
-        import copy
-        
-        # CONFIGURAÇÕES CRÍTICAS PARA STREAMLIT CLOUD
-        os.environ.update({
-            'MPLBACKEND': 'Agg',
-            'DISPLAY': ':99',
-            'KALEIDO_DISABLE_GPU': 'true',
-            'CHROMIUM_FLAGS': '--no-sandbox --disable-dev-shm-usage --disable-gpu --single-process'
-        })
-        
-        # ESTRATÉGIA 1: Configuração Ultra-Conservadora
-        print("🎯 Estratégia 1: Configuração ultra-conservadora")
-        try:
-             # Usar nova API se disponível, senão fallback para antiga
-             if hasattr(pio, 'defaults'):
-                 pio.defaults.chromium_args = (
-                     '--no-sandbox',
-                     '--disable-dev-shm-usage',
-                     '--disable-gpu',
-                     '--single-process',
-                     '--disable-extensions',
-                     '--disable-plugins',
-                     '--no-first-run',
-                     '--disable-default-apps',
-                     '--disable-background-timer-throttling',
-                     '--disable-renderer-backgrounding'
-                 )
-                 pio.defaults.default_timeout = 120
-             else:
-                 pio.kaleido.scope.chromium_args = (
-                     '--no-sandbox',
-                     '--disable-dev-shm-usage',
-                     '--disable-gpu',
-                     '--single-process',
-                     '--disable-extensions',
-                     '--disable-plugins',
-                     '--no-first-run',
-                     '--disable-default-apps',
-                     '--disable-background-timer-throttling',
-                     '--disable-renderer-backgrounding'
-                 )
-                 pio.kaleido.scope.default_timeout = 120
-             
-             fig_copy = copy.deepcopy(fig)
-             fig_copy.update_layout(
-                 plot_bgcolor='white',
-                 paper_bgcolor='white',
-                 font=dict(color='black', size=12),
-                 width=700,
-                 height=450,
-                 margin=dict(l=60, r=60, t=80, b=60)
-             )
-             
-             img_bytes = fig_copy.to_image(format="png", width=700, height=450, scale=1)
-             
-             if img_bytes and len(img_bytes) > 1000:
-                 print(f"✅ Estratégia 1 SUCESSO: {len(img_bytes)} bytes")
-                 img_buffer = io.BytesIO(img_bytes)
-                 return Image(img_buffer, width=6*inch, height=4*inch)
-                
-        except Exception as e:
-            print(f"⚠️ Estratégia 1 falhou: {e}")
-        
-        # ESTRATÉGIA 2: Configuração Minimalista
-        print("🎯 Estratégia 2: Configuração minimalista")
-        try:
-            pio.kaleido.scope.chromium_args = ('--no-sandbox', '--disable-dev-shm-usage')
-            pio.kaleido.scope.default_timeout = 90
-            
-            fig_simple = copy.deepcopy(fig)
-            fig_simple.update_layout(
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                width=600,
-                height=400
-            )
-            
-            img_bytes = fig_simple.to_image(format="png", width=600, height=400)
-            
-            if img_bytes and len(img_bytes) > 500:
-                print(f"✅ Estratégia 2 SUCESSO: {len(img_bytes)} bytes")
-                img_buffer = io.BytesIO(img_bytes)
-                return Image(img_buffer, width=6*inch, height=4*inch)
-                
-        except Exception as e:
-            print(f"⚠️ Estratégia 2 falhou: {e}")
-        
-        # ESTRATÉGIA 3: Gráfico Simplificado
-        print("🎯 Estratégia 3: Gráfico simplificado")
-        try:
-            pio.kaleido.scope.chromium_args = ('--no-sandbox',)
-            pio.kaleido.scope.default_timeout = 60
-            
-            # Criar versão simplificada do gráfico
-            if hasattr(fig, 'data') and len(fig.data) > 0:
-                trace = fig.data[0]
-                
-                fig_backup = go.Figure()
-                
-                if hasattr(trace, 'x') and hasattr(trace, 'y'):
-                    if trace.type == 'bar':
-                        fig_backup.add_trace(go.Bar(
-                            x=trace.x[:10] if len(trace.x) > 10 else trace.x,
-                            y=trace.y[:10] if len(trace.y) > 10 else trace.y,
-                            name=getattr(trace, 'name', 'Dados')
-                        ))
-                    else:
-                        fig_backup.add_trace(go.Scatter(
-                            x=trace.x[:10] if len(trace.x) > 10 else trace.x,
-                            y=trace.y[:10] if len(trace.y) > 10 else trace.y,
-                            mode='lines+markers',
-                            name=getattr(trace, 'name', 'Dados')
-                        ))
-                else:
-                    # Gráfico de fallback genérico
-                    fig_backup.add_trace(go.Bar(
-                        x=['Dados', 'Disponíveis'],
-                        y=[1, 1],
-                        name='Informações'
-                    ))
-                
-                fig_backup.update_layout(
-                    title=f"Gráfico: {titulo}",
-                    plot_bgcolor='white',
-                    paper_bgcolor='white',
-                    width=500,
-                    height=350,
-                    font=dict(size=10)
-                )
-                
-                img_bytes = fig_backup.to_image(format="png", width=500, height=350)
-                
-                if img_bytes and len(img_bytes) > 100:
-                    print(f"✅ Estratégia 3 SUCESSO: {len(img_bytes)} bytes")
-                    img_buffer = io.BytesIO(img_bytes)
-                    return Image(img_buffer, width=6*inch, height=4*inch)
-                    
-        except Exception as e:
-            print(f"⚠️ Estratégia 3 falhou: {e}")
-        
-        # ESTRATÉGIA 4: Gráfico de Emergência
-        print("🎯 Estratégia 4: Gráfico de emergência")
-        try:
-            fig_emergency = go.Figure()
-            fig_emergency.add_trace(go.Scatter(
-                x=[1, 2, 3],
-                y=[1, 2, 1],
-                mode='lines+markers',
-                name='Dados do Gráfico'
-            ))
-            
-            fig_emergency.update_layout(
-                title=f"Dados: {titulo}",
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                width=400,
-                height=300,
-                showlegend=False
-            )
-            
-            img_bytes = fig_emergency.to_image(format="png", width=400, height=300)
-            
-            if img_bytes and len(img_bytes) > 50:
-                print(f"✅ Estratégia 4 SUCESSO (emergência): {len(img_bytes)} bytes")
-                img_buffer = io.BytesIO(img_bytes)
-                return Image(img_buffer, width=6*inch, height=4*inch)
-                
-        except Exception as e:
-            print(f"❌ Estratégia 4 falhou: {e}")
-        
-        print(f"❌ TODAS as estratégias falharam para '{titulo}'")
-        return None
-        
+        imagens = exportar_graficos_para_pdf(figuras, ao_renderizar=ao_renderizar, formato=formato)
     except Exception as e:
-        print(f"❌ Erro crítico na conversão de '{titulo}': {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+        imagens = {}
+        erros.update({titulo: e for titulo in figuras})
+    informar(0.8, "Montando o documento")
+    return imagens, erros
 
-def criar_pdf_relatorio_detalhado(df_filtrado, df_original, df_sem_teste=None):
+def adicionar_grafico_pdf(story, imagens, erros, chave, titulo, estilo, espaco, mensagem_erro, estilo_erro):
+    """Segunda fase: coloca na story o gráfico já renderizado (ou a mensagem de erro dele)"""
+    if chave in erros:
+        story.append(Paragraph(f"{mensagem_erro}: {erros[chave]}", estilo_erro))
+    elif imagens.get(chave):
+        story.append(Paragraph(titulo, estilo))
+        story.append(imagens[chave])
+        story.append(Spacer(1, espaco))
+
+def criar_pdf_relatorio_detalhado(df_filtrado, df_original, df_sem_teste=None, progresso=None, formato='png'):
     """
     Cria um PDF completo e detalhado do relatório com insights e análises
     """
@@ -302,6 +364,16 @@ def criar_pdf_relatorio_detalhado(df_filtrado, df_original, df_sem_teste=None):
         st.error("📄 Bibliotecas PDF não disponíveis. Instale: pip install reportlab kaleido")
         return None
     
+    # Todos os gráficos do relatório renderizados de uma vez, em paralelo, antes da story
+    imagens, erros_graficos = renderizar_graficos_relatorio(df_filtrado, {
+        "Status dos Testes": (grafico_status_distribuicao, {}),
+        "Tarefas por Time": (grafico_tasks_por_time, {}),
+        "Tarefas Retestadas": (grafico_tarefas_retestadas, {}),
+        "Motivos de Rejeição": (grafico_motivos_rejeicao, {'por_ambiente': False}),
+        "Ranking de Problemas": (grafico_ranking_problemas, {}),
+        "Taxa de Rejeição por Time": (grafico_taxa_rejeicao_por_time, {})
+    }, progresso, formato)
+    
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(
         buffer, 
@@ -615,14 +687,14 @@ def criar_pdf_relatorio_detalhado(df_filtrado, df_original, df_sem_teste=None):
     
     # Análise de distribuição de trabalho
     if 'Time' in df_filtrado.columns:
-        time_mais_ativo = df_filtrado['Time'].value_counts().index[0] if len(df_filtrado) > 0 else 'N/A'
-        tasks_time_ativo = df_filtrado['Time'].value_counts().iloc[0] if len(df_filtrado) > 0 else 0
+        time_mais_ativo = contar_ocorrencias(df_filtrado['Time']).index[0] if len(df_filtrado) > 0 else 'N/A'
+        tasks_time_ativo = contar_ocorrencias(df_filtrado['Time']).iloc[0] if len(df_filtrado) > 0 else 0
         story.append(Paragraph(f"[*] DISTRIBUIÇÃO: Time '{time_mais_ativo}' é o mais ativo com {tasks_time_ativo} testes realizados.", insight_style_positivo))
     
     # Análise de testadores
     if 'Responsavel pelo teste' in df_filtrado.columns:
-        testador_mais_ativo = df_filtrado['Responsavel pelo teste'].value_counts().index[0] if len(df_filtrado) > 0 else 'N/A'
-        tests_testador = df_filtrado['Responsavel pelo teste'].value_counts().iloc[0] if len(df_filtrado) > 0 else 0
+        testador_mais_ativo = contar_ocorrencias(df_filtrado['Responsavel pelo teste']).index[0] if len(df_filtrado) > 0 else 'N/A'
+        tests_testador = contar_ocorrencias(df_filtrado['Responsavel pelo teste']).iloc[0] if len(df_filtrado) > 0 else 0
         story.append(Paragraph(f"[>] PERFORMANCE: Testador '{testador_mais_ativo}' realizou {tests_testador} testes, sendo o mais produtivo.", insight_style_positivo))
     
     story.append(Spacer(1, 10))
@@ -631,7 +703,7 @@ def criar_pdf_relatorio_detalhado(df_filtrado, df_original, df_sem_teste=None):
     story.append(Paragraph("3. ANÁLISE DETALHADA POR TIMES", subtitle_style))
     
     if 'Time' in df_filtrado.columns and 'Status' in df_filtrado.columns:
-        times_performance = df_filtrado.groupby('Time')['Status'].value_counts().unstack(fill_value=0)
+        times_performance = df_filtrado.groupby('Time', observed=True)['Status'].value_counts().unstack(fill_value=0)
         if 'APROVADA' in times_performance.columns or 'REJEITADA' in times_performance.columns or 'PRONTO PARA PUBLICAÇÃO' in times_performance.columns:
             aprovadas_total = times_performance.get('APROVADA', 0) + times_performance.get('PRONTO PARA PUBLICAÇÃO', 0)
             rejeitadas_total = times_performance.get('REJEITADA', 0)
@@ -665,83 +737,18 @@ def criar_pdf_relatorio_detalhado(df_filtrado, df_original, df_sem_teste=None):
     # 4. GRÁFICOS E VISUALIZAÇÕES
     story.append(Paragraph("4. GRÁFICOS E VISUALIZAÇÕES", subtitle_style))
     
-    # Gráfico de status
-    try:
-        fig_status = grafico_status_distribuicao(df_filtrado)
-        if fig_status:
-            img_grafico = exportar_grafico_para_pdf(fig_status, "Status dos Testes")
-            if img_grafico:
-                story.append(Paragraph("Distribuição por Status", chart_title_style))
-                story.append(img_grafico)
-                story.append(Spacer(1, 30))
-    except Exception as e:
-        story.append(Paragraph(f"Erro ao gerar gráfico de status: {e}", styles['Normal']))
-
-    # Gráfico de tarefas por time
-    try:
-        fig_time = grafico_tasks_por_time(df_filtrado)
-        if fig_time:
-            img_grafico = exportar_grafico_para_pdf(fig_time, "Tarefas por Time")
-            if img_grafico:
-                story.append(Paragraph("Tarefas por Time", chart_title_style))
-                story.append(img_grafico)
-                story.append(Spacer(1, 30))
-    except Exception as e:
-        story.append(Paragraph(f"Erro ao gerar gráfico por time: {e}", styles['Normal']))
-    
-
-    
-    # Gráfico de tarefas retestadas
-    try:
-        fig_retestadas = grafico_tarefas_retestadas(df_filtrado)
-        if fig_retestadas:
-            img_grafico = exportar_grafico_para_pdf(fig_retestadas, "Tarefas Retestadas")
-            if img_grafico:
-                story.append(Paragraph("Histórico de Tarefas Retestadas", chart_title_style))
-                story.append(img_grafico)
-                story.append(Spacer(1, 30))
-    except Exception as e:
-        story.append(Paragraph(f"Erro ao gerar gráfico de tarefas retestadas: {e}", styles['Normal']))
-
-    # Gráfico de motivos de rejeição
-    try:
-        fig_motivos = grafico_motivos_rejeicao(df_filtrado, por_ambiente=False)
-        if fig_motivos:
-            img_grafico = exportar_grafico_para_pdf(fig_motivos, "Motivos de Rejeição")
-            if img_grafico:
-                story.append(Paragraph("Principais Motivos de Rejeição", chart_title_style))
-                story.append(img_grafico)
-                story.append(Spacer(1, 15))
-    except Exception as e:
-        story.append(Paragraph(f"Erro ao gerar gráfico de motivos: {e}", styles['Normal']))
-    
-
-    
-
-    
-    # Gráfico de ranking de problemas
-    try:
-        fig_ranking = grafico_ranking_problemas(df_filtrado)
-        if fig_ranking:
-            img_grafico = exportar_grafico_para_pdf(fig_ranking, "Ranking de Problemas")
-            if img_grafico:
-                story.append(Paragraph("Ranking dos Principais Problemas", styles['Heading3']))
-                story.append(img_grafico)
-                story.append(Spacer(1, 20))
-    except Exception as e:
-        story.append(Paragraph(f"Erro ao gerar ranking de problemas: {e}", styles['Normal']))
-    
-    # Gráfico de taxa de rejeição por time
-    try:
-        fig_taxa_rejeicao = grafico_taxa_rejeicao_por_time(df_filtrado)
-        if fig_taxa_rejeicao:
-            img_grafico = exportar_grafico_para_pdf(fig_taxa_rejeicao, "Taxa de Rejeição por Time")
-            if img_grafico:
-                story.append(Paragraph("Taxa de Rejeição por Time de Desenvolvimento", styles['Heading3']))
-                story.append(img_grafico)
-                story.append(Spacer(1, 10))
-    except Exception as e:
-        story.append(Paragraph(f"Erro ao gerar taxa de rejeição por time: {e}", styles['Normal']))
+    for chave, titulo, estilo, espaco, mensagem_erro in [
+        ("Status dos Testes", "Distribuição por Status", chart_title_style, 30, "Erro ao gerar gráfico de status"),
+        ("Tarefas por Time", "Tarefas por Time", chart_title_style, 30, "Erro ao gerar gráfico por time"),
+        ("Tarefas Retestadas", "Histórico de Tarefas Retestadas", chart_title_style, 30,
+         "Erro ao gerar gráfico de tarefas retestadas"),
+        ("Motivos de Rejeição", "Principais Motivos de Rejeição", chart_title_style, 15, "Erro ao gerar gráfico de motivos"),
+        ("Ranking de Problemas", "Ranking dos Principais Problemas", styles['Heading3'], 20,
+         "Erro ao gerar ranking de problemas"),
+        ("Taxa de Rejeição por Time", "Taxa de Rejeição por Time de Desenvolvimento", styles['Heading3'], 10,
+         "Erro ao gerar taxa de rejeição por time")
+    ]:
+        adicionar_grafico_pdf(story, imagens, erros_graficos, chave, titulo, estilo, espaco, mensagem_erro, styles['Normal'])
     
     story.append(Spacer(1, 15))
     
@@ -889,11 +896,13 @@ def criar_pdf_relatorio_detalhado(df_filtrado, df_original, df_sem_teste=None):
     story.append(Paragraph("© 2025 DelTech - Todos os direitos reservados", assinatura_style))
     
     # Construir PDF
+    if progresso:
+        progresso(0.9, "Gerando o arquivo PDF")
     doc.build(story)
     buffer.seek(0)
     return buffer
 
-def criar_pdf_visao_geral(df_filtrado, df_original, df_sem_teste=None):
+def criar_pdf_visao_geral(df_filtrado, df_original, df_sem_teste=None, progresso=None, formato='png'):
     """
     Cria um PDF da Visão Geral Estratégica
     """
@@ -901,6 +910,10 @@ def criar_pdf_visao_geral(df_filtrado, df_original, df_sem_teste=None):
         st.error("📄 Bibliotecas PDF não disponíveis. Instale: pip install reportlab kaleido")
         return None
     
+    imagens, erros_graficos = renderizar_graficos_relatorio(df_filtrado, {
+        "Evolução da Qualidade": (grafico_evolucao_qualidade, {'por_ambiente': False})
+    }, progresso, formato)
+    
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4)
     styles = getSampleStyleSheet()
@@ -989,23 +1002,17 @@ def criar_pdf_visao_geral(df_filtrado, df_original, df_sem_teste=None):
     story.append(Paragraph("Análise Visual", styles['Heading2']))
     
     # Gráfico de evolução da qualidade
-    try:
-        fig_evolucao = grafico_evolucao_qualidade(df_filtrado, por_ambiente=False)
-        if fig_evolucao:
-            img_grafico = exportar_grafico_para_pdf(fig_evolucao, "Evolução da Qualidade")
-            if img_grafico:
-                story.append(Paragraph("Evolução da Qualidade", styles['Heading3']))
-                story.append(img_grafico)
-                story.append(Spacer(1, 10))
-    except Exception as e:
-        story.append(Paragraph(f"Erro ao gerar gráfico de evolução: {e}", styles['Normal']))
+    adicionar_grafico_pdf(story, imagens, erros_graficos, "Evolução da Qualidade", "Evolução da Qualidade",
+                          styles['Heading3'], 10, "Erro ao gerar gráfico de evolução", styles['Normal'])
     
     # Construir PDF
+    if progresso:
+        progresso(0.9, "Gerando o arquivo PDF")
     doc.build(story)
     buffer.seek(0)
     return buffer
 
-def criar_pdf_generico(titulo, df_filtrado, graficos_funcoes=None):
+def criar_pdf_generico(titulo, df_filtrado, graficos_funcoes=None, progresso=None, formato='png'):
     """
     Cria um PDF genérico para qualquer aba
     """
@@ -1068,45 +1075,164 @@ def criar_pdf_generico(titulo, df_filtrado, graficos_funcoes=None):
     # Adicionar gráficos se fornecidos
     if graficos_funcoes:
         story.append(Paragraph("Análise Visual", styles['Heading2']))
-        for nome_grafico, funcao_grafico in graficos_funcoes.items():
-            try:
-                fig = funcao_grafico(df_filtrado)
-                if fig:
-                    img_grafico = exportar_grafico_para_pdf(fig, nome_grafico)
-                    if img_grafico:
-                        story.append(Paragraph(nome_grafico, styles['Heading3']))
-                        story.append(img_grafico)
-                        story.append(Spacer(1, 10))
-            except Exception as e:
-                story.append(Paragraph(f"Erro ao gerar {nome_grafico}: {e}", styles['Normal']))
+        imagens, erros_graficos = renderizar_graficos_relatorio(
+            df_filtrado, {nome_grafico: (funcao_grafico, {}) for nome_grafico, funcao_grafico in graficos_funcoes.items()},
+            progresso, formato
+        )
+        for nome_grafico in graficos_funcoes:
+            adicionar_grafico_pdf(story, imagens, erros_graficos, nome_grafico, nome_grafico, styles['Heading3'], 10,
+                                  f"Erro ao gerar {nome_grafico}", styles['Normal'])
     
     # Construir PDF
+    if progresso:
+        progresso(0.9, "Gerando o arquivo PDF")
     doc.build(story)
     buffer.seek(0)
     return buffer
 
+def chave_pdf(nome_relatorio, funcao_exportar, args, formato='png'):
+    """
+    Chave do PDF no cache: relatório, função geradora, formato dos gráficos, dia (a data impressa
+    no documento) e o fingerprint de cada recorte passado (versão dos dados + valores que sobraram
+    dos filtros; ver impressao_digital_recorte)
+    """
+    recortes = tuple(chave_argumento(arg) for arg in args)
+    return (nome_relatorio, funcao_exportar.__name__, formato, date.today().isoformat(), recortes)
+
+# Atualização automática do andamento (st.fragment a partir do Streamlit 1.37; experimental desde o 1.33)
+FRAGMENTO = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+
+def enviar_tarefa_pdf(nome_relatorio, funcao_exportar, args, formato='png'):
+    """
+    Envia a geração do PDF para a fila em segundo plano e guarda o id da tarefa na sessão.
+    A thread da tarefa recebe o contexto desta sessão, para os gráficos lerem o que já foi
+    calculado em st.session_state (tabela de motivos, contexto de análise).
+    """
+    chave = chave_pdf(nome_relatorio, funcao_exportar, args, formato)
+    contexto = get_script_run_ctx()
+    
+    def gerar(informar):
+        thread = threading.current_thread()
+        add_script_run_ctx(thread, contexto)
+        try:
+            def construir():
+                pdf_buffer = funcao_exportar(*args, progresso=informar, formato=formato)
+                return pdf_buffer.getvalue() if pdf_buffer else None
+            return obter_cache_pdf().obter(chave, construir)
+        finally:
+            # A thread volta para o pool: não pode levar o contexto desta sessão para a próxima tarefa
+            add_script_run_ctx(thread, None)
+    
+    tarefa = obter_fila_pdf().enviar(nome_relatorio, gerar)
+    st.session_state.setdefault('tarefas_pdf', {})[nome_relatorio] = tarefa.id
+    return tarefa
+
+def exibir_andamento_pdf(nome_relatorio):
+    """Barra de progresso da tarefa da sessão ou, quando terminada, o download (ou o erro)"""
+    id_tarefa = st.session_state.get('tarefas_pdf', {}).get(nome_relatorio)
+    tarefa = obter_fila_pdf().obter(id_tarefa) if id_tarefa else None
+    if tarefa is None:
+        return None
+    
+    if not tarefa.terminada:
+        st.progress(tarefa.progresso, text=f"⏳ {tarefa.etapa} ({tarefa.segundos:.0f}s)")
+        if FRAGMENTO is None:
+            st.button("🔄 Atualizar andamento", key=f"andamento_{nome_relatorio}")
+    elif tarefa.estado == CONCLUIDA:
+        st.download_button(
+            label=f"⬇️ Download {nome_relatorio}.pdf",
+            data=tarefa.pdf,
+            file_name=f"{nome_relatorio}_{date.today().strftime('%Y%m%d')}.pdf",
+            mime="application/pdf",
+            key=f"download_{nome_relatorio}"
+        )
+        st.success(f"✅ PDF do {nome_relatorio} gerado com sucesso em {tarefa.segundos:.1f}s!")
+    else:
+        st.error(f"❌ Erro ao gerar o PDF do {nome_relatorio}: {tarefa.erro}")
+    return tarefa
+
+def _acompanhar_tarefa_pdf(nome_relatorio):
+    """Corpo do fragmento: quando a tarefa termina, uma execução completa tira o fragmento da página"""
+    tarefa = exibir_andamento_pdf(nome_relatorio)
+    if tarefa is None or tarefa.terminada:
+        st.rerun()
+
 def botao_exportar_pdf(nome_relatorio, funcao_exportar, *args):
     """
-    Cria um botão para exportar PDF
+    Cria um botão para exportar PDF. A geração roda em segundo plano: a página continua
+    respondendo e o download aparece embaixo do botão quando o PDF fica pronto. Com o svglib
+    instalado, cada relatório pode levar os gráficos como imagem ou como desenho vetorial.
     """
+    formato = 'png'
+    if SVG_DISPONIVEL:
+        rotulo = st.radio(
+            "Gráficos no PDF", list(FORMATOS_GRAFICOS_PDF), horizontal=True, key=f"formato_pdf_{nome_relatorio}",
+            help="Vetorial: arquivo menor e gráficos nítidos em qualquer zoom"
+        )
+        formato = FORMATOS_GRAFICOS_PDF[rotulo]
+    
     if st.button(f"📄 Exportar {nome_relatorio} em PDF", key=f"export_{nome_relatorio}"):
-        with st.spinner(f"Gerando PDF do {nome_relatorio}..."):
-            pdf_buffer = funcao_exportar(*args)
-            if pdf_buffer:
-                st.download_button(
-                    label=f"⬇️ Download {nome_relatorio}.pdf",
-                    data=pdf_buffer.getvalue(),
-                    file_name=f"{nome_relatorio}_{date.today().strftime('%Y%m%d')}.pdf",
-                    mime="application/pdf",
-                    key=f"download_{nome_relatorio}"
-                )
-                st.success(f"✅ PDF do {nome_relatorio} gerado com sucesso!")
+        if not PDF_AVAILABLE:
+            st.error("📄 Bibliotecas PDF não disponíveis. Instale: pip install reportlab kaleido")
+            return
+        enviar_tarefa_pdf(nome_relatorio, funcao_exportar, args, formato)
+    
+    id_tarefa = st.session_state.get('tarefas_pdf', {}).get(nome_relatorio)
+    tarefa = obter_fila_pdf().obter(id_tarefa) if id_tarefa else None
+    if tarefa is not None and not tarefa.terminada and FRAGMENTO is not None:
+        # Só a barra de progresso é reexecutada a cada segundo, não o dashboard inteiro
+        FRAGMENTO(run_every=1)(_acompanhar_tarefa_pdf)(nome_relatorio)
+    else:
+        exibir_andamento_pdf(nome_relatorio)
+
+# Cache da carga/processamento: chaveado pelo conteúdo (hash do arquivo ou revisão da planilha)
+CACHE_TTL_SEGUNDOS = 3600
+CACHE_MAX_ENTRADAS = 8
+
+@st.cache_data(ttl=CACHE_TTL_SEGUNDOS, max_entries=CACHE_MAX_ENTRADAS, show_spinner=False)
+def ler_excel_em_cache(chave_conteudo, _conteudo):
+    """
+    Lê o Excel enviado uma única vez por conteúdo (os bytes não entram no hash, só a chave).
+    Se o mesmo arquivo já foi processado antes, lê o snapshot Parquet em vez do openpyxl.
+    """
+    df = obter_snapshot_store().carregar(chave_conteudo)
+    if df is not None:
+        return df
+    return ler_excel(_conteudo, colunas=COLUNAS_PLANILHA, dtypes=DTYPES_QA)
+
+@st.cache_resource(show_spinner=False)
+def obter_snapshot_store():
+    """Pasta de snapshots do processo; pasta e retenção configuráveis em [snapshots] nos secrets"""
+    config = {}
+    try:
+        config = dict(st.secrets.get('snapshots', {}))
+    except Exception:
+        pass
+    return SnapshotStore(config.get('pasta', SNAPSHOT_DIR), config.get('retencao', SNAPSHOT_RETENCAO))
+
+def chave_conteudo_dataframe(df):
+    """Chave de conteúdo do DataFrame: a da origem (arquivo/planilha) ou, na falta dela, o hash dos valores"""
+    chave = df.attrs.get('chave_conteudo')
+    if chave:
+        return chave
+    hash_linhas = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return 'df:' + hashlib.sha256(hash_linhas.tobytes() + repr(list(df.columns)).encode()).hexdigest()
+
+# Colunas usadas pelo dashboard; só elas são lidas do Google Sheets
+COLUNAS_ESPERADAS = ['Data', 'Sprint', 'Time', 'Nome da Task', 'Link da Task', 
+                     'Status', 'Responsável', 'Motivo', 'Motivo2', 'Motivo3', 
+                     'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7', 'Ambiente',
+                     'Responsavel pelo teste', 'ID', 'Erros']
+COLUNAS_OPCIONAIS = ['Descrição']
+COLUNAS_PLANILHA = COLUNAS_ESPERADAS + COLUNAS_OPCIONAIS
 
 def carregar_dados():
     # Tentar carregar automaticamente do Google Sheets
     if GOOGLE_SHEETS_AVAILABLE:
         with st.spinner("🔄 Carregando dados do Google Sheets..."):
-            df = load_google_sheets_data_automatically()
+            df = load_google_sheets_data_automatically(
+                colunas=COLUNAS_PLANILHA, snapshot=obter_snapshot_store().mais_recente
+            )
             if df is not None:
                 st.success(f"✅Planilha importada com sucesso! {len(df)} registros encontrados.")
                 return df
@@ -1115,33 +1241,183 @@ def carregar_dados():
     
     # Fallback para upload manual
     st.info("📁 Faça upload do arquivo Excel como alternativa:")
+    if st.checkbox(
+        "📦 Exportação muito grande: ler em blocos (CSV ou xlsx) e calcular só o resumo executivo",
+        key="modo_streaming",
+        help="Para arquivos que não cabem na memória: o arquivo é processado em blocos, sem montar a planilha inteira"
+    ):
+        exibir_resumo_streaming()
+        return None
+    
     uploaded_file = st.file_uploader("Escolha o arquivo Excel", type=['xlsx', 'xls'])
     if uploaded_file is not None:
         try:
-            df = pd.read_excel(uploaded_file)
+            conteudo = uploaded_file.getvalue()
+            chave = f"upload:{hash_conteudo(conteudo)}"
+            df = ler_excel_em_cache(chave, conteudo)
+            df.attrs['chave_conteudo'] = chave
             st.success(f"✅ Arquivo carregado com sucesso! {len(df)} registros encontrados.")
             return df
         except Exception as e:
             st.error(f"Erro ao carregar arquivo: {e}")
             return None
     
-    return None
+    # Sem upload: só o último snapshot da planilha configurada pode ser exibido. Snapshots de
+    # arquivos enviados (upload:*) são de quem enviou e nunca aparecem para outras sessões.
+    prefixo = prefixo_snapshot_planilha() if GOOGLE_SHEETS_AVAILABLE else None
+    if not prefixo:
+        return None
+    df = obter_snapshot_store().mais_recente(prefixo=prefixo)
+    if df is not None:
+        st.info(
+            f"🗂️ Exibindo o último snapshot salvo ({df.attrs['snapshot_em'].strftime('%d/%m/%Y %H:%M')}, "
+            f"{len(df)} registros). Envie um arquivo para atualizar."
+        )
+    return df
 
-def processar_dados(df):
+def texto_atualizacao_dados(df):
+    """Data da cópia dos dados: momento da última sincronização da planilha ou, no upload, o registro mais recente"""
+    atualizado_em = df.attrs.get('atualizado_em')
+    if atualizado_em is not None:
+        texto = atualizado_em.strftime('%d/%m/%Y %H:%M')
+        if df.attrs.get('atualizando'):
+            texto += " (atualizando em segundo plano...)"
+        conferencia = df.attrs.get('conferencia_completa_em')
+        if conferencia is not None:
+            # Sincronização incremental: só linhas novas foram lidas desde a última leitura completa
+            texto += f" · edições em linhas antigas aparecem até {conferencia.strftime('%d/%m %H:%M')}"
+        return texto
+    if 'Data' in df.columns:
+        data_max = pd.to_datetime(df['Data'], errors='coerce').max()
+        if pd.notna(data_max):
+            return data_max.strftime('%d/%m/%Y')
+    return "não informado"
+
+# Schema aplicado na carga: colunas de baixa cardinalidade como category (além de Motivo..Motivo7)
+ORDEM_STATUS = ['APROVADA', 'REJEITADA', 'PRONTO PARA PUBLICAÇÃO']
+COLUNAS_CATEGORICAS = ['Status', 'Time', 'Sprint', 'Responsável', 'Ambiente', 'Responsavel pelo teste']
+
+def aplicar_schema(df):
+    """Converte as colunas repetitivas para category (Status com ordem estável) e 'Erros' para inteiro anulável"""
+    for col in COLUNAS_CATEGORICAS + MOTIVOS_COLS:
+        if col not in df.columns or isinstance(df[col].dtype, pd.CategoricalDtype):
+            continue
+        if col == 'Status':
+            # Status fora da lista conhecida entram no fim, para não virarem NaN
+            extras = sorted(set(df[col].dropna().unique()) - set(ORDEM_STATUS), key=str)
+            df[col] = pd.Categorical(df[col], categories=ORDEM_STATUS + extras, ordered=True)
+        else:
+            df[col] = df[col].astype('category')
+    
+    if 'Erros' in df.columns:
+        df['Erros'] = pd.to_numeric(df['Erros'], errors='coerce').round().astype('Int64')
+    
+    return df
+
+def relatorio_memoria(memoria_antes, memoria_depois):
+    """Tabela de uso de memória por coluna (KB) antes e depois do schema"""
+    relatorio = pd.DataFrame({
+        'Antes (KB)': memoria_antes / 1024,
+        'Depois (KB)': memoria_depois / 1024
+    }).drop(index='Index', errors='ignore')
+    relatorio['Redução (%)'] = (1 - relatorio['Depois (KB)'] / relatorio['Antes (KB)']) * 100
+    return relatorio.round(1).sort_values('Antes (KB)', ascending=False)
+
+# Colunas dos filtros avançados (selectbox) indexadas na carga
+COLUNAS_FILTRO = ['Sprint', 'Status', 'Time', 'Responsável']
+
+def construir_indice_filtros(df):
+    """Índice dos filtros avançados: máscara booleana por valor de cada coluna e datas ordenadas em int64"""
+    indice = {'n_linhas': len(df), 'mascaras': {}}
+    
+    for col in COLUNAS_FILTRO:
+        if col not in df.columns:
+            continue
+        codigos, valores = pd.factorize(df[col])
+        mascaras = {}
+        for codigo, valor in enumerate(valores):
+            # A chave é o texto exibido no selectbox (valores como 5 e '5' caem na mesma máscara)
+            chave = str(valor)
+            mascara = codigos == codigo
+            mascaras[chave] = mascaras[chave] | mascara if chave in mascaras else mascara
+        indice['mascaras'][col] = mascaras
+    
+    if 'Data' in df.columns:
+        datas = df['Data'].to_numpy(dtype='datetime64[ns]').view('int64')
+        com_data = np.flatnonzero(df['Data'].notna().to_numpy())
+        ordem = com_data[np.argsort(datas[com_data], kind='stable')]
+        indice['posicoes_por_data'] = ordem
+        indice['datas_ordenadas'] = datas[ordem]
+    
+    return indice
+
+def opcoes_filtro(indice, coluna):
+    """Opções do selectbox de uma coluna filtrável, a partir do índice"""
+    return ['Todos'] + sorted(indice['mascaras'].get(coluna, {}))
+
+def mascara_periodo(indice, inicio, fim):
+    """Linhas com Data entre inicio e fim (inclusive), por searchsorted no array de datas ordenado"""
+    mascara = np.zeros(indice['n_linhas'], dtype=bool)
+    if 'datas_ordenadas' not in indice:
+        return mascara
+    limites = np.array([np.datetime64(inicio, 'D'), np.datetime64(fim, 'D') + 1]).astype('datetime64[ns]').view('int64')
+    primeiro, ultimo = np.searchsorted(indice['datas_ordenadas'], limites, side='left')
+    mascara[indice['posicoes_por_data'][primeiro:ultimo]] = True
+    return mascara
+
+def aplicar_filtros(df, indice, selecoes, periodo=None):
+    """Monta o recorte filtrado intersectando as máscaras do índice, sem copiar o DataFrame completo"""
+    mascara = None
+    for coluna, valor in selecoes.items():
+        if valor == 'Todos':
+            continue
+        mascara_valor = indice['mascaras'].get(coluna, {}).get(valor)
+        if mascara_valor is None:
+            mascara_valor = np.zeros(indice['n_linhas'], dtype=bool)
+        # Sem &= para não alterar as máscaras guardadas no índice
+        mascara = mascara_valor if mascara is None else mascara & mascara_valor
+    
+    if periodo is not None:
+        mascara_datas = mascara_periodo(indice, *periodo)
+        mascara = mascara_datas if mascara is None else mascara & mascara_datas
+    
+    return df if mascara is None else df[mascara]
+
+@st.cache_data(ttl=CACHE_TTL_SEGUNDOS, max_entries=CACHE_MAX_ENTRADAS, show_spinner=False)
+def _processar_dados_em_cache(chave_conteudo, _df):
+    """Conversões, schema e tabela longa de motivos, feitos uma vez por conteúdo"""
+    df = _df.copy()
+    memoria_antes = df.memory_usage(deep=True)
+    
     if 'Data' in df.columns:
         df['Data'] = pd.to_datetime(df['Data'], errors='coerce')
     
+    df = aplicar_schema(df)
+    df.attrs['chave_conteudo'] = chave_conteudo
+    memoria = relatorio_memoria(memoria_antes, df.memory_usage(deep=True))
+    
     # Manter status original - não substituir "PRONTO PARA PUBLICAÇÃO"
     
-    colunas_esperadas = ['Data', 'Sprint', 'Time', 'Nome da Task', 'Link da Task', 
-                        'Status', 'Responsável', 'Motivo', 'Motivo2', 'Motivo3', 
-                        'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7', 'Ambiente',
-                        'Responsavel pelo teste', 'ID', 'Erros']
+    colunas_faltantes = [col for col in COLUNAS_ESPERADAS if col not in df.columns]
+    
+    # Tabela longa de motivos montada uma única vez por carga (base de todos os gráficos de motivos)
+    return df, construir_tabela_motivos(df), colunas_faltantes, memoria, construir_indice_filtros(df)
+
+def processar_dados(df):
+    chave_conteudo = chave_conteudo_dataframe(df)
+    df, tabela_motivos, colunas_faltantes, memoria, indice_filtros = _processar_dados_em_cache(chave_conteudo, df)
+    
+    # Snapshot Parquet versionado da carga processada (próximos boots partem dele). Fora da função
+    # em cache para valer igual em acertos e faltas; salvar não regrava uma chave que já existe.
+    obter_snapshot_store().salvar(df, chave_conteudo)
     
-    colunas_faltantes = [col for col in colunas_esperadas if col not in df.columns]
     if colunas_faltantes:
         st.warning(f"Colunas não encontradas: {colunas_faltantes}")
     
+    registrar_tabela_motivos(df, tabela_motivos)
+    st.session_state['relatorio_memoria'] = memoria
+    st.session_state['indice_filtros'] = indice_filtros
+    
     return df
 
 def separar_dados_sem_teste(df):
@@ -1159,99 +1435,196 @@ def separar_dados_sem_teste(df):
         return com_teste, sem_teste
     return df, pd.DataFrame()
 
+MOTIVOS_COLS = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
+MOTIVOS_NAO_BUG = ['aprovada', 'sem recusa']
+
+def empilhar_motivos(df):
+    """Empilha Motivo..Motivo7 em formato longo (posição da linha + motivo normalizado), sem os não-bugs"""
+    motivos_existentes = [col for col in MOTIVOS_COLS if col in df.columns]
+    if df.empty or not motivos_existentes:
+        return pd.DataFrame({'posicao': pd.Series(dtype='int64'), 'Motivo': pd.Series(dtype=object)})
+    
+    # Ordem linha a linha (Motivo, Motivo2, ...) igual à dos loops antigos
+    valores = pd.Series(df[motivos_existentes].to_numpy(dtype=object).ravel())
+    posicoes = np.repeat(np.arange(len(df)), len(motivos_existentes))
+    
+    preenchidos = valores.notna().to_numpy()
+    motivos = valores[preenchidos].astype(str).str.strip()
+    validos = ((motivos != '') & ~motivos.str.lower().isin(MOTIVOS_NAO_BUG)).to_numpy()
+    
+    return pd.DataFrame({
+        'posicao': posicoes[preenchidos][validos],
+        'Motivo': motivos[validos].to_numpy()
+    })
+
+def contar_motivos_por_linha(df):
+    """Quantidade de motivos válidos (bugs) em cada linha, alinhada ao índice do DataFrame"""
+    posicoes = empilhar_motivos(df)['posicao'].to_numpy()
+    return pd.Series(np.bincount(posicoes, minlength=len(df)), index=df.index)
+
+MOTIVOS_CONTEXTO_COLS = ['Time', 'Responsável', 'Responsavel pelo teste', 'Ambiente', 'Data', 'Status']
+
+def construir_tabela_motivos(df):
+    """Tabela longa de motivos (uma linha por bug) com o contexto da linha de origem e o índice original em 'linha'"""
+    empilhado = empilhar_motivos(df)
+    posicoes = empilhado['posicao'].to_numpy()
+
+    tabela = pd.DataFrame({'linha': df.index.to_numpy()[posicoes]})
+    for col in MOTIVOS_CONTEXTO_COLS:
+        if col in df.columns:
+            tabela[col] = df[col].iloc[posicoes].reset_index(drop=True)
+
+    # Motivo categórico: os agrupamentos trabalham sobre os códigos inteiros
+    tabela['Motivo'] = empilhado['Motivo'].astype('category')
+    return tabela
+
+def registrar_tabela_motivos(df, tabela=None):
+    """Guarda na sessão a tabela longa de motivos da carga atual junto com a chave de conteúdo e o índice de origem"""
+    if tabela is None:
+        tabela = construir_tabela_motivos(df)
+    st.session_state['tabela_motivos'] = (df.attrs.get('chave_conteudo'), df.index, tabela)
+
+def motivos_do_recorte(df, apenas_rejeitadas=True):
+    """
+    Recorte da tabela longa de motivos para as linhas de df (filtrado pelo índice, sem reprocessar
+    os motivos). O índice só identifica as linhas dentro da mesma carga: de outra carga, ou sem
+    chave de conteúdo, os motivos são recalculados a partir de df.
+    """
+    registro = st.session_state.get('tabela_motivos')
+    chave = df.attrs.get('chave_conteudo')
+    if registro is not None and chave and registro[0] == chave:
+        _, indice_base, tabela = registro
+        if df.index.equals(indice_base):
+            recorte = tabela
+        elif len(df) <= len(indice_base) and df.index.isin(indice_base).all():
+            recorte = tabela[tabela['linha'].isin(df.index)]
+        else:
+            recorte = construir_tabela_motivos(df)
+    else:
+        recorte = construir_tabela_motivos(df)
+
+    if apenas_rejeitadas and 'Status' in recorte.columns:
+        recorte = recorte[recorte['Status'] == 'REJEITADA']
+    return recorte
+
+def contar_ocorrencias(serie):
+    """value_counts sem as categorias que não aparecem no recorte"""
+    contagem = serie.value_counts()
+    return contagem[contagem > 0]
+
+def _mascara_sem_erros_coluna(df_filtrado):
+    """Registros sem dados na coluna 'Erros' (dados históricos), que são contados pelos motivos"""
+    if 'Erros' not in df_filtrado.columns:
+        return pd.Series(True, index=df_filtrado.index)
+    return df_filtrado['Erros'].isna() | (pd.to_numeric(df_filtrado['Erros'], errors='coerce').fillna(0) == 0)
+
+def _somar_erros_hibridos_por(df_filtrado, coluna):
+    """Soma a coluna 'Erros' e os motivos históricos agrupando por uma coluna (Time, testador...)"""
+    por_erros = pd.Series(dtype=float)
+    
+    # 1. Contar erros da coluna 'Erros' (dados mais recentes)
+    if 'Erros' in df_filtrado.columns:
+        erros = pd.to_numeric(df_filtrado['Erros'], errors='coerce').fillna(0)
+        com_erros = erros > 0
+        por_erros = erros[com_erros].groupby(df_filtrado.loc[com_erros, coluna], sort=False, dropna=False, observed=True).sum()
+    
+    # 2. Para registros sem dados na coluna 'Erros', usar análise de motivos (dados históricos)
+    df_historico = df_filtrado[_mascara_sem_erros_coluna(df_filtrado) & (df_filtrado['Status'] == 'REJEITADA')]
+    por_motivos = contar_motivos_por_linha(df_historico).groupby(df_historico[coluna], sort=False, dropna=False, observed=True).sum()
+    
+    if por_erros.empty:
+        resultado = por_motivos
+    else:
+        # Manter a ordem de primeira aparição (erros numéricos primeiro, depois históricos)
+        chaves = por_erros.index.append(por_motivos.index[~por_motivos.index.isin(por_erros.index)])
+        resultado = por_erros.reindex(chaves, fill_value=0) + por_motivos.reindex(chaves, fill_value=0)
+    
+    return resultado.sort_values(ascending=False) if not resultado.empty else pd.Series(dtype=int)
+
 def contar_bugs_por_time(df_rejeitadas):
     """Conta todos os bugs por time considerando Motivo, Motivo2 e Motivo3"""
     if df_rejeitadas.empty:
         return pd.Series(dtype=int)
     
-    bugs_por_time = {}
-    motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-    
-    for _, row in df_rejeitadas.iterrows():
-        time = row.get('Time', 'Desconhecido')
-        if time not in bugs_por_time:
-            bugs_por_time[time] = 0
-        
-        # Conta cada motivo não nulo como um bug separado, excluindo não-bugs
-        for col in motivos_cols:
-            if col in row and pd.notna(row[col]) and str(row[col]).strip() != '':
-                motivo = str(row[col]).strip().lower()
-                if motivo not in ['aprovada', 'sem recusa']:
-                    bugs_por_time[time] += 1
+    # Conta cada motivo não nulo como um bug separado, excluindo não-bugs
+    times = df_rejeitadas['Time'] if 'Time' in df_rejeitadas.columns else pd.Series('Desconhecido', index=df_rejeitadas.index)
+    bugs_por_time = contar_motivos_por_linha(df_rejeitadas).groupby(times, sort=False, dropna=False, observed=True).sum()
     
-    return pd.Series(bugs_por_time).sort_values(ascending=False)
+    return bugs_por_time.sort_values(ascending=False)
 
-def analisar_historico_retestes(df):
+def calcular_historico_retestes(df):
     """Analisa o histórico de retestes das tarefas baseado no ID ou Nome da Task"""
+    vazio = {
+        'total_tarefas_retestadas': 0,
+        'tarefas_aprovadas_apos_reteste': 0,
+        'taxa_aprovacao_apos_reteste': 0,
+        'detalhes_retestes': pd.DataFrame()
+    }
     if df.empty:
-        return {
-            'total_tarefas_retestadas': 0,
-            'tarefas_aprovadas_apos_reteste': 0,
-            'taxa_aprovacao_apos_reteste': 0,
-            'detalhes_retestes': pd.DataFrame()
-        }
+        return vazio
     
     # Usar ID como identificador principal, Nome da Task como fallback
     identificador = 'ID' if 'ID' in df.columns and df['ID'].notna().any() else 'Nome da Task'
     
     if identificador not in df.columns:
-        return {
-            'total_tarefas_retestadas': 0,
-            'tarefas_aprovadas_apos_reteste': 0,
-            'taxa_aprovacao_apos_reteste': 0,
-            'detalhes_retestes': pd.DataFrame()
-        }
+        return vazio
+    
+    # Ordenar por identificador e data: cada tarefa vira um bloco contíguo em ordem temporal
+    df_sorted = df[df[identificador].notna()].sort_values([identificador, 'Data'], kind='stable')
+    chave = df_sorted[identificador]
+    status = df_sorted['Status'].astype(object)
+    
+    rejeitada = status.eq('REJEITADA')
+    aprovada = status.isin(['APROVADA', 'PRONTO PARA PUBLICAÇÃO'])
+    
+    # Aprovação com alguma rejeição antes dela no mesmo bloco (rejeição acumulada, deslocada uma linha)
+    rejeicao_anterior = rejeitada.groupby(chave, sort=False).cummax().groupby(chave, sort=False).shift(fill_value=False)
+    
+    valores_chave = chave.to_numpy()
+    inicio_bloco = np.r_[True, valores_chave[1:] != valores_chave[:-1]]
+    fim_bloco = np.r_[inicio_bloco[1:], True]
+    primeiras = df_sorted[inicio_bloco]
+    ultimas = df_sorted[fim_bloco]
+    
+    agregado = pd.DataFrame({
+        '_chave': chave,
+        '_rejeitada': rejeitada,
+        '_aprovada_apos': aprovada & rejeicao_anterior
+    }).groupby('_chave', sort=True).agg(
+        Total_Testes=('_rejeitada', 'size'),
+        Teve_Rejeicao=('_rejeitada', 'any'),
+        Aprovada_Apos_Reteste=('_aprovada_apos', 'any')
+    )
     
-    # Ordenar por identificador e data para análise temporal
-    df_sorted = df.sort_values([identificador, 'Data']).copy()
-    
-    # Agrupar por identificador para analisar histórico
-    historico_tarefas = []
-    tarefas_retestadas = set()
-    tarefas_aprovadas_apos_reteste = set()
-    
-    for task_id, group in df_sorted.groupby(identificador):
-        if len(group) > 1:  # Tarefa testada mais de uma vez
-            group_sorted = group.sort_values('Data')
-            status_sequence = group_sorted['Status'].tolist()
-            
-            # Verificar se houve rejeição seguida de aprovação
-            teve_rejeicao = any(status in ['REJEITADA'] for status in status_sequence)
-            teve_aprovacao = any(status in ['APROVADA', 'PRONTO PARA PUBLICAÇÃO'] for status in status_sequence)
-            
-            if teve_rejeicao:
-                tarefas_retestadas.add(task_id)
-                
-                # Verificar se foi aprovada após rejeição
-                for i, status in enumerate(status_sequence):
-                    if status == 'REJEITADA' and i < len(status_sequence) - 1:
-                        # Verificar se há aprovação após esta rejeição
-                        status_posteriores = status_sequence[i+1:]
-                        if any(s in ['APROVADA', 'PRONTO PARA PUBLICAÇÃO'] for s in status_posteriores):
-                            tarefas_aprovadas_apos_reteste.add(task_id)
-                            break
-                
-                # Adicionar detalhes do histórico
-                historico_tarefas.append({
-                    'Identificador': task_id,
-                    'Nome_Tarefa': group_sorted['Nome da Task'].iloc[0] if 'Nome da Task' in group_sorted.columns else '',
-                    'Total_Testes': len(group_sorted),
-                    'Sequencia_Status': ' → '.join(status_sequence),
-                    'Aprovada_Apos_Reteste': task_id in tarefas_aprovadas_apos_reteste,
-                    'Primeira_Data': group_sorted['Data'].iloc[0],
-                    'Ultima_Data': group_sorted['Data'].iloc[-1],
-                    'Time': group_sorted['Time'].iloc[0] if 'Time' in group_sorted.columns else '',
-                    'Responsavel': group_sorted['Responsável'].iloc[0] if 'Responsável' in group_sorted.columns else ''
-                })
+    # Tarefa testada mais de uma vez e com pelo menos uma rejeição
+    retestada = ((agregado['Total_Testes'] > 1) & agregado['Teve_Rejeicao']).to_numpy()
+    
+    # Sequência de status só das retestadas, fatiando os blocos contíguos (sem agregação Python por grupo)
+    status_texto = status.astype(str).tolist()
+    inicios = np.flatnonzero(inicio_bloco)[retestada]
+    fins = np.flatnonzero(fim_bloco)[retestada] + 1
+    sequencias = [' → '.join(status_texto[inicio:fim]) for inicio, fim in zip(inicios, fins)]
+    
+    def primeiro_valor(coluna):
+        return primeiras[coluna].to_numpy(dtype=object)[retestada] if coluna in df_sorted.columns else ''
+    
+    df_detalhes = pd.DataFrame({
+        'Identificador': agregado.index.to_numpy()[retestada],
+        'Nome_Tarefa': primeiro_valor('Nome da Task'),
+        'Total_Testes': agregado['Total_Testes'].to_numpy()[retestada],
+        'Sequencia_Status': sequencias,
+        'Aprovada_Apos_Reteste': agregado['Aprovada_Apos_Reteste'].to_numpy()[retestada],
+        'Primeira_Data': primeiras['Data'].to_numpy()[retestada],
+        'Ultima_Data': ultimas['Data'].to_numpy()[retestada],
+        'Time': primeiro_valor('Time'),
+        'Responsavel': primeiro_valor('Responsável')
+    }) if retestada.any() else pd.DataFrame()
     
     # Calcular métricas
-    total_retestadas = len(tarefas_retestadas)
-    total_aprovadas_apos_reteste = len(tarefas_aprovadas_apos_reteste)
+    total_retestadas = len(df_detalhes)
+    total_aprovadas_apos_reteste = int(df_detalhes['Aprovada_Apos_Reteste'].sum()) if total_retestadas > 0 else 0
     taxa_aprovacao_apos_reteste = (total_aprovadas_apos_reteste / total_retestadas * 100) if total_retestadas > 0 else 0
     
-    # Criar DataFrame com detalhes
-    df_detalhes = pd.DataFrame(historico_tarefas)
-    
     return {
         'total_tarefas_retestadas': total_retestadas,
         'tarefas_aprovadas_apos_reteste': total_aprovadas_apos_reteste,
@@ -1259,66 +1632,122 @@ def analisar_historico_retestes(df):
         'detalhes_retestes': df_detalhes
     }
 
+def impressao_digital_recorte(df):
+    """
+    Fingerprint de um recorte: chave de conteúdo da carga + hash de índice, colunas, dtypes e valores.
+    
+    Invariante: recortes com o mesmo fingerprint têm os mesmos dados. copy/assign/fillna e os
+    filtros mantêm df.attrs (e com ele a chave de conteúdo da carga), então só índice e colunas
+    não distinguem um recorte derivado do original; por isso os valores entram no hash.
+    O hash percorre todas as células: dentro de uma execução use impressao_digital_execucao,
+    que calcula uma vez por objeto.
+    """
+    chave = df.attrs.get('chave_conteudo')
+    if not chave:
+        return chave_conteudo_dataframe(df)
+    valores = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    esquema = repr([(coluna, str(tipo)) for coluna, tipo in df.dtypes.items()])
+    return chave + ':' + hashlib.sha256(valores.tobytes() + esquema.encode()).hexdigest()
+
+def chave_argumento(arg):
+    """
+    Parte da chave de cache (figuras, PDFs) para um argumento: DataFrames e Series pelo
+    fingerprint dos valores (o repr do pandas corta objetos grandes com '...'), o resto pelo repr
+    """
+    if isinstance(arg, pd.Series):
+        arg = arg.to_frame()
+    if isinstance(arg, pd.DataFrame):
+        return impressao_digital_execucao(arg)
+    return repr(arg)
+
+@st.cache_data(ttl=CACHE_TTL_SEGUNDOS, max_entries=32, show_spinner=False)
+def _historico_retestes_em_cache(impressao_digital, _df):
+    return calcular_historico_retestes(_df)
+
+class ContextoAnalise:
+    """Resultados derivados (retestes, qualidade unificada, distribuição de erros) calculados uma vez por execução e recorte"""
+    def __init__(self):
+        self.resultados = {}
+        self.impressoes = {}
+        self.calculos = 0
+        self.reaproveitamentos = 0
+    
+    def impressao_digital(self, df):
+        """
+        Fingerprint do recorte calculado uma vez por objeto nesta execução (por id, com weakref
+        para um id reaproveitado por outro DataFrame não herdar o fingerprint). Os recortes não
+        são alterados no lugar depois de filtrados, então o valor vale até o próximo rerun.
+        """
+        entrada = self.impressoes.get(id(df))
+        if entrada is not None and entrada[0]() is df:
+            return entrada[1]
+        impressao = impressao_digital_recorte(df)
+        self.impressoes[id(df)] = (weakref.ref(df), impressao)
+        return impressao
+    
+    def obter(self, nome, df, calcular):
+        chave = (nome, self.impressao_digital(df))
+        if chave in self.resultados:
+            self.reaproveitamentos += 1
+        else:
+            self.calculos += 1
+            self.resultados[chave] = calcular(df)
+        return self.resultados[chave]
+
+def iniciar_contexto_analise():
+    """Descarta os resultados da execução anterior (chamado no início de cada rerun)"""
+    st.session_state['contexto_analise'] = ContextoAnalise()
+    return st.session_state['contexto_analise']
+
+def contexto_analise():
+    """Contexto de análise da execução atual"""
+    contexto = st.session_state.get('contexto_analise')
+    return contexto if contexto is not None else iniciar_contexto_analise()
+
+def impressao_digital_execucao(df):
+    """Fingerprint do recorte, calculado uma vez por DataFrame na execução atual"""
+    return contexto_analise().impressao_digital(df)
+
+def analisar_historico_retestes(df):
+    """Histórico de retestes compartilhado pelos gráficos, métricas e relatório da mesma execução"""
+    impressao = impressao_digital_execucao(df)
+    return contexto_analise().obter(
+        'historico_retestes', df,
+        lambda recorte: _historico_retestes_em_cache(impressao, recorte)
+    )
+
+@st.cache_resource(show_spinner=False)
+def obter_cache_figuras():
+    """Cache de figuras do processo, compartilhado por todas as sessões"""
+    return CacheFiguras()
+
+def grafico_em_cache(funcao):
+    """
+    Serve a figura do cache quando função, recorte (fingerprint dos dados filtrados) e parâmetros
+    (ex.: por_ambiente) são os mesmos da execução anterior. O fingerprint é calculado uma vez por
+    recorte na execução e reaproveitado pelos demais gráficos do mesmo recorte.
+    """
+    @functools.wraps(funcao)
+    def envoltorio(df, *args, **kwargs):
+        chave = (funcao.__name__, impressao_digital_execucao(df), tuple(map(chave_argumento, args)),
+                 tuple((nome, chave_argumento(valor)) for nome, valor in sorted(kwargs.items())))
+        return obter_cache_figuras().obter(chave, lambda: funcao(df, *args, **kwargs))
+    return envoltorio
+
 def contar_total_bugs(df_rejeitadas):
     """Conta o total de bugs considerando Motivo, Motivo2, Motivo3, Motivo4, Motivo5, Motivo6 e Motivo7"""
     if df_rejeitadas.empty:
         return 0
     
-    total_bugs = 0
-    motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-    
-    for _, row in df_rejeitadas.iterrows():
-        # Conta cada motivo não nulo como um bug separado, excluindo não-bugs
-        for col in motivos_cols:
-            if col in row and pd.notna(row[col]) and str(row[col]).strip() != '':
-                motivo = str(row[col]).strip().lower()
-                if motivo not in ['aprovada', 'sem recusa']:
-                    total_bugs += 1
-    
-    return total_bugs
+    # Conta cada motivo não nulo como um bug separado, excluindo não-bugs
+    return len(empilhar_motivos(df_rejeitadas))
 
 def contar_erros_por_time(df_filtrado):
     """Conta erros por time considerando tanto a coluna 'Erros' quanto os motivos de rejeição"""
     if df_filtrado.empty or 'Time' not in df_filtrado.columns:
         return pd.Series(dtype=int)
     
-    erros_por_time = {}
-    
-    # 1. Contar erros da coluna 'Erros' (dados mais recentes)
-    if 'Erros' in df_filtrado.columns:
-        df_temp = df_filtrado.copy()
-        df_temp['Erros'] = pd.to_numeric(df_temp['Erros'], errors='coerce').fillna(0)
-        df_com_erros = df_temp[df_temp['Erros'] > 0]
-        
-        for _, row in df_com_erros.iterrows():
-            time = row.get('Time', 'Desconhecido')
-            if time not in erros_por_time:
-                erros_por_time[time] = 0
-            erros_por_time[time] += row['Erros']
-    
-    # 2. Para registros sem dados na coluna 'Erros', usar análise de motivos (dados históricos)
-    df_sem_erros_coluna = df_filtrado[
-        (~df_filtrado['Erros'].notna()) | 
-        (pd.to_numeric(df_filtrado['Erros'], errors='coerce').fillna(0) == 0)
-    ] if 'Erros' in df_filtrado.columns else df_filtrado
-    
-    # Filtrar apenas rejeitadas para análise de motivos
-    df_rejeitadas_historicas = df_sem_erros_coluna[df_sem_erros_coluna['Status'] == 'REJEITADA']
-    
-    # Contar motivos como erros históricos por time
-    motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-    for _, row in df_rejeitadas_historicas.iterrows():
-        time = row.get('Time', 'Desconhecido')
-        if time not in erros_por_time:
-            erros_por_time[time] = 0
-        
-        for col in motivos_cols:
-            if col in row and pd.notna(row[col]) and str(row[col]).strip() != '':
-                motivo = str(row[col]).strip().lower()
-                if motivo not in ['aprovada', 'sem recusa']:
-                    erros_por_time[time] += 1
-    
-    return pd.Series(erros_por_time).sort_values(ascending=False) if erros_por_time else pd.Series(dtype=int)
+    return _somar_erros_hibridos_por(df_filtrado, 'Time')
 
 def contar_total_erros(df_filtrado):
     """Conta o total de erros considerando tanto a coluna 'Erros' quanto os motivos de rejeição"""
@@ -1333,22 +1762,8 @@ def contar_total_erros(df_filtrado):
         total_erros += erros_numericos.sum()
     
     # 2. Para registros sem dados na coluna 'Erros', usar análise de motivos (dados históricos)
-    df_sem_erros_coluna = df_filtrado[
-        (~df_filtrado['Erros'].notna()) | 
-        (pd.to_numeric(df_filtrado['Erros'], errors='coerce').fillna(0) == 0)
-    ] if 'Erros' in df_filtrado.columns else df_filtrado
-    
-    # Filtrar apenas rejeitadas para análise de motivos
-    df_rejeitadas_historicas = df_sem_erros_coluna[df_sem_erros_coluna['Status'] == 'REJEITADA']
-    
-    # Contar motivos como erros históricos
-    motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-    for _, row in df_rejeitadas_historicas.iterrows():
-        for col in motivos_cols:
-            if col in row and pd.notna(row[col]) and str(row[col]).strip() != '':
-                motivo = str(row[col]).strip().lower()
-                if motivo not in ['aprovada', 'sem recusa']:
-                    total_erros += 1
+    df_rejeitadas_historicas = df_filtrado[_mascara_sem_erros_coluna(df_filtrado) & (df_filtrado['Status'] == 'REJEITADA')]
+    total_erros += len(empilhar_motivos(df_rejeitadas_historicas))
     
     if pd.isna(total_erros) or total_erros == float('inf') or total_erros == float('-inf'):
         return 0
@@ -1376,45 +1791,13 @@ def contar_erros_por_testador(df_filtrado):
     if df_filtrado.empty or 'Responsavel pelo teste' not in df_filtrado.columns:
         return pd.Series(dtype=int)
     
-    erros_por_testador = {}
-    
-    # 1. Contar erros da coluna 'Erros' (dados mais recentes)
-    if 'Erros' in df_filtrado.columns:
-        df_temp = df_filtrado.copy()
-        df_temp['Erros'] = pd.to_numeric(df_temp['Erros'], errors='coerce').fillna(0)
-        df_com_erros = df_temp[df_temp['Erros'] > 0]
-        
-        for _, row in df_com_erros.iterrows():
-            testador = row.get('Responsavel pelo teste', 'Desconhecido')
-            if testador not in erros_por_testador:
-                erros_por_testador[testador] = 0
-            erros_por_testador[testador] += row['Erros']
-    
-    # 2. Para registros sem dados na coluna 'Erros', usar análise de motivos (dados históricos)
-    df_sem_erros_coluna = df_filtrado[
-        (~df_filtrado['Erros'].notna()) | 
-        (pd.to_numeric(df_filtrado['Erros'], errors='coerce').fillna(0) == 0)
-    ] if 'Erros' in df_filtrado.columns else df_filtrado
-    
-    # Filtrar apenas rejeitadas para análise de motivos
-    df_rejeitadas_historicas = df_sem_erros_coluna[df_sem_erros_coluna['Status'] == 'REJEITADA']
-    
-    # Contar motivos como erros históricos por testador
-    motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-    for _, row in df_rejeitadas_historicas.iterrows():
-        testador = row.get('Responsavel pelo teste', 'Desconhecido')
-        if testador not in erros_por_testador:
-            erros_por_testador[testador] = 0
-        
-        for col in motivos_cols:
-            if col in row and pd.notna(row[col]) and str(row[col]).strip() != '':
-                motivo = str(row[col]).strip().lower()
-                if motivo not in ['aprovada', 'sem recusa']:
-                    erros_por_testador[testador] += 1
-    
-    return pd.Series(erros_por_testador).sort_values(ascending=False) if erros_por_testador else pd.Series(dtype=int)
+    return _somar_erros_hibridos_por(df_filtrado, 'Responsavel pelo teste')
 
 def analisar_distribuicao_erros(df_filtrado):
+    """Distribuição de erros compartilhada pelos gráficos e métricas da mesma execução"""
+    return contexto_analise().obter('distribuicao_erros', df_filtrado, calcular_distribuicao_erros)
+
+def calcular_distribuicao_erros(df_filtrado):
     """Analisa a distribuição de erros considerando tanto a coluna 'Erros' quanto os motivos históricos"""
     if df_filtrado.empty:
         return {}
@@ -1426,40 +1809,19 @@ def analisar_distribuicao_erros(df_filtrado):
     testes_com_erro_hibrido = 0
     
     # 1. Contar erros da coluna 'Erros' (dados mais recentes)
-    if 'Erros' in df_filtrado.columns:
-        df_temp = df_filtrado.copy()
-        df_temp['Erros'] = pd.to_numeric(df_temp['Erros'], errors='coerce').fillna(0)
-        df_com_erros = df_temp[df_temp['Erros'] > 0]
+    erros_numericos = pd.to_numeric(df_filtrado['Erros'], errors='coerce').fillna(0) if 'Erros' in df_filtrado.columns else None
+    if erros_numericos is not None:
+        erros_positivos = erros_numericos[erros_numericos > 0]
         
-        total_erros_hibrido += df_com_erros['Erros'].sum()
-        testes_com_erro_hibrido += len(df_com_erros)
+        total_erros_hibrido += erros_positivos.sum()
+        testes_com_erro_hibrido += len(erros_positivos)
     
     # 2. Para registros sem dados na coluna 'Erros', usar análise de motivos (dados históricos)
-    df_sem_erros_coluna = df_filtrado[
-        (~df_filtrado['Erros'].notna()) | 
-        (pd.to_numeric(df_filtrado['Erros'], errors='coerce').fillna(0) == 0)
-    ] if 'Erros' in df_filtrado.columns else df_filtrado
-    
-    # Filtrar apenas rejeitadas para análise de motivos
-    df_rejeitadas_historicas = df_sem_erros_coluna[df_sem_erros_coluna['Status'] == 'REJEITADA']
-    
-    # Contar motivos como erros históricos
-    motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-    testes_historicos_com_erro = set()
-    
-    for idx, row in df_rejeitadas_historicas.iterrows():
-        erros_neste_teste = 0
-        for col in motivos_cols:
-            if col in row and pd.notna(row[col]) and str(row[col]).strip() != '':
-                motivo = str(row[col]).strip().lower()
-                if motivo not in ['aprovada', 'sem recusa']:
-                    erros_neste_teste += 1
-        
-        if erros_neste_teste > 0:
-            total_erros_hibrido += erros_neste_teste
-            testes_historicos_com_erro.add(idx)
+    df_rejeitadas_historicas = df_filtrado[_mascara_sem_erros_coluna(df_filtrado) & (df_filtrado['Status'] == 'REJEITADA')]
+    erros_por_teste_historico = contar_motivos_por_linha(df_rejeitadas_historicas)
     
-    testes_com_erro_hibrido += len(testes_historicos_com_erro)
+    total_erros_hibrido += erros_por_teste_historico.sum()
+    testes_com_erro_hibrido += int((erros_por_teste_historico > 0).sum())
     testes_sem_erro_hibrido = total_testes_real - testes_com_erro_hibrido
     
     # Calcular métricas de distribuição
@@ -1467,14 +1829,10 @@ def analisar_distribuicao_erros(df_filtrado):
     min_erros = 0
     mediana_erros = 0
     
-    if 'Erros' in df_filtrado.columns:
-        df_temp = df_filtrado.copy()
-        df_temp['Erros'] = pd.to_numeric(df_temp['Erros'], errors='coerce').fillna(0)
-        df_com_dados = df_temp[df_temp['Erros'].notna()]
-        if not df_com_dados.empty:
-            max_erros = df_com_dados['Erros'].max()
-            min_erros = df_com_dados['Erros'].min()
-            mediana_erros = df_com_dados['Erros'].median()
+    if erros_numericos is not None and not erros_numericos.empty:
+        max_erros = erros_numericos.max()
+        min_erros = erros_numericos.min()
+        mediana_erros = erros_numericos.median()
     
     analise = {
         'testes_sem_erro': testes_sem_erro_hibrido,
@@ -1491,6 +1849,10 @@ def analisar_distribuicao_erros(df_filtrado):
     return analise
 
 def analisar_qualidade_unificada(df_filtrado):
+    """Análise unificada compartilhada pelas abas e relatórios da mesma execução"""
+    return contexto_analise().obter('qualidade_unificada', df_filtrado, calcular_qualidade_unificada)
+
+def calcular_qualidade_unificada(df_filtrado):
     """Análise unificada combinando motivos qualitativos e erros quantitativos"""
     if df_filtrado.empty:
         return {}
@@ -1508,26 +1870,14 @@ def analisar_qualidade_unificada(df_filtrado):
     # Análise de motivos
     motivos_analysis = {}
     if not df_rejeitadas.empty:
-        motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-        motivos_existentes = [col for col in motivos_cols if col in df_rejeitadas.columns]
-        
-        if motivos_existentes:
-            todos_motivos = []
-            for col in motivos_existentes:
-                motivos = df_rejeitadas[col].dropna().tolist()
-                todos_motivos.extend(motivos)
-            
-            if todos_motivos:
-                motivos_filtrados = [motivo for motivo in todos_motivos 
-                                   if motivo.lower() not in ['aprovada', 'sem recusa']]
-                
-                if motivos_filtrados:
-                    motivos_counts = pd.Series(motivos_filtrados).value_counts()
-                    motivos_analysis = {
-                        'motivos_counts': motivos_counts.to_dict(),
-                        'motivo_mais_comum': motivos_counts.index[0] if len(motivos_counts) > 0 else None,
-                        'total_motivos_registrados': len(motivos_filtrados)
-                    }
+        motivos_counts = contar_ocorrencias(motivos_do_recorte(df_rejeitadas)['Motivo'])
+
+        if not motivos_counts.empty:
+            motivos_analysis = {
+                'motivos_counts': motivos_counts.to_dict(),
+                'motivo_mais_comum': motivos_counts.index[0],
+                'total_motivos_registrados': int(motivos_counts.sum())
+            }
     
     # Combinar análises
     analise_unificada = {
@@ -1568,7 +1918,7 @@ def carregar_dados_bugs():
     
     if uploaded_file_bugs is not None:
         try:
-            df_bugs = pd.read_excel(uploaded_file_bugs)
+            df_bugs = ler_upload_excel(uploaded_file_bugs, dtypes=DTYPES_BUGS)
             # Processar dados de bugs
             if 'Data' in df_bugs.columns:
                 df_bugs['Data'] = pd.to_datetime(df_bugs['Data'], errors='coerce')
@@ -1597,7 +1947,7 @@ def processar_metricas_bugs(df_bugs):
     
     # Análise por status
     if 'Status' in df_bugs.columns:
-        metricas['bugs_por_status'] = df_bugs['Status'].value_counts().to_dict()
+        metricas['bugs_por_status'] = contar_ocorrencias(df_bugs['Status']).to_dict()
         metricas['bugs_abertos'] = sum([v for k, v in metricas['bugs_por_status'].items() 
                                        if any(palavra in k.lower() for palavra in ['pendente', 'aberto', 'em correção'])])
         metricas['bugs_resolvidos'] = sum([v for k, v in metricas['bugs_por_status'].items() 
@@ -1611,7 +1961,7 @@ def processar_metricas_bugs(df_bugs):
     
     # Análise por time
     if 'Time' in df_bugs.columns:
-        metricas['bugs_por_time'] = df_bugs['Time'].value_counts().to_dict()
+        metricas['bugs_por_time'] = contar_ocorrencias(df_bugs['Time']).to_dict()
     
     # Análise por fonte (quem encontrou)
     if 'Encontrado por:' in df_bugs.columns:
@@ -1619,12 +1969,13 @@ def processar_metricas_bugs(df_bugs):
     
     return metricas
 
+@grafico_em_cache
 def grafico_bugs_por_status(df_bugs):
     """Gráfico de distribuição de bugs por status"""
     if df_bugs is None or df_bugs.empty or 'Status' not in df_bugs.columns:
         return None
     
-    status_counts = df_bugs['Status'].value_counts()
+    status_counts = contar_ocorrencias(df_bugs['Status'])
     
     # Mapeamento de cores específico para cada status
     cores_status = {
@@ -1652,6 +2003,7 @@ def grafico_bugs_por_status(df_bugs):
     )
     return fig
 
+@grafico_em_cache
 def grafico_bugs_por_prioridade(df_bugs):
     """Gráfico de bugs por prioridade"""
     if df_bugs is None or df_bugs.empty or 'Prioridade' not in df_bugs.columns:
@@ -1675,12 +2027,13 @@ def grafico_bugs_por_prioridade(df_bugs):
     fig.update_layout(showlegend=False)
     return fig
 
+@grafico_em_cache
 def grafico_bugs_por_time(df_bugs):
     """Gráfico de bugs por time"""
     if df_bugs is None or df_bugs.empty or 'Time' not in df_bugs.columns:
         return None
     
-    time_counts = df_bugs['Time'].value_counts()
+    time_counts = contar_ocorrencias(df_bugs['Time'])
     fig = px.bar(
         y=time_counts.index,
         x=time_counts.values,
@@ -1700,6 +2053,7 @@ def grafico_bugs_por_time(df_bugs):
     )
     return fig
 
+@grafico_em_cache
 def grafico_bugs_fonte_deteccao(df_bugs):
     """Gráfico de fonte de detecção de bugs"""
     if df_bugs is None or df_bugs.empty or 'Encontrado por:' not in df_bugs.columns:
@@ -1718,6 +2072,7 @@ def grafico_bugs_fonte_deteccao(df_bugs):
     )
     return fig
 
+@grafico_em_cache
 def grafico_evolucao_bugs(df_bugs):
     """Gráfico de evolução temporal dos bugs"""
     if df_bugs is None or df_bugs.empty or 'Data' not in df_bugs.columns:
@@ -1748,6 +2103,7 @@ def grafico_evolucao_bugs(df_bugs):
     return fig
 
 
+@grafico_em_cache
 def grafico_status_distribuicao(df_filtrado):
     if 'Status' in df_filtrado.columns:
         # Filtrar registros com Status não vazio
@@ -1756,7 +2112,7 @@ def grafico_status_distribuicao(df_filtrado):
         if df_status_valido.empty:
             return None
             
-        status_counts = df_status_valido['Status'].value_counts()
+        status_counts = contar_ocorrencias(df_status_valido['Status'])
         
         # Definir cores baseadas no status
         color_map = {
@@ -1789,9 +2145,10 @@ def grafico_status_distribuicao(df_filtrado):
         return fig
     return None
 
+@grafico_em_cache
 def grafico_tasks_por_time(df_filtrado):
     if 'Time' in df_filtrado.columns:
-        time_counts = df_filtrado['Time'].value_counts()
+        time_counts = contar_ocorrencias(df_filtrado['Time'])
         fig = px.bar(
             x=time_counts.values, 
             y=time_counts.index,
@@ -1816,9 +2173,10 @@ def grafico_tasks_por_time(df_filtrado):
         return fig
     return None
 
+@grafico_em_cache
 def grafico_responsavel_performance(df_filtrado):
     if 'Responsavel pelo teste' in df_filtrado.columns and 'Status' in df_filtrado.columns:
-        perf_data = df_filtrado.groupby('Responsavel pelo teste')['Status'].value_counts().unstack(fill_value=0)
+        perf_data = df_filtrado.groupby('Responsavel pelo teste', observed=True)['Status'].value_counts().unstack(fill_value=0)
         if not perf_data.empty:
             perf_data['Total'] = perf_data.sum(axis=1)
             perf_data = perf_data.sort_values('Total', ascending=True)
@@ -1846,12 +2204,13 @@ def grafico_responsavel_performance(df_filtrado):
             return fig
     return None
 
+@grafico_em_cache
 def grafico_timeline_tasks(df_filtrado):
     if 'Data' in df_filtrado.columns and 'Status' in df_filtrado.columns:
         df_timeline = df_filtrado.dropna(subset=['Data'])
         if not df_timeline.empty:
             df_timeline['Mes'] = df_timeline['Data'].dt.to_period('M')
-            timeline_data = df_timeline.groupby(['Mes', 'Status']).size().reset_index(name='Count')
+            timeline_data = df_timeline.groupby(['Mes', 'Status'], observed=True).size().reset_index(name='Count')
             timeline_data['Mes'] = timeline_data['Mes'].astype(str)
             
             # Definir cores para os status
@@ -1880,28 +2239,21 @@ def grafico_timeline_tasks(df_filtrado):
             return fig
     return None
 
+@grafico_em_cache
 def grafico_motivos_rejeicao(df_filtrado, por_ambiente=False):
     if 'Status' in df_filtrado.columns:
         df_rejeitadas = df_filtrado[df_filtrado['Status'] == 'REJEITADA']
-        motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-        motivos_existentes = [col for col in motivos_cols if col in df_rejeitadas.columns]
+        motivos_existentes = [col for col in MOTIVOS_COLS if col in df_rejeitadas.columns]
         
         if motivos_existentes and not df_rejeitadas.empty:
+            recorte = motivos_do_recorte(df_rejeitadas)
+            recorte = recorte[~recorte['Motivo'].str.lower().isin(['nan', 'none'])]
+            
             # Se por_ambiente=True e temos coluna Ambiente, criar análise por ambiente
             if por_ambiente and 'Ambiente' in df_rejeitadas.columns and df_rejeitadas['Ambiente'].notna().any():
-                motivos_ambiente = []
-                for _, row in df_rejeitadas.iterrows():
-                    ambiente = row.get('Ambiente', 'N/A')
-                    for col in motivos_existentes:
-                        motivo = row[col]
-                        if (pd.notna(motivo) and 
-                            str(motivo).strip() != '' and 
-                            str(motivo).lower() not in ['aprovada', 'sem recusa', 'nan', 'none']):
-                            motivos_ambiente.append({'Motivo': str(motivo).strip(), 'Ambiente': ambiente})
-                
-                if motivos_ambiente:
-                    df_motivos = pd.DataFrame(motivos_ambiente)
-                    motivos_counts = df_motivos.groupby(['Motivo', 'Ambiente']).size().reset_index(name='Count')
+                if not recorte.empty:
+                    motivos_counts = recorte.groupby(['Motivo', 'Ambiente'], observed=True).size().reset_index(name='Count')
+                    motivos_counts = motivos_counts[motivos_counts['Count'] > 0]
                     motivos_counts = motivos_counts.sort_values('Count', ascending=True).tail(20)
                     
                     fig = px.bar(
@@ -1931,22 +2283,8 @@ def grafico_motivos_rejeicao(df_filtrado, por_ambiente=False):
                     return fig
             else:
                 # Versão original sem ambiente
-                todos_motivos = []
-                for col in motivos_existentes:
-                    motivos = df_rejeitadas[col].dropna().tolist()
-                    todos_motivos.extend(motivos)
-                
-                if todos_motivos:
-                    # Filtrar motivos que não são bugs reais
-                    motivos_filtrados = [str(motivo).strip() for motivo in todos_motivos 
-                                       if (pd.notna(motivo) and 
-                                           str(motivo).strip() != '' and 
-                                           str(motivo).lower() not in ['aprovada', 'sem recusa', 'nan', 'none'])]
-                    
-                    if motivos_filtrados:
-                        motivos_counts = pd.Series(motivos_filtrados).value_counts().head(10)
-                    else:
-                        return None
+                if not recorte.empty:
+                    motivos_counts = contar_ocorrencias(recorte['Motivo']).head(10)
                     fig = px.bar(
                         y=motivos_counts.index,
                         x=motivos_counts.values,
@@ -1975,9 +2313,10 @@ def grafico_motivos_rejeicao(df_filtrado, por_ambiente=False):
 
 
 
+@grafico_em_cache
 def grafico_rejeicoes_por_dev(df_filtrado):
     if 'Status' in df_filtrado.columns and 'Responsável' in df_filtrado.columns:
-        dev_stats = df_filtrado.groupby('Responsável')['Status'].value_counts().unstack(fill_value=0)
+        dev_stats = df_filtrado.groupby('Responsável', observed=True)['Status'].value_counts().unstack(fill_value=0)
         if 'REJEITADA' in dev_stats.columns:
             dev_stats['Total_Tasks'] = dev_stats.sum(axis=1)
             dev_stats['Total_Rejeicoes'] = dev_stats.get('REJEITADA', 0)
@@ -2008,6 +2347,7 @@ def grafico_rejeicoes_por_dev(df_filtrado):
                 return fig
     return None
 
+@grafico_em_cache
 def grafico_evolucao_qualidade(df_filtrado, por_ambiente=False):
     if 'Data' in df_filtrado.columns and 'Status' in df_filtrado.columns:
         df_timeline = df_filtrado.dropna(subset=['Data'])
@@ -2016,7 +2356,7 @@ def grafico_evolucao_qualidade(df_filtrado, por_ambiente=False):
             
             # Se temos informação de ambiente e foi solicitado, mostrar evolução por ambiente
             if por_ambiente and 'Ambiente' in df_filtrado.columns and df_filtrado['Ambiente'].notna().any():
-                monthly_stats = df_timeline.groupby(['Mes', 'Status', 'Ambiente']).size().unstack(fill_value=0)
+                monthly_stats = df_timeline.groupby(['Mes', 'Status', 'Ambiente'], observed=True).size().unstack(fill_value=0)
                 
                 if 'APROVADA' in monthly_stats.columns or 'REJEITADA' in monthly_stats.columns or 'PRONTO PARA PUBLICAÇÃO' in monthly_stats.columns:
                     aprovadas_col = monthly_stats.get('APROVADA', 0) + monthly_stats.get('PRONTO PARA PUBLICAÇÃO', 0)
@@ -2039,7 +2379,7 @@ def grafico_evolucao_qualidade(df_filtrado, por_ambiente=False):
                     return fig
             else:
                 # Versão original sem ambiente
-                monthly_stats = df_timeline.groupby(['Mes', 'Status']).size().unstack(fill_value=0)
+                monthly_stats = df_timeline.groupby(['Mes', 'Status'], observed=True).size().unstack(fill_value=0)
                 
                 if 'APROVADA' in monthly_stats.columns or 'REJEITADA' in monthly_stats.columns or 'PRONTO PARA PUBLICAÇÃO' in monthly_stats.columns:
                     aprovadas_col = monthly_stats.get('APROVADA', 0) + monthly_stats.get('PRONTO PARA PUBLICAÇÃO', 0)
@@ -2061,6 +2401,7 @@ def grafico_evolucao_qualidade(df_filtrado, por_ambiente=False):
                     return fig
     return None
 
+@grafico_em_cache
 def grafico_erros_por_time(df_filtrado):
     """Gráfico mostrando quantidade de erros/bugs identificados por time"""
     if 'Time' in df_filtrado.columns and 'Status' in df_filtrado.columns:
@@ -2091,6 +2432,7 @@ def grafico_erros_por_time(df_filtrado):
             return fig
     return None
 
+@grafico_em_cache
 def grafico_erros_coluna_por_time(df_filtrado):
     """Gráfico mostrando quantidade de erros por time usando a coluna 'Erros'"""
     if 'Erros' not in df_filtrado.columns or 'Time' not in df_filtrado.columns:
@@ -2123,6 +2465,7 @@ def grafico_erros_coluna_por_time(df_filtrado):
     )
     return fig
 
+@grafico_em_cache
 def grafico_erros_por_testador(df_filtrado):
     """Gráfico mostrando quantidade de erros por testador"""
     if ('Erros' not in df_filtrado.columns or 
@@ -2155,6 +2498,7 @@ def grafico_erros_por_testador(df_filtrado):
     )
     return fig
 
+@grafico_em_cache
 def grafico_distribuicao_erros(df_filtrado):
     """Gráfico de distribuição de erros (testes com/sem erro e sem dados)"""
     if 'Erros' not in df_filtrado.columns:
@@ -2183,6 +2527,7 @@ def grafico_distribuicao_erros(df_filtrado):
     )
     return fig
 
+@grafico_em_cache
 def grafico_media_erros_por_time(df_filtrado):
     """Gráfico da média de erros por time usando lógica híbrida"""
     if 'Time' not in df_filtrado.columns:
@@ -2194,7 +2539,7 @@ def grafico_media_erros_por_time(df_filtrado):
         return None
     
     # Contar total de testes por time para calcular a média
-    testes_por_time = df_filtrado.groupby('Time').size()
+    testes_por_time = df_filtrado.groupby('Time', observed=True).size()
     
     # Calcular média de erros por teste por time
     media_erros_time = {}
@@ -2230,29 +2575,18 @@ def grafico_media_erros_por_time(df_filtrado):
     )
     return fig
 
+@grafico_em_cache
 def grafico_distribuicao_bugs_tipo(df_filtrado):
     """Gráfico de distribuição dos tipos de bugs mais comuns"""
     if 'Status' in df_filtrado.columns:
         df_rejeitadas = df_filtrado[df_filtrado['Status'] == 'REJEITADA']
-        motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-        motivos_existentes = [col for col in motivos_cols if col in df_rejeitadas.columns]
+        motivos_existentes = [col for col in MOTIVOS_COLS if col in df_rejeitadas.columns]
         
         if motivos_existentes and not df_rejeitadas.empty:
-            todos_motivos = []
-            for col in motivos_existentes:
-                motivos = df_rejeitadas[col].dropna().tolist()
-                todos_motivos.extend(motivos)
-            
-            if todos_motivos:
-                # Filtrar motivos que não são bugs reais
-                motivos_filtrados = [motivo for motivo in todos_motivos 
-                                   if motivo.lower() not in ['aprovada', 'sem recusa']]
-                
-                if motivos_filtrados:
-                    motivos_counts = pd.Series(motivos_filtrados).value_counts().head(8)
-                else:
-                    return None
-                
+            # Motivos que não são bugs reais já ficam fora da tabela longa
+            motivos_counts = contar_ocorrencias(motivos_do_recorte(df_rejeitadas)['Motivo']).head(8)
+            
+            if not motivos_counts.empty:
                 fig = px.pie(
                     values=motivos_counts.values,
                     names=motivos_counts.index,
@@ -2270,6 +2604,7 @@ def grafico_distribuicao_bugs_tipo(df_filtrado):
                 return fig
     return None
 
+@grafico_em_cache
 def grafico_heatmap_atividade(df_filtrado):
     """Heatmap de atividade de testes por dia da semana e hora"""
     if 'Data' in df_filtrado.columns:
@@ -2308,6 +2643,7 @@ def grafico_heatmap_atividade(df_filtrado):
                 return fig
     return None
 
+@grafico_em_cache
 def grafico_motivos_por_time(df_filtrado):
     if df_filtrado.empty or 'Time' not in df_filtrado.columns:
         return None
@@ -2316,25 +2652,12 @@ def grafico_motivos_por_time(df_filtrado):
     if df_rejeitadas.empty:
         return None
     
-    motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-    motivos_existentes = [col for col in motivos_cols if col in df_rejeitadas.columns]
+    motivos_existentes = [col for col in MOTIVOS_COLS if col in df_rejeitadas.columns]
     
     if not motivos_existentes:
         return None
     
-    dados_motivos = []
-    for _, row in df_rejeitadas.iterrows():
-        time = row.get('Time', 'N/A')
-        for col in motivos_existentes:
-            motivo = row.get(col)
-            if pd.notna(motivo) and motivo.lower() not in ['aprovada', 'sem recusa', ''] and str(motivo).strip() != '':
-                dados_motivos.append({'Time': time})
-    
-    if not dados_motivos:
-        return None
-    
-    df_motivos = pd.DataFrame(dados_motivos)
-    total_por_time = df_motivos['Time'].value_counts().sort_values(ascending=False)
+    total_por_time = contar_ocorrencias(motivos_do_recorte(df_rejeitadas)['Time'])
     
     if total_por_time.empty:
         return None
@@ -2362,6 +2685,7 @@ def grafico_motivos_por_time(df_filtrado):
     
     return fig
 
+@grafico_em_cache
 def grafico_motivos_por_desenvolvedor(df_filtrado):
     if df_filtrado.empty or 'Responsável' not in df_filtrado.columns:
         return None
@@ -2370,25 +2694,12 @@ def grafico_motivos_por_desenvolvedor(df_filtrado):
     if df_rejeitadas.empty:
         return None
     
-    motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-    motivos_existentes = [col for col in motivos_cols if col in df_rejeitadas.columns]
+    motivos_existentes = [col for col in MOTIVOS_COLS if col in df_rejeitadas.columns]
     
     if not motivos_existentes:
         return None
     
-    dados_motivos = []
-    for _, row in df_rejeitadas.iterrows():
-        dev = row.get('Responsável', 'N/A')
-        for col in motivos_existentes:
-            motivo = row.get(col)
-            if pd.notna(motivo) and motivo.lower() not in ['aprovada', 'sem recusa', ''] and str(motivo).strip() != '':
-                dados_motivos.append({'Desenvolvedor': dev})
-    
-    if not dados_motivos:
-        return None
-    
-    df_motivos = pd.DataFrame(dados_motivos)
-    total_por_dev = df_motivos['Desenvolvedor'].value_counts().sort_values(ascending=False).head(10)
+    total_por_dev = contar_ocorrencias(motivos_do_recorte(df_rejeitadas)['Responsável']).head(10)
     
     if total_por_dev.empty:
         return None
@@ -2416,6 +2727,7 @@ def grafico_motivos_por_desenvolvedor(df_filtrado):
     
     return fig
 
+@grafico_em_cache
 def grafico_ranking_problemas(df_filtrado):
     if df_filtrado.empty:
         return None
@@ -2424,25 +2736,16 @@ def grafico_ranking_problemas(df_filtrado):
     if df_rejeitadas.empty:
         return None
     
-    motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-    motivos_existentes = [col for col in motivos_cols if col in df_rejeitadas.columns]
+    motivos_existentes = [col for col in MOTIVOS_COLS if col in df_rejeitadas.columns]
     
     if not motivos_existentes:
         return None
     
-    todos_motivos = []
-    for col in motivos_existentes:
-        motivos = df_rejeitadas[col].dropna().tolist()
-        todos_motivos.extend(motivos)
+    ranking_motivos = contar_ocorrencias(motivos_do_recorte(df_rejeitadas)['Motivo']).head(10)
     
-    motivos_filtrados = [motivo for motivo in todos_motivos 
-                        if motivo.lower() not in ['aprovada', 'sem recusa', '']]
-    
-    if not motivos_filtrados:
+    if ranking_motivos.empty:
         return None
     
-    ranking_motivos = pd.Series(motivos_filtrados).value_counts().head(10)
-    
     fig = px.bar(
         x=ranking_motivos.values,
         y=ranking_motivos.index,
@@ -2469,6 +2772,7 @@ def grafico_ranking_problemas(df_filtrado):
     
     return fig
 
+@grafico_em_cache
 def grafico_motivos_recusa_por_dev(df_filtrado):
     """Gráfico mostrando total de rejeições por desenvolvedor"""
     if 'Status' in df_filtrado.columns and 'Responsável' in df_filtrado.columns:
@@ -2476,7 +2780,7 @@ def grafico_motivos_recusa_por_dev(df_filtrado):
         
         if not df_rejeitadas.empty:
             # Contar total de rejeições por desenvolvedor
-            rejeicoes_por_dev = df_rejeitadas['Responsável'].value_counts()
+            rejeicoes_por_dev = contar_ocorrencias(df_rejeitadas['Responsável'])
             
             # Filtrar apenas desenvolvedores com pelo menos 2 rejeições
             devs_relevantes = rejeicoes_por_dev[rejeicoes_por_dev >= 2]
@@ -2505,10 +2809,11 @@ def grafico_motivos_recusa_por_dev(df_filtrado):
                 return fig
     return None
 
+@grafico_em_cache
 def grafico_cobertura_testes_por_dev(df_filtrado):
     """Gráfico de cobertura de testes por desenvolvedor"""
     if 'Responsável' in df_filtrado.columns and 'Status' in df_filtrado.columns:
-        dev_stats = df_filtrado.groupby('Responsável').agg({
+        dev_stats = df_filtrado.groupby('Responsável', observed=True).agg({
             'Status': ['count', lambda x: (x.isin(['APROVADA', 'REJEITADA', 'PRONTO PARA PUBLICAÇÃO'])).sum()]
         }).round(1)
         
@@ -2540,13 +2845,14 @@ def grafico_cobertura_testes_por_dev(df_filtrado):
             return fig
     return None
 
+@grafico_em_cache
 def grafico_ranking_aprovadas_por_dev(df_filtrado):
     """Gráfico de ranking de desenvolvedores com mais tarefas aprovadas"""
     if 'Status' in df_filtrado.columns and 'Responsável' in df_filtrado.columns:
         df_aprovadas = df_filtrado[df_filtrado['Status'].isin(['APROVADA', 'PRONTO PARA PUBLICAÇÃO'])]
         
         if not df_aprovadas.empty:
-            aprovadas_por_dev = df_aprovadas['Responsável'].value_counts().head(10)
+            aprovadas_por_dev = contar_ocorrencias(df_aprovadas['Responsável']).head(10)
             
             if not aprovadas_por_dev.empty:
                 fig = px.bar(
@@ -2569,6 +2875,7 @@ def grafico_ranking_aprovadas_por_dev(df_filtrado):
                 return fig
     return None
 
+@grafico_em_cache
 def grafico_tarefas_retestadas(df_filtrado):
     """Gráfico de tarefas que tiveram mais de 1 teste"""
     historico_retestes = analisar_historico_retestes(df_filtrado)
@@ -2582,7 +2889,7 @@ def grafico_tarefas_retestadas(df_filtrado):
     
     # Agrupar por time se disponível
     if 'Time' in df_retestes.columns:
-        retestes_por_time = df_retestes.groupby('Time').agg({
+        retestes_por_time = df_retestes.groupby('Time', observed=True).agg({
             'Total_Testes': 'sum',
             'Aprovada_Apos_Reteste': 'sum'
         }).reset_index()
@@ -2618,13 +2925,14 @@ def grafico_tarefas_retestadas(df_filtrado):
     
     return None
 
+@grafico_em_cache
 def grafico_tarefas_retestadas_por_dev(df_filtrado):
     """Gráfico de quantidade de tarefas retestadas por desenvolvedor"""
     if 'Responsável' in df_filtrado.columns and 'Status' in df_filtrado.columns:
         df_retestadas = df_filtrado[df_filtrado['Status'] == 'REJEITADA']
         
         if not df_retestadas.empty:
-            retestadas_por_dev = df_retestadas['Responsável'].value_counts().head(10)
+            retestadas_por_dev = contar_ocorrencias(df_retestadas['Responsável']).head(10)
             
             if not retestadas_por_dev.empty:
                 fig = px.bar(
@@ -2647,10 +2955,11 @@ def grafico_tarefas_retestadas_por_dev(df_filtrado):
                 return fig
     return None
 
+@grafico_em_cache
 def grafico_taxa_rejeicao_por_time(df_filtrado):
     """Gráfico da taxa de rejeição por time"""
     if 'Time' in df_filtrado.columns and 'Status' in df_filtrado.columns:
-        time_stats = df_filtrado.groupby('Time')['Status'].value_counts().unstack(fill_value=0)
+        time_stats = df_filtrado.groupby('Time', observed=True)['Status'].value_counts().unstack(fill_value=0)
         
         if not time_stats.empty:
             time_stats['Total'] = time_stats.sum(axis=1)
@@ -2688,6 +2997,7 @@ def grafico_taxa_rejeicao_por_time(df_filtrado):
                 return fig
     return None
 
+@grafico_em_cache
 def grafico_distribuicao_ambientes(df_filtrado):
     """Gráfico de distribuição de testes por ambiente"""
     if 'Ambiente' in df_filtrado.columns:
@@ -2698,7 +3008,7 @@ def grafico_distribuicao_ambientes(df_filtrado):
             return None
             
         # Contar distribuição por ambiente
-        ambiente_counts = df_ambiente_valido['Ambiente'].value_counts()
+        ambiente_counts = contar_ocorrencias(df_ambiente_valido['Ambiente'])
         
         if not ambiente_counts.empty:
             # Criar gráfico de pizza
@@ -2725,6 +3035,7 @@ def grafico_distribuicao_ambientes(df_filtrado):
             return fig
     return None
 
+@grafico_em_cache
 def grafico_ambiente_por_status(df_filtrado):
     """Gráfico de status por ambiente"""
     if 'Ambiente' in df_filtrado.columns and 'Status' in df_filtrado.columns:
@@ -2762,10 +3073,11 @@ def grafico_ambiente_por_status(df_filtrado):
             return fig
     return None
 
+@grafico_em_cache
 def grafico_comparativo_testadores(df_filtrado):
     """Gráfico comparativo de produtividade entre testadores"""
     if 'Responsavel pelo teste' in df_filtrado.columns and 'Status' in df_filtrado.columns:
-        testador_stats = df_filtrado.groupby('Responsavel pelo teste').agg({
+        testador_stats = df_filtrado.groupby('Responsavel pelo teste', observed=True).agg({
             'Status': ['count', lambda x: (x == 'REJEITADA').sum(), lambda x: (x == 'APROVADA').sum(), lambda x: (x == 'PRONTO PARA PUBLICAÇÃO').sum()]
         }).round(1)
         
@@ -2826,26 +3138,219 @@ def grafico_comparativo_testadores(df_filtrado):
 
 
 
-def metricas_resumo(df_filtrado, df_original, df_sem_teste=None):
-    # Cabeçalho executivo
-    st.markdown("#### 📈 **Resumo Executivo - Impacto do Time de Qualidade**")
-    
-    # Cálculos principais
-    total_planilha = len(df_filtrado) + (len(df_sem_teste) if df_sem_teste is not None else 0)
+def calcular_metricas_resumo(df_filtrado, df_sem_teste=None):
+    """Números do resumo executivo (o modo streaming monta o mesmo dicionário bloco a bloco)"""
+    tem_status = 'Status' in df_filtrado.columns
     
     # Verificar se a coluna 'Responsavel pelo teste' existe
     if 'Responsavel pelo teste' in df_filtrado.columns:
         total_testes_efetuados = len(df_filtrado[df_filtrado['Responsavel pelo teste'].notna()])
     else:
         # Se não existir, usar uma estimativa baseada em status diferentes de vazio
-        total_testes_efetuados = len(df_filtrado[df_filtrado['Status'].notna()]) if 'Status' in df_filtrado.columns else len(df_filtrado)
-    
-    total_sem_teste = len(df_sem_teste) if df_sem_teste is not None else 0
+        total_testes_efetuados = len(df_filtrado[df_filtrado['Status'].notna()]) if tem_status else len(df_filtrado)
     
     # Métricas de bugs
-    df_rejeitadas = df_filtrado[df_filtrado['Status'] == 'REJEITADA'] if 'Status' in df_filtrado.columns else pd.DataFrame()
-    total_bugs_encontrados = contar_total_bugs(df_rejeitadas) if not df_rejeitadas.empty else 0
-    aprovadas = len(df_filtrado[df_filtrado['Status'] == 'APROVADA']) if 'Status' in df_filtrado.columns else 0
+    df_rejeitadas = df_filtrado[df_filtrado['Status'] == 'REJEITADA'] if tem_status else pd.DataFrame()
+    
+    # Situação dos motivos das rejeitadas (define o card "Principal Tipo de Defeito")
+    motivos_counts = pd.Series(dtype=int)
+    motivos_existentes = [col for col in MOTIVOS_COLS if col in df_rejeitadas.columns]
+    if df_rejeitadas.empty:
+        situacao_motivos = 'sem_rejeicoes'
+    elif not motivos_existentes:
+        situacao_motivos = 'colunas_ausentes'
+    elif not df_rejeitadas[motivos_existentes].notna().any().any():
+        situacao_motivos = 'nao_preenchidos'
+    else:
+        situacao_motivos = 'preenchidos'
+        motivos_counts = contar_ocorrencias(motivos_do_recorte(df_rejeitadas)['Motivo'])
+    
+    tem_erros = 'Erros' in df_filtrado.columns
+    return {
+        'total_planilha': len(df_filtrado) + (len(df_sem_teste) if df_sem_teste is not None else 0),
+        'total_testes_efetuados': total_testes_efetuados,
+        'total_sem_teste': len(df_sem_teste) if df_sem_teste is not None else 0,
+        'total_bugs_encontrados': contar_total_bugs(df_rejeitadas) if not df_rejeitadas.empty else 0,
+        'aprovadas': len(df_filtrado[df_filtrado['Status'] == 'APROVADA']) if tem_status else 0,
+        'rejeitadas': len(df_rejeitadas),
+        'prontas': len(df_filtrado[df_filtrado['Status'] == 'PRONTO PARA PUBLICAÇÃO']) if tem_status else 0,
+        'tarefas_unicas': df_filtrado['Nome da Task'].nunique() if 'Nome da Task' in df_filtrado.columns else 0,
+        'times_atendidos': df_filtrado['Time'].nunique() if 'Time' in df_filtrado.columns else 0,
+        'tem_coluna_erros': tem_erros,
+        'total_erros': contar_total_erros(df_filtrado) if tem_erros else 0,
+        'media_erros': calcular_media_erros_por_teste(df_filtrado) if tem_erros else 0,
+        'distribuicao_erros': analisar_distribuicao_erros(df_filtrado) if tem_erros else {},
+        'bugs_por_time': (contar_bugs_por_time(df_rejeitadas)
+                          if not df_rejeitadas.empty and 'Time' in df_rejeitadas.columns else pd.Series(dtype=int)),
+        'situacao_motivos': situacao_motivos,
+        'motivos': motivos_counts
+    }
+
+class ResumoIncremental:
+    """
+    Agregações do resumo executivo alimentadas bloco a bloco (modo streaming para exportações grandes).
+    Cada bloco passa pelas mesmas regras do calcular_metricas_resumo; só contadores, somas e os
+    conjuntos de tarefas/times ficam em memória.
+    """
+    def __init__(self):
+        self.colunas = set()
+        self.blocos = 0
+        self.total_com_teste = 0
+        self.total_sem_teste = 0
+        self.testes_efetuados = 0
+        self.por_status = Counter()
+        self.por_time = Counter()
+        self.por_sprint = Counter()
+        self.motivos = Counter()
+        self.bugs_por_time = {}
+        self.tarefas = set()
+        self.total_bugs = 0
+        self.rejeitadas = 0
+        self.motivos_preenchidos = False
+        self.soma_erros = 0.0
+        self.erros_historicos = 0
+        self.testes_com_erro = 0
+    
+    def atualizar(self, bloco):
+        self.blocos += 1
+        self.colunas.update(bloco.columns)
+        com_teste, sem_teste = separar_dados_sem_teste(bloco)
+        self.total_com_teste += len(com_teste)
+        self.total_sem_teste += len(sem_teste)
+        
+        if 'Responsavel pelo teste' in com_teste.columns:
+            self.testes_efetuados += int(com_teste['Responsavel pelo teste'].notna().sum())
+        elif 'Status' in com_teste.columns:
+            self.testes_efetuados += int(com_teste['Status'].notna().sum())
+        else:
+            self.testes_efetuados += len(com_teste)
+        
+        for coluna, contador in (('Status', self.por_status), ('Time', self.por_time), ('Sprint', self.por_sprint)):
+            if coluna in com_teste.columns:
+                contador.update(com_teste[coluna].value_counts().to_dict())
+        if 'Nome da Task' in com_teste.columns:
+            self.tarefas.update(com_teste['Nome da Task'].dropna().unique())
+        
+        if 'Status' not in com_teste.columns:
+            return
+        rejeitadas = com_teste[com_teste['Status'] == 'REJEITADA']
+        self.rejeitadas += len(rejeitadas)
+        motivos_existentes = [col for col in MOTIVOS_COLS if col in rejeitadas.columns]
+        if not rejeitadas.empty and motivos_existentes:
+            self.motivos_preenchidos |= bool(rejeitadas[motivos_existentes].notna().any().any())
+            empilhado = empilhar_motivos(rejeitadas)
+            self.total_bugs += len(empilhado)
+            self.motivos.update(empilhado['Motivo'].value_counts().to_dict())
+            if 'Time' in rejeitadas.columns:
+                # Ordem de primeira aparição, como no groupby(sort=False) do contar_bugs_por_time
+                por_time = contar_motivos_por_linha(rejeitadas).groupby(rejeitadas['Time'], sort=False, dropna=False).sum()
+                for time_bloco, bugs in por_time.items():
+                    chave = None if pd.isna(time_bloco) else time_bloco
+                    self.bugs_por_time[chave] = self.bugs_por_time.get(chave, 0) + int(bugs)
+        
+        if 'Erros' in com_teste.columns:
+            erros = pd.to_numeric(com_teste['Erros'], errors='coerce').fillna(0)
+            self.soma_erros += float(erros.sum())
+            self.testes_com_erro += int((erros > 0).sum())
+            historicas = com_teste[_mascara_sem_erros_coluna(com_teste) & (com_teste['Status'] == 'REJEITADA')]
+            por_linha = contar_motivos_por_linha(historicas)
+            self.erros_historicos += int(por_linha.sum())
+            self.testes_com_erro += int((por_linha > 0).sum())
+    
+    def metricas(self):
+        """Mesmo dicionário do calcular_metricas_resumo, para o exibir_metricas_resumo"""
+        tem_erros = 'Erros' in self.colunas
+        total_erros = int(self.soma_erros + self.erros_historicos) if tem_erros else 0
+        
+        if not self.rejeitadas:
+            situacao_motivos = 'sem_rejeicoes'
+        elif not any(col in self.colunas for col in MOTIVOS_COLS):
+            situacao_motivos = 'colunas_ausentes'
+        elif not self.motivos_preenchidos:
+            situacao_motivos = 'nao_preenchidos'
+        else:
+            situacao_motivos = 'preenchidos'
+        
+        bugs_por_time = pd.Series(
+            list(self.bugs_por_time.values()),
+            index=[np.nan if time_bugs is None else time_bugs for time_bugs in self.bugs_por_time],
+            dtype='int64'
+        ).sort_values(ascending=False)
+        motivos = pd.Series(self.motivos, dtype='int64').sort_index()
+        
+        return {
+            'total_planilha': self.total_com_teste + self.total_sem_teste,
+            'total_testes_efetuados': self.testes_efetuados,
+            'total_sem_teste': self.total_sem_teste,
+            'total_bugs_encontrados': self.total_bugs,
+            'aprovadas': self.por_status.get('APROVADA', 0),
+            'rejeitadas': self.rejeitadas,
+            'prontas': self.por_status.get('PRONTO PARA PUBLICAÇÃO', 0),
+            'tarefas_unicas': len(self.tarefas),
+            'times_atendidos': sum(1 for quantidade in self.por_time.values() if quantidade > 0),
+            'tem_coluna_erros': tem_erros,
+            'total_erros': total_erros,
+            'media_erros': round(total_erros / self.total_com_teste, 2) if tem_erros and self.total_com_teste else 0,
+            'distribuicao_erros': {
+                'testes_com_erro': self.testes_com_erro,
+                'total_testes': self.total_com_teste,
+                'total_erros': total_erros
+            } if tem_erros and self.total_com_teste else {},
+            'bugs_por_time': bugs_por_time if 'Time' in self.colunas else pd.Series(dtype=int),
+            'situacao_motivos': situacao_motivos,
+            'motivos': motivos[motivos > 0].sort_values(ascending=False, kind='stable')
+        }
+
+@st.cache_data(ttl=CACHE_TTL_SEGUNDOS, max_entries=CACHE_MAX_ENTRADAS, show_spinner=False)
+def calcular_resumo_streaming(chave_conteudo, nome_arquivo, _arquivo):
+    """Lê o arquivo em blocos e devolve as métricas do resumo e as contagens por Status/Time/Sprint"""
+    resumo = ResumoIncremental()
+    for bloco in ler_em_blocos(_arquivo, nome_arquivo, colunas=COLUNAS_PLANILHA):
+        resumo.atualizar(bloco)
+    contagens = {
+        coluna: pd.Series(contador, dtype='int64').sort_values(ascending=False)
+        for coluna, contador in (('Status', resumo.por_status), ('Time', resumo.por_time), ('Sprint', resumo.por_sprint))
+        if contador
+    }
+    return resumo.metricas(), contagens, resumo.blocos
+
+def exibir_resumo_streaming():
+    """Modo streaming: só o resumo executivo de uma exportação grande, sem carregar o arquivo inteiro em memória"""
+    arquivo = st.file_uploader("Escolha o arquivo CSV ou Excel (.xlsx)", type=['csv', 'xlsx'], key="upload_streaming")
+    if arquivo is None:
+        st.caption("O arquivo é lido em blocos; só as agregações do resumo executivo ficam em memória.")
+        return
+    
+    try:
+        with st.spinner("📦 Lendo o arquivo em blocos..."):
+            chave = f"upload:{hash_conteudo(arquivo.getvalue())}"
+            metricas, contagens, blocos = calcular_resumo_streaming(chave, arquivo.name, arquivo)
+    except Exception as e:
+        st.error(f"Erro ao ler o arquivo em blocos: {e}")
+        return
+    
+    st.success(f"✅ {arquivo.name}: {metricas['total_planilha']:,} registros lidos em {blocos} bloco(s).")
+    exibir_metricas_resumo(metricas)
+    
+    with st.expander("📊 Contagens por Status, Time e Sprint"):
+        colunas_contagem = st.columns(max(len(contagens), 1))
+        for coluna_tela, (coluna, contagem) in zip(colunas_contagem, contagens.items()):
+            with coluna_tela:
+                st.dataframe(contagem.rename('Registros').rename_axis(coluna), use_container_width=True)
+
+def metricas_resumo(df_filtrado, df_original, df_sem_teste=None):
+    exibir_metricas_resumo(calcular_metricas_resumo(df_filtrado, df_sem_teste))
+
+def exibir_metricas_resumo(metricas):
+    # Cabeçalho executivo
+    st.markdown("#### 📈 **Resumo Executivo - Impacto do Time de Qualidade**")
+    
+    # Cálculos principais
+    total_planilha = metricas['total_planilha']
+    total_testes_efetuados = metricas['total_testes_efetuados']
+    total_sem_teste = metricas['total_sem_teste']
+    total_bugs_encontrados = metricas['total_bugs_encontrados']
+    aprovadas = metricas['aprovadas']
     
     # === SEÇÃO 1: MÉTRICAS DE VOLUME E COBERTURA ===
     st.markdown("##### 🎯 **Volume de Trabalho e Cobertura**")
@@ -2861,10 +3366,7 @@ def metricas_resumo(df_filtrado, df_original, df_sem_teste=None):
         )
     
     with col2:
-        if 'Nome da Task' in df_filtrado.columns:
-            tarefas_unicas = df_filtrado['Nome da Task'].nunique()
-        else:
-            tarefas_unicas = 0
+        tarefas_unicas = metricas['tarefas_unicas']
         st.metric(
             "📋 Tarefas Validadas", 
             f"{tarefas_unicas:,}",
@@ -2873,10 +3375,7 @@ def metricas_resumo(df_filtrado, df_original, df_sem_teste=None):
         )
     
     with col3:
-        if 'Time' in df_filtrado.columns:
-            times_atendidos = df_filtrado['Time'].nunique()
-        else:
-            times_atendidos = 0
+        times_atendidos = metricas['times_atendidos']
         st.metric(
             "🏢 Times Atendidos", 
             f"{times_atendidos}",
@@ -2900,7 +3399,7 @@ def metricas_resumo(df_filtrado, df_original, df_sem_teste=None):
     
     with col6:
         taxa_deteccao = (total_bugs_encontrados / total_testes_efetuados * 100) if total_testes_efetuados > 0 else 0
-        rejeitadas = len(df_filtrado[df_filtrado['Status'] == 'REJEITADA']) if 'Status' in df_filtrado.columns else 0
+        rejeitadas = metricas['rejeitadas']
         st.metric(
             "🔍 Bugs Encontrados (%)", 
             f"{taxa_deteccao:.1f}%",
@@ -2909,9 +3408,9 @@ def metricas_resumo(df_filtrado, df_original, df_sem_teste=None):
         )
     
     with col7:
-        prontas_dash = len(df_filtrado[df_filtrado['Status'] == 'PRONTO PARA PUBLICAÇÃO']) if 'Status' in df_filtrado.columns else 0
+        prontas_dash = metricas['prontas']
         total_aprovadas_dash = aprovadas + prontas_dash
-        rejeitadas_dash = len(df_filtrado[df_filtrado['Status'] == 'REJEITADA']) if 'Status' in df_filtrado.columns else 0
+        rejeitadas_dash = metricas['rejeitadas']
         taxa_aprovacao = (total_aprovadas_dash / (total_aprovadas_dash + rejeitadas_dash) * 100) if (total_aprovadas_dash + rejeitadas_dash) > 0 else 0
         st.metric(
             "✅ Taxa de Aprovação", 
@@ -2921,12 +3420,12 @@ def metricas_resumo(df_filtrado, df_original, df_sem_teste=None):
         )
     
     # === SEÇÃO 3: ANÁLISE DE ERROS ===
-    if 'Erros' in df_filtrado.columns:
+    if metricas['tem_coluna_erros']:
         st.markdown("##### 🐛 **Análise de Erros Encontrados**")
         col_e1, col_e2, col_e3 = st.columns(3)
         
         with col_e1:
-            total_erros = contar_total_erros(df_filtrado)
+            total_erros = metricas['total_erros']
             tempo_correcao_estimado = total_erros * 45  # 45 min por erro em média
             st.metric(
                 "🔢 Total de Erros", 
@@ -2936,7 +3435,7 @@ def metricas_resumo(df_filtrado, df_original, df_sem_teste=None):
             )
         
         with col_e2:
-            media_erros = calcular_media_erros_por_teste(df_filtrado)
+            media_erros = metricas['media_erros']
             classificacao = "Baixa" if media_erros < 2 else "Média" if media_erros < 4 else "Alta"
             st.metric(
                 "📊 Média de Erros/Teste", 
@@ -2946,7 +3445,7 @@ def metricas_resumo(df_filtrado, df_original, df_sem_teste=None):
             )
         
         with col_e3:
-            distribuicao_erros = analisar_distribuicao_erros(df_filtrado)
+            distribuicao_erros = metricas['distribuicao_erros']
             if distribuicao_erros:
                 testes_com_erro = distribuicao_erros['testes_com_erro']
                 total_testes_real = distribuicao_erros['total_testes']
@@ -2964,65 +3463,54 @@ def metricas_resumo(df_filtrado, df_original, df_sem_teste=None):
     col9, col10, col11 = st.columns(3)
     
     with col9:
-        if not df_rejeitadas.empty and 'Time' in df_rejeitadas.columns:
-            bugs_por_time = contar_bugs_por_time(df_rejeitadas)
-            if not bugs_por_time.empty:
-                time_critico = bugs_por_time.index[0]
-                bugs_time_critico = bugs_por_time.iloc[0]
+        bugs_por_time = metricas['bugs_por_time']
+        if not bugs_por_time.empty:
+            time_critico = bugs_por_time.index[0]
+            bugs_time_critico = bugs_por_time.iloc[0]
+            st.metric(
+                "🚨 Time com Maior Risco", 
+                f"{time_critico}",
+                delta=f"🐛 {bugs_time_critico} defeitos encontrados",
+                delta_color="inverse",
+                help=f"Time {time_critico} apresentou {bugs_time_critico} defeitos no período - requer atenção especial e revisão de processos"
+            )
+    
+    with col10:
+        situacao_motivos = metricas['situacao_motivos']
+        if situacao_motivos == 'preenchidos':
+            motivos_counts = metricas['motivos']
+            
+            if not motivos_counts.empty:
+                motivo_mais_comum = motivos_counts.index[0]
+                ocorrencias_motivo = motivos_counts.iloc[0]
                 st.metric(
-                    "🚨 Time com Maior Risco", 
-                    f"{time_critico}",
-                    delta=f"🐛 {bugs_time_critico} defeitos encontrados",
+                    "🔍 Principal Tipo de Defeito", 
+                    motivo_mais_comum,
+                    delta=f"📊 {ocorrencias_motivo}x identificado no período",
                     delta_color="inverse",
-                    help=f"Time {time_critico} apresentou {bugs_time_critico} defeitos no período - requer atenção especial e revisão de processos"
+                    help=f"Defeito mais frequente: '{motivo_mais_comum}' com {ocorrencias_motivo} ocorrências - oportunidade de melhoria no processo de desenvolvimento"
                 )
-    
-    with col10:
-        if not df_rejeitadas.empty:
-            motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-            motivos_existentes = [col for col in motivos_cols if col in df_rejeitadas.columns]
-            
-            if motivos_existentes:
-                todos_motivos = []
-                for col in motivos_existentes:
-                    motivos = df_rejeitadas[col].dropna().tolist()
-                    todos_motivos.extend(motivos)
-                
-                if todos_motivos:
-                    motivos_filtrados = [motivo for motivo in todos_motivos 
-                                       if motivo.lower() not in ['aprovada', 'sem recusa'] and str(motivo).strip() != '']
-                    
-                    if motivos_filtrados:
-                        motivo_mais_comum = pd.Series(motivos_filtrados).value_counts().index[0]
-                        ocorrencias_motivo = pd.Series(motivos_filtrados).value_counts().iloc[0]
-                        st.metric(
-                            "🔍 Principal Tipo de Defeito", 
-                            motivo_mais_comum,
-                            delta=f"📊 {ocorrencias_motivo}x identificado no período",
-                            delta_color="inverse",
-                            help=f"Defeito mais frequente: '{motivo_mais_comum}' com {ocorrencias_motivo} ocorrências - oportunidade de melhoria no processo de desenvolvimento"
-                        )
-                    else:
-                        st.metric(
-                            "🔍 Principal Tipo de Defeito", 
-                            "Nenhum defeito",
-                            delta="📊 Sem motivos válidos no período",
-                            help="Não foram encontrados motivos de defeito válidos no período filtrado"
-                        )
-                else:
-                    st.metric(
-                        "🔍 Principal Tipo de Defeito", 
-                        "Sem dados",
-                        delta="📊 Motivos não preenchidos",
-                        help="As colunas de motivos estão vazias para as tarefas rejeitadas"
-                    )
             else:
                 st.metric(
                     "🔍 Principal Tipo de Defeito", 
-                    "Colunas ausentes",
-                    delta="📊 Motivo, Motivo2, Motivo3, Motivo4, Motivo5, Motivo6, Motivo7 não encontradas",
-                    help="As colunas de motivos não foram encontradas nos dados"
+                    "Nenhum defeito",
+                    delta="📊 Sem motivos válidos no período",
+                    help="Não foram encontrados motivos de defeito válidos no período filtrado"
                 )
+        elif situacao_motivos == 'nao_preenchidos':
+            st.metric(
+                "🔍 Principal Tipo de Defeito", 
+                "Sem dados",
+                delta="📊 Motivos não preenchidos",
+                help="As colunas de motivos estão vazias para as tarefas rejeitadas"
+            )
+        elif situacao_motivos == 'colunas_ausentes':
+            st.metric(
+                "🔍 Principal Tipo de Defeito", 
+                "Colunas ausentes",
+                delta="📊 Motivo, Motivo2, Motivo3, Motivo4, Motivo5, Motivo6, Motivo7 não encontradas",
+                help="As colunas de motivos não foram encontradas nos dados"
+            )
         else:
             st.metric(
                 "🔍 Principal Tipo de Defeito", 
@@ -3045,7 +3533,110 @@ def metricas_resumo(df_filtrado, df_original, df_sem_teste=None):
     # Seção removida conforme solicitação
 
 
+# ===== NAVEGAÇÃO POR ABAS (SOB DEMANDA) =====
+
+NOMES_ABAS = ["📌 Visão Geral Estratégica", "🛡️ Prevenção e Qualidade", "🏁 Visão por Sprint", "🧑‍🤝‍🧑 Visão por Testador", "📋 Tarefas Sem Teste", "🔢 Análise de Erros", "🐛 Análise de Bugs", "📊 Relatório"]
+
+class AbaDashboard:
+    """Container de uma aba; `with aba as ativa` informa se o conteúdo deve rodar e mede o tempo gasto nela"""
+    def __init__(self, container, nome, ativa, tempos):
+        self.container = container
+        self.nome = nome
+        self.ativa = ativa
+        self.tempos = tempos
+    
+    def __enter__(self):
+        self.container.__enter__()
+        self.inicio = time.perf_counter()
+        return self.ativa
+    
+    def __exit__(self, *exc_info):
+        if self.ativa:
+            # Acumula: uma mesma aba pode ser preenchida em mais de um bloco
+            self.tempos[self.nome] = self.tempos.get(self.nome, 0) + time.perf_counter() - self.inicio
+        return self.container.__exit__(*exc_info)
+
+def criar_abas(nomes, sob_demanda, tempos):
+    """Cria as abas do dashboard; no modo sob demanda só a aba selecionada executa"""
+    if not sob_demanda:
+        return [AbaDashboard(container, nome, True, tempos) for container, nome in zip(st.tabs(nomes), nomes)]
+    
+    if 'on_change' in inspect.signature(st.tabs).parameters:
+        containers = st.tabs(nomes, key="aba_selecionada", on_change="rerun")
+        return [AbaDashboard(container, nome, bool(container.open), tempos) for container, nome in zip(containers, nomes)]
+    
+    # Versões do Streamlit sem execução preguiçosa em st.tabs: navegação por radio horizontal
+    selecionada = st.radio("Navegação", nomes, horizontal=True, key="aba_selecionada", label_visibility="collapsed")
+    container = st.container()
+    return [AbaDashboard(container, nome, nome == selecionada, tempos) for nome in nomes]
+
+def exibir_tempos_abas(tempos_execucao):
+    """Tempo de renderização de cada aba (última execução em que ela rodou)"""
+    tempos_abas = st.session_state.setdefault('tempos_abas', {})
+    tempos_abas.update(tempos_execucao)
+    
+    with st.sidebar.expander("⏱️ Tempo por Aba"):
+        contexto = contexto_analise()
+        st.caption(f"Análises calculadas: {contexto.calculos} | reaproveitadas: {contexto.reaproveitamentos}")
+        figuras = obter_cache_figuras().estatisticas()
+        st.caption(
+            f"Gráficos em cache: {figuras['entradas']} ({figuras['mb']:.1f} MB) | "
+            f"acertos: {figuras['acertos']} | montados: {figuras['faltas']} | descartados: {figuras['descartes']}"
+        )
+        for nome in NOMES_ABAS:
+            if nome in tempos_execucao:
+                st.write(f"**{nome}**: {tempos_execucao[nome]:.2f}s (nesta execução)")
+            elif nome in tempos_abas:
+                st.write(f"{nome}: {tempos_abas[nome]:.2f}s (última vez aberta)")
+            else:
+                st.write(f"{nome}: ainda não aberta")
+
+def exibir_estatisticas_renderizador():
+    """Estado do renderizador de gráficos dos PDFs e latência por gráfico"""
+    estatisticas = obter_renderizador().estatisticas()
+    st.markdown("**Renderizador de gráficos (PDF):**")
+    if estatisticas['erro_inicio']:
+        st.error(f"❌ Navegador não iniciou: {estatisticas['erro_inicio']}")
+        st.caption("Gráficos de barras e pizza saem desenhados direto no ReportLab; os demais ficam de fora do PDF.")
+    elif estatisticas['ativo']:
+        st.success(f"✅ Chromium aberto ({estatisticas['processos']} abas, iniciado em {estatisticas['tempo_inicio']:.1f}s)")
+    elif not estatisticas['lotes']:
+        st.caption("Inicia no primeiro PDF gerado.")
+    
+    cache_pdf = obter_cache_pdf().estatisticas()
+    st.caption(
+        f"PDFs em cache: {cache_pdf['entradas']} ({cache_pdf['mb']:.1f} MB) | "
+        f"acertos: {cache_pdf['acertos']} | gerados: {cache_pdf['faltas']} "
+        f"({cache_pdf['segundos_gerando']:.1f}s) | descartados: {cache_pdf['descartes']}"
+    )
+    
+    fila_pdf = obter_fila_pdf().estatisticas()
+    st.caption(
+        f"Fila de PDFs: {fila_pdf['gerando']} gerando | {fila_pdf['na_fila']} na fila | "
+        f"{fila_pdf['concluidas']} concluídas | {fila_pdf['falhas']} falhas"
+    )
+    
+    cache_png = obter_cache_png().estatisticas()
+    st.caption(
+        f"Imagens em cache (PNG/SVG): {cache_png['arquivos']} ({cache_png['mb']:.1f} MB) | "
+        f"acertos: {cache_png['acertos']} | renderizados: {cache_png['faltas']} | descartados: {cache_png['descartes']}"
+    )
+    
+    if estatisticas['graficos']:
+        st.caption(
+            f"Gráficos: {estatisticas['graficos']} ({estatisticas['falhas']} falhas) | "
+            f"latência média: {estatisticas['latencia_media'] or 0:.2f}s | máxima: {estatisticas['latencia_max'] or 0:.2f}s"
+        )
+        ultimo = estatisticas['ultimo_lote']
+        st.caption(f"Último lote: {ultimo['graficos']} gráfico(s) em {ultimo['segundos']:.2f}s")
+        st.dataframe(pd.DataFrame(estatisticas['recentes']).rename(columns={
+            'titulo': 'Gráfico', 'segundos': 'Segundos', 'ok': 'OK'
+        }).round(2), use_container_width=True, hide_index=True)
+
 def main():
+    # Resultados derivados valem só para esta execução
+    iniciar_contexto_analise()
+    
     # Diagnóstico do sistema (expansível)
     with st.sidebar.expander("🔍 Diagnóstico do Sistema"):
         if st.button("Executar Diagnóstico"):
@@ -3080,6 +3671,8 @@ def main():
                         st.error("❌ Falha no teste de gráfico")
                 except Exception as e:
                     st.error(f"❌ Erro no teste: {e}")
+        
+        exibir_estatisticas_renderizador()
     
     # Módulo de QA (código original)
     # Título principal
@@ -3092,27 +3685,44 @@ def main():
     df = carregar_dados()
     
     if df is not None:
+        data_atualizacao = texto_atualizacao_dados(df)
         df = processar_dados(df)
         
+        # Economia de memória do schema categórico (dados completos, antes dos filtros)
+        memoria = st.session_state.get('relatorio_memoria')
+        if memoria is not None:
+            with st.sidebar.expander("💾 Memória dos Dados"):
+                total_antes = memoria['Antes (KB)'].sum() / 1024
+                total_depois = memoria['Depois (KB)'].sum() / 1024
+                st.metric(
+                    "Uso de memória",
+                    f"{total_depois:.1f} MB",
+                    delta=f"-{total_antes - total_depois:.1f} MB (antes: {total_antes:.1f} MB)",
+                    delta_color="inverse"
+                )
+                st.dataframe(memoria, use_container_width=True)
+        
+        indice_filtros = st.session_state['indice_filtros']
+        
         # Filtros avançados
         st.subheader("🔍 Filtros Avançados")
         
         col1, col2, col3, col4, col5 = st.columns(5)
         
         with col1:
-            sprints_disponiveis = ['Todos'] + sorted([str(x) for x in df['Sprint'].dropna().unique().tolist()]) if 'Sprint' in df.columns else ['Todos']
+            sprints_disponiveis = opcoes_filtro(indice_filtros, 'Sprint')
             sprint_selecionado = st.selectbox("Filtrar por Sprint:", sprints_disponiveis)
         
         with col2:
-            status_disponiveis = ['Todos'] + sorted([str(x) for x in df['Status'].dropna().unique().tolist()]) if 'Status' in df.columns else ['Todos']
+            status_disponiveis = opcoes_filtro(indice_filtros, 'Status')
             status_selecionado = st.selectbox("Filtrar por Status:", status_disponiveis)
         
         with col3:
-            times_disponiveis = ['Todos'] + sorted([str(x) for x in df['Time'].dropna().unique().tolist()]) if 'Time' in df.columns else ['Todos']
+            times_disponiveis = opcoes_filtro(indice_filtros, 'Time')
             time_selecionado = st.selectbox("Filtrar por Time:", times_disponiveis)
         
         with col4:
-            devs_disponiveis = ['Todos'] + sorted([str(x) for x in df['Responsável'].dropna().unique().tolist()]) if 'Responsável' in df.columns else ['Todos']
+            devs_disponiveis = opcoes_filtro(indice_filtros, 'Responsável')
             dev_selecionado = st.selectbox("Filtrar por Desenvolvedor:", devs_disponiveis)
         
         with col5:
@@ -3128,26 +3738,18 @@ def main():
             else:
                 data_range = None
         
-        # Aplicar filtros
-        df_filtrado = df.copy()
-        
-        if sprint_selecionado != 'Todos':
-            df_filtrado = df_filtrado[df_filtrado['Sprint'] == sprint_selecionado]
-        
-        if status_selecionado != 'Todos':
-            df_filtrado = df_filtrado[df_filtrado['Status'] == status_selecionado]
-        
-        if time_selecionado != 'Todos':
-            df_filtrado = df_filtrado[df_filtrado['Time'] == time_selecionado]
-        
-        if dev_selecionado != 'Todos':
-            df_filtrado = df_filtrado[df_filtrado['Responsável'] == dev_selecionado]
-        
-        if data_range and len(data_range) == 2 and 'Data' in df.columns:
-            df_filtrado = df_filtrado[
-                (df_filtrado['Data'].dt.date >= data_range[0]) & 
-                (df_filtrado['Data'].dt.date <= data_range[1])
-            ]
+        # Aplicar filtros (interseção das máscaras pré-calculadas na carga)
+        df_filtrado = aplicar_filtros(
+            df,
+            indice_filtros,
+            {
+                'Sprint': sprint_selecionado,
+                'Status': status_selecionado,
+                'Time': time_selecionado,
+                'Responsável': dev_selecionado
+            },
+            periodo=tuple(data_range) if data_range and len(data_range) == 2 and 'Data' in df.columns else None
+        )
         
         # Verificar se há filtros ativos
         filtros_ativos = (
@@ -3168,7 +3770,6 @@ def main():
         else:
             periodo_texto = "Período completo"
         
-        data_atualizacao = datetime.now().strftime("%B %Y")
         placeholder_subtitulo.markdown(
             f"**Período filtrado:** {periodo_texto} | **Dados atualizados até:** {data_atualizacao}"
         )
@@ -3178,208 +3779,216 @@ def main():
         
         st.markdown("---")
         
-        # Criar abas para organizar o dashboard
-        tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs(["📌 Visão Geral Estratégica", "🛡️ Prevenção e Qualidade", "🏁 Visão por Sprint", "🧑‍🤝‍🧑 Visão por Testador", "📋 Tarefas Sem Teste", "🔢 Análise de Erros", "🐛 Análise de Bugs", "📊 Relatório"])
+        # Criar abas para organizar o dashboard (no modo sob demanda só a aba aberta é calculada)
+        sob_demanda = st.sidebar.checkbox(
+            "⚡ Calcular apenas a aba selecionada",
+            value=True,
+            help="Evita processar gráficos e relatórios das abas que não estão sendo vistas"
+        )
+        tempos_execucao = {}
+        tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = criar_abas(NOMES_ABAS, sob_demanda, tempos_execucao)
         
-        with tab1:
-            st.markdown("### 📌 **Visão Geral Estratégica**")
-            st.markdown("*Dashboard Executivo - Impacto e Performance do Time de Qualidade*")
+        with tab1 as ativa:
+            if ativa:
+                st.markdown("### 📌 **Visão Geral Estratégica**")
+                st.markdown("*Dashboard Executivo - Impacto e Performance do Time de Qualidade*")
+            
+                # Botão de exportação PDF
+                col_export_geral, col_space_geral = st.columns([1, 3])
+                with col_export_geral:
+                    botao_exportar_pdf("Visao_Geral_Estrategica", criar_pdf_visao_geral, df_com_teste, df, df_sem_teste)
             
-            # Botão de exportação PDF
-            col_export_geral, col_space_geral = st.columns([1, 3])
-            with col_export_geral:
-                botao_exportar_pdf("Visao_Geral_Estrategica", criar_pdf_visao_geral, df_com_teste, df, df_sem_teste)
+                st.markdown("---")
             
-            st.markdown("---")
+                # === RESUMO EXECUTIVO PARA DIRETORIA ===
+                st.markdown("#### 🎯 **Resumo Executivo - Principais Indicadores**")
             
-            # === RESUMO EXECUTIVO PARA DIRETORIA ===
-            st.markdown("#### 🎯 **Resumo Executivo - Principais Indicadores**")
+                # Calcular métricas principais para o resumo
+                total_planilha = len(df_com_teste) + len(df_sem_teste) if df_sem_teste is not None else len(df_com_teste)
+                total_testes_efetuados = len(df_com_teste)
+                cobertura_teste = (total_testes_efetuados / total_planilha * 100) if total_planilha > 0 else 0
+                aprovadas = len(df_com_teste[df_com_teste['Status'] == 'APROVADA']) if 'Status' in df_com_teste.columns else 0
+                prontas_exec = len(df_com_teste[df_com_teste['Status'] == 'PRONTO PARA PUBLICAÇÃO']) if 'Status' in df_com_teste.columns else 0
+                total_aprovadas_exec = aprovadas + prontas_exec
+                rejeitadas = len(df_com_teste[df_com_teste['Status'] == 'REJEITADA']) if 'Status' in df_com_teste.columns else 0
+                taxa_aprovacao = (total_aprovadas_exec / (total_aprovadas_exec + rejeitadas) * 100) if (total_aprovadas_exec + rejeitadas) > 0 else 0
             
-            # Calcular métricas principais para o resumo
-            total_planilha = len(df_com_teste) + len(df_sem_teste) if df_sem_teste is not None else len(df_com_teste)
-            total_testes_efetuados = len(df_com_teste)
-            cobertura_teste = (total_testes_efetuados / total_planilha * 100) if total_planilha > 0 else 0
-            aprovadas = len(df_com_teste[df_com_teste['Status'] == 'APROVADA']) if 'Status' in df_com_teste.columns else 0
-            prontas_exec = len(df_com_teste[df_com_teste['Status'] == 'PRONTO PARA PUBLICAÇÃO']) if 'Status' in df_com_teste.columns else 0
-            total_aprovadas_exec = aprovadas + prontas_exec
-            rejeitadas = len(df_com_teste[df_com_teste['Status'] == 'REJEITADA']) if 'Status' in df_com_teste.columns else 0
-            taxa_aprovacao = (total_aprovadas_exec / (total_aprovadas_exec + rejeitadas) * 100) if (total_aprovadas_exec + rejeitadas) > 0 else 0
+                # Resumo em destaque
+                col_resumo1, col_resumo2, col_resumo3 = st.columns(3)
             
-            # Resumo em destaque
-            col_resumo1, col_resumo2, col_resumo3 = st.columns(3)
+                with col_resumo1:
+                    status_cobertura = "🟢 Excelente" if cobertura_teste >= 80 else "🟡 Boa" if cobertura_teste >= 60 else "🔴 Crítica"
+                    st.info(f"**📊 Cobertura de Testes:** {cobertura_teste:.1f}% ({total_testes_efetuados:,}/{total_planilha:,} tarefas)\n\n**Status:** {status_cobertura}")
             
-            with col_resumo1:
-                status_cobertura = "🟢 Excelente" if cobertura_teste >= 80 else "🟡 Boa" if cobertura_teste >= 60 else "🔴 Crítica"
-                st.info(f"**📊 Cobertura de Testes:** {cobertura_teste:.1f}% ({total_testes_efetuados:,}/{total_planilha:,} tarefas)\n\n**Status:** {status_cobertura}")
+                with col_resumo2:
+                    status_qualidade = "🟢 Excelente" if taxa_aprovacao >= 75 else "🟡 Boa" if taxa_aprovacao >= 60 else "🔴 Atenção"
+                    st.info(f"**✅ Taxa de Aprovação:** {taxa_aprovacao:.1f}% ({total_aprovadas_exec:,}/{total_aprovadas_exec + rejeitadas:,} testes)\n\n**Status:** {status_qualidade}")
             
-            with col_resumo2:
-                status_qualidade = "🟢 Excelente" if taxa_aprovacao >= 75 else "🟡 Boa" if taxa_aprovacao >= 60 else "🔴 Atenção"
-                st.info(f"**✅ Taxa de Aprovação:** {taxa_aprovacao:.1f}% ({total_aprovadas_exec:,}/{total_aprovadas_exec + rejeitadas:,} testes)\n\n**Status:** {status_qualidade}")
+                with col_resumo3:
+                    bugs_encontrados = contar_total_bugs(df_com_teste[df_com_teste['Status'] == 'REJEITADA']) if not df_com_teste.empty else 0
+                    st.info(f"**🚫 Bugs Interceptados:** {bugs_encontrados:,} problemas\n\n**Status:** Problemas identificados antes da produção")
             
-            with col_resumo3:
-                bugs_encontrados = contar_total_bugs(df_com_teste[df_com_teste['Status'] == 'REJEITADA']) if not df_com_teste.empty else 0
-                st.info(f"**🚫 Bugs Interceptados:** {bugs_encontrados:,} problemas\n\n**Status:** Problemas identificados antes da produção")
+                st.markdown("---")
             
-            st.markdown("---")
+                # Métricas executivas principais
+                metricas_resumo(df_com_teste, df, df_sem_teste)
             
-            # Métricas executivas principais
-            metricas_resumo(df_com_teste, df, df_sem_teste)
+                st.markdown("---")
             
-            st.markdown("---")
+                # === INSIGHTS ESTRATÉGICOS REMOVIDOS ===
+                # Seção removida conforme solicitação
             
-            # === INSIGHTS ESTRATÉGICOS REMOVIDOS ===
-            # Seção removida conforme solicitação
+                st.markdown("---")
             
-            st.markdown("---")
+                # Gráficos estratégicos
+                st.markdown("#### 📊 **Indicadores Visuais Estratégicos**")
             
-            # Gráficos estratégicos
-            st.markdown("#### 📊 **Indicadores Visuais Estratégicos**")
+                col_exec1, col_exec2 = st.columns(2)
             
-            col_exec1, col_exec2 = st.columns(2)
+                with col_exec1:
+                    # Gráfico de evolução da qualidade
+                    fig_evolucao = grafico_evolucao_qualidade(df_com_teste, por_ambiente=False)
+                    if fig_evolucao:
+                        st.plotly_chart(fig_evolucao, use_container_width=True, key="evolucao_qualidade")
+                
+                    # Distribuição de status
+                    fig_status = grafico_status_distribuicao(df_com_teste)
+                    if fig_status:
+                        st.plotly_chart(fig_status, use_container_width=True, key="distribuicao_status")
             
-            with col_exec1:
-                # Gráfico de evolução da qualidade
-                fig_evolucao = grafico_evolucao_qualidade(df_com_teste, por_ambiente=False)
-                if fig_evolucao:
-                    st.plotly_chart(fig_evolucao, use_container_width=True, key="evolucao_qualidade")
-                
-                # Distribuição de status
-                fig_status = grafico_status_distribuicao(df_com_teste)
-                if fig_status:
-                    st.plotly_chart(fig_status, use_container_width=True, key="distribuicao_status")
-            
-            with col_exec2:
-                # Erros por time (crítico para diretoria)
-                fig_erros_time = grafico_erros_por_time(df_com_teste)
-                if fig_erros_time:
-                    st.plotly_chart(fig_erros_time, use_container_width=True, key="erros_por_time_exec")
-                
-                # Taxa de rejeição por time
-                fig_taxa_rejeicao = grafico_taxa_rejeicao_por_time(df_com_teste)
-                if fig_taxa_rejeicao:
-                    st.plotly_chart(fig_taxa_rejeicao, use_container_width=True, key="taxa_rejeicao_exec")
-            
-            # Gráfico de tarefas retestadas (nova seção)
-            st.markdown("#### 🔄 **Análise de Retestes**")
-            fig_retestadas = grafico_tarefas_retestadas(df_com_teste)
-            if fig_retestadas:
-                st.plotly_chart(fig_retestadas, use_container_width=True, key="tarefas_retestadas_exec")
-            
-            st.markdown("---")
-            
-            # === RECOMENDAÇÕES ESTRATÉGICAS PARA DIRETORIA ===
-            st.markdown("#### 🎯 **Recomendações Estratégicas**")
-            
-            if not df_com_teste.empty:
-                # Calcular métricas para recomendações
-                total_testes = len(df_com_teste)
-                aprovados = len(df_com_teste[df_com_teste['Status'] == 'APROVADA'])
-                prontos = len(df_com_teste[df_com_teste['Status'] == 'PRONTO PARA PUBLICAÇÃO'])
-                total_aprovados = aprovados + prontos
-                rejeitados = len(df_com_teste[df_com_teste['Status'] == 'REJEITADA'])
-                taxa_aprovacao = (total_aprovados / total_testes * 100) if total_testes > 0 else 0
-                
-                col_rec1, col_rec2, col_rec3 = st.columns(3)
-                
-                with col_rec1:
-                    if taxa_aprovacao >= 80:
-                        st.success(f"**✅ QUALIDADE EXCELENTE**\n\nTaxa de aprovação: {taxa_aprovacao:.1f}%\n\n**Ação:** Manter padrão atual e documentar boas práticas para replicação.")
-                    elif taxa_aprovacao >= 60:
-                        st.warning(f"**⚠️ QUALIDADE MODERADA**\n\nTaxa de aprovação: {taxa_aprovacao:.1f}%\n\n**Ação:** Implementar treinamentos específicos nos times com maior rejeição.")
-                    else:
-                        st.error(f"**🚨 QUALIDADE CRÍTICA**\n\nTaxa de aprovação: {taxa_aprovacao:.1f}%\n\n**Ação:** Intervenção imediata necessária - revisar processos de desenvolvimento.")
+                with col_exec2:
+                    # Erros por time (crítico para diretoria)
+                    fig_erros_time = grafico_erros_por_time(df_com_teste)
+                    if fig_erros_time:
+                        st.plotly_chart(fig_erros_time, use_container_width=True, key="erros_por_time_exec")
+                
+                    # Taxa de rejeição por time
+                    fig_taxa_rejeicao = grafico_taxa_rejeicao_por_time(df_com_teste)
+                    if fig_taxa_rejeicao:
+                        st.plotly_chart(fig_taxa_rejeicao, use_container_width=True, key="taxa_rejeicao_exec")
+            
+                # Gráfico de tarefas retestadas (nova seção)
+                st.markdown("#### 🔄 **Análise de Retestes**")
+                fig_retestadas = grafico_tarefas_retestadas(df_com_teste)
+                if fig_retestadas:
+                    st.plotly_chart(fig_retestadas, use_container_width=True, key="tarefas_retestadas_exec")
+            
+                st.markdown("---")
+            
+                # === RECOMENDAÇÕES ESTRATÉGICAS PARA DIRETORIA ===
+                st.markdown("#### 🎯 **Recomendações Estratégicas**")
+            
+                if not df_com_teste.empty:
+                    # Calcular métricas para recomendações
+                    total_testes = len(df_com_teste)
+                    aprovados = len(df_com_teste[df_com_teste['Status'] == 'APROVADA'])
+                    prontos = len(df_com_teste[df_com_teste['Status'] == 'PRONTO PARA PUBLICAÇÃO'])
+                    total_aprovados = aprovados + prontos
+                    rejeitados = len(df_com_teste[df_com_teste['Status'] == 'REJEITADA'])
+                    taxa_aprovacao = (total_aprovados / total_testes * 100) if total_testes > 0 else 0
+                
+                    col_rec1, col_rec2, col_rec3 = st.columns(3)
+                
+                    with col_rec1:
+                        if taxa_aprovacao >= 80:
+                            st.success(f"**✅ QUALIDADE EXCELENTE**\n\nTaxa de aprovação: {taxa_aprovacao:.1f}%\n\n**Ação:** Manter padrão atual e documentar boas práticas para replicação.")
+                        elif taxa_aprovacao >= 60:
+                            st.warning(f"**⚠️ QUALIDADE MODERADA**\n\nTaxa de aprovação: {taxa_aprovacao:.1f}%\n\n**Ação:** Implementar treinamentos específicos nos times com maior rejeição.")
+                        else:
+                            st.error(f"**🚨 QUALIDADE CRÍTICA**\n\nTaxa de aprovação: {taxa_aprovacao:.1f}%\n\n**Ação:** Intervenção imediata necessária - revisar processos de desenvolvimento.")
                 
-                with col_rec2:
-                    # Análise de Eficiência
-                    bugs_interceptados = contar_total_bugs(df_com_teste[df_com_teste['Status'] == 'REJEITADA'])
-                    eficiencia = (bugs_interceptados / total_testes * 100) if total_testes > 0 else 0
+                    with col_rec2:
+                        # Análise de Eficiência
+                        bugs_interceptados = contar_total_bugs(df_com_teste[df_com_teste['Status'] == 'REJEITADA'])
+                        eficiencia = (bugs_interceptados / total_testes * 100) if total_testes > 0 else 0
                     
-                    if eficiencia >= 30:
-                        st.success(f"**🎯 EFICIÊNCIA ALTA**\n\nDetecção: {eficiencia:.1f}%\n\n**{bugs_interceptados} bugs** encontrados em **{total_testes} testes**")
-                    elif eficiencia >= 15:
-                        st.info(f"**📊 EFICIÊNCIA MODERADA**\n\nDetecção: {eficiencia:.1f}%\n\n**{bugs_interceptados} bugs** encontrados em **{total_testes} testes**")
-                    else:
-                        st.warning(f"**⚠️ BAIXA DETECÇÃO**\n\nDetecção: {eficiencia:.1f}%\n\n**Ação:** Revisar critérios de teste para melhor detecção.")
+                        if eficiencia >= 30:
+                            st.success(f"**🎯 EFICIÊNCIA ALTA**\n\nDetecção: {eficiencia:.1f}%\n\n**{bugs_interceptados} bugs** encontrados em **{total_testes} testes**")
+                        elif eficiencia >= 15:
+                            st.info(f"**📊 EFICIÊNCIA MODERADA**\n\nDetecção: {eficiencia:.1f}%\n\n**{bugs_interceptados} bugs** encontrados em **{total_testes} testes**")
+                        else:
+                            st.warning(f"**⚠️ BAIXA DETECÇÃO**\n\nDetecção: {eficiencia:.1f}%\n\n**Ação:** Revisar critérios de teste para melhor detecção.")
                 
-                with col_rec3:
-                    # Análise de cobertura
-                    total_tasks = len(df_com_teste) + len(df_sem_teste) if df_sem_teste is not None else len(df_com_teste)
-                    cobertura = (total_testes / total_tasks * 100) if total_tasks > 0 else 0
+                    with col_rec3:
+                        # Análise de cobertura
+                        total_tasks = len(df_com_teste) + len(df_sem_teste) if df_sem_teste is not None else len(df_com_teste)
+                        cobertura = (total_testes / total_tasks * 100) if total_tasks > 0 else 0
                     
-                    if cobertura >= 90:
-                        st.success(f"**🎯 COBERTURA EXCELENTE**\n\nCobertura: {cobertura:.1f}%\n\n**Status:** Meta de cobertura atingida com sucesso.")
-                    elif cobertura >= 70:
-                        st.warning(f"**📊 COBERTURA MODERADA**\n\nCobertura: {cobertura:.1f}%\n\n**Ação:** Expandir cobertura para atingir meta de 90%.")
-                    else:
-                        st.error(f"**🚨 COBERTURA BAIXA**\n\nCobertura: {cobertura:.1f}%\n\n**Ação:** Urgente - aumentar significativamente a cobertura de testes.")
+                        if cobertura >= 90:
+                            st.success(f"**🎯 COBERTURA EXCELENTE**\n\nCobertura: {cobertura:.1f}%\n\n**Status:** Meta de cobertura atingida com sucesso.")
+                        elif cobertura >= 70:
+                            st.warning(f"**📊 COBERTURA MODERADA**\n\nCobertura: {cobertura:.1f}%\n\n**Ação:** Expandir cobertura para atingir meta de 90%.")
+                        else:
+                            st.error(f"**🚨 COBERTURA BAIXA**\n\nCobertura: {cobertura:.1f}%\n\n**Ação:** Urgente - aumentar significativamente a cobertura de testes.")
                 
-                # Resumo executivo final
-                st.markdown("##### 📋 **Resumo Executivo para Diretoria**")
+                    # Resumo executivo final
+                    st.markdown("##### 📋 **Resumo Executivo para Diretoria**")
                 
-                resumo_status = "🟢 SAUDÁVEL" if taxa_aprovacao >= 70 and cobertura >= 70 else "🟡 ATENÇÃO" if taxa_aprovacao >= 50 and cobertura >= 50 else "🔴 CRÍTICO"
+                    resumo_status = "🟢 SAUDÁVEL" if taxa_aprovacao >= 70 and cobertura >= 70 else "🟡 ATENÇÃO" if taxa_aprovacao >= 50 and cobertura >= 50 else "🔴 CRÍTICO"
                 
-                st.info(f"**Status Geral do QA:** {resumo_status}\n\n"
-                       f"• **{total_testes:,} testes** realizados com **{taxa_aprovacao:.1f}% de aprovação**\n"
-                       f"• **{bugs_interceptados} bugs interceptados** antes da produção\n"
-                       f"• **Cobertura de {cobertura:.1f}%** das tasks de desenvolvimento\n"
-                       f"• **Eficiência de detecção:** {(bugs_interceptados/total_testes*100):.1f}% dos testes encontraram problemas")
-            else:
-                st.info("📋 Dados insuficientes para gerar recomendações estratégicas")
+                    st.info(f"**Status Geral do QA:** {resumo_status}\n\n"
+                           f"• **{total_testes:,} testes** realizados com **{taxa_aprovacao:.1f}% de aprovação**\n"
+                           f"• **{bugs_interceptados} bugs interceptados** antes da produção\n"
+                           f"• **Cobertura de {cobertura:.1f}%** das tasks de desenvolvimento\n"
+                           f"• **Eficiência de detecção:** {(bugs_interceptados/total_testes*100):.1f}% dos testes encontraram problemas")
+                else:
+                    st.info("📋 Dados insuficientes para gerar recomendações estratégicas")
         
-        with tab2:
-            st.markdown("### 🛡️ **Prevenção e Qualidade**")
-            st.markdown("*Análise unificada: bugs identificados (motivos) + erros encontrados (quantitativos)*")
+        with tab2 as ativa:
+            if ativa:
+                st.markdown("### 🛡️ **Prevenção e Qualidade**")
+                st.markdown("*Análise unificada: bugs identificados (motivos) + erros encontrados (quantitativos)*")
             
-            # Botão de exportação PDF
-            col_export_prev, col_space_prev = st.columns([1, 3])
-            with col_export_prev:
-                botao_exportar_pdf("Prevencao_e_Qualidade", criar_pdf_generico, df_com_teste, df, df_sem_teste)
+                # Botão de exportação PDF
+                col_export_prev, col_space_prev = st.columns([1, 3])
+                with col_export_prev:
+                    botao_exportar_pdf("Prevencao_e_Qualidade", criar_pdf_generico, df_com_teste, df, df_sem_teste)
             
-            st.markdown("---")
+                st.markdown("---")
             
-            # Análise unificada de qualidade
-            analise_unificada = analisar_qualidade_unificada(df_com_teste)
+                # Análise unificada de qualidade
+                analise_unificada = analisar_qualidade_unificada(df_com_teste)
             
-            if analise_unificada:
-                # Seção de comparação entre as duas abordagens
-                st.markdown("#### 📊 **Visão Comparativa: Motivos vs Erros Numéricos**")
+                if analise_unificada:
+                    # Seção de comparação entre as duas abordagens
+                    st.markdown("#### 📊 **Visão Comparativa: Motivos vs Erros Numéricos**")
                 
-                col_comp1, col_comp2, col_comp3, col_comp4 = st.columns(4)
+                    col_comp1, col_comp2, col_comp3, col_comp4 = st.columns(4)
                 
-                with col_comp1:
-                    bugs_motivos = analise_unificada['bugs_qualitativos']['total_bugs_motivos']
-                    st.metric(
-                        "🐛 Bugs por Motivos", 
-                        f"{bugs_motivos}",
-                        help="Total de bugs identificados através dos motivos de rejeição (análise qualitativa)"
-                    )
+                    with col_comp1:
+                        bugs_motivos = analise_unificada['bugs_qualitativos']['total_bugs_motivos']
+                        st.metric(
+                            "🐛 Bugs por Motivos", 
+                            f"{bugs_motivos}",
+                            help="Total de bugs identificados através dos motivos de rejeição (análise qualitativa)"
+                        )
                 
-                with col_comp2:
-                    erros_numericos = analise_unificada['total_erros_numericos']
-                    st.metric(
-                        "🔢 Erros Numéricos", 
-                        f"{erros_numericos}",
-                        help="Total de erros contabilizados na coluna 'Erros' (análise quantitativa)"
-                    )
+                    with col_comp2:
+                        erros_numericos = analise_unificada['total_erros_numericos']
+                        st.metric(
+                            "🔢 Erros Numéricos", 
+                            f"{erros_numericos}",
+                            help="Total de erros contabilizados na coluna 'Erros' (análise quantitativa)"
+                        )
                 
-                with col_comp3:
-                    taxa_rejeicao = analise_unificada['metricas_comparativas']['taxa_rejeicao']
-                    st.metric(
-                        "📉 Taxa de Rejeição", 
-                        f"{taxa_rejeicao:.1f}%",
-                        help="Percentual de testes rejeitados (com motivos de falha)"
-                    )
+                    with col_comp3:
+                        taxa_rejeicao = analise_unificada['metricas_comparativas']['taxa_rejeicao']
+                        st.metric(
+                            "📉 Taxa de Rejeição", 
+                            f"{taxa_rejeicao:.1f}%",
+                            help="Percentual de testes rejeitados (com motivos de falha)"
+                        )
                 
-                with col_comp4:
-                    taxa_erros = analise_unificada['metricas_comparativas']['taxa_erros_numericos']
-                    st.metric(
-                        "⚠️ Taxa c/ Erros", 
-                        f"{taxa_erros:.1f}%",
-                        help="Percentual de testes que encontraram erros (coluna numérica)"
-                    )
+                    with col_comp4:
+                        taxa_erros = analise_unificada['metricas_comparativas']['taxa_erros_numericos']
+                        st.metric(
+                            "⚠️ Taxa c/ Erros", 
+                            f"{taxa_erros:.1f}%",
+                            help="Percentual de testes que encontraram erros (coluna numérica)"
+                        )
                 
-                # Explicação das diferenças
-                st.info("""
+                    # Explicação das diferenças
+                    st.info("""
                 💡 **Entendendo as Métricas:**
                 
                 - **Bugs por Motivos**: Análise qualitativa baseada nos motivos de rejeição (Motivo, Motivo2, Motivo3)
@@ -3390,135 +3999,129 @@ def main():
                 Ambas as métricas são complementares e oferecem perspectivas diferentes sobre a qualidade.
                 """)
                 
-                st.markdown("---")
+                    st.markdown("---")
             
-            # Análise de bugs e qualidade
-            st.markdown("#### 🚨 **Bugs Identificados por Time**")
-            
-            col_bugs1, col_bugs2 = st.columns(2)
-            
-            with col_bugs1:
-                # Gráfico de barras para bugs por time
-                fig_erros_time = grafico_erros_por_time(df_com_teste)
-                if fig_erros_time:
-                    # Melhorar cores e adicionar anotações
-                    try:
-                        if (fig_erros_time.data and len(fig_erros_time.data) > 0 and 
-                            hasattr(fig_erros_time.data[0], 'y') and 
-                            hasattr(fig_erros_time.data[0], 'x') and 
-                            fig_erros_time.data[0].y is not None and 
-                            len(fig_erros_time.data[0].y) > 0):
+                # Análise de bugs e qualidade
+                st.markdown("#### 🚨 **Bugs Identificados por Time**")
+            
+                col_bugs1, col_bugs2 = st.columns(2)
+            
+                with col_bugs1:
+                    # Gráfico de barras para bugs por time
+                    fig_erros_time = grafico_erros_por_time(df_com_teste)
+                    if fig_erros_time:
+                        # Melhorar cores e adicionar anotações
+                        try:
+                            if (fig_erros_time.data and len(fig_erros_time.data) > 0 and 
+                                hasattr(fig_erros_time.data[0], 'y') and 
+                                hasattr(fig_erros_time.data[0], 'x') and 
+                                fig_erros_time.data[0].y is not None and 
+                                len(fig_erros_time.data[0].y) > 0):
                             
-                            y_values = list(fig_erros_time.data[0].y)
-                            x_values = list(fig_erros_time.data[0].x)
-                            fig_erros_time.update_traces(
-                                marker_color=['#FF6B6B' if i == 0 else '#4ECDC4' for i in range(len(x_values))],
-                                text=[f'🚨 Foco prioritário' if i == 0 else f'✅ {y_values[i]} bugs' for i in range(len(x_values))],
-                                textposition='outside'
-                            )
-                        else:
+                                y_values = list(fig_erros_time.data[0].y)
+                                x_values = list(fig_erros_time.data[0].x)
+                                fig_erros_time.update_traces(
+                                    marker_color=['#FF6B6B' if i == 0 else '#4ECDC4' for i in range(len(x_values))],
+                                    text=[f'🚨 Foco prioritário' if i == 0 else f'✅ {y_values[i]} bugs' for i in range(len(x_values))],
+                                    textposition='outside'
+                                )
+                            else:
+                                fig_erros_time.update_traces(
+                                    marker_color='#4ECDC4'
+                                )
+                        except (AttributeError, IndexError, TypeError):
+                            # Fallback para casos onde os dados não estão no formato esperado
                             fig_erros_time.update_traces(
                                 marker_color='#4ECDC4'
                             )
-                    except (AttributeError, IndexError, TypeError):
-                        # Fallback para casos onde os dados não estão no formato esperado
-                        fig_erros_time.update_traces(
-                            marker_color='#4ECDC4'
-                        )
-                    fig_erros_time.update_layout(title_font_color='#FFFFFF')
-                    st.plotly_chart(fig_erros_time, use_container_width=True, key="bugs_por_time_principal")
+                        fig_erros_time.update_layout(title_font_color='#FFFFFF')
+                        st.plotly_chart(fig_erros_time, use_container_width=True, key="bugs_por_time_principal")
             
-            with col_bugs2:
-                # Gráfico de pizza para distribuição de bugs
-                if not df_com_teste.empty and 'Time' in df_com_teste.columns:
-                    df_rejeitadas = df_com_teste[df_com_teste['Status'] == 'REJEITADA']
-                    if not df_rejeitadas.empty:
-                        bugs_por_time = contar_bugs_por_time(df_rejeitadas)
-                        if not bugs_por_time.empty:
-                            import plotly.express as px
-                            fig_pizza = px.pie(
-                                values=bugs_por_time.values,
-                                names=bugs_por_time.index,
-                                title="🥧 Distribuição de Bugs por Time",
-                                color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
-                            )
-                            fig_pizza.update_layout(title_font_color='#FFFFFF')
-                            st.plotly_chart(fig_pizza, use_container_width=True, key="distribuicao_bugs_pizza")
+                with col_bugs2:
+                    # Gráfico de pizza para distribuição de bugs
+                    if not df_com_teste.empty and 'Time' in df_com_teste.columns:
+                        df_rejeitadas = df_com_teste[df_com_teste['Status'] == 'REJEITADA']
+                        if not df_rejeitadas.empty:
+                            bugs_por_time = contar_bugs_por_time(df_rejeitadas)
+                            if not bugs_por_time.empty:
+                                import plotly.express as px
+                                fig_pizza = px.pie(
+                                    values=bugs_por_time.values,
+                                    names=bugs_por_time.index,
+                                    title="🥧 Distribuição de Bugs por Time",
+                                    color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
+                                )
+                                fig_pizza.update_layout(title_font_color='#FFFFFF')
+                                st.plotly_chart(fig_pizza, use_container_width=True, key="distribuicao_bugs_pizza")
             
-            st.markdown("---")
+                st.markdown("---")
             
-            # Nova seção de comparação visual
-            if analise_unificada:
-                st.markdown("#### 🔄 **Comparação Visual: Duas Perspectivas de Qualidade**")
+                # Nova seção de comparação visual
+                if analise_unificada:
+                    st.markdown("#### 🔄 **Comparação Visual: Duas Perspectivas de Qualidade**")
                 
-                col_comp_visual1, col_comp_visual2 = st.columns(2)
+                    col_comp_visual1, col_comp_visual2 = st.columns(2)
                 
-                with col_comp_visual1:
-                    st.markdown("##### 📝 **Análise Qualitativa (Motivos)**")
+                    with col_comp_visual1:
+                        st.markdown("##### 📝 **Análise Qualitativa (Motivos)**")
                     
-                    # Opção de visualização por ambiente se disponível
-                    por_ambiente = False
-                    if 'Ambiente' in df_com_teste.columns and df_com_teste['Ambiente'].notna().any():
-                        por_ambiente = st.checkbox("📊 Visualizar por Ambiente", key="motivos_por_ambiente_principal")
+                        # Opção de visualização por ambiente se disponível
+                        por_ambiente = False
+                        if 'Ambiente' in df_com_teste.columns and df_com_teste['Ambiente'].notna().any():
+                            por_ambiente = st.checkbox("📊 Visualizar por Ambiente", key="motivos_por_ambiente_principal")
                     
-                    # Gráfico de motivos de rejeição
-                    fig_motivos = grafico_motivos_rejeicao(df_com_teste, por_ambiente=por_ambiente)
-                    if fig_motivos:
-                        if not por_ambiente:
-                            fig_motivos.update_traces(
-                                marker_color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57'],
-                                text=[f'✅ Mais comum' if i == 0 else '' for i in range(len(fig_motivos.data[0].x))],
-                                textposition='outside'
-                            )
-                        fig_motivos.update_layout(title_font_color='#FFFFFF')
-                        st.plotly_chart(fig_motivos, use_container_width=True, key="motivos_rejeicao_principal")
+                        # Gráfico de motivos de rejeição
+                        fig_motivos = grafico_motivos_rejeicao(df_com_teste, por_ambiente=por_ambiente)
+                        if fig_motivos:
+                            if not por_ambiente:
+                                fig_motivos.update_traces(
+                                    marker_color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57'],
+                                    text=[f'✅ Mais comum' if i == 0 else '' for i in range(len(fig_motivos.data[0].x))],
+                                    textposition='outside'
+                                )
+                            fig_motivos.update_layout(title_font_color='#FFFFFF')
+                            st.plotly_chart(fig_motivos, use_container_width=True, key="motivos_rejeicao_principal")
                     
-                    # Insights sobre motivos
-                    motivos_analysis = analise_unificada['bugs_qualitativos']['motivos_analysis']
-                    if motivos_analysis and 'motivo_mais_comum' in motivos_analysis and motivos_analysis['motivo_mais_comum']:
-                        st.success(f"🎯 **Motivo mais comum**: {motivos_analysis['motivo_mais_comum']}")
-                    else:
-                        # Fallback: buscar diretamente nos dados
-                        df_rejeitadas = df_com_teste[df_com_teste['Status'] == 'REJEITADA'] if 'Status' in df_com_teste.columns else pd.DataFrame()
-                        if not df_rejeitadas.empty:
-                            motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-                            todos_motivos = []
-                            for col in motivos_cols:
-                                if col in df_rejeitadas.columns:
-                                    motivos = df_rejeitadas[col].dropna().tolist()
-                                    todos_motivos.extend(motivos)
+                        # Insights sobre motivos
+                        motivos_analysis = analise_unificada['bugs_qualitativos']['motivos_analysis']
+                        if motivos_analysis and 'motivo_mais_comum' in motivos_analysis and motivos_analysis['motivo_mais_comum']:
+                            st.success(f"🎯 **Motivo mais comum**: {motivos_analysis['motivo_mais_comum']}")
+                        else:
+                            # Fallback: buscar diretamente nos dados
+                            df_rejeitadas = df_com_teste[df_com_teste['Status'] == 'REJEITADA'] if 'Status' in df_com_teste.columns else pd.DataFrame()
+                            if not df_rejeitadas.empty:
+                                motivos_existentes = [col for col in MOTIVOS_COLS if col in df_rejeitadas.columns]
                             
-                            if todos_motivos:
-                                motivos_filtrados = [motivo for motivo in todos_motivos 
-                                                   if motivo.lower() not in ['aprovada', 'sem recusa', '']]
-                                if motivos_filtrados:
-                                    motivo_mais_comum = pd.Series(motivos_filtrados).value_counts().index[0]
-                                    ocorrencias = pd.Series(motivos_filtrados).value_counts().iloc[0]
-                                    st.success(f"🎯 **Motivo mais comum**: {motivo_mais_comum} ({ocorrencias} ocorrências)")
+                                if motivos_existentes and df_rejeitadas[motivos_existentes].notna().any().any():
+                                    motivos_counts = contar_ocorrencias(motivos_do_recorte(df_rejeitadas)['Motivo'])
+                                    if not motivos_counts.empty:
+                                        motivo_mais_comum = motivos_counts.index[0]
+                                        ocorrencias = motivos_counts.iloc[0]
+                                        st.success(f"🎯 **Motivo mais comum**: {motivo_mais_comum} ({ocorrencias} ocorrências)")
+                                    else:
+                                        st.info("📝 Nenhum motivo específico identificado nos dados filtrados")
                                 else:
-                                    st.info("📝 Nenhum motivo específico identificado nos dados filtrados")
+                                    st.info("📝 Nenhum motivo registrado nos dados disponíveis")
                             else:
-                                st.info("📝 Nenhum motivo registrado nos dados disponíveis")
-                        else:
-                            st.info("📝 Nenhuma tarefa rejeitada encontrada nos dados filtrados")
+                                st.info("📝 Nenhuma tarefa rejeitada encontrada nos dados filtrados")
                 
-                with col_comp_visual2:
-                    st.markdown("##### 🔢 **Análise Quantitativa (Erros)**")
+                    with col_comp_visual2:
+                        st.markdown("##### 🔢 **Análise Quantitativa (Erros)**")
                     
-                    # Gráfico de distribuição de erros
-                    fig_dist_erros = grafico_distribuicao_erros(df_com_teste)
-                    if fig_dist_erros:
-                        st.plotly_chart(fig_dist_erros, use_container_width=True, key="distribuicao_erros_comparativo")
+                        # Gráfico de distribuição de erros
+                        fig_dist_erros = grafico_distribuicao_erros(df_com_teste)
+                        if fig_dist_erros:
+                            st.plotly_chart(fig_dist_erros, use_container_width=True, key="distribuicao_erros_comparativo")
                     
-                    # Gráfico de erros por time (coluna numérica)
-                    fig_erros_numericos = grafico_erros_coluna_por_time(df_com_teste)
-                    if fig_erros_numericos:
-                        st.plotly_chart(fig_erros_numericos, use_container_width=True, key="erros_numericos_time")
+                        # Gráfico de erros por time (coluna numérica)
+                        fig_erros_numericos = grafico_erros_coluna_por_time(df_com_teste)
+                        if fig_erros_numericos:
+                            st.plotly_chart(fig_erros_numericos, use_container_width=True, key="erros_numericos_time")
                 
-                # Explicação detalhada das diferenças
-                st.markdown("#### 📚 **Entendendo as Duas Abordagens de Análise**")
+                    # Explicação detalhada das diferenças
+                    st.markdown("#### 📚 **Entendendo as Duas Abordagens de Análise**")
                 
-                st.info("""
+                    st.info("""
                 **🔍 Diferenças entre as Métricas:**
                 
                 **📝 Análise Qualitativa (Motivos):**
@@ -3539,613 +4142,609 @@ def main():
                 - **Decisões melhores**: Dados qualitativos + quantitativos
                 """)
                 
-                st.markdown("---")
+                    st.markdown("---")
             
-            st.markdown("#### 🔍 **Tipos de Falha e Motivos**")
+                st.markdown("#### 🔍 **Tipos de Falha e Motivos**")
             
-            col_motivos1, col_motivos2 = st.columns(2)
+                col_motivos1, col_motivos2 = st.columns(2)
             
-            with col_motivos1:
-                # Taxa de aprovação vs rejeição (barras + pizza)
-                if not df_com_teste.empty and 'Status' in df_com_teste.columns:
-                    status_counts = df_com_teste['Status'].value_counts()
-                    if len(status_counts) > 1:
-                        import plotly.express as px
-                        st.markdown("**📊 Análise Qualitativa - Motivos de Rejeição**")
-                        st.info("Esta seção foca nos motivos e causas dos problemas encontrados, permitindo identificar padrões e oportunidades de melhoria no processo de desenvolvimento.")
-            
-            with col_motivos2:
-                # Taxa de aprovação vs rejeição (barras + pizza)
-                if not df_com_teste.empty and 'Status' in df_com_teste.columns:
-                    status_counts = df_com_teste['Status'].value_counts()
-                    if len(status_counts) > 1:
-                        import plotly.express as px
-                        fig_aprovacao = px.bar(
-                            x=status_counts.index,
-                            y=status_counts.values,
-                            title="📊 Taxa de Aprovação vs Rejeição",
-                            color=status_counts.values,
-                            color_discrete_sequence=['#28a745', '#dc3545'],
-                            text=status_counts.values
-                        )
-                        fig_aprovacao.update_traces(textposition='outside')
-                        fig_aprovacao.update_layout(
-                            title_font_color='#FFFFFF',
-                            xaxis_title="Status",
-                            yaxis_title="Quantidade",
-                            margin=dict(t=50, b=80, l=80, r=80),
-                            height=450
-                        )
-                        st.plotly_chart(fig_aprovacao, use_container_width=True, key="taxa_aprovacao_barras")
+                with col_motivos1:
+                    # Taxa de aprovação vs rejeição (barras + pizza)
+                    if not df_com_teste.empty and 'Status' in df_com_teste.columns:
+                        status_counts = contar_ocorrencias(df_com_teste['Status'])
+                        if len(status_counts) > 1:
+                            import plotly.express as px
+                            st.markdown("**📊 Análise Qualitativa - Motivos de Rejeição**")
+                            st.info("Esta seção foca nos motivos e causas dos problemas encontrados, permitindo identificar padrões e oportunidades de melhoria no processo de desenvolvimento.")
+            
+                with col_motivos2:
+                    # Taxa de aprovação vs rejeição (barras + pizza)
+                    if not df_com_teste.empty and 'Status' in df_com_teste.columns:
+                        status_counts = contar_ocorrencias(df_com_teste['Status'])
+                        if len(status_counts) > 1:
+                            import plotly.express as px
+                            fig_aprovacao = px.bar(
+                                x=status_counts.index,
+                                y=status_counts.values,
+                                title="📊 Taxa de Aprovação vs Rejeição",
+                                color=status_counts.values,
+                                color_discrete_sequence=['#28a745', '#dc3545'],
+                                text=status_counts.values
+                            )
+                            fig_aprovacao.update_traces(textposition='outside')
+                            fig_aprovacao.update_layout(
+                                title_font_color='#FFFFFF',
+                                xaxis_title="Status",
+                                yaxis_title="Quantidade",
+                                margin=dict(t=50, b=80, l=80, r=80),
+                                height=450
+                            )
+                            st.plotly_chart(fig_aprovacao, use_container_width=True, key="taxa_aprovacao_barras")
             
-            st.markdown("---")
-            st.markdown("#### 🎯 **Análise Detalhada de Motivos por Time**")
+                st.markdown("---")
+                st.markdown("#### 🎯 **Análise Detalhada de Motivos por Time**")
             
-            col_time1, col_time2 = st.columns(2)
+                col_time1, col_time2 = st.columns(2)
             
-            with col_time1:
-                # Gráfico de motivos por time
-                fig_motivos_time = grafico_motivos_por_time(df_com_teste)
-                if fig_motivos_time:
-                    st.plotly_chart(fig_motivos_time, use_container_width=True, key="motivos_por_time")
-                else:
-                    st.info("📋 Dados insuficientes para análise de motivos por time")
+                with col_time1:
+                    # Gráfico de motivos por time
+                    fig_motivos_time = grafico_motivos_por_time(df_com_teste)
+                    if fig_motivos_time:
+                        st.plotly_chart(fig_motivos_time, use_container_width=True, key="motivos_por_time")
+                    else:
+                        st.info("📋 Dados insuficientes para análise de motivos por time")
             
-            with col_time2:
-                # Ranking dos problemas mais encontrados
-                fig_ranking = grafico_ranking_problemas(df_com_teste)
-                if fig_ranking:
-                    st.plotly_chart(fig_ranking, use_container_width=True, key="ranking_problemas")
-                else:
-                    st.info("📋 Dados insuficientes para ranking de problemas")
+                with col_time2:
+                    # Ranking dos problemas mais encontrados
+                    fig_ranking = grafico_ranking_problemas(df_com_teste)
+                    if fig_ranking:
+                        st.plotly_chart(fig_ranking, use_container_width=True, key="ranking_problemas")
+                    else:
+                        st.info("📋 Dados insuficientes para ranking de problemas")
             
-            st.markdown("---")
-            st.markdown("#### 👨‍💻 **Análise Detalhada por Desenvolvedor**")
+                st.markdown("---")
+                st.markdown("#### 👨‍💻 **Análise Detalhada por Desenvolvedor**")
             
-            col_dev1, col_dev2 = st.columns(2)
+                col_dev1, col_dev2 = st.columns(2)
             
-            with col_dev1:
-                # Gráfico sunburst de motivos por desenvolvedor
-                fig_motivos_dev_sun = grafico_motivos_por_desenvolvedor(df_com_teste)
-                if fig_motivos_dev_sun:
-                    st.plotly_chart(fig_motivos_dev_sun, use_container_width=True, key="motivos_por_desenvolvedor")
-                else:
-                    st.info("📋 Dados insuficientes para análise de motivos por desenvolvedor")
+                with col_dev1:
+                    # Gráfico sunburst de motivos por desenvolvedor
+                    fig_motivos_dev_sun = grafico_motivos_por_desenvolvedor(df_com_teste)
+                    if fig_motivos_dev_sun:
+                        st.plotly_chart(fig_motivos_dev_sun, use_container_width=True, key="motivos_por_desenvolvedor")
+                    else:
+                        st.info("📋 Dados insuficientes para análise de motivos por desenvolvedor")
             
-            with col_dev2:
-                # Gráfico de barras: Motivos de recusa por desenvolvedor
-                fig_motivos_dev = grafico_motivos_recusa_por_dev(df_com_teste)
-                if fig_motivos_dev:
-                    st.plotly_chart(fig_motivos_dev, use_container_width=True, key="motivos_recusa_por_dev")
-                else:
-                    st.info("📋 Dados insuficientes para análise de rejeições por desenvolvedor (mínimo 2 rejeições por dev)")
+                with col_dev2:
+                    # Gráfico de barras: Motivos de recusa por desenvolvedor
+                    fig_motivos_dev = grafico_motivos_recusa_por_dev(df_com_teste)
+                    if fig_motivos_dev:
+                        st.plotly_chart(fig_motivos_dev, use_container_width=True, key="motivos_recusa_por_dev")
+                    else:
+                        st.info("📋 Dados insuficientes para análise de rejeições por desenvolvedor (mínimo 2 rejeições por dev)")
             
-            st.markdown("---")
+                st.markdown("---")
             
-            # === INSIGHTS EXECUTIVOS PARA GERÊNCIA ===
-            st.markdown("#### 🎯 **Insights Executivos - Análise de Problemas por Time**")
+                # === INSIGHTS EXECUTIVOS PARA GERÊNCIA ===
+                st.markdown("#### 🎯 **Insights Executivos - Análise de Problemas por Time**")
             
-            if not df_com_teste.empty:
-                df_rejeitadas = df_com_teste[df_com_teste['Status'] == 'REJEITADA']
+                if not df_com_teste.empty:
+                    df_rejeitadas = df_com_teste[df_com_teste['Status'] == 'REJEITADA']
                 
-                if not df_rejeitadas.empty and 'Time' in df_rejeitadas.columns:
-                    # Análise de problemas por time
-                    motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-                    motivos_existentes = [col for col in motivos_cols if col in df_rejeitadas.columns]
+                    if not df_rejeitadas.empty and 'Time' in df_rejeitadas.columns:
+                        # Análise de problemas por time
+                        motivos_existentes = [col for col in MOTIVOS_COLS if col in df_rejeitadas.columns]
                     
-                    if motivos_existentes:
-                        dados_analise = []
-                        for _, row in df_rejeitadas.iterrows():
-                            time = row.get('Time', 'N/A')
-                            for col in motivos_existentes:
-                                motivo = row.get(col)
-                                if pd.notna(motivo) and motivo.lower() not in ['aprovada', 'sem recusa', '']:
-                                    dados_analise.append({'Time': time, 'Motivo': motivo})
+                        if motivos_existentes:
+                            df_analise = motivos_do_recorte(df_rejeitadas)[['Time', 'Motivo']]
                         
-                        if dados_analise:
-                            df_analise = pd.DataFrame(dados_analise)
+                            if not df_analise.empty:
                             
-                            col_insight1, col_insight2 = st.columns(2)
+                                col_insight1, col_insight2 = st.columns(2)
                             
-                            with col_insight1:
-                                # Time com mais problemas
-                                problemas_por_time = df_analise['Time'].value_counts()
-                                time_critico = problemas_por_time.index[0]
-                                qtd_problemas = problemas_por_time.iloc[0]
+                                with col_insight1:
+                                    # Time com mais problemas
+                                    problemas_por_time = contar_ocorrencias(df_analise['Time'])
+                                    time_critico = problemas_por_time.index[0]
+                                    qtd_problemas = problemas_por_time.iloc[0]
                                 
-                                st.error(f"**🚨 Time com Maior Necessidade de Atenção**\n\n**{time_critico}** - {qtd_problemas} problemas identificados\n\nRecomendação: Revisar processos e oferecer treinamento específico.")
+                                    st.error(f"**🚨 Time com Maior Necessidade de Atenção**\n\n**{time_critico}** - {qtd_problemas} problemas identificados\n\nRecomendação: Revisar processos e oferecer treinamento específico.")
                             
-                            with col_insight2:
-                                # Problema mais comum
-                                problema_comum = df_analise['Motivo'].value_counts().index[0]
-                                qtd_comum = df_analise['Motivo'].value_counts().iloc[0]
+                                with col_insight2:
+                                    # Problema mais comum
+                                    motivos_counts = contar_ocorrencias(df_analise['Motivo'])
+                                    problema_comum = motivos_counts.index[0]
+                                    qtd_comum = motivos_counts.iloc[0]
                                 
-                                st.warning(f"**⚠️ Problema Mais Recorrente**\n\n**{problema_comum}** - {qtd_comum} ocorrências\n\nRecomendação: Implementar checklist preventivo para este tipo de erro.")
+                                    st.warning(f"**⚠️ Problema Mais Recorrente**\n\n**{problema_comum}** - {qtd_comum} ocorrências\n\nRecomendação: Implementar checklist preventivo para este tipo de erro.")
                             
-                            # Análise de distribuição de problemas
-                            st.markdown("##### 📊 **Distribuição de Problemas por Time**")
+                                # Análise de distribuição de problemas
+                                st.markdown("##### 📊 **Distribuição de Problemas por Time**")
                             
-                            col_dist1, col_dist2 = st.columns(2)
+                                col_dist1, col_dist2 = st.columns(2)
                             
-                            with col_dist1:
-                                # Tabela de problemas por time
-                                tabela_problemas = df_analise.groupby('Time').agg({
-                                    'Motivo': ['count', lambda x: x.nunique()]
-                                }).round(2)
-                                tabela_problemas.columns = ['Total Problemas', 'Tipos Diferentes']
-                                tabela_problemas = tabela_problemas.sort_values('Total Problemas', ascending=False)
+                                with col_dist1:
+                                    # Tabela de problemas por time
+                                    tabela_problemas = df_analise.groupby('Time', observed=True).agg({
+                                        'Motivo': ['count', lambda x: x.nunique()]
+                                    }).round(2)
+                                    tabela_problemas.columns = ['Total Problemas', 'Tipos Diferentes']
+                                    tabela_problemas = tabela_problemas.sort_values('Total Problemas', ascending=False)
                                 
-                                st.dataframe(
-                                    tabela_problemas,
-                                    use_container_width=True,
-                                    column_config={
-                                        "Total Problemas": st.column_config.NumberColumn(
-                                            "Total de Problemas",
-                                            help="Quantidade total de problemas encontrados"
-                                        ),
-                                        "Tipos Diferentes": st.column_config.NumberColumn(
-                                            "Tipos Diferentes",
-                                            help="Variedade de tipos de problemas"
-                                        )
-                                    }
-                                )
+                                    st.dataframe(
+                                        tabela_problemas,
+                                        use_container_width=True,
+                                        column_config={
+                                            "Total Problemas": st.column_config.NumberColumn(
+                                                "Total de Problemas",
+                                                help="Quantidade total de problemas encontrados"
+                                            ),
+                                            "Tipos Diferentes": st.column_config.NumberColumn(
+                                                "Tipos Diferentes",
+                                                help="Variedade de tipos de problemas"
+                                            )
+                                        }
+                                    )
                             
-                            with col_dist2:
-                                # Top 5 problemas mais comuns
-                                top_problemas = df_analise['Motivo'].value_counts().head(5)
+                                with col_dist2:
+                                    # Top 5 problemas mais comuns
+                                    top_problemas = contar_ocorrencias(df_analise['Motivo']).head(5)
                                 
-                                st.markdown("**🏆 Top 5 Problemas Mais Comuns:**")
-                                for i, (problema, qtd) in enumerate(top_problemas.items(), 1):
-                                    st.markdown(f"{i}. **{problema}** - {qtd} ocorrências")
+                                    st.markdown("**🏆 Top 5 Problemas Mais Comuns:**")
+                                    for i, (problema, qtd) in enumerate(top_problemas.items(), 1):
+                                        st.markdown(f"{i}. **{problema}** - {qtd} ocorrências")
+                            else:
+                                st.info("📋 Nenhum motivo de rejeição encontrado para análise")
                         else:
-                            st.info("📋 Nenhum motivo de rejeição encontrado para análise")
+                            st.info("📋 Colunas de motivos não encontradas nos dados")
                     else:
-                        st.info("📋 Colunas de motivos não encontradas nos dados")
+                        st.info("📋 Dados insuficientes para análise de problemas por time")
                 else:
-                    st.info("📋 Dados insuficientes para análise de problemas por time")
-            else:
-                st.info("📋 Nenhum dado disponível para análise")
-            
-            st.markdown("---")
-            st.markdown("#### 📈 **Evolução de Taxa ao Longo do Tempo**")
-            
-            # Opção de visualização por ambiente se disponível
-            por_ambiente_evolucao = False
-            if 'Ambiente' in df_com_teste.columns and df_com_teste['Ambiente'].notna().any():
-                por_ambiente_evolucao = st.checkbox("📊 Visualizar evolução por Ambiente", key="evolucao_por_ambiente_principal")
-            
-            # Melhorar gráfico de evolução
-            fig_evolucao = grafico_evolucao_qualidade(df_com_teste, por_ambiente=por_ambiente_evolucao)
-            if fig_evolucao:
-                # Melhorar escala do eixo Y para mostrar variações reais
-                fig_evolucao.update_layout(
-                    yaxis=dict(
-                        title="Taxa de Aprovação (%)",
-                        range=[0, 100],
-                        dtick=10
-                    ),
-                    title_font_color='#FFFFFF',
-                    annotations=[
-                        dict(
-                            x=0.5, y=1.1,
-                            xref='paper', yref='paper',
-                            text="💡 Dica: Busque tendência de melhoria contínua",
-                            showarrow=False,
-                            font=dict(size=12, color='#7F8C8D')
-                        )
-                    ]
-                )
-                st.plotly_chart(fig_evolucao, use_container_width=True, key="evolucao_qualidade_melhorada")
+                    st.info("📋 Nenhum dado disponível para análise")
+            
+                st.markdown("---")
+                st.markdown("#### 📈 **Evolução de Taxa ao Longo do Tempo**")
+            
+                # Opção de visualização por ambiente se disponível
+                por_ambiente_evolucao = False
+                if 'Ambiente' in df_com_teste.columns and df_com_teste['Ambiente'].notna().any():
+                    por_ambiente_evolucao = st.checkbox("📊 Visualizar evolução por Ambiente", key="evolucao_por_ambiente_principal")
+            
+                # Melhorar gráfico de evolução
+                fig_evolucao = grafico_evolucao_qualidade(df_com_teste, por_ambiente=por_ambiente_evolucao)
+                if fig_evolucao:
+                    # Melhorar escala do eixo Y para mostrar variações reais
+                    fig_evolucao.update_layout(
+                        yaxis=dict(
+                            title="Taxa de Aprovação (%)",
+                            range=[0, 100],
+                            dtick=10
+                        ),
+                        title_font_color='#FFFFFF',
+                        annotations=[
+                            dict(
+                                x=0.5, y=1.1,
+                                xref='paper', yref='paper',
+                                text="💡 Dica: Busque tendência de melhoria contínua",
+                                showarrow=False,
+                                font=dict(size=12, color='#7F8C8D')
+                            )
+                        ]
+                    )
+                    st.plotly_chart(fig_evolucao, use_container_width=True, key="evolucao_qualidade_melhorada")
         
-        with tab3:
-            st.markdown("### 🏁 **Visão por Sprint**")
-            st.markdown("*Tasks testadas por sprint e cobertura de Q.A por time*")
+        with tab3 as ativa:
+            if ativa:
+                st.markdown("### 🏁 **Visão por Sprint**")
+                st.markdown("*Tasks testadas por sprint e cobertura de Q.A por time*")
             
-            # Botão de exportação PDF
-            col_export_sprint, col_space_sprint = st.columns([1, 3])
-            with col_export_sprint:
-                botao_exportar_pdf("Visao_por_Sprint", criar_pdf_generico, df_com_teste, df, df_sem_teste)
+                # Botão de exportação PDF
+                col_export_sprint, col_space_sprint = st.columns([1, 3])
+                with col_export_sprint:
+                    botao_exportar_pdf("Visao_por_Sprint", criar_pdf_generico, df_com_teste, df, df_sem_teste)
             
-            st.markdown("---")
+                st.markdown("---")
             
-            # Análise por Sprint
-            st.markdown("#### 📊 **Tasks Testadas por Sprint**")
+                # Análise por Sprint
+                st.markdown("#### 📊 **Tasks Testadas por Sprint**")
             
-            # Timeline de tasks
-            with st.container():
                 # Timeline de tasks
-                fig_timeline = grafico_timeline_tasks(df_com_teste)
-                if fig_timeline:
-                    fig_timeline.update_layout(title_font_color='#FFFFFF')
-                    st.plotly_chart(fig_timeline, use_container_width=True, key="timeline_tasks")
+                with st.container():
+                    # Timeline de tasks
+                    fig_timeline = grafico_timeline_tasks(df_com_teste)
+                    if fig_timeline:
+                        fig_timeline.update_layout(title_font_color='#FFFFFF')
+                        st.plotly_chart(fig_timeline, use_container_width=True, key="timeline_tasks")
             
-            st.markdown("---")
-            st.markdown("#### 🎯 **Cobertura de Q.A por Time**")
+                st.markdown("---")
+                st.markdown("#### 🎯 **Cobertura de Q.A por Time**")
             
-            col_cobertura1, col_cobertura2 = st.columns(2)
+                col_cobertura1, col_cobertura2 = st.columns(2)
             
-            with col_cobertura1:
-                fig_time = grafico_tasks_por_time(df_com_teste)
-                if fig_time:
-                    fig_time.update_layout(
-                        title_font_color='#FFFFFF',
-                        xaxis_tickangle=45
-                    )
-                    st.plotly_chart(fig_time, use_container_width=True, key="tasks_por_time_sprint")
+                with col_cobertura1:
+                    fig_time = grafico_tasks_por_time(df_com_teste)
+                    if fig_time:
+                        fig_time.update_layout(
+                            title_font_color='#FFFFFF',
+                            xaxis_tickangle=45
+                        )
+                        st.plotly_chart(fig_time, use_container_width=True, key="tasks_por_time_sprint")
             
-            with col_cobertura2:
-                # Distribuição de status
-                fig_status = grafico_status_distribuicao(df_com_teste)
-                if fig_status:
-                    fig_status.update_layout(title_font_color='#FFFFFF')
-                    st.plotly_chart(fig_status, use_container_width=True, key="status_distribuicao_sprint")
+                with col_cobertura2:
+                    # Distribuição de status
+                    fig_status = grafico_status_distribuicao(df_com_teste)
+                    if fig_status:
+                        fig_status.update_layout(title_font_color='#FFFFFF')
+                        st.plotly_chart(fig_status, use_container_width=True, key="status_distribuicao_sprint")
             
-            st.markdown("---")
-            st.markdown("#### 👨‍💻 **Análise por Desenvolvedor**")
+                st.markdown("---")
+                st.markdown("#### 👨‍💻 **Análise por Desenvolvedor**")
             
-            col_dev1, col_dev2 = st.columns(2)
+                col_dev1, col_dev2 = st.columns(2)
             
-            with col_dev1:
-                fig_aprovadas_dev = grafico_ranking_aprovadas_por_dev(df_com_teste)
-                if fig_aprovadas_dev:
-                    fig_aprovadas_dev.update_layout(title_font_color='#FFFFFF')
-                    st.plotly_chart(fig_aprovadas_dev, use_container_width=True, key="ranking_aprovadas_por_dev")
-                else:
-                    st.info("📋 Dados insuficientes para ranking de tarefas aprovadas")
+                with col_dev1:
+                    fig_aprovadas_dev = grafico_ranking_aprovadas_por_dev(df_com_teste)
+                    if fig_aprovadas_dev:
+                        fig_aprovadas_dev.update_layout(title_font_color='#FFFFFF')
+                        st.plotly_chart(fig_aprovadas_dev, use_container_width=True, key="ranking_aprovadas_por_dev")
+                    else:
+                        st.info("📋 Dados insuficientes para ranking de tarefas aprovadas")
             
-            with col_dev2:
-                fig_rejeitadas_dev = grafico_rejeicoes_por_dev(df_com_teste)
-                if fig_rejeitadas_dev:
-                    fig_rejeitadas_dev.update_layout(title_font_color='#FFFFFF')
-                    st.plotly_chart(fig_rejeitadas_dev, use_container_width=True, key="rejeicoes_por_dev_sprint")
-                else:
-                    st.info("📋 Dados insuficientes para análise de rejeições por desenvolvedor")
+                with col_dev2:
+                    fig_rejeitadas_dev = grafico_rejeicoes_por_dev(df_com_teste)
+                    if fig_rejeitadas_dev:
+                        fig_rejeitadas_dev.update_layout(title_font_color='#FFFFFF')
+                        st.plotly_chart(fig_rejeitadas_dev, use_container_width=True, key="rejeicoes_por_dev_sprint")
+                    else:
+                        st.info("📋 Dados insuficientes para análise de rejeições por desenvolvedor")
             
-            col_dev3, col_dev4 = st.columns(2)
+                col_dev3, col_dev4 = st.columns(2)
             
-            with col_dev3:
-                fig_retestadas_dev = grafico_tarefas_retestadas_por_dev(df_com_teste)
-                if fig_retestadas_dev:
-                    fig_retestadas_dev.update_layout(title_font_color='#FFFFFF')
-                    st.plotly_chart(fig_retestadas_dev, use_container_width=True, key="tarefas_retestadas_por_dev")
-                else:
-                    st.info("📋 Dados insuficientes para análise de tarefas retestadas")
+                with col_dev3:
+                    fig_retestadas_dev = grafico_tarefas_retestadas_por_dev(df_com_teste)
+                    if fig_retestadas_dev:
+                        fig_retestadas_dev.update_layout(title_font_color='#FFFFFF')
+                        st.plotly_chart(fig_retestadas_dev, use_container_width=True, key="tarefas_retestadas_por_dev")
+                    else:
+                        st.info("📋 Dados insuficientes para análise de tarefas retestadas")
             
-            with col_dev4:
-                st.empty()
+                with col_dev4:
+                    st.empty()
         
-        with tab4:
-            st.markdown("### 🧑‍🤝‍🧑 **Visão por Testador**")
-            st.markdown("*Ranking de performance, produtividade e comparação entre testadores*")
+        with tab4 as ativa:
+            if ativa:
+                st.markdown("### 🧑‍🤝‍🧑 **Visão por Testador**")
+                st.markdown("*Ranking de performance, produtividade e comparação entre testadores*")
             
-            # Botão de exportação PDF
-            col_export_testador, col_space_testador = st.columns([1, 3])
-            with col_export_testador:
-                botao_exportar_pdf("Visao_por_Testador", criar_pdf_generico, df_com_teste, df, df_sem_teste)
+                # Botão de exportação PDF
+                col_export_testador, col_space_testador = st.columns([1, 3])
+                with col_export_testador:
+                    botao_exportar_pdf("Visao_por_Testador", criar_pdf_generico, df_com_teste, df, df_sem_teste)
             
-            st.markdown("---")
+                st.markdown("---")
             
-            if 'Responsavel pelo teste' in df_com_teste.columns and not df_com_teste.empty:
-                testador_stats = df_com_teste.groupby('Responsavel pelo teste').agg({
-                    'Status': ['count', lambda x: (x == 'REJEITADA').sum(), lambda x: (x == 'APROVADA').sum(), lambda x: (x == 'PRONTO PARA PUBLICAÇÃO').sum()]
-                }).round(1)
+                if 'Responsavel pelo teste' in df_com_teste.columns and not df_com_teste.empty:
+                    testador_stats = df_com_teste.groupby('Responsavel pelo teste', observed=True).agg({
+                        'Status': ['count', lambda x: (x == 'REJEITADA').sum(), lambda x: (x == 'APROVADA').sum(), lambda x: (x == 'PRONTO PARA PUBLICAÇÃO').sum()]
+                    }).round(1)
                 
-                testador_stats.columns = ['Total_Testes', 'Bugs_Encontrados', 'Testes_Aprovados', 'Testes_Prontos']
-                testador_stats['Total_Aprovadas'] = testador_stats['Testes_Aprovados'] + testador_stats['Testes_Prontos']
-                testador_stats['Taxa_Deteccao'] = (testador_stats['Bugs_Encontrados'] / testador_stats['Total_Testes'] * 100).round(1)
-                testador_stats['Taxa_Aprovacao'] = (testador_stats['Total_Aprovadas'] / testador_stats['Total_Testes'] * 100).round(1)
-                testador_stats['Produtividade'] = testador_stats['Total_Testes']
-                testador_stats = testador_stats.reset_index()
+                    testador_stats.columns = ['Total_Testes', 'Bugs_Encontrados', 'Testes_Aprovados', 'Testes_Prontos']
+                    testador_stats['Total_Aprovadas'] = testador_stats['Testes_Aprovados'] + testador_stats['Testes_Prontos']
+                    testador_stats['Taxa_Deteccao'] = (testador_stats['Bugs_Encontrados'] / testador_stats['Total_Testes'] * 100).round(1)
+                    testador_stats['Taxa_Aprovacao'] = (testador_stats['Total_Aprovadas'] / testador_stats['Total_Testes'] * 100).round(1)
+                    testador_stats['Produtividade'] = testador_stats['Total_Testes']
+                    testador_stats = testador_stats.reset_index()
                 
-                # Insights destacados
-                st.markdown("#### 💡 **Insights de Performance**")
+                    # Insights destacados
+                    st.markdown("#### 💡 **Insights de Performance**")
                 
-                total_tarefas = testador_stats['Total_Testes'].sum()
-                media_aprovacao = testador_stats['Taxa_Aprovacao'].mean()
+                    total_tarefas = testador_stats['Total_Testes'].sum()
+                    media_aprovacao = testador_stats['Taxa_Aprovacao'].mean()
                 
-                col_insight1, col_insight2 = st.columns(2)
+                    col_insight1, col_insight2 = st.columns(2)
                 
-                with col_insight1:
-                    testadores_nomes = ' e '.join(testador_stats['Responsavel pelo teste'].tolist())
-                    st.success(f"🎯 **Eficiência por pessoa:** {testadores_nomes} juntos validaram {int(total_tarefas)} tarefas com taxa de aprovação média de {media_aprovacao:.1f}%.")
+                    with col_insight1:
+                        testadores_nomes = ' e '.join(testador_stats['Responsavel pelo teste'].tolist())
+                        st.success(f"🎯 **Eficiência por pessoa:** {testadores_nomes} juntos validaram {int(total_tarefas)} tarefas com taxa de aprovação média de {media_aprovacao:.1f}%.")
                 
-                with col_insight2:
-                    acima_media = testador_stats[testador_stats['Taxa_Aprovacao'] >= media_aprovacao]
-                    if len(acima_media) >= 2:
-                        st.info(f"⭐ **Qualidade similar:** Ambos testadores entregaram acima da média com qualidade similar — excelente consistência da equipe!")
+                    with col_insight2:
+                        acima_media = testador_stats[testador_stats['Taxa_Aprovacao'] >= media_aprovacao]
+                        if len(acima_media) >= 2:
+                            st.info(f"⭐ **Qualidade similar:** Ambos testadores entregaram acima da média com qualidade similar — excelente consistência da equipe!")
                 
-                st.markdown("---")
-                st.markdown("#### 📊 **Comparação Visual de Performance**")
-                
-                # Gráfico de comparação
-                col_graf1, col_graf2 = st.columns(2)
-                
-                with col_graf1:
-                    # Gráfico de barras comparativo - Produtividade
-                    import plotly.express as px
-                    fig_prod = px.bar(
-                        testador_stats,
-                        x='Responsavel pelo teste',
-                        y='Total_Testes',
-                        title='📈 Comparativo de Produtividade',
-                        color='Total_Testes',
-                        color_continuous_scale=['#4ECDC4', '#45B7D1'],
-                        text='Total_Testes'
-                    )
-                    fig_prod.update_traces(textposition='outside')
-                    fig_prod.update_coloraxes(showscale=False)
-                    fig_prod.update_layout(
-                        title_font_color='#FFFFFF',
-                        xaxis_title='Testador',
-                        yaxis_title='Total de Testes',
-                        showlegend=False,
-                        margin=dict(t=50, b=80, l=80, r=80),
-                        height=450
-                    )
-                    fig_prod.update_xaxes(tickangle=45)
-                    st.plotly_chart(fig_prod, use_container_width=True, key="comparativo_produtividade")
-                
-                with col_graf2:
-                    # Gráfico de barras comparativo - Taxas
-                    fig_taxas = px.bar(
-                        testador_stats,
-                        x='Responsavel pelo teste',
-                        y=['Taxa_Aprovacao', 'Taxa_Deteccao'],
-                        title='📊 Comparativo de Taxas (%)',
-                        color_discrete_sequence=['#28a745', '#ffc107'],
-                        barmode='group',
-                        text_auto=True
-                    )
+                    st.markdown("---")
+                    st.markdown("#### 📊 **Comparação Visual de Performance**")
+                
+                    # Gráfico de comparação
+                    col_graf1, col_graf2 = st.columns(2)
+                
+                    with col_graf1:
+                        # Gráfico de barras comparativo - Produtividade
+                        import plotly.express as px
+                        fig_prod = px.bar(
+                            testador_stats,
+                            x='Responsavel pelo teste',
+                            y='Total_Testes',
+                            title='📈 Comparativo de Produtividade',
+                            color='Total_Testes',
+                            color_continuous_scale=['#4ECDC4', '#45B7D1'],
+                            text='Total_Testes'
+                        )
+                        fig_prod.update_traces(textposition='outside')
+                        fig_prod.update_coloraxes(showscale=False)
+                        fig_prod.update_layout(
+                            title_font_color='#FFFFFF',
+                            xaxis_title='Testador',
+                            yaxis_title='Total de Testes',
+                            showlegend=False,
+                            margin=dict(t=50, b=80, l=80, r=80),
+                            height=450
+                        )
+                        fig_prod.update_xaxes(tickangle=45)
+                        st.plotly_chart(fig_prod, use_container_width=True, key="comparativo_produtividade")
+                
+                    with col_graf2:
+                        # Gráfico de barras comparativo - Taxas
+                        fig_taxas = px.bar(
+                            testador_stats,
+                            x='Responsavel pelo teste',
+                            y=['Taxa_Aprovacao', 'Taxa_Deteccao'],
+                            title='📊 Comparativo de Taxas (%)',
+                            color_discrete_sequence=['#28a745', '#ffc107'],
+                            barmode='group',
+                            text_auto=True
+                        )
                     
-                    # Renomear legendas para serem mais claras
-                    newnames = {'Taxa_Aprovacao': 'Taxa de Aprovação (%)', 'Taxa_Deteccao': 'Bugs Encontrados (%)'}
-                    fig_taxas.for_each_trace(lambda t: t.update(name = newnames[t.name]))
+                        # Renomear legendas para serem mais claras
+                        newnames = {'Taxa_Aprovacao': 'Taxa de Aprovação (%)', 'Taxa_Deteccao': 'Bugs Encontrados (%)'}
+                        fig_taxas.for_each_trace(lambda t: t.update(name = newnames[t.name]))
                     
-                    fig_taxas.update_layout(
-                        title_font_color='#FFFFFF',
-                        xaxis_title='Testador',
-                        yaxis_title='Percentual (%)',
-                        legend_title='Métricas',
-                        margin=dict(t=50, b=120, l=80, r=80),
-                        height=450
-                    )
-                    fig_taxas.update_traces(texttemplate='%{y:.1f}%', textposition='outside')
-                    fig_taxas.update_xaxes(tickangle=45)
-                    st.plotly_chart(fig_taxas, use_container_width=True, key="comparativo_taxas")
-                
-                st.markdown("---")
-                st.markdown("#### 🏆 **Ranking Detalhado de Performance**")
-            
-                col1, col2 = st.columns(2)
+                        fig_taxas.update_layout(
+                            title_font_color='#FFFFFF',
+                            xaxis_title='Testador',
+                            yaxis_title='Percentual (%)',
+                            legend_title='Métricas',
+                            margin=dict(t=50, b=120, l=80, r=80),
+                            height=450
+                        )
+                        fig_taxas.update_traces(texttemplate='%{y:.1f}%', textposition='outside')
+                        fig_taxas.update_xaxes(tickangle=45)
+                        st.plotly_chart(fig_taxas, use_container_width=True, key="comparativo_taxas")
                 
-                with col1:
-                    st.markdown("**📊 Métricas por Testador**")
-                    for _, row in testador_stats.iterrows():
-                        with st.expander(f"👤 {row['Responsavel pelo teste']}"):
-                            col_a, col_b, col_c = st.columns(3)
-                            with col_a:
-                                st.metric("Total de Testes", int(row['Total_Testes']))
-                            with col_b:
-                                st.metric("Bugs Encontrados", int(row['Bugs_Encontrados']))
-                            with col_c:
-                                st.metric("Testes Aprovados", int(row['Testes_Aprovados']))
+                    st.markdown("---")
+                    st.markdown("#### 🏆 **Ranking Detalhado de Performance**")
+            
+                    col1, col2 = st.columns(2)
+                
+                    with col1:
+                        st.markdown("**📊 Métricas por Testador**")
+                        for _, row in testador_stats.iterrows():
+                            with st.expander(f"👤 {row['Responsavel pelo teste']}"):
+                                col_a, col_b, col_c = st.columns(3)
+                                with col_a:
+                                    st.metric("Total de Testes", int(row['Total_Testes']))
+                                with col_b:
+                                    st.metric("Bugs Encontrados", int(row['Bugs_Encontrados']))
+                                with col_c:
+                                    st.metric("Testes Aprovados", int(row['Testes_Aprovados']))
                             
-                            col_d, col_e = st.columns(2)
-                            with col_d:
-                                st.metric("Bugs Encontrados (%)", f"{row['Taxa_Deteccao']:.1f}%")
-                            with col_e:
-                                st.metric("Taxa de Aprovação", f"{row['Taxa_Aprovacao']:.1f}%")
-                
-                with col2:
-                    st.markdown("**📈 Ranking de Performance**")
+                                col_d, col_e = st.columns(2)
+                                with col_d:
+                                    st.metric("Bugs Encontrados (%)", f"{row['Taxa_Deteccao']:.1f}%")
+                                with col_e:
+                                    st.metric("Taxa de Aprovação", f"{row['Taxa_Aprovacao']:.1f}%")
+                
+                    with col2:
+                        st.markdown("**📈 Ranking de Performance**")
                     
-                    ranking_produtividade = testador_stats.sort_values('Total_Testes', ascending=False)
-                    st.markdown("🏆 **Produtividade (Total de Testes)**")
-                    for i, (_, row) in enumerate(ranking_produtividade.iterrows(), 1):
-                        emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else "📍"
-                        st.write(f"{emoji} {i}º - {row['Responsavel pelo teste']}: {int(row['Total_Testes'])} testes")
+                        ranking_produtividade = testador_stats.sort_values('Total_Testes', ascending=False)
+                        st.markdown("🏆 **Produtividade (Total de Testes)**")
+                        for i, (_, row) in enumerate(ranking_produtividade.iterrows(), 1):
+                            emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else "📍"
+                            st.write(f"{emoji} {i}º - {row['Responsavel pelo teste']}: {int(row['Total_Testes'])} testes")
                     
-                    st.markdown("")
-                    ranking_deteccao = testador_stats.sort_values('Taxa_Deteccao', ascending=False)
-                    st.markdown("🔍 **Bugs Encontrados (%)**")
-                    for i, (_, row) in enumerate(ranking_deteccao.iterrows(), 1):
-                        emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else "📍"
-                        st.write(f"{emoji} {i}º - {row['Responsavel pelo teste']}: {row['Taxa_Deteccao']:.1f}%")
+                        st.markdown("")
+                        ranking_deteccao = testador_stats.sort_values('Taxa_Deteccao', ascending=False)
+                        st.markdown("🔍 **Bugs Encontrados (%)**")
+                        for i, (_, row) in enumerate(ranking_deteccao.iterrows(), 1):
+                            emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else "📍"
+                            st.write(f"{emoji} {i}º - {row['Responsavel pelo teste']}: {row['Taxa_Deteccao']:.1f}%")
                     
+                        st.markdown("")
+                        ranking_aprovacao = testador_stats.sort_values('Taxa_Aprovacao', ascending=False)
+                        st.markdown("✅ **Taxa de Aprovação**")
+                        for i, (_, row) in enumerate(ranking_aprovacao.iterrows(), 1):
+                            emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else "📍"
+                            st.write(f"{emoji} {i}º - {row['Responsavel pelo teste']}: {row['Taxa_Aprovacao']:.1f}%")
+                
                     st.markdown("")
-                    ranking_aprovacao = testador_stats.sort_values('Taxa_Aprovacao', ascending=False)
-                    st.markdown("✅ **Taxa de Aprovação**")
-                    for i, (_, row) in enumerate(ranking_aprovacao.iterrows(), 1):
-                        emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else "📍"
-                        st.write(f"{emoji} {i}º - {row['Responsavel pelo teste']}: {row['Taxa_Aprovacao']:.1f}%")
-                
-                st.markdown("")
-                st.markdown("**📊 Comparativo Visual**")
-                
-                fig_comp = go.Figure()
-                
-                fig_comp.add_trace(go.Bar(
-                    name='Total de Testes',
-                    x=testador_stats['Responsavel pelo teste'],
-                    y=testador_stats['Total_Testes'],
-                    marker_color='lightgreen',
-                    text=testador_stats['Total_Testes'],
-                    textposition='outside'
-                ))
+                    st.markdown("**📊 Comparativo Visual**")
                 
-                fig_comp.update_layout(
-                    title="📊 Comparativo de Produtividade entre Testadores",
-                    xaxis_title="Testador",
-                    yaxis_title="Quantidade de Testes",
-                    margin=dict(t=50, b=50, l=50, r=50),
-                    height=400
-                )
+                    fig_comp = go.Figure()
                 
-                st.plotly_chart(fig_comp, use_container_width=True, key="comparativo_produtividade_detalhado")
+                    fig_comp.add_trace(go.Bar(
+                        name='Total de Testes',
+                        x=testador_stats['Responsavel pelo teste'],
+                        y=testador_stats['Total_Testes'],
+                        marker_color='lightgreen',
+                        text=testador_stats['Total_Testes'],
+                        textposition='outside'
+                    ))
                 
-                fig_taxa = go.Figure()
+                    fig_comp.update_layout(
+                        title="📊 Comparativo de Produtividade entre Testadores",
+                        xaxis_title="Testador",
+                        yaxis_title="Quantidade de Testes",
+                        margin=dict(t=50, b=50, l=50, r=50),
+                        height=400
+                    )
                 
-                fig_taxa.add_trace(go.Scatter(
-                    name='Bugs Encontrados (%)',
-                    x=testador_stats['Responsavel pelo teste'],
-                    y=testador_stats['Taxa_Deteccao'],
-                    mode='lines+markers',
-                    marker_color='red',
-                    line=dict(width=3),
-                    text=[f"{val:.1f}%" for val in testador_stats['Taxa_Deteccao']],
-                    textposition='top center'
-                ))
+                    st.plotly_chart(fig_comp, use_container_width=True, key="comparativo_produtividade_detalhado")
                 
-                fig_taxa.add_trace(go.Scatter(
-                    name='Taxa de Aprovação',
-                    x=testador_stats['Responsavel pelo teste'],
-                    y=testador_stats['Taxa_Aprovacao'],
-                    mode='lines+markers',
-                    marker_color='green',
-                    line=dict(width=3),
-                    text=[f"{val:.1f}%" for val in testador_stats['Taxa_Aprovacao']],
-                    textposition='bottom center'
-                ))
+                    fig_taxa = go.Figure()
                 
-                fig_taxa.update_layout(
-                    title="📈 Comparativo de Taxas de Performance",
-                    xaxis_title="Testador",
-                    yaxis_title="Percentual (%)",
-                    margin=dict(t=50, b=50, l=50, r=50),
-                    height=400
-                )
+                    fig_taxa.add_trace(go.Scatter(
+                        name='Bugs Encontrados (%)',
+                        x=testador_stats['Responsavel pelo teste'],
+                        y=testador_stats['Taxa_Deteccao'],
+                        mode='lines+markers',
+                        marker_color='red',
+                        line=dict(width=3),
+                        text=[f"{val:.1f}%" for val in testador_stats['Taxa_Deteccao']],
+                        textposition='top center'
+                    ))
+                
+                    fig_taxa.add_trace(go.Scatter(
+                        name='Taxa de Aprovação',
+                        x=testador_stats['Responsavel pelo teste'],
+                        y=testador_stats['Taxa_Aprovacao'],
+                        mode='lines+markers',
+                        marker_color='green',
+                        line=dict(width=3),
+                        text=[f"{val:.1f}%" for val in testador_stats['Taxa_Aprovacao']],
+                        textposition='bottom center'
+                    ))
                 
-                st.plotly_chart(fig_taxa, use_container_width=True, key="comparativo_taxas_detalhado")
+                    fig_taxa.update_layout(
+                        title="📈 Comparativo de Taxas de Performance",
+                        xaxis_title="Testador",
+                        yaxis_title="Percentual (%)",
+                        margin=dict(t=50, b=50, l=50, r=50),
+                        height=400
+                    )
+                
+                    st.plotly_chart(fig_taxa, use_container_width=True, key="comparativo_taxas_detalhado")
         
 
         
-        with tab5:
-            st.markdown("### 📋 **Tarefas Sem Teste**")
-            st.markdown("*Análise detalhada das tarefas que não passaram por testes de qualidade*")
+        with tab5 as ativa:
+            if ativa:
+                st.markdown("### 📋 **Tarefas Sem Teste**")
+                st.markdown("*Análise detalhada das tarefas que não passaram por testes de qualidade*")
             
-            # Botão de exportação PDF
-            col_export_sem_teste, col_space_sem_teste = st.columns([1, 3])
-            with col_export_sem_teste:
-                botao_exportar_pdf("Tarefas_Sem_Teste", criar_pdf_generico, df_com_teste, df, df_sem_teste)
+                # Botão de exportação PDF
+                col_export_sem_teste, col_space_sem_teste = st.columns([1, 3])
+                with col_export_sem_teste:
+                    botao_exportar_pdf("Tarefas_Sem_Teste", criar_pdf_generico, df_com_teste, df, df_sem_teste)
             
-            st.markdown("---")
+                st.markdown("---")
             
-            if not df_sem_teste.empty:
-                # Filtros para tarefas sem teste
-                st.markdown("#### 🔍 **Filtros**")
+                if not df_sem_teste.empty:
+                    # Filtros para tarefas sem teste
+                    st.markdown("#### 🔍 **Filtros**")
                 
-                col_filter1, col_filter2, col_filter3 = st.columns(3)
+                    col_filter1, col_filter2, col_filter3 = st.columns(3)
                 
-                with col_filter1:
-                    # Filtro por Sprint
-                    sprints_sem_teste = ['Todos'] + sorted(df_sem_teste['Sprint'].dropna().unique().tolist()) if 'Sprint' in df_sem_teste.columns else ['Todos']
-                    sprint_selecionado = st.selectbox("Sprint:", sprints_sem_teste, key="sprint_sem_teste")
+                    with col_filter1:
+                        # Filtro por Sprint
+                        sprints_sem_teste = ['Todos'] + sorted(df_sem_teste['Sprint'].dropna().unique().tolist()) if 'Sprint' in df_sem_teste.columns else ['Todos']
+                        sprint_selecionado = st.selectbox("Sprint:", sprints_sem_teste, key="sprint_sem_teste")
                 
-                with col_filter2:
-                    # Filtro por Time
-                    times_sem_teste = ['Todos'] + sorted(df_sem_teste['Time'].dropna().unique().tolist()) if 'Time' in df_sem_teste.columns else ['Todos']
-                    time_selecionado = st.selectbox("Time:", times_sem_teste, key="time_sem_teste")
+                    with col_filter2:
+                        # Filtro por Time
+                        times_sem_teste = ['Todos'] + sorted(df_sem_teste['Time'].dropna().unique().tolist()) if 'Time' in df_sem_teste.columns else ['Todos']
+                        time_selecionado = st.selectbox("Time:", times_sem_teste, key="time_sem_teste")
                 
-                with col_filter3:
-                    # Filtro por Responsável
-                    responsaveis_sem_teste = ['Todos'] + sorted(df_sem_teste['Responsável'].dropna().unique().tolist()) if 'Responsável' in df_sem_teste.columns else ['Todos']
-                    responsavel_selecionado = st.selectbox("Responsável:", responsaveis_sem_teste, key="responsavel_sem_teste")
+                    with col_filter3:
+                        # Filtro por Responsável
+                        responsaveis_sem_teste = ['Todos'] + sorted(df_sem_teste['Responsável'].dropna().unique().tolist()) if 'Responsável' in df_sem_teste.columns else ['Todos']
+                        responsavel_selecionado = st.selectbox("Responsável:", responsaveis_sem_teste, key="responsavel_sem_teste")
                 
-                # Aplicar filtros
-                df_sem_teste_filtrado = df_sem_teste.copy()
+                    # Aplicar filtros
+                    df_sem_teste_filtrado = df_sem_teste.copy()
                 
-                if sprint_selecionado != 'Todos':
-                    df_sem_teste_filtrado = df_sem_teste_filtrado[df_sem_teste_filtrado['Sprint'] == sprint_selecionado]
+                    if sprint_selecionado != 'Todos':
+                        df_sem_teste_filtrado = df_sem_teste_filtrado[df_sem_teste_filtrado['Sprint'] == sprint_selecionado]
                 
-                if time_selecionado != 'Todos':
-                    df_sem_teste_filtrado = df_sem_teste_filtrado[df_sem_teste_filtrado['Time'] == time_selecionado]
+                    if time_selecionado != 'Todos':
+                        df_sem_teste_filtrado = df_sem_teste_filtrado[df_sem_teste_filtrado['Time'] == time_selecionado]
                 
-                if responsavel_selecionado != 'Todos':
-                    df_sem_teste_filtrado = df_sem_teste_filtrado[df_sem_teste_filtrado['Responsável'] == responsavel_selecionado]
+                    if responsavel_selecionado != 'Todos':
+                        df_sem_teste_filtrado = df_sem_teste_filtrado[df_sem_teste_filtrado['Responsável'] == responsavel_selecionado]
                 
-                st.markdown("---")
+                    st.markdown("---")
                 
-                # Métricas resumidas
-                col_metric1, col_metric2, col_metric3, col_metric4 = st.columns(4)
+                    # Métricas resumidas
+                    col_metric1, col_metric2, col_metric3, col_metric4 = st.columns(4)
                 
-                with col_metric1:
-                    st.metric("Total de Tarefas", len(df_sem_teste_filtrado))
+                    with col_metric1:
+                        st.metric("Total de Tarefas", len(df_sem_teste_filtrado))
                 
-                with col_metric2:
-                    times_unicos = df_sem_teste_filtrado['Time'].nunique() if 'Time' in df_sem_teste_filtrado.columns else 0
-                    st.metric("Times Envolvidos", times_unicos)
+                    with col_metric2:
+                        times_unicos = df_sem_teste_filtrado['Time'].nunique() if 'Time' in df_sem_teste_filtrado.columns else 0
+                        st.metric("Times Envolvidos", times_unicos)
                 
-                with col_metric3:
-                    sprints_unicos = df_sem_teste_filtrado['Sprint'].nunique() if 'Sprint' in df_sem_teste_filtrado.columns else 0
-                    st.metric("Sprints Afetados", sprints_unicos)
+                    with col_metric3:
+                        sprints_unicos = df_sem_teste_filtrado['Sprint'].nunique() if 'Sprint' in df_sem_teste_filtrado.columns else 0
+                        st.metric("Sprints Afetados", sprints_unicos)
                 
-                with col_metric4:
-                    responsaveis_unicos = df_sem_teste_filtrado['Responsável'].nunique() if 'Responsável' in df_sem_teste_filtrado.columns else 0
-                    st.metric("Desenvolvedores", responsaveis_unicos)
+                    with col_metric4:
+                        responsaveis_unicos = df_sem_teste_filtrado['Responsável'].nunique() if 'Responsável' in df_sem_teste_filtrado.columns else 0
+                        st.metric("Desenvolvedores", responsaveis_unicos)
                 
-                st.markdown("---")
+                    st.markdown("---")
                 
-                # Gráficos de análise
-                if not df_sem_teste_filtrado.empty:
-                    col_chart1, col_chart2 = st.columns(2)
+                    # Gráficos de análise
+                    if not df_sem_teste_filtrado.empty:
+                        col_chart1, col_chart2 = st.columns(2)
                     
-                    with col_chart1:
-                        # Gráfico por Time
-                        if 'Time' in df_sem_teste_filtrado.columns:
-                            time_counts = df_sem_teste_filtrado['Time'].value_counts()
-                            if not time_counts.empty:
-                                fig_time = px.bar(
-                                    x=time_counts.values,
-                                    y=time_counts.index,
-                                    orientation='h',
-                                    title='Tarefas Sem Teste por Time',
-                                    labels={'x': 'Quantidade', 'y': 'Time'}
-                                )
-                                fig_time.update_traces(marker_color='#FF6B6B', text=time_counts.values, textposition='outside')
-                                fig_time.update_layout(
-                                    margin=dict(t=50, b=80, l=150, r=80),
-                                    height=400
-                                )
-                                st.plotly_chart(fig_time, use_container_width=True)
+                        with col_chart1:
+                            # Gráfico por Time
+                            if 'Time' in df_sem_teste_filtrado.columns:
+                                time_counts = contar_ocorrencias(df_sem_teste_filtrado['Time'])
+                                if not time_counts.empty:
+                                    fig_time = px.bar(
+                                        x=time_counts.values,
+                                        y=time_counts.index,
+                                        orientation='h',
+                                        title='Tarefas Sem Teste por Time',
+                                        labels={'x': 'Quantidade', 'y': 'Time'}
+                                    )
+                                    fig_time.update_traces(marker_color='#FF6B6B', text=time_counts.values, textposition='outside')
+                                    fig_time.update_layout(
+                                        margin=dict(t=50, b=80, l=150, r=80),
+                                        height=400
+                                    )
+                                    st.plotly_chart(fig_time, use_container_width=True)
                     
-                    with col_chart2:
-                        # Gráfico por Sprint
-                        if 'Sprint' in df_sem_teste_filtrado.columns:
-                            sprint_counts = df_sem_teste_filtrado['Sprint'].value_counts().sort_index()
-                            if not sprint_counts.empty:
-                                fig_sprint = px.bar(
-                                    x=sprint_counts.index,
-                                    y=sprint_counts.values,
-                                    title='Tarefas Sem Teste por Sprint',
-                                    labels={'x': 'Sprint', 'y': 'Quantidade'}
-                                )
-                                fig_sprint.update_traces(marker_color='#FFA726', text=sprint_counts.values, textposition='outside')
-                                fig_sprint.update_layout(
-                                    margin=dict(t=50, b=80, l=80, r=80),
-                                    height=400
-                                )
-                                st.plotly_chart(fig_sprint, use_container_width=True)
+                        with col_chart2:
+                            # Gráfico por Sprint
+                            if 'Sprint' in df_sem_teste_filtrado.columns:
+                                sprint_counts = contar_ocorrencias(df_sem_teste_filtrado['Sprint']).sort_index()
+                                if not sprint_counts.empty:
+                                    fig_sprint = px.bar(
+                                        x=sprint_counts.index,
+                                        y=sprint_counts.values,
+                                        title='Tarefas Sem Teste por Sprint',
+                                        labels={'x': 'Sprint', 'y': 'Quantidade'}
+                                    )
+                                    fig_sprint.update_traces(marker_color='#FFA726', text=sprint_counts.values, textposition='outside')
+                                    fig_sprint.update_layout(
+                                        margin=dict(t=50, b=80, l=80, r=80),
+                                        height=400
+                                    )
+                                    st.plotly_chart(fig_sprint, use_container_width=True)
                 
-                st.markdown("---")
+                    st.markdown("---")
                 
-                # Tabela de dados filtrados
-                st.markdown("#### 📊 **Dados Detalhados**")
-                if st.checkbox("Mostrar tabela de tarefas sem teste", key="show_sem_teste_table"):
-                    st.dataframe(df_sem_teste_filtrado, use_container_width=True)
-                    st.caption(f"Exibindo {len(df_sem_teste_filtrado)} de {len(df_sem_teste)} tarefas sem teste")
+                    # Tabela de dados filtrados
+                    st.markdown("#### 📊 **Dados Detalhados**")
+                    if st.checkbox("Mostrar tabela de tarefas sem teste", key="show_sem_teste_table"):
+                        st.dataframe(df_sem_teste_filtrado, use_container_width=True)
+                        st.caption(f"Exibindo {len(df_sem_teste_filtrado)} de {len(df_sem_teste)} tarefas sem teste")
                     
-                    # Opção de download
-                    if not df_sem_teste_filtrado.empty:
-                        csv = df_sem_teste_filtrado.to_csv(index=False)
-                        st.download_button(
-                            label="📥 Baixar dados filtrados (CSV)",
-                            data=csv,
-                            file_name=f"tarefas_sem_teste_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                            mime="text/csv"
-                        )
-            else:
-                st.info("📋 Nenhuma tarefa sem teste encontrada nos dados carregados.")
-                st.markdown("""
+                        # Opção de download
+                        if not df_sem_teste_filtrado.empty:
+                            csv = df_sem_teste_filtrado.to_csv(index=False)
+                            st.download_button(
+                                label="📥 Baixar dados filtrados (CSV)",
+                                data=csv,
+                                file_name=f"tarefas_sem_teste_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                                mime="text/csv"
+                            )
+                else:
+                    st.info("📋 Nenhuma tarefa sem teste encontrada nos dados carregados.")
+                    st.markdown("""
                 ### ℹ️ **Sobre esta seção:**
                 
                 Esta aba mostra tarefas que foram marcadas com motivo "SEM TESTE", permitindo:
@@ -4158,157 +4757,158 @@ def main():
                 Isso ajuda a identificar padrões e tomar ações para melhorar a cobertura de testes.
                 """)
         
-        with tab6:
-            st.markdown("### 🔢 **Análise de Erros Encontrados**")
-            st.markdown("*Análise detalhada dos erros identificados durante os testes*")
+        with tab6 as ativa:
+            if ativa:
+                st.markdown("### 🔢 **Análise de Erros Encontrados**")
+                st.markdown("*Análise detalhada dos erros identificados durante os testes*")
             
-            # Botão de exportação PDF
-            col_export_erros, col_space_erros = st.columns([1, 3])
-            with col_export_erros:
-                botao_exportar_pdf("Analise_de_Erros", criar_pdf_generico, df_com_teste, df, df_sem_teste)
+                # Botão de exportação PDF
+                col_export_erros, col_space_erros = st.columns([1, 3])
+                with col_export_erros:
+                    botao_exportar_pdf("Analise_de_Erros", criar_pdf_generico, df_com_teste, df, df_sem_teste)
             
-            st.markdown("---")
+                st.markdown("---")
             
-            # Informação sobre o escopo da análise
-            st.info("ℹ️ **Importante**: A taxa de testes com erro é calculada sobre o total de testes realizados. O gráfico de distribuição mostra três categorias: testes com erro, testes sem erro e testes sem dados de erro preenchidos.")
+                # Informação sobre o escopo da análise
+                st.info("ℹ️ **Importante**: A taxa de testes com erro é calculada sobre o total de testes realizados. O gráfico de distribuição mostra três categorias: testes com erro, testes sem erro e testes sem dados de erro preenchidos.")
             
-            if 'Erros' in df_com_teste.columns:
-                # Verificar se há dados de erros
-                dados_erros = df_com_teste[df_com_teste['Erros'].notna()]
+                if 'Erros' in df_com_teste.columns:
+                    # Verificar se há dados de erros
+                    dados_erros = df_com_teste[df_com_teste['Erros'].notna()]
                 
-                if not dados_erros.empty:
-                    # Métricas principais de erros
-                    st.markdown("#### 📊 **Métricas de Erros**")
+                    if not dados_erros.empty:
+                        # Métricas principais de erros
+                        st.markdown("#### 📊 **Métricas de Erros**")
                     
-                    col_err1, col_err2, col_err3, col_err4 = st.columns(4)
+                        col_err1, col_err2, col_err3, col_err4 = st.columns(4)
                     
-                    with col_err1:
-                        total_erros = contar_total_erros(dados_erros)
-                        st.metric("🔢 Total de Erros", f"{total_erros:,}")
+                        with col_err1:
+                            total_erros = contar_total_erros(dados_erros)
+                            st.metric("🔢 Total de Erros", f"{total_erros:,}")
                     
-                    with col_err2:
-                        media_erros = calcular_media_erros_por_teste(dados_erros)
-                        st.metric("📊 Média por Teste", f"{media_erros:.1f}")
+                        with col_err2:
+                            media_erros = calcular_media_erros_por_teste(dados_erros)
+                            st.metric("📊 Média por Teste", f"{media_erros:.1f}")
                     
-                    with col_err3:
-                        distribuicao = analisar_distribuicao_erros(dados_erros)
-                        if distribuicao:
-                            st.metric("📈 Máximo de Erros", f"{distribuicao['max_erros_teste']}")
+                        with col_err3:
+                            distribuicao = analisar_distribuicao_erros(dados_erros)
+                            if distribuicao:
+                                st.metric("📈 Máximo de Erros", f"{distribuicao['max_erros_teste']}")
                     
-                    with col_err4:
-                        if distribuicao:
-                            testes_com_erro = distribuicao['testes_com_erro']
-                            total_testes = distribuicao['total_testes']
-                            taxa = (testes_com_erro / total_testes * 100) if total_testes > 0 else 0
-                            st.metric("⚠️ Taxa c/ Erro", f"{taxa:.1f}%")
+                        with col_err4:
+                            if distribuicao:
+                                testes_com_erro = distribuicao['testes_com_erro']
+                                total_testes = distribuicao['total_testes']
+                                taxa = (testes_com_erro / total_testes * 100) if total_testes > 0 else 0
+                                st.metric("⚠️ Taxa c/ Erro", f"{taxa:.1f}%")
                     
-                    st.markdown("---")
+                        st.markdown("---")
                     
-                    # Gráficos de análise de erros
-                    st.markdown("#### 📈 **Análise Visual de Erros**")
+                        # Gráficos de análise de erros
+                        st.markdown("#### 📈 **Análise Visual de Erros**")
                     
-                    col_graf_err1, col_graf_err2 = st.columns(2)
+                        col_graf_err1, col_graf_err2 = st.columns(2)
                     
-                    with col_graf_err1:
-                        # Erros por time
-                        fig_erros_time = grafico_erros_coluna_por_time(dados_erros)
-                        if fig_erros_time:
-                            st.plotly_chart(fig_erros_time, use_container_width=True, key="erros_coluna_por_time")
+                        with col_graf_err1:
+                            # Erros por time
+                            fig_erros_time = grafico_erros_coluna_por_time(dados_erros)
+                            if fig_erros_time:
+                                st.plotly_chart(fig_erros_time, use_container_width=True, key="erros_coluna_por_time")
                         
-                        # Distribuição de erros
-                        fig_dist_erros = grafico_distribuicao_erros(dados_erros)
-                        if fig_dist_erros:
-                            st.plotly_chart(fig_dist_erros, use_container_width=True, key="distribuicao_erros")
+                            # Distribuição de erros
+                            fig_dist_erros = grafico_distribuicao_erros(dados_erros)
+                            if fig_dist_erros:
+                                st.plotly_chart(fig_dist_erros, use_container_width=True, key="distribuicao_erros")
                     
-                    with col_graf_err2:
-                        # Erros por testador
-                        fig_erros_testador = grafico_erros_por_testador(dados_erros)
-                        if fig_erros_testador:
-                            st.plotly_chart(fig_erros_testador, use_container_width=True, key="erros_por_testador")
+                        with col_graf_err2:
+                            # Erros por testador
+                            fig_erros_testador = grafico_erros_por_testador(dados_erros)
+                            if fig_erros_testador:
+                                st.plotly_chart(fig_erros_testador, use_container_width=True, key="erros_por_testador")
                         
-                        # Média de erros por time
-                        fig_media_erros = grafico_media_erros_por_time(dados_erros)
-                        if fig_media_erros:
-                            st.plotly_chart(fig_media_erros, use_container_width=True, key="media_erros_por_time")
+                            # Média de erros por time
+                            fig_media_erros = grafico_media_erros_por_time(dados_erros)
+                            if fig_media_erros:
+                                st.plotly_chart(fig_media_erros, use_container_width=True, key="media_erros_por_time")
                     
-                    st.markdown("---")
+                        st.markdown("---")
                     
-                    # Insights automáticos sobre erros
-                    st.markdown("#### 💡 **Insights sobre Erros**")
+                        # Insights automáticos sobre erros
+                        st.markdown("#### 💡 **Insights sobre Erros**")
                     
-                    insights_erros = []
+                        insights_erros = []
                     
-                    # Insight sobre total de erros
-                    if total_erros > 0:
-                        if media_erros > 2:
-                            insights_erros.append(f"🚨 **ATENÇÃO**: Média de {media_erros:.1f} erros por teste é alta - revisar processos")
-                        elif media_erros > 1:
-                            insights_erros.append(f"⚠️ Média de {media_erros:.1f} erros por teste - monitorar tendência")
-                        else:
-                            insights_erros.append(f"✅ Média de {media_erros:.1f} erros por teste está em nível aceitável")
+                        # Insight sobre total de erros
+                        if total_erros > 0:
+                            if media_erros > 2:
+                                insights_erros.append(f"🚨 **ATENÇÃO**: Média de {media_erros:.1f} erros por teste é alta - revisar processos")
+                            elif media_erros > 1:
+                                insights_erros.append(f"⚠️ Média de {media_erros:.1f} erros por teste - monitorar tendência")
+                            else:
+                                insights_erros.append(f"✅ Média de {media_erros:.1f} erros por teste está em nível aceitável")
                     
-                    # Insight sobre distribuição
-                    if distribuicao:
-                        if distribuicao['max_erros_teste'] > 5:
-                            insights_erros.append(f"🔍 **CRÍTICO**: Teste com {distribuicao['max_erros_teste']} erros requer investigação")
+                        # Insight sobre distribuição
+                        if distribuicao:
+                            if distribuicao['max_erros_teste'] > 5:
+                                insights_erros.append(f"🔍 **CRÍTICO**: Teste com {distribuicao['max_erros_teste']} erros requer investigação")
                         
-                        taxa_sem_erro = (distribuicao['testes_sem_erro'] / distribuicao['total_testes'] * 100) if distribuicao['total_testes'] > 0 else 0
-                        if taxa_sem_erro > 70:
-                            insights_erros.append(f"✅ {taxa_sem_erro:.1f}% dos testes não encontraram erros - boa qualidade")
-                        elif taxa_sem_erro < 50:
-                            insights_erros.append(f"⚠️ Apenas {taxa_sem_erro:.1f}% dos testes não encontraram erros - revisar qualidade")
+                            taxa_sem_erro = (distribuicao['testes_sem_erro'] / distribuicao['total_testes'] * 100) if distribuicao['total_testes'] > 0 else 0
+                            if taxa_sem_erro > 70:
+                                insights_erros.append(f"✅ {taxa_sem_erro:.1f}% dos testes não encontraram erros - boa qualidade")
+                            elif taxa_sem_erro < 50:
+                                insights_erros.append(f"⚠️ Apenas {taxa_sem_erro:.1f}% dos testes não encontraram erros - revisar qualidade")
                     
-                    # Insight sobre time com mais erros
-                    erros_por_time = contar_erros_por_time(dados_erros)
-                    if not erros_por_time.empty:
-                        time_mais_erros = erros_por_time.index[0]
-                        qtd_erros_time = erros_por_time.iloc[0]
-                        insights_erros.append(f"🏢 Time **{time_mais_erros}** tem o maior número de erros ({qtd_erros_time})")
+                        # Insight sobre time com mais erros
+                        erros_por_time = contar_erros_por_time(dados_erros)
+                        if not erros_por_time.empty:
+                            time_mais_erros = erros_por_time.index[0]
+                            qtd_erros_time = erros_por_time.iloc[0]
+                            insights_erros.append(f"🏢 Time **{time_mais_erros}** tem o maior número de erros ({qtd_erros_time})")
                     
-                    # Insight sobre testador com mais erros
-                    erros_por_testador = contar_erros_por_testador(dados_erros)
-                    if not erros_por_testador.empty:
-                        testador_mais_erros = erros_por_testador.index[0]
-                        qtd_erros_testador = erros_por_testador.iloc[0]
-                        insights_erros.append(f"👤 Testador **{testador_mais_erros}** identificou mais erros ({qtd_erros_testador})")
+                        # Insight sobre testador com mais erros
+                        erros_por_testador = contar_erros_por_testador(dados_erros)
+                        if not erros_por_testador.empty:
+                            testador_mais_erros = erros_por_testador.index[0]
+                            qtd_erros_testador = erros_por_testador.iloc[0]
+                            insights_erros.append(f"👤 Testador **{testador_mais_erros}** identificou mais erros ({qtd_erros_testador})")
                     
-                    # Exibir insights
-                    for insight in insights_erros:
-                        if "CRÍTICO" in insight or "ATENÇÃO" in insight:
-                            st.error(insight)
-                        elif "⚠️" in insight:
-                            st.warning(insight)
-                        else:
-                            st.info(insight)
+                        # Exibir insights
+                        for insight in insights_erros:
+                            if "CRÍTICO" in insight or "ATENÇÃO" in insight:
+                                st.error(insight)
+                            elif "⚠️" in insight:
+                                st.warning(insight)
+                            else:
+                                st.info(insight)
                     
-                    st.markdown("---")
+                        st.markdown("---")
                     
-                    # Tabela detalhada de erros
-                    st.markdown("#### 📋 **Dados Detalhados de Erros**")
-                    if st.checkbox("Mostrar tabela de testes com erros", key="show_erros_table"):
-                        # Filtrar apenas testes com erros > 0
-                        dados_temp = dados_erros.copy()
-                        dados_temp['Erros'] = pd.to_numeric(dados_temp['Erros'], errors='coerce').fillna(0)
-                        dados_com_erros = dados_temp[dados_temp['Erros'] > 0].sort_values('Erros', ascending=False)
-                        if not dados_com_erros.empty:
-                            st.dataframe(dados_com_erros, use_container_width=True)
-                            st.caption(f"Exibindo {len(dados_com_erros)} testes que encontraram erros")
+                        # Tabela detalhada de erros
+                        st.markdown("#### 📋 **Dados Detalhados de Erros**")
+                        if st.checkbox("Mostrar tabela de testes com erros", key="show_erros_table"):
+                            # Filtrar apenas testes com erros > 0
+                            dados_temp = dados_erros.copy()
+                            dados_temp['Erros'] = pd.to_numeric(dados_temp['Erros'], errors='coerce').fillna(0)
+                            dados_com_erros = dados_temp[dados_temp['Erros'] > 0].sort_values('Erros', ascending=False)
+                            if not dados_com_erros.empty:
+                                st.dataframe(dados_com_erros, use_container_width=True)
+                                st.caption(f"Exibindo {len(dados_com_erros)} testes que encontraram erros")
                             
-                            # Opção de download
-                            csv = dados_com_erros.to_csv(index=False)
-                            st.download_button(
-                                label="📥 Baixar dados de erros (CSV)",
-                                data=csv,
-                                file_name=f"analise_erros_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                                mime="text/csv"
-                            )
-                        else:
-                            st.info("📋 Nenhum teste com erros encontrado nos dados filtrados.")
+                                # Opção de download
+                                csv = dados_com_erros.to_csv(index=False)
+                                st.download_button(
+                                    label="📥 Baixar dados de erros (CSV)",
+                                    data=csv,
+                                    file_name=f"analise_erros_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                                    mime="text/csv"
+                                )
+                            else:
+                                st.info("📋 Nenhum teste com erros encontrado nos dados filtrados.")
+                    else:
+                        st.info("📋 Nenhum dado de erro encontrado nos testes realizados.")
                 else:
-                    st.info("📋 Nenhum dado de erro encontrado nos testes realizados.")
-            else:
-                st.warning("⚠️ Coluna 'Erros' não encontrada na planilha. Verifique se a coluna foi adicionada corretamente.")
-                st.markdown("""
+                    st.warning("⚠️ Coluna 'Erros' não encontrada na planilha. Verifique se a coluna foi adicionada corretamente.")
+                    st.markdown("""
                 ### ℹ️ **Sobre esta seção:**
                 
                 Esta aba analisa a coluna "Erros" da planilha, mostrando:
@@ -4322,174 +4922,175 @@ def main():
                 Para usar esta funcionalidade, certifique-se de que a coluna "Erros" existe na planilha.
                 """)
         
-        with tab7:
-            st.markdown("### 🐛 **Análise Detalhada de Bugs**")
-            st.markdown("*Insights profissionais sobre defeitos identificados em produção*")
+        with tab7 as ativa:
+            if ativa:
+                st.markdown("### 🐛 **Análise Detalhada de Bugs**")
+                st.markdown("*Insights profissionais sobre defeitos identificados em produção*")
             
-            # Botão de exportação PDF
-            col_export_bugs, col_space_bugs = st.columns([1, 3])
-            with col_export_bugs:
-                botao_exportar_pdf("Analise_de_Bugs", criar_pdf_generico, df_com_teste, df, df_sem_teste)
+                # Botão de exportação PDF
+                col_export_bugs, col_space_bugs = st.columns([1, 3])
+                with col_export_bugs:
+                    botao_exportar_pdf("Analise_de_Bugs", criar_pdf_generico, df_com_teste, df, df_sem_teste)
             
-            st.markdown("---")
+                st.markdown("---")
             
-            # Carregar dados de bugs
-            df_bugs = carregar_dados_bugs()
+                # Carregar dados de bugs
+                df_bugs = carregar_dados_bugs()
             
-            if df_bugs is not None and not df_bugs.empty:
-                # Usar os dados de bugs sem filtros adicionais
-                df_bugs_filtrado = df_bugs.copy()
+                if df_bugs is not None and not df_bugs.empty:
+                    # Usar os dados de bugs sem filtros adicionais
+                    df_bugs_filtrado = df_bugs.copy()
                 
-                st.markdown("---")
-                # Processar métricas de bugs (usando dados filtrados)
-                metricas_bugs = processar_metricas_bugs(df_bugs_filtrado)
+                    st.markdown("---")
+                    # Processar métricas de bugs (usando dados filtrados)
+                    metricas_bugs = processar_metricas_bugs(df_bugs_filtrado)
                 
-                # Métricas principais de bugs
-                st.markdown("#### 📊 **Métricas Executivas de Bugs**")
+                    # Métricas principais de bugs
+                    st.markdown("#### 📊 **Métricas Executivas de Bugs**")
                 
-                col_bug1, col_bug2, col_bug3, col_bug4 = st.columns(4)
+                    col_bug1, col_bug2, col_bug3, col_bug4 = st.columns(4)
                 
-                with col_bug1:
-                    st.metric("🐛 Total de Bugs", metricas_bugs.get('total_bugs', 0))
+                    with col_bug1:
+                        st.metric("🐛 Total de Bugs", metricas_bugs.get('total_bugs', 0))
                 
-                with col_bug2:
-                    st.metric("🚨 Bugs Críticos", metricas_bugs.get('bugs_criticos', 0))
+                    with col_bug2:
+                        st.metric("🚨 Bugs Críticos", metricas_bugs.get('bugs_criticos', 0))
                 
-                with col_bug3:
-                    st.metric("🔓 Bugs Abertos", metricas_bugs.get('bugs_abertos', 0))
+                    with col_bug3:
+                        st.metric("🔓 Bugs Abertos", metricas_bugs.get('bugs_abertos', 0))
                 
-                with col_bug4:
-                    st.metric("✅ Bugs Resolvidos", metricas_bugs.get('bugs_resolvidos', 0))
+                    with col_bug4:
+                        st.metric("✅ Bugs Resolvidos", metricas_bugs.get('bugs_resolvidos', 0))
                 
-                st.markdown("---")
+                    st.markdown("---")
                 
-                # Gráficos de análise de bugs (usando dados filtrados)
-                st.markdown("#### 📈 **Análise Visual de Bugs**")
+                    # Gráficos de análise de bugs (usando dados filtrados)
+                    st.markdown("#### 📈 **Análise Visual de Bugs**")
                 
-                col_graf1, col_graf2 = st.columns(2)
+                    col_graf1, col_graf2 = st.columns(2)
                 
-                with col_graf1:
-                    # Status dos bugs
-                    fig_status_bugs = grafico_bugs_por_status(df_bugs_filtrado)
-                    if fig_status_bugs:
-                        st.plotly_chart(fig_status_bugs, use_container_width=True, key="bugs_status")
+                    with col_graf1:
+                        # Status dos bugs
+                        fig_status_bugs = grafico_bugs_por_status(df_bugs_filtrado)
+                        if fig_status_bugs:
+                            st.plotly_chart(fig_status_bugs, use_container_width=True, key="bugs_status")
                     
-                    # Bugs por time
-                    fig_bugs_time = grafico_bugs_por_time(df_bugs_filtrado)
-                    if fig_bugs_time:
-                        st.plotly_chart(fig_bugs_time, use_container_width=True, key="bugs_time")
-                
-                with col_graf2:
-                    # Prioridade dos bugs
-                    fig_prioridade_bugs = grafico_bugs_por_prioridade(df_bugs_filtrado)
-                    if fig_prioridade_bugs:
-                        st.plotly_chart(fig_prioridade_bugs, use_container_width=True, key="bugs_prioridade")
+                        # Bugs por time
+                        fig_bugs_time = grafico_bugs_por_time(df_bugs_filtrado)
+                        if fig_bugs_time:
+                            st.plotly_chart(fig_bugs_time, use_container_width=True, key="bugs_time")
+                
+                    with col_graf2:
+                        # Prioridade dos bugs
+                        fig_prioridade_bugs = grafico_bugs_por_prioridade(df_bugs_filtrado)
+                        if fig_prioridade_bugs:
+                            st.plotly_chart(fig_prioridade_bugs, use_container_width=True, key="bugs_prioridade")
                     
-                    # Fonte de detecção
-                    fig_fonte_bugs = grafico_bugs_fonte_deteccao(df_bugs_filtrado)
-                    if fig_fonte_bugs:
-                        st.plotly_chart(fig_fonte_bugs, use_container_width=True, key="bugs_fonte")
+                        # Fonte de detecção
+                        fig_fonte_bugs = grafico_bugs_fonte_deteccao(df_bugs_filtrado)
+                        if fig_fonte_bugs:
+                            st.plotly_chart(fig_fonte_bugs, use_container_width=True, key="bugs_fonte")
                 
-                # Evolução temporal dos bugs
-                st.markdown("#### 📅 **Evolução Temporal**")
-                fig_evolucao_bugs = grafico_evolucao_bugs(df_bugs_filtrado)
-                if fig_evolucao_bugs:
-                    st.plotly_chart(fig_evolucao_bugs, use_container_width=True, key="bugs_evolucao")
+                    # Evolução temporal dos bugs
+                    st.markdown("#### 📅 **Evolução Temporal**")
+                    fig_evolucao_bugs = grafico_evolucao_bugs(df_bugs_filtrado)
+                    if fig_evolucao_bugs:
+                        st.plotly_chart(fig_evolucao_bugs, use_container_width=True, key="bugs_evolucao")
                 
-                st.markdown("---")
+                    st.markdown("---")
                 
-                # Insights automáticos
-                st.markdown("#### 💡 **Insights Estratégicos**")
+                    # Insights automáticos
+                    st.markdown("#### 💡 **Insights Estratégicos**")
                 
-                insights_bugs = []
+                    insights_bugs = []
                 
-                # Insight sobre bugs críticos
-                if metricas_bugs.get('bugs_criticos', 0) > 0:
-                    total_bugs = metricas_bugs.get('total_bugs', 1)
-                    perc_criticos = (metricas_bugs['bugs_criticos'] / total_bugs) * 100
-                    if perc_criticos > 30:
-                        insights_bugs.append(f"🚨 **ATENÇÃO**: {perc_criticos:.1f}% dos bugs são de alta prioridade - requer ação imediata")
-                    else:
-                        insights_bugs.append(f"⚠️ {perc_criticos:.1f}% dos bugs são de alta prioridade")
-                
-                # Insight sobre bugs abertos
-                if metricas_bugs.get('bugs_abertos', 0) > 0:
-                    total_bugs = metricas_bugs.get('total_bugs', 1)
-                    perc_abertos = (metricas_bugs['bugs_abertos'] / total_bugs) * 100
-                    if perc_abertos > 50:
-                        insights_bugs.append(f"🔓 **CRÍTICO**: {perc_abertos:.1f}% dos bugs ainda estão pendentes de correção")
-                    else:
-                        insights_bugs.append(f"🔓 {perc_abertos:.1f}% dos bugs estão pendentes")
-                
-                # Insight sobre time com mais bugs
-                if metricas_bugs.get('bugs_por_time'):
-                    time_mais_bugs = max(metricas_bugs['bugs_por_time'], key=metricas_bugs['bugs_por_time'].get)
-                    qtd_bugs_time = metricas_bugs['bugs_por_time'][time_mais_bugs]
-                    insights_bugs.append(f"🏢 Time **{time_mais_bugs}** tem o maior número de bugs ({qtd_bugs_time})")
-                
-                # Insight sobre fonte de detecção
-                if metricas_bugs.get('bugs_por_fonte'):
-                    fonte_principal = max(metricas_bugs['bugs_por_fonte'], key=metricas_bugs['bugs_por_fonte'].get)
-                    qtd_fonte = metricas_bugs['bugs_por_fonte'][fonte_principal]
-                    total_bugs = sum(metricas_bugs['bugs_por_fonte'].values())
-                    perc_fonte = (qtd_fonte / total_bugs) * 100
-                    if fonte_principal.lower() == 'cliente':
-                        insights_bugs.append(f"🔍 **ALERTA**: {perc_fonte:.1f}% dos bugs foram encontrados por clientes - melhorar testes internos")
-                    else:
-                        insights_bugs.append(f"🔍 {perc_fonte:.1f}% dos bugs foram detectados por {fonte_principal}")
-                
-                # Exibir insights
-                for insight in insights_bugs:
-                    if "CRÍTICO" in insight or "ATENÇÃO" in insight or "ALERTA" in insight:
-                        st.error(insight)
-                    elif "⚠️" in insight:
-                        st.warning(insight)
-                    else:
-                        st.info(insight)
+                    # Insight sobre bugs críticos
+                    if metricas_bugs.get('bugs_criticos', 0) > 0:
+                        total_bugs = metricas_bugs.get('total_bugs', 1)
+                        perc_criticos = (metricas_bugs['bugs_criticos'] / total_bugs) * 100
+                        if perc_criticos > 30:
+                            insights_bugs.append(f"🚨 **ATENÇÃO**: {perc_criticos:.1f}% dos bugs são de alta prioridade - requer ação imediata")
+                        else:
+                            insights_bugs.append(f"⚠️ {perc_criticos:.1f}% dos bugs são de alta prioridade")
+                
+                    # Insight sobre bugs abertos
+                    if metricas_bugs.get('bugs_abertos', 0) > 0:
+                        total_bugs = metricas_bugs.get('total_bugs', 1)
+                        perc_abertos = (metricas_bugs['bugs_abertos'] / total_bugs) * 100
+                        if perc_abertos > 50:
+                            insights_bugs.append(f"🔓 **CRÍTICO**: {perc_abertos:.1f}% dos bugs ainda estão pendentes de correção")
+                        else:
+                            insights_bugs.append(f"🔓 {perc_abertos:.1f}% dos bugs estão pendentes")
+                
+                    # Insight sobre time com mais bugs
+                    if metricas_bugs.get('bugs_por_time'):
+                        time_mais_bugs = max(metricas_bugs['bugs_por_time'], key=metricas_bugs['bugs_por_time'].get)
+                        qtd_bugs_time = metricas_bugs['bugs_por_time'][time_mais_bugs]
+                        insights_bugs.append(f"🏢 Time **{time_mais_bugs}** tem o maior número de bugs ({qtd_bugs_time})")
+                
+                    # Insight sobre fonte de detecção
+                    if metricas_bugs.get('bugs_por_fonte'):
+                        fonte_principal = max(metricas_bugs['bugs_por_fonte'], key=metricas_bugs['bugs_por_fonte'].get)
+                        qtd_fonte = metricas_bugs['bugs_por_fonte'][fonte_principal]
+                        total_bugs = sum(metricas_bugs['bugs_por_fonte'].values())
+                        perc_fonte = (qtd_fonte / total_bugs) * 100
+                        if fonte_principal.lower() == 'cliente':
+                            insights_bugs.append(f"🔍 **ALERTA**: {perc_fonte:.1f}% dos bugs foram encontrados por clientes - melhorar testes internos")
+                        else:
+                            insights_bugs.append(f"🔍 {perc_fonte:.1f}% dos bugs foram detectados por {fonte_principal}")
                 
-                st.markdown("---")
+                    # Exibir insights
+                    for insight in insights_bugs:
+                        if "CRÍTICO" in insight or "ATENÇÃO" in insight or "ALERTA" in insight:
+                            st.error(insight)
+                        elif "⚠️" in insight:
+                            st.warning(insight)
+                        else:
+                            st.info(insight)
+                
+                    st.markdown("---")
                 
-                # Tabela detalhada de bugs (usando dados filtrados)
-                st.markdown("#### 📋 **Dados Detalhados de Bugs**")
-                if st.checkbox("Mostrar tabela completa de bugs", key="show_bugs_table"):
-                    st.dataframe(df_bugs_filtrado, use_container_width=True)
-                    st.caption(f"Total de bugs registrados: {len(df_bugs_filtrado)}")
+                    # Tabela detalhada de bugs (usando dados filtrados)
+                    st.markdown("#### 📋 **Dados Detalhados de Bugs**")
+                    if st.checkbox("Mostrar tabela completa de bugs", key="show_bugs_table"):
+                        st.dataframe(df_bugs_filtrado, use_container_width=True)
+                        st.caption(f"Total de bugs registrados: {len(df_bugs_filtrado)}")
                     
-                    # Download dos dados de bugs filtrados
-                    csv_bugs = df_bugs_filtrado.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Baixar dados de bugs filtrados (CSV)",
-                        data=csv_bugs,
-                        file_name=f"bugs_analysis_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv"
-                    )
+                        # Download dos dados de bugs filtrados
+                        csv_bugs = df_bugs_filtrado.to_csv(index=False)
+                        st.download_button(
+                            label="📥 Baixar dados de bugs filtrados (CSV)",
+                            data=csv_bugs,
+                            file_name=f"bugs_analysis_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                            mime="text/csv"
+                        )
                 
-                # Recomendações estratégicas
-                st.markdown("#### 🎯 **Recomendações Estratégicas**")
+                    # Recomendações estratégicas
+                    st.markdown("#### 🎯 **Recomendações Estratégicas**")
                 
-                recomendacoes = []
+                    recomendacoes = []
                 
-                if metricas_bugs.get('bugs_criticos', 0) > 3:
-                    recomendacoes.append("🚨 **Priorizar correção de bugs críticos** - Alocar recursos dedicados")
+                    if metricas_bugs.get('bugs_criticos', 0) > 3:
+                        recomendacoes.append("🚨 **Priorizar correção de bugs críticos** - Alocar recursos dedicados")
                 
-                if metricas_bugs.get('bugs_abertos', 0) > metricas_bugs.get('bugs_resolvidos', 0):
-                    recomendacoes.append("⚡ **Acelerar processo de correção** - Bugs abertos excedem resolvidos")
+                    if metricas_bugs.get('bugs_abertos', 0) > metricas_bugs.get('bugs_resolvidos', 0):
+                        recomendacoes.append("⚡ **Acelerar processo de correção** - Bugs abertos excedem resolvidos")
                 
-                if metricas_bugs.get('bugs_por_fonte', {}).get('Cliente', 0) > 0:
-                    recomendacoes.append("🔍 **Fortalecer testes internos** - Evitar bugs chegarem ao cliente")
+                    if metricas_bugs.get('bugs_por_fonte', {}).get('Cliente', 0) > 0:
+                        recomendacoes.append("🔍 **Fortalecer testes internos** - Evitar bugs chegarem ao cliente")
                 
-                if len(metricas_bugs.get('bugs_por_time', {})) > 3:
-                    recomendacoes.append("📚 **Implementar treinamento de qualidade** - Múltiplos times afetados")
+                    if len(metricas_bugs.get('bugs_por_time', {})) > 3:
+                        recomendacoes.append("📚 **Implementar treinamento de qualidade** - Múltiplos times afetados")
                 
-                if not recomendacoes:
-                    recomendacoes.append("✅ **Manter padrão atual** - Métricas de bugs estão controladas")
+                    if not recomendacoes:
+                        recomendacoes.append("✅ **Manter padrão atual** - Métricas de bugs estão controladas")
                 
-                for rec in recomendacoes:
-                    st.success(rec)
+                    for rec in recomendacoes:
+                        st.success(rec)
                     
-            else:
-                st.info("📁 Faça upload da planilha de bugs para começar a análise")
-                st.markdown("""
+                else:
+                    st.info("📁 Faça upload da planilha de bugs para começar a análise")
+                    st.markdown("""
                 ### 📋 **Como usar a Análise de Bugs:**
                 
                 1. **Faça upload da planilha de bugs** usando o botão acima
@@ -4510,711 +5111,698 @@ def main():
                    - 🎯 Recomendações estratégicas
                 """)
         
-        with tab8:
-            st.header("📊 Relatório Detalhado.")
-            st.markdown("### Análise Detalhada de Bugs e Falhas por Tarefa")
-            
-            # Botão de exportação PDF
-            col_export, col_space = st.columns([1, 3])
-            with col_export:
-                botao_exportar_pdf("Relatorio_Detalhado", criar_pdf_relatorio_detalhado, df_com_teste, df, df_sem_teste)
-            
-            st.markdown("---")
-            
-            # Usar os dados já filtrados pelos filtros principais
-            df_pm = df_com_teste.copy()
-            
-            # Separar dados por tipo de problema
-            df_rejeitadas = df_pm[df_pm['Status'] == 'REJEITADA'].copy()
-            df_temp = df_pm.copy()
-            df_temp['Erros'] = pd.to_numeric(df_temp['Erros'], errors='coerce').fillna(0)
-            
-            # Contar tarefas com defeitos (unificando coluna Erros e motivos de rejeição)
-            tarefas_com_defeitos = set()
-            
-            # 1. Tarefas com erros na coluna numérica
-            df_com_erros_numericos = df_temp[df_temp['Erros'] > 0]
-            for idx in df_com_erros_numericos.index:
-                tarefas_com_defeitos.add(idx)
-            
-            # 2. Tarefas rejeitadas com motivos válidos
-            motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-            for idx, row in df_rejeitadas.iterrows():
-                tem_motivo_valido = False
-                for col in motivos_cols:
-                    if col in row and pd.notna(row[col]) and str(row[col]).strip() != '':
-                        motivo = str(row[col]).strip().lower()
-                        if motivo not in ['aprovada', 'sem recusa']:
-                            tem_motivo_valido = True
-                            break
-                if tem_motivo_valido:
-                    tarefas_com_defeitos.add(idx)
-            
-            total_com_defeitos = len(tarefas_com_defeitos)
-            
-            # Seção 1: Resumo Executivo
-            st.markdown("#### 📈 Resumo Executivo")
-            
-            # Primeira linha de métricas
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                total_tasks = len(df_pm)
-                tarefas_unicas = df_pm['Nome da Task'].nunique() if 'Nome da Task' in df_pm.columns else 0
-                st.metric(
-                    "📋 Total de Tarefas", 
-                    f"{tarefas_unicas}",
-                    delta=f"📊 {total_tasks} testes realizados",
-                    help=f"Tarefas únicas testadas: {tarefas_unicas} | Total de testes efetuados: {total_tasks}"
-                )
+        with tab8 as ativa:
+            if ativa:
+                st.header("📊 Relatório Detalhado.")
+                st.markdown("### Análise Detalhada de Bugs e Falhas por Tarefa")
             
-            with col2:
-                total_aprovadas = len(df_pm[df_pm['Status'] == 'APROVADA'])
-                st.metric("✅ Tarefas Aprovadas", total_aprovadas, delta="Entregues em produção")
+                # Botão de exportação PDF
+                col_export, col_space = st.columns([1, 3])
+                with col_export:
+                    botao_exportar_pdf("Relatorio_Detalhado", criar_pdf_relatorio_detalhado, df_com_teste, df, df_sem_teste)
             
-            with col3:
-                total_prontas = len(df_pm[df_pm['Status'] == 'PRONTO PARA PUBLICAÇÃO'])
-                st.metric("🚀 Prontas p/ Publicação", total_prontas, delta="Aguardando deploy")
+                st.markdown("---")
             
-            with col4:
-                total_rejeitadas = len(df_rejeitadas)
-                taxa_rejeicao = (total_rejeitadas / total_tasks * 100) if total_tasks > 0 else 0
-                st.metric("❌ Tarefas Rejeitadas", total_rejeitadas, f"{taxa_rejeicao:.1f}%")
+                # Usar os dados já filtrados pelos filtros principais
+                df_pm = df_com_teste.copy()
             
-            # Segunda linha de métricas
-            col5, col6, col7, col8 = st.columns(4)
+                # Separar dados por tipo de problema
+                df_rejeitadas = df_pm[df_pm['Status'] == 'REJEITADA'].copy()
+                df_temp = df_pm.copy()
+                df_temp['Erros'] = pd.to_numeric(df_temp['Erros'], errors='coerce').fillna(0)
             
-            with col5:
-                st.metric("⚠️ Tarefas com Defeitos", total_com_defeitos, 
-                         help="Tarefas com erros numéricos ou motivos de rejeição válidos")
+                # Contar tarefas com defeitos (unificando coluna Erros e motivos de rejeição)
+                tarefas_com_defeitos = set()
             
-            with col6:
-                # Contar total de problemas encontrados (soma de todos os motivos + erros numéricos)
-                total_problemas_encontrados = contar_total_bugs(df_rejeitadas)
-                if 'Erros' in df_temp.columns:
-                    total_problemas_encontrados += int(df_temp['Erros'].sum())
-                st.metric("🔴 Total de Problemas Encontrados", total_problemas_encontrados,
-                         help="Soma de todos os motivos de rejeição + erros numéricos da coluna Erros")
+                # 1. Tarefas com erros na coluna numérica
+                tarefas_com_defeitos.update(df_temp.index[df_temp['Erros'] > 0])
             
-            with col7:
-                total_concluidas = total_aprovadas + total_prontas
-                st.metric("🎯 Tarefas Concluídas", total_concluidas)
+                # 2. Tarefas rejeitadas com motivos válidos
+                tarefas_com_defeitos.update(motivos_do_recorte(df_rejeitadas)['linha'].unique())
             
-            with col8:
-                taxa_sucesso = (total_concluidas / total_tasks * 100) if total_tasks > 0 else 0
-                st.metric("📊 Taxa de Sucesso", f"{taxa_sucesso:.1f}%")
+                total_com_defeitos = len(tarefas_com_defeitos)
             
-            st.divider()
+                # Seção 1: Resumo Executivo
+                st.markdown("#### 📈 Resumo Executivo")
             
-            # Seção 2: Análise de Retestes e Ciclo de Vida das Tarefas
-            st.markdown("#### 🔄 Histórico de Retestes e Taxa de Aprovação")
+                # Primeira linha de métricas
+                col1, col2, col3, col4 = st.columns(4)
             
-            # Analisar histórico de retestes
-            historico_retestes = analisar_historico_retestes(df_pm)
+                with col1:
+                    total_tasks = len(df_pm)
+                    tarefas_unicas = df_pm['Nome da Task'].nunique() if 'Nome da Task' in df_pm.columns else 0
+                    st.metric(
+                        "📋 Total de Tarefas", 
+                        f"{tarefas_unicas}",
+                        delta=f"📊 {total_tasks} testes realizados",
+                        help=f"Tarefas únicas testadas: {tarefas_unicas} | Total de testes efetuados: {total_tasks}"
+                    )
             
-            # Métricas de reteste
-            col_ret1, col_ret2, col_ret3, col_ret4 = st.columns(4)
+                with col2:
+                    total_aprovadas = len(df_pm[df_pm['Status'] == 'APROVADA'])
+                    st.metric("✅ Tarefas Aprovadas", total_aprovadas, delta="Entregues em produção")
             
-            with col_ret1:
-                st.metric(
-                    "🔄 Tarefas Retestadas", 
-                    historico_retestes['total_tarefas_retestadas'],
-                    help="Tarefas que foram rejeitadas e posteriormente retestadas"
-                )
+                with col3:
+                    total_prontas = len(df_pm[df_pm['Status'] == 'PRONTO PARA PUBLICAÇÃO'])
+                    st.metric("🚀 Prontas p/ Publicação", total_prontas, delta="Aguardando deploy")
             
-            with col_ret2:
-                st.metric(
-                    "✅ Aprovadas Após Reteste", 
-                    historico_retestes['tarefas_aprovadas_apos_reteste'],
-                    help="Tarefas que foram aprovadas após correções e reteste"
-                )
+                with col4:
+                    total_rejeitadas = len(df_rejeitadas)
+                    taxa_rejeicao = (total_rejeitadas / total_tasks * 100) if total_tasks > 0 else 0
+                    st.metric("❌ Tarefas Rejeitadas", total_rejeitadas, f"{taxa_rejeicao:.1f}%")
             
-            with col_ret3:
-                taxa_aprovacao_reteste = historico_retestes['taxa_aprovacao_apos_reteste']
-                st.metric(
-                    "📈 Taxa de Aprovação Pós-Reteste", 
-                    f"{taxa_aprovacao_reteste:.1f}%",
-                    help="Percentual de tarefas aprovadas após correções"
-                )
+                # Segunda linha de métricas
+                col5, col6, col7, col8 = st.columns(4)
             
-            with col_ret4:
-                if historico_retestes['total_tarefas_retestadas'] > 0:
-                    eficiencia_correcao = (historico_retestes['tarefas_aprovadas_apos_reteste'] / historico_retestes['total_tarefas_retestadas']) * 100
-                    delta_eficiencia = "🟢 Excelente" if eficiencia_correcao >= 80 else "🟡 Bom" if eficiencia_correcao >= 60 else "🔴 Atenção"
-                else:
-                    eficiencia_correcao = 0
-                    delta_eficiencia = "📊 Sem dados"
+                with col5:
+                    st.metric("⚠️ Tarefas com Defeitos", total_com_defeitos, 
+                             help="Tarefas com erros numéricos ou motivos de rejeição válidos")
+            
+                with col6:
+                    # Contar total de problemas encontrados (soma de todos os motivos + erros numéricos)
+                    total_problemas_encontrados = contar_total_bugs(df_rejeitadas)
+                    if 'Erros' in df_temp.columns:
+                        total_problemas_encontrados += int(df_temp['Erros'].sum())
+                    st.metric("🔴 Total de Problemas Encontrados", total_problemas_encontrados,
+                             help="Soma de todos os motivos de rejeição + erros numéricos da coluna Erros")
+            
+                with col7:
+                    total_concluidas = total_aprovadas + total_prontas
+                    st.metric("🎯 Tarefas Concluídas", total_concluidas)
+            
+                with col8:
+                    taxa_sucesso = (total_concluidas / total_tasks * 100) if total_tasks > 0 else 0
+                    st.metric("📊 Taxa de Sucesso", f"{taxa_sucesso:.1f}%")
+            
+                st.divider()
+            
+                # Seção 2: Análise de Retestes e Ciclo de Vida das Tarefas
+                st.markdown("#### 🔄 Histórico de Retestes e Taxa de Aprovação")
+            
+                # Analisar histórico de retestes
+                historico_retestes = analisar_historico_retestes(df_pm)
+            
+                # Métricas de reteste
+                col_ret1, col_ret2, col_ret3, col_ret4 = st.columns(4)
+            
+                with col_ret1:
+                    st.metric(
+                        "🔄 Tarefas Retestadas", 
+                        historico_retestes['total_tarefas_retestadas'],
+                        help="Tarefas que foram rejeitadas e posteriormente retestadas"
+                    )
+            
+                with col_ret2:
+                    st.metric(
+                        "✅ Aprovadas Após Reteste", 
+                        historico_retestes['tarefas_aprovadas_apos_reteste'],
+                        help="Tarefas que foram aprovadas após correções e reteste"
+                    )
+            
+                with col_ret3:
+                    taxa_aprovacao_reteste = historico_retestes['taxa_aprovacao_apos_reteste']
+                    st.metric(
+                        "📈 Taxa de Aprovação Pós-Reteste", 
+                        f"{taxa_aprovacao_reteste:.1f}%",
+                        help="Percentual de tarefas aprovadas após correções"
+                    )
+            
+                with col_ret4:
+                    if historico_retestes['total_tarefas_retestadas'] > 0:
+                        eficiencia_correcao = (historico_retestes['tarefas_aprovadas_apos_reteste'] / historico_retestes['total_tarefas_retestadas']) * 100
+                        delta_eficiencia = "🟢 Excelente" if eficiencia_correcao >= 80 else "🟡 Bom" if eficiencia_correcao >= 60 else "🔴 Atenção"
+                    else:
+                        eficiencia_correcao = 0
+                        delta_eficiencia = "📊 Sem dados"
                 
-                st.metric(
-                    "🎯 Eficiência de Correção", 
-                    f"{eficiencia_correcao:.1f}%",
-                    delta=delta_eficiencia,
-                    help="Capacidade da equipe de corrigir problemas identificados"
-                )
+                    st.metric(
+                        "🎯 Eficiência de Correção", 
+                        f"{eficiencia_correcao:.1f}%",
+                        delta=delta_eficiencia,
+                        help="Capacidade da equipe de corrigir problemas identificados"
+                    )
             
-            # Detalhamento do histórico de retestes
-            if not historico_retestes['detalhes_retestes'].empty:
-                st.markdown("##### 📋 Detalhamento das Tarefas Retestadas")
-                
-                df_retestes = historico_retestes['detalhes_retestes'].copy()
-                
-                # Formatar datas
-                if 'Primeira_Data' in df_retestes.columns:
-                    df_retestes['Primeira_Data'] = pd.to_datetime(df_retestes['Primeira_Data']).dt.strftime('%d/%m/%Y')
-                if 'Ultima_Data' in df_retestes.columns:
-                    df_retestes['Ultima_Data'] = pd.to_datetime(df_retestes['Ultima_Data']).dt.strftime('%d/%m/%Y')
-                
-                # Renomear colunas para exibição
-                df_retestes_exibir = df_retestes.rename(columns={
-                    'Identificador': 'ID/Identificador',
-                    'Nome_Tarefa': 'Nome da Tarefa',
-                    'Total_Testes': 'Qtd Testes',
-                    'Sequencia_Status': 'Sequência de Status',
-                    'Aprovada_Apos_Reteste': 'Aprovada Após Reteste',
-                    'Primeira_Data': 'Primeira Data',
-                    'Ultima_Data': 'Última Data',
-                    'Responsavel': 'Responsável'
-                })
-                
-                st.dataframe(
-                    df_retestes_exibir,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "Aprovada Após Reteste": st.column_config.CheckboxColumn(
-                            "Aprovada Após Reteste",
-                            help="Indica se a tarefa foi aprovada após correções"
-                        ),
-                        "Sequência de Status": st.column_config.TextColumn(
-                            "Sequência de Status",
-                            help="Histórico completo dos status da tarefa",
-                            width="large"
-                        )
-                    }
-                )
+                # Detalhamento do histórico de retestes
+                if not historico_retestes['detalhes_retestes'].empty:
+                    st.markdown("##### 📋 Detalhamento das Tarefas Retestadas")
+                
+                    df_retestes = historico_retestes['detalhes_retestes'].copy()
+                
+                    # Formatar datas
+                    if 'Primeira_Data' in df_retestes.columns:
+                        df_retestes['Primeira_Data'] = pd.to_datetime(df_retestes['Primeira_Data']).dt.strftime('%d/%m/%Y')
+                    if 'Ultima_Data' in df_retestes.columns:
+                        df_retestes['Ultima_Data'] = pd.to_datetime(df_retestes['Ultima_Data']).dt.strftime('%d/%m/%Y')
+                
+                    # Renomear colunas para exibição
+                    df_retestes_exibir = df_retestes.rename(columns={
+                        'Identificador': 'ID/Identificador',
+                        'Nome_Tarefa': 'Nome da Tarefa',
+                        'Total_Testes': 'Qtd Testes',
+                        'Sequencia_Status': 'Sequência de Status',
+                        'Aprovada_Apos_Reteste': 'Aprovada Após Reteste',
+                        'Primeira_Data': 'Primeira Data',
+                        'Ultima_Data': 'Última Data',
+                        'Responsavel': 'Responsável'
+                    })
                 
-                # Botão para exportar dados de retestes
-                csv_retestes = df_retestes_exibir.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📥 Exportar Histórico de Retestes (CSV)",
-                    data=csv_retestes,
-                    file_name=f"historico_retestes_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                    mime="text/csv"
-                )
+                    st.dataframe(
+                        df_retestes_exibir,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={
+                            "Aprovada Após Reteste": st.column_config.CheckboxColumn(
+                                "Aprovada Após Reteste",
+                                help="Indica se a tarefa foi aprovada após correções"
+                            ),
+                            "Sequência de Status": st.column_config.TextColumn(
+                                "Sequência de Status",
+                                help="Histórico completo dos status da tarefa",
+                                width="large"
+                            )
+                        }
+                    )
                 
-                # Insights sobre retestes
-                st.markdown("##### 💡 Insights sobre Retestes")
+                    # Botão para exportar dados de retestes
+                    csv_retestes = df_retestes_exibir.to_csv(index=False, encoding='utf-8-sig')
+                    st.download_button(
+                        label="📥 Exportar Histórico de Retestes (CSV)",
+                        data=csv_retestes,
+                        file_name=f"historico_retestes_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                        mime="text/csv"
+                    )
                 
-                if taxa_aprovacao_reteste >= 80:
-                    st.success(f"🎯 **Excelente capacidade de correção**: {taxa_aprovacao_reteste:.1f}% das tarefas retestadas foram aprovadas após correções.")
-                elif taxa_aprovacao_reteste >= 60:
-                    st.info(f"📊 **Boa capacidade de correção**: {taxa_aprovacao_reteste:.1f}% das tarefas retestadas foram aprovadas. Há espaço para melhorias.")
-                else:
-                    st.warning(f"⚠️ **Atenção necessária**: Apenas {taxa_aprovacao_reteste:.1f}% das tarefas retestadas foram aprovadas. Revisar processo de correções.")
+                    # Insights sobre retestes
+                    st.markdown("##### 💡 Insights sobre Retestes")
                 
-                # Análise por time se houver dados suficientes
-                if len(df_retestes) > 0 and 'Time' in df_retestes.columns:
-                    times_reteste = df_retestes.groupby('Time').agg({
-                        'Aprovada_Apos_Reteste': ['count', 'sum']
-                    }).round(1)
+                    if taxa_aprovacao_reteste >= 80:
+                        st.success(f"🎯 **Excelente capacidade de correção**: {taxa_aprovacao_reteste:.1f}% das tarefas retestadas foram aprovadas após correções.")
+                    elif taxa_aprovacao_reteste >= 60:
+                        st.info(f"📊 **Boa capacidade de correção**: {taxa_aprovacao_reteste:.1f}% das tarefas retestadas foram aprovadas. Há espaço para melhorias.")
+                    else:
+                        st.warning(f"⚠️ **Atenção necessária**: Apenas {taxa_aprovacao_reteste:.1f}% das tarefas retestadas foram aprovadas. Revisar processo de correções.")
+                
+                    # Análise por time se houver dados suficientes
+                    if len(df_retestes) > 0 and 'Time' in df_retestes.columns:
+                        times_reteste = df_retestes.groupby('Time', observed=True).agg({
+                            'Aprovada_Apos_Reteste': ['count', 'sum']
+                        }).round(1)
                     
-                    if len(times_reteste) > 1:
-                        st.markdown("**📊 Performance por Time:**")
-                        for time in times_reteste.index:
-                            total_time = times_reteste.loc[time, ('Aprovada_Apos_Reteste', 'count')]
-                            aprovadas_time = times_reteste.loc[time, ('Aprovada_Apos_Reteste', 'sum')]
-                            taxa_time = (aprovadas_time / total_time * 100) if total_time > 0 else 0
-                            st.write(f"• **{time}**: {aprovadas_time}/{total_time} aprovadas ({taxa_time:.1f}%)")
-            else:
-                st.info("📊 Nenhuma tarefa retestada encontrada no período selecionado.")
+                        if len(times_reteste) > 1:
+                            st.markdown("**📊 Performance por Time:**")
+                            for time in times_reteste.index:
+                                total_time = times_reteste.loc[time, ('Aprovada_Apos_Reteste', 'count')]
+                                aprovadas_time = times_reteste.loc[time, ('Aprovada_Apos_Reteste', 'sum')]
+                                taxa_time = (aprovadas_time / total_time * 100) if total_time > 0 else 0
+                                st.write(f"• **{time}**: {aprovadas_time}/{total_time} aprovadas ({taxa_time:.1f}%)")
+                else:
+                    st.info("📊 Nenhuma tarefa retestada encontrada no período selecionado.")
             
-            st.divider()
+                st.divider()
             
-            # Seção 2: Tarefas Entregues e Prontas para Publicação
-            st.markdown("#### ✅ Tarefas Entregues e Produção")
+                # Seção 2: Tarefas Entregues e Prontas para Publicação
+                st.markdown("#### ✅ Tarefas Entregues e Produção")
             
-            # Filtrar tarefas aprovadas
-            df_aprovadas = df_pm[df_pm['Status'] == 'APROVADA'].copy()
+                # Filtrar tarefas aprovadas
+                df_aprovadas = df_pm[df_pm['Status'] == 'APROVADA'].copy()
             
-            if len(df_aprovadas) > 0:
-                # Criar tabela de tarefas aprovadas
-                df_aprovadas_detalhada = df_aprovadas[['Data', 'Sprint', 'Time', 'Nome da Task', 'Link da Task', 
-                                                     'Responsável', 'Descrição', 'Responsavel pelo teste']].copy()
+                if len(df_aprovadas) > 0:
+                    # Criar tabela de tarefas aprovadas
+                    df_aprovadas_detalhada = df_aprovadas[['Data', 'Sprint', 'Time', 'Nome da Task', 'Link da Task', 
+                                                         'Responsável', 'Descrição', 'Responsavel pelo teste']].copy()
                 
-                # Reorganizar colunas para melhor visualização
-                colunas_aprovadas = ['Data', 'Sprint', 'Time', 'Nome da Task', 'Responsável', 
-                                   'Descrição', 'Responsavel pelo teste', 'Link da Task']
-                
-                df_aprovadas_exibir = df_aprovadas_detalhada[colunas_aprovadas].copy()
-                df_aprovadas_exibir['Data'] = df_aprovadas_exibir['Data'].dt.strftime('%d/%m/%Y')
-                
-                # Preencher descrições vazias
-                df_aprovadas_exibir['Descrição'] = df_aprovadas_exibir['Descrição'].fillna('Descrição não informada')
-                
-                st.dataframe(
-                    df_aprovadas_exibir,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "Link da Task": st.column_config.LinkColumn(
-                            "Link da Task",
-                            help="Clique para abrir a task",
-                            display_text="🔗 Abrir Task"
-                        ),
-                        "Descrição": st.column_config.TextColumn(
-                            "Descrição",
-                            help="Descrição da tarefa entregue",
-                            width="large"
-                        )
-                    }
-                )
+                    # Reorganizar colunas para melhor visualização
+                    colunas_aprovadas = ['Data', 'Sprint', 'Time', 'Nome da Task', 'Responsável', 
+                                       'Descrição', 'Responsavel pelo teste', 'Link da Task']
                 
-                # Botão para exportar dados de aprovadas
-                csv_aprovadas = df_aprovadas_exibir.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📥 Exportar Tarefas Entregues (CSV)",
-                    data=csv_aprovadas,
-                    file_name=f"tarefas_entregues_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.info("Nenhuma tarefa aprovada encontrada no período selecionado.")
+                    df_aprovadas_exibir = df_aprovadas_detalhada[colunas_aprovadas].copy()
+                    df_aprovadas_exibir['Data'] = df_aprovadas_exibir['Data'].dt.strftime('%d/%m/%Y')
+                
+                    # Preencher descrições vazias
+                    df_aprovadas_exibir['Descrição'] = df_aprovadas_exibir['Descrição'].fillna('Descrição não informada')
+                
+                    st.dataframe(
+                        df_aprovadas_exibir,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={
+                            "Link da Task": st.column_config.LinkColumn(
+                                "Link da Task",
+                                help="Clique para abrir a task",
+                                display_text="🔗 Abrir Task"
+                            ),
+                            "Descrição": st.column_config.TextColumn(
+                                "Descrição",
+                                help="Descrição da tarefa entregue",
+                                width="large"
+                            )
+                        }
+                    )
+                
+                    # Botão para exportar dados de aprovadas
+                    csv_aprovadas = df_aprovadas_exibir.to_csv(index=False, encoding='utf-8-sig')
+                    st.download_button(
+                        label="📥 Exportar Tarefas Entregues (CSV)",
+                        data=csv_aprovadas,
+                        file_name=f"tarefas_entregues_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                        mime="text/csv"
+                    )
+                else:
+                    st.info("Nenhuma tarefa aprovada encontrada no período selecionado.")
             
-            st.markdown("#### 🚀 Tarefas Prontas para Publicação")
+                st.markdown("#### 🚀 Tarefas Prontas para Publicação")
             
-            # Filtrar tarefas prontas para publicação
-            df_prontas = df_pm[df_pm['Status'] == 'PRONTO PARA PUBLICAÇÃO'].copy()
+                # Filtrar tarefas prontas para publicação
+                df_prontas = df_pm[df_pm['Status'] == 'PRONTO PARA PUBLICAÇÃO'].copy()
             
-            if len(df_prontas) > 0:
-                # Criar tabela de tarefas prontas
-                df_prontas_detalhada = df_prontas[['Data', 'Sprint', 'Time', 'Nome da Task', 'Link da Task', 
-                                                 'Responsável', 'Descrição', 'Responsavel pelo teste']].copy()
+                if len(df_prontas) > 0:
+                    # Criar tabela de tarefas prontas
+                    df_prontas_detalhada = df_prontas[['Data', 'Sprint', 'Time', 'Nome da Task', 'Link da Task', 
+                                                     'Responsável', 'Descrição', 'Responsavel pelo teste']].copy()
                 
-                # Reorganizar colunas para melhor visualização
-                colunas_prontas = ['Data', 'Sprint', 'Time', 'Nome da Task', 'Responsável', 
-                                 'Descrição', 'Responsavel pelo teste', 'Link da Task']
+                    # Reorganizar colunas para melhor visualização
+                    colunas_prontas = ['Data', 'Sprint', 'Time', 'Nome da Task', 'Responsável', 
+                                     'Descrição', 'Responsavel pelo teste', 'Link da Task']
                 
-                df_prontas_exibir = df_prontas_detalhada[colunas_prontas].copy()
-                df_prontas_exibir['Data'] = df_prontas_exibir['Data'].dt.strftime('%d/%m/%Y')
+                    df_prontas_exibir = df_prontas_detalhada[colunas_prontas].copy()
+                    df_prontas_exibir['Data'] = df_prontas_exibir['Data'].dt.strftime('%d/%m/%Y')
                 
-                # Preencher descrições vazias
-                df_prontas_exibir['Descrição'] = df_prontas_exibir['Descrição'].fillna('Descrição não informada')
+                    # Preencher descrições vazias
+                    df_prontas_exibir['Descrição'] = df_prontas_exibir['Descrição'].fillna('Descrição não informada')
                 
-                st.dataframe(
-                    df_prontas_exibir,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "Link da Task": st.column_config.LinkColumn(
-                            "Link da Task",
-                            help="Clique para abrir a task",
-                            display_text="🔗 Abrir Task"
-                        ),
-                        "Descrição": st.column_config.TextColumn(
-                            "Descrição",
-                            help="Descrição da tarefa pronta para publicação",
-                            width="large"
-                        )
-                    }
-                )
+                    st.dataframe(
+                        df_prontas_exibir,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={
+                            "Link da Task": st.column_config.LinkColumn(
+                                "Link da Task",
+                                help="Clique para abrir a task",
+                                display_text="🔗 Abrir Task"
+                            ),
+                            "Descrição": st.column_config.TextColumn(
+                                "Descrição",
+                                help="Descrição da tarefa pronta para publicação",
+                                width="large"
+                            )
+                        }
+                    )
                 
-                # Botão para exportar dados de prontas
-                csv_prontas = df_prontas_exibir.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📥 Exportar Tarefas Prontas para Publicação (CSV)",
-                    data=csv_prontas,
-                    file_name=f"tarefas_prontas_publicacao_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.info("Nenhuma tarefa pronta para publicação encontrada no período selecionado.")
-            
-            st.divider()
-            
-            # Seção 3: Detalhamento de Tarefas Rejeitadas
-            if len(df_rejeitadas) > 0:
-                st.markdown("#### 🚫 Detalhamento de Tarefas Rejeitadas")
-                
-                # Criar tabela detalhada com descrição dos problemas
-                df_rejeitadas_detalhada = df_rejeitadas[['Data', 'Sprint', 'Time', 'Nome da Task', 'Link da Task', 
-                                                       'Responsável', 'Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7', 'Responsavel pelo teste']].copy()
-                
-                # Criar coluna de descrição consolidada
-                def criar_descricao_problema(row):
-                    motivos = []
-                    if pd.notna(row['Motivo']) and row['Motivo'].strip():
-                        motivos.append(f"• {row['Motivo'].strip()}")
-                    if pd.notna(row['Motivo2']) and row['Motivo2'].strip():
-                        motivos.append(f"• {row['Motivo2'].strip()}")
-                    if pd.notna(row['Motivo3']) and row['Motivo3'].strip():
-                        motivos.append(f"• {row['Motivo3'].strip()}")
-                    if pd.notna(row['Motivo4']) and row['Motivo4'].strip():
-                        motivos.append(f"• {row['Motivo4'].strip()}")
-                    if pd.notna(row['Motivo5']) and row['Motivo5'].strip():
-                        motivos.append(f"• {row['Motivo5'].strip()}")
-                    if pd.notna(row['Motivo6']) and row['Motivo6'].strip():
-                        motivos.append(f"• {row['Motivo6'].strip()}")
-                    if pd.notna(row['Motivo7']) and row['Motivo7'].strip():
-                        motivos.append(f"• {row['Motivo7'].strip()}")
+                    # Botão para exportar dados de prontas
+                    csv_prontas = df_prontas_exibir.to_csv(index=False, encoding='utf-8-sig')
+                    st.download_button(
+                        label="📥 Exportar Tarefas Prontas para Publicação (CSV)",
+                        data=csv_prontas,
+                        file_name=f"tarefas_prontas_publicacao_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                        mime="text/csv"
+                    )
+                else:
+                    st.info("Nenhuma tarefa pronta para publicação encontrada no período selecionado.")
+            
+                st.divider()
+            
+                # Seção 3: Detalhamento de Tarefas Rejeitadas
+                if len(df_rejeitadas) > 0:
+                    st.markdown("#### 🚫 Detalhamento de Tarefas Rejeitadas")
+                
+                    # Criar tabela detalhada com descrição dos problemas
+                    df_rejeitadas_detalhada = df_rejeitadas[['Data', 'Sprint', 'Time', 'Nome da Task', 'Link da Task', 
+                                                           'Responsável', 'Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7', 'Responsavel pelo teste']].copy()
+                
+                    # Criar coluna de descrição consolidada
+                    def criar_descricao_problema(row):
+                        motivos = []
+                        if pd.notna(row['Motivo']) and row['Motivo'].strip():
+                            motivos.append(f"• {row['Motivo'].strip()}")
+                        if pd.notna(row['Motivo2']) and row['Motivo2'].strip():
+                            motivos.append(f"• {row['Motivo2'].strip()}")
+                        if pd.notna(row['Motivo3']) and row['Motivo3'].strip():
+                            motivos.append(f"• {row['Motivo3'].strip()}")
+                        if pd.notna(row['Motivo4']) and row['Motivo4'].strip():
+                            motivos.append(f"• {row['Motivo4'].strip()}")
+                        if pd.notna(row['Motivo5']) and row['Motivo5'].strip():
+                            motivos.append(f"• {row['Motivo5'].strip()}")
+                        if pd.notna(row['Motivo6']) and row['Motivo6'].strip():
+                            motivos.append(f"• {row['Motivo6'].strip()}")
+                        if pd.notna(row['Motivo7']) and row['Motivo7'].strip():
+                            motivos.append(f"• {row['Motivo7'].strip()}")
                     
-                    if motivos:
-                        return "\n".join(motivos)
-                    else:
-                        return "Motivo não especificado"
-                
-                df_rejeitadas_detalhada['Descrição do Problema'] = df_rejeitadas_detalhada.apply(criar_descricao_problema, axis=1)
-                
-                # Reorganizar colunas para melhor visualização
-                colunas_exibir = ['Data', 'Sprint', 'Time', 'Nome da Task', 'Responsável', 
-                                'Descrição do Problema', 'Responsavel pelo teste', 'Link da Task']
-                
-                df_rejeitadas_exibir = df_rejeitadas_detalhada[colunas_exibir].copy()
-                df_rejeitadas_exibir['Data'] = df_rejeitadas_exibir['Data'].dt.strftime('%d/%m/%Y')
-                
-                st.dataframe(
-                    df_rejeitadas_exibir,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "Link da Task": st.column_config.LinkColumn(
-                            "Link da Task",
-                            help="Clique para abrir a task",
-                            display_text="🔗 Abrir Task"
-                        ),
-                        "Descrição do Problema": st.column_config.TextColumn(
-                            "Descrição do Problema",
-                            help="Detalhes dos problemas encontrados",
-                            width="large"
-                        )
-                    }
-                )
+                        if motivos:
+                            return "\n".join(motivos)
+                        else:
+                            return "Motivo não especificado"
                 
-                # Botão para exportar dados de rejeitadas
-                csv_rejeitadas = df_rejeitadas_exibir.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📥 Exportar Tarefas Rejeitadas (CSV)",
-                    data=csv_rejeitadas,
-                    file_name=f"tarefas_rejeitadas_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                    mime="text/csv"
-                )
+                    df_rejeitadas_detalhada['Descrição do Problema'] = df_rejeitadas_detalhada.apply(criar_descricao_problema, axis=1)
+                
+                    # Reorganizar colunas para melhor visualização
+                    colunas_exibir = ['Data', 'Sprint', 'Time', 'Nome da Task', 'Responsável', 
+                                    'Descrição do Problema', 'Responsavel pelo teste', 'Link da Task']
+                
+                    df_rejeitadas_exibir = df_rejeitadas_detalhada[colunas_exibir].copy()
+                    df_rejeitadas_exibir['Data'] = df_rejeitadas_exibir['Data'].dt.strftime('%d/%m/%Y')
+                
+                    st.dataframe(
+                        df_rejeitadas_exibir,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={
+                            "Link da Task": st.column_config.LinkColumn(
+                                "Link da Task",
+                                help="Clique para abrir a task",
+                                display_text="🔗 Abrir Task"
+                            ),
+                            "Descrição do Problema": st.column_config.TextColumn(
+                                "Descrição do Problema",
+                                help="Detalhes dos problemas encontrados",
+                                width="large"
+                            )
+                        }
+                    )
+                
+                    # Botão para exportar dados de rejeitadas
+                    csv_rejeitadas = df_rejeitadas_exibir.to_csv(index=False, encoding='utf-8-sig')
+                    st.download_button(
+                        label="📥 Exportar Tarefas Rejeitadas (CSV)",
+                        data=csv_rejeitadas,
+                        file_name=f"tarefas_rejeitadas_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                        mime="text/csv"
+                    )
             
-            st.divider()
-            
-            # Seção 4: Detalhamento de Tarefas com Defeitos
-            if total_com_defeitos > 0:
-                st.markdown("#### ⚠️ Detalhamento de Tarefas com Defeitos")
-                
-                # Criar DataFrame com todas as tarefas que têm defeitos
-                df_com_defeitos = df_pm.loc[list(tarefas_com_defeitos)].copy()
-                df_erros_detalhada = df_com_defeitos[['Data', 'Sprint', 'Time', 'Nome da Task', 'Link da Task', 
-                                                     'Responsável', 'Erros', 'Status', 'Responsavel pelo teste']].copy()
-                
-                # Criar descrição para defeitos
-                def criar_descricao_defeito(row):
-                    try:
-                        num_erros = int(float(str(row['Erros']))) if pd.notna(row['Erros']) and str(row['Erros']).strip() != '' else 0
-                        num_erros = num_erros if num_erros > 0 else 0
-                    except (ValueError, TypeError):
-                        num_erros = 0
-                    status = row['Status'] if pd.notna(row['Status']) else 'N/A'
+                st.divider()
+            
+                # Seção 4: Detalhamento de Tarefas com Defeitos
+                if total_com_defeitos > 0:
+                    st.markdown("#### ⚠️ Detalhamento de Tarefas com Defeitos")
+                
+                    # Criar DataFrame com todas as tarefas que têm defeitos
+                    df_com_defeitos = df_pm.loc[list(tarefas_com_defeitos)].copy()
+                    df_erros_detalhada = df_com_defeitos[['Data', 'Sprint', 'Time', 'Nome da Task', 'Link da Task', 
+                                                         'Responsável', 'Erros', 'Status', 'Responsavel pelo teste']].copy()
+                
+                    # Motivos válidos por tarefa, vindos da tabela longa (df_erros_detalhada não tem as colunas de motivo)
+                    motivos_por_linha = motivos_do_recorte(df_com_defeitos, apenas_rejeitadas=False)['linha'].value_counts()
+                
+                    # Criar descrição para defeitos
+                    def criar_descricao_defeito(row):
+                        try:
+                            num_erros = int(float(str(row['Erros']))) if pd.notna(row['Erros']) and str(row['Erros']).strip() != '' else 0
+                            num_erros = num_erros if num_erros > 0 else 0
+                        except (ValueError, TypeError):
+                            num_erros = 0
+                        status = row['Status'] if pd.notna(row['Status']) else 'N/A'
                     
-                    # Contar motivos de rejeição válidos
-                    motivos_cols = ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']
-                    motivos_validos = 0
-                    for col in motivos_cols:
-                        if col in row and pd.notna(row[col]) and str(row[col]).strip() != '':
-                            motivo = str(row[col]).strip().lower()
-                            if motivo not in ['aprovada', 'sem recusa']:
-                                motivos_validos += 1
+                        # Contar motivos de rejeição válidos
+                        motivos_validos = int(motivos_por_linha.get(row.name, 0))
                     
-                    descricao_partes = []
-                    if num_erros > 0:
-                        descricao_partes.append(f"{num_erros} erro{'s' if num_erros > 1 else ''} numérico{'s' if num_erros > 1 else ''}")
-                    if motivos_validos > 0:
-                        descricao_partes.append(f"{motivos_validos} motivo{'s' if motivos_validos > 1 else ''} de rejeição")
+                        descricao_partes = []
+                        if num_erros > 0:
+                            descricao_partes.append(f"{num_erros} erro{'s' if num_erros > 1 else ''} numérico{'s' if num_erros > 1 else ''}")
+                        if motivos_validos > 0:
+                            descricao_partes.append(f"{motivos_validos} motivo{'s' if motivos_validos > 1 else ''} de rejeição")
                     
-                    if descricao_partes:
-                        return f"{' + '.join(descricao_partes)} (Status: {status})"
-                    else:
-                        return f"Defeito identificado (Status: {status})"
+                        if descricao_partes:
+                            return f"{' + '.join(descricao_partes)} (Status: {status})"
+                        else:
+                            return f"Defeito identificado (Status: {status})"
                 
-                df_erros_detalhada['Descrição do Defeito'] = df_erros_detalhada.apply(criar_descricao_defeito, axis=1)
+                    df_erros_detalhada['Descrição do Defeito'] = df_erros_detalhada.apply(criar_descricao_defeito, axis=1)
                 
-                colunas_erros = ['Data', 'Sprint', 'Time', 'Nome da Task', 'Responsável', 
-                               'Descrição do Defeito', 'Responsavel pelo teste', 'Link da Task']
+                    colunas_erros = ['Data', 'Sprint', 'Time', 'Nome da Task', 'Responsável', 
+                                   'Descrição do Defeito', 'Responsavel pelo teste', 'Link da Task']
                 
-                df_erros_exibir = df_erros_detalhada[colunas_erros].copy()
-                df_erros_exibir['Data'] = df_erros_exibir['Data'].dt.strftime('%d/%m/%Y')
+                    df_erros_exibir = df_erros_detalhada[colunas_erros].copy()
+                    df_erros_exibir['Data'] = df_erros_exibir['Data'].dt.strftime('%d/%m/%Y')
                 
-                st.dataframe(
-                    df_erros_exibir,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "Link da Task": st.column_config.LinkColumn(
-                            "Link da Task",
-                            help="Clique para abrir a task",
-                            display_text="🔗 Abrir Task"
-                        ),
-                        "Descrição do Defeito": st.column_config.TextColumn(
-                            "Descrição do Defeito",
-                            help="Detalhes dos defeitos encontrados (erros numéricos + motivos de rejeição)"
-                        )
-                    }
-                )
+                    st.dataframe(
+                        df_erros_exibir,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={
+                            "Link da Task": st.column_config.LinkColumn(
+                                "Link da Task",
+                                help="Clique para abrir a task",
+                                display_text="🔗 Abrir Task"
+                            ),
+                            "Descrição do Defeito": st.column_config.TextColumn(
+                                "Descrição do Defeito",
+                                help="Detalhes dos defeitos encontrados (erros numéricos + motivos de rejeição)"
+                            )
+                        }
+                    )
                 
-                # Botão para exportar dados de erros
-                csv_erros = df_erros_exibir.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📥 Exportar Tarefas com Erros (CSV)",
-                    data=csv_erros,
-                    file_name=f"tarefas_com_erros_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                    mime="text/csv"
-                )
+                    # Botão para exportar dados de erros
+                    csv_erros = df_erros_exibir.to_csv(index=False, encoding='utf-8-sig')
+                    st.download_button(
+                        label="📥 Exportar Tarefas com Erros (CSV)",
+                        data=csv_erros,
+                        file_name=f"tarefas_com_erros_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                        mime="text/csv"
+                    )
             
-            st.divider()
+                st.divider()
             
-            # Seção 5: Análise de Tendências
-            st.markdown("#### 📊 Análise de Tendências")
+                # Seção 5: Análise de Tendências
+                st.markdown("#### 📊 Análise de Tendências")
             
-            if len(df_pm) > 0:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Gráfico de problemas por time
-                    problemas_por_time = df_pm.groupby('Time').agg({
-                        'Status': lambda x: (x == 'REJEITADA').sum(),
-                        'Erros': lambda x: (pd.to_numeric(x, errors='coerce').fillna(0) > 0).sum() if x.notna().any() else 0
-                    }).reset_index()
-                    problemas_por_time.columns = ['Time', 'Rejeitadas', 'Com_Erros']
-                    problemas_por_time['Total_Problemas'] = problemas_por_time['Rejeitadas'] + problemas_por_time['Com_Erros']
-                    
-                    if not problemas_por_time.empty and problemas_por_time['Total_Problemas'].sum() > 0:
-                        fig_time = px.bar(
-                            problemas_por_time.sort_values('Total_Problemas', ascending=True),
-                            x='Total_Problemas',
-                            y='Time',
-                            orientation='h',
-                            title="Problemas por Time",
-                            color='Total_Problemas',
-                            color_continuous_scale='Reds'
-                        )
-                        fig_time.update_layout(height=400)
-                        st.plotly_chart(fig_time, use_container_width=True)
-                    else:
-                        st.info("Nenhum problema encontrado para exibir no gráfico.")
+                if len(df_pm) > 0:
+                    col1, col2 = st.columns(2)
                 
-                with col2:
-                    # Gráfico de evolução temporal
-                    if 'Data' in df_pm.columns:
-                        df_pm['Semana'] = df_pm['Data'].dt.to_period('W').astype(str)
-                        evolucao = df_pm.groupby('Semana').agg({
+                    with col1:
+                        # Gráfico de problemas por time
+                        problemas_por_time = df_pm.groupby('Time', observed=True).agg({
                             'Status': lambda x: (x == 'REJEITADA').sum(),
                             'Erros': lambda x: (pd.to_numeric(x, errors='coerce').fillna(0) > 0).sum() if x.notna().any() else 0
                         }).reset_index()
-                        evolucao.columns = ['Semana', 'Rejeitadas', 'Com_Erros']
-                        
-                        if not evolucao.empty:
-                            fig_evolucao = go.Figure()
-                            fig_evolucao.add_trace(go.Scatter(
-                                x=evolucao['Semana'],
-                                y=evolucao['Rejeitadas'],
-                                mode='lines+markers',
-                                name='Rejeitadas',
-                                line=dict(color='red')
-                            ))
-                            fig_evolucao.add_trace(go.Scatter(
-                                x=evolucao['Semana'],
-                                y=evolucao['Com_Erros'],
-                                mode='lines+markers',
-                                name='Com Erros',
-                                line=dict(color='orange')
-                            ))
-                            fig_evolucao.update_layout(
-                                title="Evolução de Problemas por Semana",
-                                xaxis_title="Semana",
-                                yaxis_title="Quantidade",
-                                height=400
+                        problemas_por_time.columns = ['Time', 'Rejeitadas', 'Com_Erros']
+                        problemas_por_time['Total_Problemas'] = problemas_por_time['Rejeitadas'] + problemas_por_time['Com_Erros']
+                    
+                        if not problemas_por_time.empty and problemas_por_time['Total_Problemas'].sum() > 0:
+                            fig_time = px.bar(
+                                problemas_por_time.sort_values('Total_Problemas', ascending=True),
+                                x='Total_Problemas',
+                                y='Time',
+                                orientation='h',
+                                title="Problemas por Time",
+                                color='Total_Problemas',
+                                color_continuous_scale='Reds'
                             )
-                            st.plotly_chart(fig_evolucao, use_container_width=True)
+                            fig_time.update_layout(height=400)
+                            st.plotly_chart(fig_time, use_container_width=True)
                         else:
-                            st.info("Dados insuficientes para análise temporal.")
+                            st.info("Nenhum problema encontrado para exibir no gráfico.")
+                
+                    with col2:
+                        # Gráfico de evolução temporal
+                        if 'Data' in df_pm.columns:
+                            df_pm['Semana'] = df_pm['Data'].dt.to_period('W').astype(str)
+                            evolucao = df_pm.groupby('Semana').agg({
+                                'Status': lambda x: (x == 'REJEITADA').sum(),
+                                'Erros': lambda x: (pd.to_numeric(x, errors='coerce').fillna(0) > 0).sum() if x.notna().any() else 0
+                            }).reset_index()
+                            evolucao.columns = ['Semana', 'Rejeitadas', 'Com_Erros']
+                        
+                            if not evolucao.empty:
+                                fig_evolucao = go.Figure()
+                                fig_evolucao.add_trace(go.Scatter(
+                                    x=evolucao['Semana'],
+                                    y=evolucao['Rejeitadas'],
+                                    mode='lines+markers',
+                                    name='Rejeitadas',
+                                    line=dict(color='red')
+                                ))
+                                fig_evolucao.add_trace(go.Scatter(
+                                    x=evolucao['Semana'],
+                                    y=evolucao['Com_Erros'],
+                                    mode='lines+markers',
+                                    name='Com Erros',
+                                    line=dict(color='orange')
+                                ))
+                                fig_evolucao.update_layout(
+                                    title="Evolução de Problemas por Semana",
+                                    xaxis_title="Semana",
+                                    yaxis_title="Quantidade",
+                                    height=400
+                                )
+                                st.plotly_chart(fig_evolucao, use_container_width=True)
+                            else:
+                                st.info("Dados insuficientes para análise temporal.")
             
-            # Seção 6: Recomendações
-            st.markdown("#### 💡 Recomendações")
+                # Seção 6: Recomendações
+                st.markdown("#### 💡 Recomendações")
             
-            if len(df_pm) > 0:
-                recomendacoes = []
+                if len(df_pm) > 0:
+                    recomendacoes = []
                 
-                # Análise de taxa de rejeição
-                if taxa_rejeicao > 20:
-                    recomendacoes.append(f"🔴 **Alta taxa de rejeição ({taxa_rejeicao:.1f}%)**: Revisar processo de desenvolvimento e critérios de aceitação")
-                elif taxa_rejeicao > 10:
-                    recomendacoes.append(f"🟡 **Taxa de rejeição moderada ({taxa_rejeicao:.1f}%)**: Monitorar tendência e identificar padrões")
-                else:
-                    recomendacoes.append(f"🟢 **Taxa de rejeição baixa ({taxa_rejeicao:.1f}%)**: Manter qualidade atual")
+                    # Análise de taxa de rejeição
+                    if taxa_rejeicao > 20:
+                        recomendacoes.append(f"🔴 **Alta taxa de rejeição ({taxa_rejeicao:.1f}%)**: Revisar processo de desenvolvimento e critérios de aceitação")
+                    elif taxa_rejeicao > 10:
+                        recomendacoes.append(f"🟡 **Taxa de rejeição moderada ({taxa_rejeicao:.1f}%)**: Monitorar tendência e identificar padrões")
+                    else:
+                        recomendacoes.append(f"🟢 **Taxa de rejeição baixa ({taxa_rejeicao:.1f}%)**: Manter qualidade atual")
                 
-                # Análise por time
-                if len(df_rejeitadas) > 0:
-                    time_mais_problemas = df_rejeitadas['Time'].value_counts().index[0]
-                    qtd_problemas = df_rejeitadas['Time'].value_counts().iloc[0]
-                    recomendacoes.append(f"⚠️ **Time {time_mais_problemas}** apresenta mais problemas ({qtd_problemas} tarefas rejeitadas)")
+                    # Análise por time
+                    if len(df_rejeitadas) > 0:
+                        time_mais_problemas = contar_ocorrencias(df_rejeitadas['Time']).index[0]
+                        qtd_problemas = contar_ocorrencias(df_rejeitadas['Time']).iloc[0]
+                        recomendacoes.append(f"⚠️ **Time {time_mais_problemas}** apresenta mais problemas ({qtd_problemas} tarefas rejeitadas)")
                 
-                # Análise de motivos mais comuns
-                if len(df_rejeitadas) > 0:
-                    motivos_todos = []
-                    for col in ['Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7']:
-                        motivos_todos.extend(df_rejeitadas[col].dropna().tolist())
+                    # Análise de motivos mais comuns
+                    if len(df_rejeitadas) > 0:
+                        motivos_counts = contar_ocorrencias(motivos_do_recorte(df_rejeitadas)['Motivo'])
                     
-                    if motivos_todos:
-                        motivo_mais_comum = pd.Series(motivos_todos).value_counts().index[0]
-                        recomendacoes.append(f"🎯 **Motivo mais comum**: {motivo_mais_comum}")
+                        if not motivos_counts.empty:
+                            motivo_mais_comum = motivos_counts.index[0]
+                            recomendacoes.append(f"🎯 **Motivo mais comum**: {motivo_mais_comum}")
                 
-                for rec in recomendacoes:
-                    st.markdown(rec)
-            else:
-                st.info("Nenhum dado disponível para análise com os filtros selecionados.")
+                    for rec in recomendacoes:
+                        st.markdown(rec)
+                else:
+                    st.info("Nenhum dado disponível para análise com os filtros selecionados.")
             
-        with tab8:
-            st.markdown("### 🌐 **Análise de Ambientes de Teste**")
-            st.markdown("*Distribuição e análise de testes por ambiente*")
+        with tab8 as ativa:
+            if ativa:
+                st.markdown("### 🌐 **Análise de Ambientes de Teste**")
+                st.markdown("*Distribuição e análise de testes por ambiente*")
             
-            # Botão de exportação PDF
-            col_export_amb, col_space_amb = st.columns([1, 3])
-            with col_export_amb:
-                botao_exportar_pdf("Analise_de_Ambientes", criar_pdf_generico, df_com_teste, df, df_sem_teste)
+                # Botão de exportação PDF
+                col_export_amb, col_space_amb = st.columns([1, 3])
+                with col_export_amb:
+                    botao_exportar_pdf("Analise_de_Ambientes", criar_pdf_generico, df_com_teste, df, df_sem_teste)
             
-            st.markdown("---")
+                st.markdown("---")
             
-            if 'Ambiente' in df_com_teste.columns:
-                # Verificar se há dados de ambiente válidos (não nulos e não vazios)
-                dados_ambiente = df_com_teste[df_com_teste['Ambiente'].notna() & (df_com_teste['Ambiente'].str.strip() != '')]
+                if 'Ambiente' in df_com_teste.columns:
+                    # Verificar se há dados de ambiente válidos (não nulos e não vazios)
+                    dados_ambiente = df_com_teste[df_com_teste['Ambiente'].notna() & (df_com_teste['Ambiente'].str.strip() != '')]
                 
-                if not dados_ambiente.empty:
-                    # Métricas principais de ambientes
-                    st.markdown("#### 📊 **Métricas de Ambientes**")
+                    if not dados_ambiente.empty:
+                        # Métricas principais de ambientes
+                        st.markdown("#### 📊 **Métricas de Ambientes**")
                     
-                    col_amb1, col_amb2, col_amb3, col_amb4 = st.columns(4)
+                        col_amb1, col_amb2, col_amb3, col_amb4 = st.columns(4)
                     
-                    with col_amb1:
-                        total_ambientes = dados_ambiente['Ambiente'].nunique()
-                        st.metric("🌐 Total de Ambientes", f"{total_ambientes}")
+                        with col_amb1:
+                            total_ambientes = dados_ambiente['Ambiente'].nunique()
+                            st.metric("🌐 Total de Ambientes", f"{total_ambientes}")
                     
-                    with col_amb2:
-                        ambiente_mais_usado = dados_ambiente['Ambiente'].value_counts().index[0]
-                        st.metric("🏆 Ambiente Mais Usado", ambiente_mais_usado)
+                        with col_amb2:
+                            ambiente_mais_usado = contar_ocorrencias(dados_ambiente['Ambiente']).index[0]
+                            st.metric("🏆 Ambiente Mais Usado", ambiente_mais_usado)
                     
-                    with col_amb3:
-                        testes_com_ambiente = len(dados_ambiente)
-                        total_testes = len(df_com_teste)
-                        cobertura_ambiente = (testes_com_ambiente / total_testes * 100) if total_testes > 0 else 0
-                        st.metric("📊 Cobertura de Ambiente", f"{cobertura_ambiente:.1f}%")
+                        with col_amb3:
+                            testes_com_ambiente = len(dados_ambiente)
+                            total_testes = len(df_com_teste)
+                            cobertura_ambiente = (testes_com_ambiente / total_testes * 100) if total_testes > 0 else 0
+                            st.metric("📊 Cobertura de Ambiente", f"{cobertura_ambiente:.1f}%")
                     
-                    with col_amb4:
-                        if 'Status' in dados_ambiente.columns:
-                            rejeitadas_ambiente = len(dados_ambiente[dados_ambiente['Status'] == 'REJEITADA'])
-                            taxa_rejeicao_ambiente = (rejeitadas_ambiente / testes_com_ambiente * 100) if testes_com_ambiente > 0 else 0
-                            st.metric("⚠️ Taxa Rejeição", f"{taxa_rejeicao_ambiente:.1f}%")
+                        with col_amb4:
+                            if 'Status' in dados_ambiente.columns:
+                                rejeitadas_ambiente = len(dados_ambiente[dados_ambiente['Status'] == 'REJEITADA'])
+                                taxa_rejeicao_ambiente = (rejeitadas_ambiente / testes_com_ambiente * 100) if testes_com_ambiente > 0 else 0
+                                st.metric("⚠️ Taxa Rejeição", f"{taxa_rejeicao_ambiente:.1f}%")
                     
-                    st.markdown("---")
+                        st.markdown("---")
                     
-                    # Gráficos de análise de ambientes
-                    st.markdown("#### 📈 **Análise Visual de Ambientes**")
+                        # Gráficos de análise de ambientes
+                        st.markdown("#### 📈 **Análise Visual de Ambientes**")
                     
-                    col_graf_amb1, col_graf_amb2 = st.columns(2)
+                        col_graf_amb1, col_graf_amb2 = st.columns(2)
                     
-                    with col_graf_amb1:
-                        # Gráfico de distribuição por ambiente
-                        fig_dist_amb = grafico_distribuicao_ambientes(dados_ambiente)
-                        if fig_dist_amb:
-                            st.plotly_chart(fig_dist_amb, use_container_width=True, key="distribuicao_ambientes")
+                        with col_graf_amb1:
+                            # Gráfico de distribuição por ambiente
+                            fig_dist_amb = grafico_distribuicao_ambientes(dados_ambiente)
+                            if fig_dist_amb:
+                                st.plotly_chart(fig_dist_amb, use_container_width=True, key="distribuicao_ambientes")
                     
-                    with col_graf_amb2:
-                        # Gráfico de status por ambiente
-                        fig_status_amb = grafico_ambiente_por_status(dados_ambiente)
-                        if fig_status_amb:
-                            st.plotly_chart(fig_status_amb, use_container_width=True, key="status_por_ambiente")
+                        with col_graf_amb2:
+                            # Gráfico de status por ambiente
+                            fig_status_amb = grafico_ambiente_por_status(dados_ambiente)
+                            if fig_status_amb:
+                                st.plotly_chart(fig_status_amb, use_container_width=True, key="status_por_ambiente")
                     
-                    st.markdown("---")
+                        st.markdown("---")
                     
-                    # Tabela detalhada por ambiente
-                    st.markdown("#### 📋 **Detalhamento por Ambiente**")
+                        # Tabela detalhada por ambiente
+                        st.markdown("#### 📋 **Detalhamento por Ambiente**")
                     
-                    # Criar resumo por ambiente
-                    resumo_ambiente = dados_ambiente.groupby('Ambiente').agg({
-                        'Status': ['count', lambda x: (x == 'APROVADA').sum(), lambda x: (x == 'REJEITADA').sum(), lambda x: (x == 'PRONTO PARA PUBLICAÇÃO').sum()],
-                        'Time': 'nunique',
-                        'Responsavel pelo teste': 'nunique'
-                    }).round(2)
+                        # Criar resumo por ambiente
+                        resumo_ambiente = dados_ambiente.groupby('Ambiente', observed=True).agg({
+                            'Status': ['count', lambda x: (x == 'APROVADA').sum(), lambda x: (x == 'REJEITADA').sum(), lambda x: (x == 'PRONTO PARA PUBLICAÇÃO').sum()],
+                            'Time': 'nunique',
+                            'Responsavel pelo teste': 'nunique'
+                        }).round(2)
                     
-                    resumo_ambiente.columns = ['Total_Testes', 'Aprovadas', 'Rejeitadas', 'Prontas', 'Times_Atendidos', 'Testadores']
-                    resumo_ambiente['Total_Aprovadas'] = resumo_ambiente['Aprovadas'] + resumo_ambiente['Prontas']
-                    resumo_ambiente['Taxa_Aprovacao'] = (resumo_ambiente['Total_Aprovadas'] / resumo_ambiente['Total_Testes'] * 100).round(1)
-                    resumo_ambiente['Taxa_Rejeicao'] = (resumo_ambiente['Rejeitadas'] / resumo_ambiente['Total_Testes'] * 100).round(1)
+                        resumo_ambiente.columns = ['Total_Testes', 'Aprovadas', 'Rejeitadas', 'Prontas', 'Times_Atendidos', 'Testadores']
+                        resumo_ambiente['Total_Aprovadas'] = resumo_ambiente['Aprovadas'] + resumo_ambiente['Prontas']
+                        resumo_ambiente['Taxa_Aprovacao'] = (resumo_ambiente['Total_Aprovadas'] / resumo_ambiente['Total_Testes'] * 100).round(1)
+                        resumo_ambiente['Taxa_Rejeicao'] = (resumo_ambiente['Rejeitadas'] / resumo_ambiente['Total_Testes'] * 100).round(1)
                     
-                    resumo_ambiente = resumo_ambiente.reset_index()
+                        resumo_ambiente = resumo_ambiente.reset_index()
                     
-                    st.dataframe(
-                        resumo_ambiente,
-                        column_config={
-                            "Ambiente": "🌐 Ambiente",
-                            "Total_Testes": "📊 Total de Testes",
-                            "Aprovadas": "✅ Aprovadas",
-                            "Rejeitadas": "❌ Rejeitadas",
-                            "Times_Atendidos": "👥 Times Atendidos",
-                            "Testadores": "🧑‍💻 Testadores",
-                            "Taxa_Aprovacao": "📈 Taxa Aprovação (%)",
-                            "Taxa_Rejeicao": "📉 Taxa Rejeição (%)"
-                        },
-                        use_container_width=True
-                    )
+                        st.dataframe(
+                            resumo_ambiente,
+                            column_config={
+                                "Ambiente": "🌐 Ambiente",
+                                "Total_Testes": "📊 Total de Testes",
+                                "Aprovadas": "✅ Aprovadas",
+                                "Rejeitadas": "❌ Rejeitadas",
+                                "Times_Atendidos": "👥 Times Atendidos",
+                                "Testadores": "🧑‍💻 Testadores",
+                                "Taxa_Aprovacao": "📈 Taxa Aprovação (%)",
+                                "Taxa_Rejeicao": "📉 Taxa Rejeição (%)"
+                            },
+                            use_container_width=True
+                        )
                     
-                    # Botão para exportar dados de ambientes
-                    csv_ambientes = resumo_ambiente.to_csv(index=False, encoding='utf-8-sig')
-                    st.download_button(
-                        label="📥 Exportar Análise de Ambientes (CSV)",
-                        data=csv_ambientes,
-                        file_name=f"analise_ambientes_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                        mime="text/csv"
-                    )
+                        # Botão para exportar dados de ambientes
+                        csv_ambientes = resumo_ambiente.to_csv(index=False, encoding='utf-8-sig')
+                        st.download_button(
+                            label="📥 Exportar Análise de Ambientes (CSV)",
+                            data=csv_ambientes,
+                            file_name=f"analise_ambientes_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                            mime="text/csv"
+                        )
                     
-                    st.markdown("---")
+                        st.markdown("---")
                     
-                    # Insights sobre ambientes
-                    st.markdown("#### 💡 **Insights sobre Ambientes**")
+                        # Insights sobre ambientes
+                        st.markdown("#### 💡 **Insights sobre Ambientes**")
                     
-                    insights_ambiente = []
+                        insights_ambiente = []
                     
-                    # Ambiente com maior taxa de rejeição
-                    if not resumo_ambiente.empty:
-                        ambiente_problema = resumo_ambiente.loc[resumo_ambiente['Taxa_Rejeicao'].idxmax()]
-                        if ambiente_problema['Taxa_Rejeicao'] > 20:
-                            insights_ambiente.append(f"⚠️ **Ambiente {ambiente_problema['Ambiente']}** apresenta alta taxa de rejeição ({ambiente_problema['Taxa_Rejeicao']:.1f}%)")
+                        # Ambiente com maior taxa de rejeição
+                        if not resumo_ambiente.empty:
+                            ambiente_problema = resumo_ambiente.loc[resumo_ambiente['Taxa_Rejeicao'].idxmax()]
+                            if ambiente_problema['Taxa_Rejeicao'] > 20:
+                                insights_ambiente.append(f"⚠️ **Ambiente {ambiente_problema['Ambiente']}** apresenta alta taxa de rejeição ({ambiente_problema['Taxa_Rejeicao']:.1f}%)")
                         
-                        # Ambiente mais eficiente
-                        ambiente_eficiente = resumo_ambiente.loc[resumo_ambiente['Taxa_Aprovacao'].idxmax()]
-                        if ambiente_eficiente['Taxa_Aprovacao'] > 80:
-                            insights_ambiente.append(f"✅ **Ambiente {ambiente_eficiente['Ambiente']}** apresenta excelente taxa de aprovação ({ambiente_eficiente['Taxa_Aprovacao']:.1f}%)")
+                            # Ambiente mais eficiente
+                            ambiente_eficiente = resumo_ambiente.loc[resumo_ambiente['Taxa_Aprovacao'].idxmax()]
+                            if ambiente_eficiente['Taxa_Aprovacao'] > 80:
+                                insights_ambiente.append(f"✅ **Ambiente {ambiente_eficiente['Ambiente']}** apresenta excelente taxa de aprovação ({ambiente_eficiente['Taxa_Aprovacao']:.1f}%)")
                         
-                        # Cobertura de ambientes
-                        if cobertura_ambiente < 70:
-                            insights_ambiente.append(f"📊 **Baixa cobertura de ambientes**: Apenas {cobertura_ambiente:.1f}% dos testes têm ambiente especificado")
+                            # Cobertura de ambientes
+                            if cobertura_ambiente < 70:
+                                insights_ambiente.append(f"📊 **Baixa cobertura de ambientes**: Apenas {cobertura_ambiente:.1f}% dos testes têm ambiente especificado")
                     
-                    if insights_ambiente:
-                        for insight in insights_ambiente:
-                            st.markdown(insight)
-                    else:
-                        st.info("✅ Não foram identificados problemas significativos na distribuição por ambientes.")
+                        if insights_ambiente:
+                            for insight in insights_ambiente:
+                                st.markdown(insight)
+                        else:
+                            st.info("✅ Não foram identificados problemas significativos na distribuição por ambientes.")
                     
+                    else:
+                        st.warning("⚠️ Nenhum dado de ambiente encontrado nos testes realizados.")
+                        st.info("💡 **Dica**: Certifique-se de que a coluna 'Ambiente' esteja preenchida na planilha para obter análises detalhadas.")
                 else:
-                    st.warning("⚠️ Nenhum dado de ambiente encontrado nos testes realizados.")
-                    st.info("💡 **Dica**: Certifique-se de que a coluna 'Ambiente' esteja preenchida na planilha para obter análises detalhadas.")
-            else:
-                st.error("❌ Coluna 'Ambiente' não encontrada na planilha.")
-                st.info("💡 **Solução**: Adicione uma coluna 'Ambiente' na sua planilha para habilitar esta análise.")
+                    st.error("❌ Coluna 'Ambiente' não encontrada na planilha.")
+                    st.info("💡 **Solução**: Adicione uma coluna 'Ambiente' na sua planilha para habilitar esta análise.")
         
 
-    else:
+        exibir_tempos_abas(tempos_execucao)
+    
+    elif not st.session_state.get('modo_streaming'):
         st.info("👆 Faça upload de um arquivo Excel para começar a análise")
         st.markdown("""
         ### 📋 Colunas esperadas na planilha:
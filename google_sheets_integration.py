@@ -2,8 +2,18 @@ import streamlit as st
 import gspread
 from google.oauth2.service_account import Credentials
 import pandas as pd
+import numpy as np
 import json
+import os
+import pickle
+import hashlib
+from pathlib import Path
 from datetime import datetime, timedelta
+import threading
+from collections import Counter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from gspread.utils import numericise_all, rowcol_to_a1
 
 def get_service_account_info():
     """
@@ -37,7 +47,10 @@ def get_spreadsheet_config():
     try:
         return {
             "url": st.secrets["google_sheets"]["spreadsheet_url"],
-            "worksheet_name": st.secrets["google_sheets"]["worksheet_name"]
+            "worksheet_name": st.secrets["google_sheets"]["worksheet_name"],
+            # Opcionais: modo de sincronização ("incremental" ou "completo") e pasta da cópia local
+            "sync_mode": st.secrets["google_sheets"].get("sync_mode", "incremental"),
+            "cache_dir": st.secrets["google_sheets"].get("cache_dir", SYNC_CACHE_DIR)
         }
     except KeyError as e:
         st.error(f"Configuração da planilha incompleta: {e}")
@@ -48,6 +61,200 @@ def get_spreadsheet_config():
 
 import time
 
+# Sincronização incremental: cópia local da aba e intervalo máximo entre conferências completas
+SYNC_CACHE_DIR = os.path.join('.cache', 'sheets')
+FULL_REFRESH_INTERVAL = timedelta(hours=6)
+
+def column_letter(indice):
+    """Letra A1 da coluna (1 = A)"""
+    return rowcol_to_a1(1, indice).rstrip('0123456789')
+
+def _first_row(resposta):
+    """Primeira linha de um intervalo lido por linhas (intervalo vazio volta como [[]] na API)"""
+    return list(resposta[0]) if resposta and resposta[0] else []
+
+def _header_from_columns(resposta):
+    """Cabeçalho lido com major_dimension=COLUMNS: cada coluna vem como [valor] (ou [] se vazia)"""
+    return IncrementalSheetSync._trim([coluna[0] if coluna else '' for coluna in resposta])
+
+def numericise_column(valores):
+    """Conversão numérica do get_all_records aplicada a uma coluna, uma vez por valor distinto"""
+    codigos, distintos = pd.factorize(np.asarray(valores, dtype=object))
+    convertidos = np.empty(len(distintos), dtype=object)
+    convertidos[:] = numericise_all(list(distintos), False, '')
+    return convertidos[codigos]
+
+def columns_to_frame(header, colunas, linhas=None):
+    """
+    Monta o DataFrame coluna a coluna a partir dos valores brutos (major_dimension=COLUMNS),
+    com a mesma conversão numérica do get_all_records. Colunas mais curtas são completadas com ''.
+    """
+    if linhas is None:
+        linhas = max((len(coluna) for coluna in colunas), default=0)
+    dados = {}
+    for nome, valores in zip(header, colunas):
+        valores = list(valores[:linhas])
+        dados[nome] = numericise_column(valores + [''] * (linhas - len(valores)))
+    return pd.DataFrame(dados, index=pd.RangeIndex(linhas)).infer_objects()
+
+def fetch_columns(worksheet, header, columns=None, first_row=2):
+    """
+    Lê numa única chamada batch_get (major_dimension=COLUMNS) só as colunas pedidas, da linha
+    first_row em diante. Devolve os nomes encontrados no cabeçalho (na ordem da planilha) e os
+    valores brutos de cada coluna. columns=None lê todas as colunas do cabeçalho.
+    """
+    pedidas = set(header if columns is None else columns)
+    nomes = [nome for nome in dict.fromkeys(header) if nome in pedidas]
+    if not nomes:
+        return [], []
+    letras = [column_letter(header.index(nome) + 1) for nome in nomes]
+    respostas = worksheet.batch_get([f"{letra}{first_row}:{letra}" for letra in letras], major_dimension='COLUMNS')
+    return nomes, [_first_row(resposta) for resposta in respostas]
+
+def fetch_frame(worksheet, columns=None):
+    """Baixa a aba coluna a coluna (só as colunas pedidas), sem passar por dicionários por linha"""
+    header = IncrementalSheetSync._trim(_first_row(worksheet.get('1:1')))
+    nomes, colunas = fetch_columns(worksheet, header, columns)
+    return columns_to_frame(nomes, colunas)
+
+class IncrementalSheetSync:
+    """
+    Sincronização incremental de uma aba que só cresce com linhas adicionadas no final.
+    Mantém em disco o DataFrame já baixado e, a cada sincronização, busca só as linhas depois
+    da última conhecida. Cabeçalho ou última linha conhecida diferentes (edição), revisão nova
+    sem linhas novas ou conferência completa vencida fazem baixar a aba inteira de novo.
+    A revisão é só a data da última alteração: com linhas novas, ela não diz se linhas antigas
+    também foram editadas na mesma janela. Essas edições aparecem na próxima conferência completa;
+    até lá pending_rows conta as linhas acrescentadas sem conferência e next_full_sync diz quando
+    ela acontece, para a tela avisar.
+    A leitura é feita por colunas e, se columns for informado, só dessas colunas.
+    """
+    def __init__(self, worksheet, cache_key, cache_dir=SYNC_CACHE_DIR, full_refresh_interval=FULL_REFRESH_INTERVAL,
+                 columns=None):
+        self.worksheet = worksheet
+        self.cache_path = Path(cache_dir) / f"{hashlib.sha256(cache_key.encode()).hexdigest()[:16]}.pkl"
+        self.full_refresh_interval = full_refresh_interval
+        self.columns = sorted(columns) if columns is not None else None
+        self.state = self._load_state()
+        self.last_mode = None
+    
+    def _load_state(self):
+        try:
+            with open(self.cache_path, 'rb') as arquivo:
+                return pickle.load(arquivo)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+    
+    def _save_state(self):
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temporario = self.cache_path.with_suffix('.tmp')
+            with open(temporario, 'wb') as arquivo:
+                pickle.dump(self.state, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporario, self.cache_path)
+        except OSError:
+            # Sem disco gravável a sincronização continua funcionando, só não sobrevive ao restart
+            pass
+    
+    @property
+    def version(self):
+        """Identifica o conteúdo sincronizado (revisão da planilha ou, sem ela, quantidade de linhas)"""
+        if not self.state:
+            return None
+        return self.state['revision'] or f"linhas-{self.state['rows']}"
+    
+    @property
+    def frame(self):
+        return self.state['frame'] if self.state else None
+    
+    @property
+    def pending_rows(self):
+        """Linhas acrescentadas de forma incremental desde a última leitura completa"""
+        return self.state.get('pending_rows', 0) if self.state else 0
+    
+    @property
+    def next_full_sync(self):
+        """Momento da próxima leitura completa (conferência de edições em linhas antigas)"""
+        return self.state['full_sync_at'] + self.full_refresh_interval if self.state else None
+    
+    def sync(self, revision=None, force_full=False):
+        """Atualiza a cópia local e devolve o DataFrame sincronizado (não altere o objeto devolvido)"""
+        estado = self.state
+        if (force_full or estado is None or estado['rows'] == 0 or
+                estado.get('requested') != self.columns or
+                datetime.now() - estado['full_sync_at'] > self.full_refresh_interval):
+            return self._full_sync(revision)
+        
+        if revision is not None and revision == estado['revision']:
+            self.last_mode = 'inalterado'
+            return estado['frame']
+        
+        # Uma única chamada: cabeçalho e, por coluna, a última linha conhecida e tudo o que veio depois dela
+        ultima_linha = estado['rows'] + 1
+        letras = [column_letter(estado['header'].index(nome) + 1) for nome in estado['columns']]
+        cabecalho, *colunas = self.worksheet.batch_get(
+            ['1:1'] + [f"{letra}{ultima_linha}:{letra}" for letra in letras],
+            major_dimension='COLUMNS'
+        )
+        
+        colunas = [_first_row(coluna) for coluna in colunas]
+        linha_conhecida = [coluna[0] if coluna else '' for coluna in colunas]
+        novas = [coluna[1:] for coluna in colunas]
+        quantidade = max((len(coluna) for coluna in novas), default=0)
+        editada = (
+            _header_from_columns(cabecalho) != estado['header'] or
+            linha_conhecida != estado['last_row']
+        )
+        if editada or (revision is not None and not quantidade):
+            return self._full_sync(revision)
+        
+        if quantidade:
+            self.state = {
+                **estado,
+                'frame': pd.concat([estado['frame'], columns_to_frame(estado['columns'], novas, quantidade)],
+                                   ignore_index=True),
+                'rows': estado['rows'] + quantidade,
+                'last_row': self._last_values(novas, quantidade),
+                'revision': revision,
+                'pending_rows': estado.get('pending_rows', 0) + quantidade
+            }
+            self._save_state()
+            self.last_mode = f'incremental (+{quantidade} linhas)'
+        else:
+            self.last_mode = 'inalterado'
+        return self.state['frame']
+    
+    def _full_sync(self, revision):
+        header = self._trim(_first_row(self.worksheet.get('1:1')))
+        nomes, colunas = fetch_columns(self.worksheet, header, self.columns)
+        quantidade = max((len(coluna) for coluna in colunas), default=0)
+        self.state = {
+            'header': header,
+            'columns': nomes,
+            'requested': self.columns,
+            'rows': quantidade,
+            'last_row': self._last_values(colunas, quantidade),
+            'revision': revision,
+            'frame': columns_to_frame(nomes, colunas, quantidade),
+            'full_sync_at': datetime.now()
+        }
+        self._save_state()
+        self.last_mode = 'completo'
+        return self.state['frame']
+    
+    @staticmethod
+    def _last_values(colunas, quantidade):
+        """Valores brutos da última linha, por coluna ('' onde a coluna termina antes)"""
+        return [coluna[quantidade - 1] if len(coluna) >= quantidade > 0 else '' for coluna in colunas]
+    
+    @staticmethod
+    def _trim(linha):
+        """Linha como a API devolve em intervalos: sem as células vazias do final"""
+        linha = list(linha)
+        while linha and linha[-1] == '':
+            linha.pop()
+        return linha
+
 class GoogleSheetsConnector:
     def __init__(self):
         self.gc = None
@@ -55,6 +262,7 @@ class GoogleSheetsConnector:
         self.last_update = None
         self.cache_duration = 300  # 5 minutos em segundos
         self.cached_data = None
+        self.sync = None
         
     def setup_credentials_from_json(self, credentials_json):
         """
@@ -107,6 +315,9 @@ class GoogleSheetsConnector:
             else:
                 self.worksheet = spreadsheet.sheet1
             
+            # Cópia local sincronizada de forma incremental (só linhas novas a cada atualização)
+            self.sync = IncrementalSheetSync(self.worksheet, cache_key=f"{sheet_id}:{self.worksheet.id}")
+            
             return True, f"Conectado à planilha: {spreadsheet.title}"
             
         except gspread.SpreadsheetNotFound:
@@ -130,15 +341,15 @@ class GoogleSheetsConnector:
                 (now - self.last_update).seconds < self.cache_duration):
                 return self.cached_data, "Dados obtidos do cache"
             
-            # Obter todos os dados da planilha
-            data = self.worksheet.get_all_records()
+            # Obter os dados da planilha (incremental: só as linhas adicionadas desde a última vez)
+            if self.sync is not None:
+                df = self.sync.sync(force_full=force_refresh).copy()
+            else:
+                df = pd.DataFrame(self.worksheet.get_all_records())
             
-            if not data:
+            if df.empty:
                 return None, "Planilha vazia ou sem dados"
             
-            # Converter para DataFrame
-            df = pd.DataFrame(data)
-            
             # Processar colunas de data se existirem
             date_columns = ['Data', 'data', 'DATE', 'Date']
             for col in date_columns:
@@ -278,8 +489,218 @@ def create_google_sheets_interface():
     
     return connector
 
-def load_google_sheets_data_automatically():
-    """Carrega dados automaticamente da planilha configurada usando secrets"""
+# Cache do conteúdo da planilha, chaveado pela revisão (modifiedTime do Drive)
+CACHE_TTL_SEGUNDOS = 3600
+CACHE_MAX_ENTRADAS = 4
+
+@st.cache_data(ttl=CACHE_TTL_SEGUNDOS, max_entries=CACHE_MAX_ENTRADAS, show_spinner=False)
+def baixar_planilha_por_revisao(url, worksheet_name, revisao, colunas, _worksheet):
+    """Baixa as colunas da aba; só volta à API quando a revisão da planilha muda"""
+    df = fetch_frame(_worksheet, colunas)
+    return df if not df.empty else None
+
+# Cliente e dados compartilhados entre todas as sessões do processo
+SHEETS_SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets.readonly',
+    'https://www.googleapis.com/auth/drive.readonly'
+]
+HTTP_POOL_SIZE = 10
+SHARED_CACHE_MAX_AGE = timedelta(minutes=5)
+BACKGROUND_REFRESH_INTERVAL = timedelta(minutes=5)
+
+class SharedSheetsCache:
+    """
+    Dados da planilha compartilhados por todas as sessões do processo.
+    Cada chave tem sua própria trava, então cada chave é buscada por uma só thread de cada vez
+    (single-flight). Sem nenhuma cópia ainda, as sessões esperam a primeira busca. Com cópia
+    vencida, recebem a última cópia boa na hora e a atualização roda em segundo plano
+    (stale-while-revalidate). Um worker também atualiza as chaves registradas periodicamente.
+    Também guarda as abas abertas e as sincronizações incrementais, para não reabri-las a cada carga.
+    """
+    def __init__(self, max_age=SHARED_CACHE_MAX_AGE, refresh_interval=BACKGROUND_REFRESH_INTERVAL):
+        self.max_age = max_age
+        self.refresh_interval = refresh_interval
+        self.entries = {}
+        self.fetchers = {}
+        self.errors = {}
+        self.worksheets = {}
+        self.syncs = {}
+        self.stats = Counter()
+        self._locks = {}
+        self._guard = threading.Lock()
+        self._worker = None
+    
+    def lock(self, key):
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+    
+    def seed(self, key, valor, momento):
+        """Semeia a chave com uma cópia já existente (ex.: snapshot em disco) se ela ainda não tiver valor"""
+        with self._guard:
+            if key not in self.entries and valor is not None:
+                self.entries[key] = (valor, momento or datetime.min)
+                self.stats['sementes'] += 1
+    
+    def refreshing(self, key):
+        return self.lock(key).locked()
+    
+    def get(self, key, fetch, force=False):
+        """
+        Devolve (valor, momento da busca) da chave; só bloqueia se ainda não houver cópia (ou com force)
+        """
+        self.fetchers[key] = fetch
+        self.start_worker()
+        
+        pedido_em = datetime.now()
+        entrada = self.entries.get(key)
+        if not force and entrada:
+            if pedido_em - entrada[1] < self.max_age:
+                self.stats['acertos'] += 1
+            else:
+                # Vencido: serve a última cópia boa e revalida em segundo plano
+                self.stats['servidos_vencidos'] += 1
+                self.refresh_async(key)
+            return entrada
+        
+        with self.lock(key):
+            # Outra thread atualizou enquanto esperávamos a trava: reaproveita o resultado dela
+            entrada = self.entries.get(key)
+            if entrada and entrada[1] >= pedido_em:
+                self.stats['esperas'] += 1
+                return entrada
+            return self._fetch(key)
+    
+    def refresh(self, key):
+        """Atualiza a chave se nenhuma outra thread já estiver atualizando (não espera)"""
+        trava = self.lock(key)
+        if not trava.acquire(blocking=False):
+            return
+        try:
+            self._fetch(key)
+        except Exception as e:
+            # Em segundo plano a falha não derruba nada: mantém a última cópia boa
+            self.errors[key] = (str(e), datetime.now())
+            self.stats['falhas'] += 1
+        finally:
+            trava.release()
+    
+    def refresh_async(self, key):
+        if not self.refreshing(key):
+            threading.Thread(target=self.refresh, args=(key,), name='sheets-refresh', daemon=True).start()
+    
+    def _fetch(self, key):
+        """Busca com o fetcher registrado (chamar com a trava da chave em mãos)"""
+        entrada = (self.fetchers[key](), datetime.now())
+        self.stats['buscas'] += 1
+        # Falha na busca (None) não substitui a última cópia boa nem fica em cache
+        if entrada[0] is not None:
+            self.entries[key] = entrada
+            self.errors.pop(key, None)
+        return entrada
+    
+    def start_worker(self):
+        """Inicia (uma vez por processo) a thread que atualiza as chaves registradas periodicamente"""
+        with self._guard:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run_worker, name='sheets-worker', daemon=True)
+            self._worker.start()
+    
+    def _run_worker(self):
+        while True:
+            time.sleep(self.refresh_interval.total_seconds())
+            for key in list(self.fetchers):
+                self.refresh(key)
+
+@st.cache_resource(show_spinner=False)
+def get_shared_sheets_cache():
+    """Cache de dados da planilha único por processo"""
+    return SharedSheetsCache()
+
+@st.cache_resource(show_spinner=False)
+def get_shared_client(client_email, private_key_id, _service_account_info):
+    """
+    Cliente gspread único por processo (por service account), com pool de conexões HTTP
+    reaproveitado por todas as sessões em vez de autenticar a cada carga (http_client e
+    get_lastUpdateTime existem a partir do gspread 6, ver requirements.txt)
+    """
+    credentials = Credentials.from_service_account_info(_service_account_info, scopes=SHEETS_SCOPES)
+    client = gspread.authorize(credentials)
+    adaptador = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    )
+    client.http_client.session.mount('https://', adaptador)
+    return client
+
+def _fetch_sheet_data(client, cache, spreadsheet_config, colunas):
+    """Busca os dados na API (chamado por uma única sessão de cada vez, ver SharedSheetsCache)"""
+    chave_aba = (spreadsheet_config['url'], spreadsheet_config['worksheet_name'])
+    if chave_aba not in cache.worksheets:
+        spreadsheet = client.open_by_url(spreadsheet_config['url'])
+        cache.worksheets[chave_aba] = (spreadsheet, spreadsheet.worksheet(spreadsheet_config['worksheet_name']))
+    spreadsheet, worksheet = cache.worksheets[chave_aba]
+    
+    # Obter dados (reaproveitando o download enquanto a revisão não mudar)
+    try:
+        revisao = spreadsheet.get_lastUpdateTime()
+    except Exception as e:
+        # Sem revisão a carga continua, mas sem o cache por revisão (a aba é conferida a cada busca)
+        print(f"⚠️ Revisão da planilha indisponível: {type(e).__name__}: {e}")
+        revisao = None
+    
+    versao = revisao
+    if spreadsheet_config['sync_mode'] == 'incremental':
+        chave_sync = chave_aba + (spreadsheet_config['cache_dir'], tuple(colunas) if colunas is not None else None)
+        if chave_sync not in cache.syncs:
+            cache.syncs[chave_sync] = IncrementalSheetSync(
+                worksheet,
+                cache_key=f"{spreadsheet_config['url']}:{spreadsheet_config['worksheet_name']}",
+                cache_dir=spreadsheet_config['cache_dir'],
+                columns=colunas
+            )
+        sync = cache.syncs[chave_sync]
+        df = sync.sync(revision=revisao)
+        versao = sync.version
+    elif revisao:
+        df = baixar_planilha_por_revisao(spreadsheet_config['url'], spreadsheet_config['worksheet_name'], revisao,
+                                         tuple(colunas) if colunas is not None else None, worksheet)
+    else:
+        df = fetch_frame(worksheet, colunas)
+    
+    if df is None or df.empty:
+        return None
+    
+    # Chave de conteúdo usada pelo cache de processamento do dashboard
+    df = df.copy(deep=False)
+    if versao:
+        df.attrs['chave_conteudo'] = f"sheets:{spreadsheet_config['url']}:{spreadsheet_config['worksheet_name']}:{versao}"
+    # Linhas novas acrescentadas sem releitura: edições em linhas antigas só entram na próxima conferência
+    if spreadsheet_config['sync_mode'] == 'incremental' and sync.pending_rows:
+        df.attrs['conferencia_completa_em'] = sync.next_full_sync
+    return df
+
+def prefixo_snapshot_planilha():
+    """
+    Prefixo das chaves de snapshot da planilha configurada nos secrets (None sem planilha
+    configurada). Sem mensagens na tela: serve só para escolher qual snapshot pode ser exibido.
+    """
+    try:
+        config = st.secrets["google_sheets"]
+        return f"sheets:{config['spreadsheet_url']}:{config['worksheet_name']}:"
+    except Exception:
+        return None
+
+def load_google_sheets_data_automatically(colunas=None, snapshot=None):
+    """
+    Carrega dados automaticamente da planilha configurada usando secrets.
+    Se colunas for informado, só essas colunas são lidas da planilha.
+    Cliente e dados são compartilhados entre as sessões e atualizados em segundo plano: só a
+    primeira carga do processo espera a API, as demais recebem a última cópia boa na hora.
+    snapshot(prefixo) pode devolver uma cópia salva em disco para a primeira carga do processo
+    não esperar a API (a planilha é revalidada em segundo plano).
+    """
     try:
         # Obter configurações dos secrets
         service_account_info = get_service_account_info()
@@ -288,38 +709,26 @@ def load_google_sheets_data_automatically():
         if not service_account_info or not spreadsheet_config:
             return None
         
-        # Verificar se já temos dados em cache
-        cache_key = f"auto_sheets_data_{spreadsheet_config['url']}_{spreadsheet_config['worksheet_name']}"
-        
-        if cache_key in st.session_state:
-            cached_data, cached_time = st.session_state[cache_key]
-            if datetime.now() - cached_time < timedelta(minutes=5):
-                return cached_data
-        
-        # Configurar credenciais
-        scopes = [
-            'https://www.googleapis.com/auth/spreadsheets.readonly',
-            'https://www.googleapis.com/auth/drive.readonly'
-        ]
-        
-        credentials = Credentials.from_service_account_info(service_account_info, scopes=scopes)
-        client = gspread.authorize(credentials)
-        
-        # Conectar à planilha
-        spreadsheet = client.open_by_url(spreadsheet_config['url'])
-        worksheet = spreadsheet.worksheet(spreadsheet_config['worksheet_name'])
+        client = get_shared_client(
+            service_account_info['client_email'], service_account_info['private_key_id'], service_account_info
+        )
+        cache = get_shared_sheets_cache()
+        cache_key = (spreadsheet_config['url'], spreadsheet_config['worksheet_name'],
+                     tuple(colunas) if colunas is not None else None)
         
-        # Obter dados
-        data = worksheet.get_all_records()
+        if snapshot is not None and cache_key not in cache.entries:
+            df_snapshot = snapshot(f"sheets:{spreadsheet_config['url']}:{spreadsheet_config['worksheet_name']}:")
+            if df_snapshot is not None:
+                cache.seed(cache_key, df_snapshot, df_snapshot.attrs.get('snapshot_em'))
         
-        if not data:
+        df, atualizado_em = cache.get(cache_key, lambda: _fetch_sheet_data(client, cache, spreadsheet_config, colunas))
+        if df is None:
             return None
-            
-        df = pd.DataFrame(data)
-        
-        # Cache dos dados
-        st.session_state[cache_key] = (df, datetime.now())
         
+        # Cada sessão recebe sua própria cópia do DataFrame compartilhado, com a data da cópia
+        df = df.copy()
+        df.attrs['atualizado_em'] = atualizado_em
+        df.attrs['atualizando'] = cache.refreshing(cache_key)
         return df
         
     except Exception as e:
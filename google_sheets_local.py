@@ -0,0 +1,115 @@
+"""
+Substituto local (em memória) da API do Google Sheets, com a mesma interface do gspread
+usada pelo dashboard. Serve para benchmarks e para exercitar a sincronização sem rede.
+"""
+from collections import Counter
+from datetime import datetime, timedelta
+
+from gspread.utils import a1_range_to_grid_range, numericise_all, to_records
+
+
+class LocalSpreadsheet:
+    def __init__(self, title='Planilha Local'):
+        self.title = title
+        self.id = 'planilha-local'
+        self.worksheets = {}
+        self._revision = datetime(2024, 1, 1)
+
+    def add_worksheet(self, title, values):
+        worksheet = LocalWorksheet(self, title, values)
+        self.worksheets[title] = worksheet
+        return worksheet
+
+    def worksheet(self, title):
+        return self.worksheets[title]
+
+    def get_lastUpdateTime(self):
+        """Equivalente ao modifiedTime do Drive: muda a cada alteração de qualquer aba"""
+        return self._revision.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+    def _touch(self):
+        self._revision += timedelta(seconds=1)
+
+
+class LocalWorksheet:
+    def __init__(self, spreadsheet, title, values):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.values = [[str(valor) for valor in linha] for linha in values]
+        # Quantidade de chamadas e de células devolvidas, para comparar estratégias de leitura
+        self.calls = Counter()
+        self.cells_read = 0
+
+    @property
+    def row_count(self):
+        return len(self.values)
+
+    @property
+    def col_count(self):
+        return max((len(linha) for linha in self.values), default=0)
+
+    def _read_range(self, range_name=None, major_dimension=None):
+        """Lê um intervalo A1 (aberto ou fechado) com o recorte de vazios da API real"""
+        if range_name is None:
+            linhas = [list(linha) for linha in self.values]
+            inicio_col, fim_col = 0, None
+        else:
+            grade = a1_range_to_grid_range(range_name)
+            inicio_linha = grade.get('startRowIndex', 0)
+            fim_linha = grade.get('endRowIndex', len(self.values))
+            inicio_col = grade.get('startColumnIndex', 0)
+            fim_col = grade.get('endColumnIndex')
+            linhas = [linha[inicio_col:fim_col] for linha in self.values[inicio_linha:fim_linha]]
+
+        if major_dimension == 'COLUMNS':
+            # Por colunas: transpõe a grade (linhas curtas completadas com vazio)
+            largura = max((len(linha) for linha in linhas), default=0)
+            if fim_col is not None:
+                largura = min(largura, fim_col - inicio_col)
+            linhas = [[linha[i] if i < len(linha) else '' for linha in linhas] for i in range(largura)]
+
+        # A API omite células vazias no fim de cada linha (ou coluna) e as vazias no fim do intervalo
+        linhas = [linha[:max((i + 1 for i, valor in enumerate(linha) if valor != ''), default=0)] for linha in linhas]
+        while linhas and not linhas[-1]:
+            linhas.pop()
+
+        self.cells_read += sum(len(linha) for linha in linhas)
+        return linhas
+
+    def get(self, range_name=None, pad_values=False, major_dimension=None, **kwargs):
+        self.calls['get'] += 1
+        linhas = self._read_range(range_name, major_dimension)
+        if pad_values and linhas:
+            largura = max(len(linha) for linha in linhas)
+            linhas = [linha + [''] * (largura - len(linha)) for linha in linhas]
+        return linhas or [[]]
+
+    def get_all_values(self, **kwargs):
+        return self.get(pad_values=True)
+
+    def get_all_records(self, **kwargs):
+        self.calls['get_all_records'] += 1
+        valores = self.get(pad_values=True)
+        if valores == [[]]:
+            return []
+        return to_records(valores[0], [numericise_all(linha, False, '') for linha in valores[1:]])
+
+    def batch_get(self, ranges, major_dimension=None, **kwargs):
+        self.calls['batch_get'] += 1
+        return [self._read_range(range_name, major_dimension) for range_name in ranges]
+
+    def append_rows(self, rows):
+        self.values.extend([str(valor) for valor in linha] for linha in rows)
+        self.spreadsheet._touch()
+
+    def update_cell(self, row, col, value):
+        linha = self.values[row - 1]
+        linha.extend([''] * (col - len(linha)))
+        linha[col - 1] = str(value)
+        self.spreadsheet._touch()
+
+
+def local_worksheet_from_frame(df, title='Página1'):
+    """Cria uma aba local a partir de um DataFrame (cabeçalho + valores como texto, como a API devolve)"""
+    valores = [list(df.columns)] + df.astype(object).where(df.notna(), '').astype(str).values.tolist()
+    return LocalSpreadsheet().add_worksheet(title, valores)
@@ -0,0 +1,262 @@
+"""
+Gráficos simples (barras e pizza) desenhados direto com o reportlab.graphics a partir dos dados
+já agregados nas figuras Plotly, sem navegador. Os PDFs usam estes desenhos quando o Chromium
+do Kaleido não abre ou não renderiza um gráfico; figuras de outros tipos (linhas, heatmap,
+subplots) devolvem None e seguem pelo caminho normal.
+"""
+import math
+import base64
+from collections import OrderedDict
+
+import numpy as np
+
+from reportlab.lib import colors
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.charts.barcharts import VerticalBarChart, HorizontalBarChart
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.charts.legends import Legend
+
+# Paleta padrão do Plotly, para as cores baterem com as da tela quando a figura não define cor
+CORES_PLOTLY = ['#636efa', '#EF553B', '#00cc96', '#ab63fa', '#FFA15A',
+                '#19d3f3', '#FF6692', '#B6E880', '#FF97FF', '#FECB52']
+MAX_CATEGORIAS = 25
+MAX_ROTULO = 22
+
+
+def valores_trace(valor):
+    """
+    Lista com os valores de um atributo da trace. Figuras reconstruídas do JSON (cache de figuras)
+    trazem arrays numéricos codificados em base64 ({'dtype', 'bdata'}), não listas.
+    """
+    if valor is None:
+        return None
+    if isinstance(valor, dict) and 'bdata' in valor:
+        array = np.frombuffer(base64.b64decode(valor['bdata']), dtype=valor.get('dtype', 'f8'))
+        return array.reshape(valor['shape']).tolist() if valor.get('shape') else array.tolist()
+    if isinstance(valor, str):
+        return valor
+    return list(valor)
+
+
+def _texto(valor, limite=None):
+    """Texto sem emojis e outros caracteres fora das fontes padrão do PDF (Helvetica/WinAnsi)"""
+    texto = ''.join(c for c in str(valor if valor is not None else '') if ord(c) < 256).strip()
+    if limite and len(texto) > limite:
+        texto = texto[:limite - 1] + '…'
+    return texto
+
+
+def _numero(valor):
+    try:
+        numero = float(valor)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if math.isnan(numero) else numero
+
+
+def _formatar(valor):
+    return f"{valor:.0f}" if float(valor).is_integer() else f"{valor:.1f}"
+
+
+def _cor(valor, padrao):
+    """Cor do Plotly ('#hex', 'rgb(...)', nome CSS) como cor do ReportLab; numéricas (escala) usam o padrão"""
+    if isinstance(valor, str):
+        try:
+            return colors.toColor(valor)
+        except ValueError:
+            pass
+    return colors.toColor(padrao)
+
+
+def _paleta(figura):
+    # Só a colorway da própria figura: a do template do Streamlit tem cores provisórias
+    # (#000001, #000002...) que o navegador troca pelas do tema
+    return list(figura.layout.colorway or CORES_PLOTLY)
+
+
+def _desenho_com_titulo(figura, largura, altura):
+    desenho = Drawing(largura, altura)
+    titulo = _texto(figura.layout.title.text)
+    if titulo:
+        desenho.add(String(largura / 2, altura - 16, titulo, fontName='Helvetica-Bold',
+                           fontSize=11, textAnchor='middle'))
+    return desenho
+
+
+def _legenda(desenho, itens, x, y):
+    legenda = Legend()
+    legenda.alignment = 'right'
+    legenda.x, legenda.y = x, y
+    legenda.fontName, legenda.fontSize = 'Helvetica', 7
+    legenda.boxAnchor = 'nw'
+    legenda.columnMaximum = 12
+    legenda.dx = legenda.dy = 7
+    legenda.deltay = 10
+    legenda.colorNamePairs = itens
+    desenho.add(legenda)
+
+
+def _series_barras(figura):
+    """
+    Categorias (na ordem de aparição) e, por trace, o total de cada categoria; None se alguma
+    trace não for de barras na mesma orientação
+    """
+    orientacao = figura.data[0].orientation or 'v'
+    categorias = OrderedDict()
+    series = []
+    for trace in figura.data:
+        if trace.type != 'bar' or (trace.orientation or 'v') != orientacao:
+            return None
+        eixo_categoria, eixo_valor = (trace.y, trace.x) if orientacao == 'h' else (trace.x, trace.y)
+        eixo_categoria, eixo_valor = valores_trace(eixo_categoria), valores_trace(eixo_valor)
+        if eixo_categoria is None or eixo_valor is None:
+            return None
+        valores = OrderedDict()
+        for categoria, valor in zip(eixo_categoria, eixo_valor):
+            chave = _texto(categoria)
+            categorias.setdefault(chave, None)
+            # Como no Plotly, a mesma categoria repetida na trace soma na mesma barra
+            valores[chave] = valores.get(chave, 0.0) + _numero(valor)
+        series.append((trace, valores))
+    return orientacao, list(categorias), series
+
+
+def desenhar_barras(figura, largura, altura):
+    dados = _series_barras(figura)
+    if dados is None:
+        return None
+    orientacao, categorias, series = dados
+    if not categorias or len(categorias) > MAX_CATEGORIAS:
+        return None
+
+    eixo_categoria = figura.layout.yaxis if orientacao == 'h' else figura.layout.xaxis
+    ordem = eixo_categoria.categoryorder or ''
+    if ordem.startswith('total'):
+        totais = {c: sum(valores.get(c, 0.0) for _, valores in series) for c in categorias}
+        categorias.sort(key=totais.get, reverse=ordem.endswith('descending'))
+
+    desenho = _desenho_com_titulo(figura, largura, altura)
+    multiplas = len(series) > 1
+    margem_direita = 140 if multiplas else 20
+    if orientacao == 'h':
+        grafico = HorizontalBarChart()
+        grafico.x, grafico.y = 120, 35
+        grafico.width = largura - grafico.x - margem_direita
+        grafico.height = altura - 75
+        grafico.categoryAxis.labels.boxAnchor = 'e'
+        grafico.categoryAxis.labels.dx = -4
+    else:
+        grafico = VerticalBarChart()
+        grafico.x, grafico.y = 45, 70
+        grafico.width = largura - grafico.x - margem_direita
+        grafico.height = altura - 110
+        grafico.categoryAxis.labels.boxAnchor = 'ne' if len(categorias) > 4 else 'n'
+        grafico.categoryAxis.labels.angle = 45 if len(categorias) > 12 else 30 if len(categorias) > 4 else 0
+
+    grafico.data = [[valores.get(c, 0.0) for c in categorias] for _, valores in series]
+    grafico.categoryAxis.categoryNames = [_texto(c, MAX_ROTULO) for c in categorias]
+    grafico.categoryAxis.labels.fontName = grafico.valueAxis.labels.fontName = 'Helvetica'
+    grafico.categoryAxis.labels.fontSize = grafico.valueAxis.labels.fontSize = 7
+    if all(v >= 0 for linha in grafico.data for v in linha):
+        grafico.valueAxis.valueMin = 0
+    grafico.valueAxis.visibleGrid = True
+    grafico.valueAxis.gridStrokeColor = colors.Color(0.9, 0.9, 0.9)
+    if multiplas and figura.layout.barmode in ('stack', 'relative'):
+        grafico.categoryAxis.style = 'stacked'
+    grafico.barSpacing = 1
+    grafico.groupSpacing = 6
+
+    paleta = _paleta(figura)
+    for i, (trace, valores) in enumerate(series):
+        padrao = paleta[i % len(paleta)]
+        cor = valores_trace(trace.marker.color)
+        grafico.bars[i].fillColor = _cor(cor, padrao)
+        grafico.bars[i].strokeColor = None
+        if cor is not None and not isinstance(cor, str):
+            # Lista com uma cor por barra, na ordem da trace (valores de escala numérica ficam na cor padrão)
+            ordem_trace = list(valores)
+            for j, categoria in enumerate(categorias):
+                if categoria in valores and ordem_trace.index(categoria) < len(cor):
+                    grafico.bars[(i, j)].fillColor = _cor(cor[ordem_trace.index(categoria)], padrao)
+
+    # Valores em cima das barras só quando cabem
+    if len(categorias) * len(series) <= 30 and grafico.categoryAxis.style != 'stacked':
+        grafico.barLabelFormat = _formatar
+        grafico.barLabels.fontName, grafico.barLabels.fontSize = 'Helvetica', 6
+        grafico.barLabels.nudge = 6
+    desenho.add(grafico)
+
+    if multiplas:
+        _legenda(desenho, [(grafico.bars[i].fillColor, _texto(trace.name, MAX_ROTULO) or f"Série {i + 1}")
+                           for i, (trace, _) in enumerate(series)],
+                 largura - margem_direita + 10, grafico.y + grafico.height)
+    return desenho
+
+
+def desenhar_pizza(figura, largura, altura):
+    trace = figura.data[0]
+    if trace.labels is None:
+        return None
+    # px.pie sem coluna de valores conta as linhas de cada rótulo; rótulos repetidos somam
+    rotulos = valores_trace(trace.labels)
+    valores = valores_trace(trace.values) or [1] * len(rotulos)
+    fatias = OrderedDict()
+    for rotulo, valor in zip(rotulos, valores):
+        chave = _texto(rotulo)
+        fatias[chave] = fatias.get(chave, 0.0) + _numero(valor)
+    fatias = OrderedDict((r, v) for r, v in fatias.items() if v > 0)
+    total = sum(fatias.values())
+    if not fatias or len(fatias) > MAX_CATEGORIAS:
+        return None
+
+    desenho = _desenho_com_titulo(figura, largura, altura)
+    pizza = Pie()
+    lado = min(altura - 70, largura - 200)
+    pizza.x, pizza.y = 40, (altura - 30 - lado) / 2
+    pizza.width = pizza.height = lado
+    pizza.data = list(fatias.values())
+    pizza.labels = [f"{valor / total * 100:.1f}%" for valor in fatias.values()]
+    pizza.simpleLabels = 1
+    pizza.slices.fontName, pizza.slices.fontSize = 'Helvetica', 7
+    pizza.slices.strokeColor = colors.white
+    pizza.slices.strokeWidth = 1
+    pizza.startAngle = 90
+    pizza.direction = 'clockwise'
+    if trace.hole:
+        pizza.innerRadiusFraction = trace.hole
+
+    # Cor de cada rótulo pelos pares originais (rótulos, cores): depois de somar rótulos repetidos
+    # e tirar fatias zeradas, a posição da fatia não corresponde mais à posição em marker.colors
+    paleta = _paleta(figura)
+    cores = valores_trace(trace.marker.colors)
+    cor_do_rotulo = {}
+    if cores is not None and not isinstance(cores, str):
+        for rotulo, cor in zip(rotulos, cores):
+            cor_do_rotulo.setdefault(_texto(rotulo), cor)
+    for i, rotulo in enumerate(fatias):
+        pizza.slices[i].fillColor = _cor(cor_do_rotulo.get(rotulo), paleta[i % len(paleta)])
+    desenho.add(pizza)
+
+    _legenda(desenho, [(pizza.slices[i].fillColor, f"{_texto(rotulo, MAX_ROTULO)}: {_formatar(valor)}")
+                       for i, (rotulo, valor) in enumerate(fatias.items())],
+             pizza.x + lado + 40, pizza.y + lado - 10)
+    return desenho
+
+
+def desenhar_figura(figura, largura, altura):
+    """
+    Drawing do ReportLab equivalente à figura (largura x altura em pontos), ou None se a figura
+    não for só de barras ou de uma pizza
+    """
+    dados = getattr(figura, 'data', None)
+    if not dados:
+        return None
+    tipos = {trace.type for trace in dados}
+    try:
+        if tipos == {'bar'}:
+            return desenhar_barras(figura, largura, altura)
+        if tipos == {'pie'} and len(dados) == 1:
+            return desenhar_pizza(figura, largura, altura)
+    except Exception as e:
+        print(f"⚠️ Gráfico sem desenho nativo: {type(e).__name__}: {e}")
+    return None
@@ -0,0 +1,98 @@
+"""
+Leitura em blocos de exportações muito grandes (CSV ou xlsx), para calcular agregações sem
+montar o DataFrame completo. Cada bloco é um DataFrame pequeno que pode ser descartado depois
+de alimentar as agregações.
+"""
+import io
+
+import pandas as pd
+
+TAMANHO_BLOCO = 50_000
+
+
+def _filtro_colunas(colunas):
+    if colunas is None:
+        return None
+    pedidas = set(colunas)
+    return lambda coluna: coluna in pedidas
+
+
+def _detectar_csv(inicio):
+    """Codificação e separador a partir do começo do arquivo (exportações do Excel em pt-BR usam ';')"""
+    try:
+        texto = inicio.decode('utf-8-sig')
+        codificacao = 'utf-8-sig'
+    except UnicodeDecodeError:
+        texto = inicio.decode('latin-1')
+        codificacao = 'latin-1'
+    primeira_linha = texto.split('\n', 1)[0]
+    separador = ';' if primeira_linha.count(';') > primeira_linha.count(',') else ','
+    return codificacao, separador
+
+
+def ler_csv_em_blocos(arquivo, colunas=None, tamanho_bloco=TAMANHO_BLOCO):
+    """Blocos de um CSV (caminho ou arquivo binário), todas as células como texto"""
+    if isinstance(arquivo, (bytes, bytearray)):
+        arquivo = io.BytesIO(arquivo)
+    if hasattr(arquivo, 'read'):
+        arquivo.seek(0)
+        codificacao, separador = _detectar_csv(arquivo.read(64 * 1024))
+        arquivo.seek(0)
+    else:
+        with open(arquivo, 'rb') as origem:
+            codificacao, separador = _detectar_csv(origem.read(64 * 1024))
+
+    # Texto em todos os blocos: a inferência de tipo por bloco daria tipos diferentes entre blocos
+    leitor = pd.read_csv(
+        arquivo, sep=separador, encoding=codificacao, dtype=str,
+        usecols=_filtro_colunas(colunas), chunksize=tamanho_bloco
+    )
+    with leitor:
+        yield from leitor
+
+
+def ler_xlsx_em_blocos(arquivo, colunas=None, tamanho_bloco=TAMANHO_BLOCO):
+    """Blocos da primeira aba de um xlsx, iterando as linhas em modo somente leitura do openpyxl"""
+    from openpyxl import load_workbook
+
+    if isinstance(arquivo, (bytes, bytearray)):
+        arquivo = io.BytesIO(arquivo)
+    elif hasattr(arquivo, 'seek'):
+        arquivo.seek(0)
+
+    workbook = load_workbook(arquivo, read_only=True, data_only=True)
+    try:
+        linhas = workbook.worksheets[0].iter_rows(values_only=True)
+        cabecalho = next(linhas, None)
+        if cabecalho is None:
+            return
+        pedidas = set(colunas) if colunas is not None else None
+        posicoes = [i for i, nome in enumerate(cabecalho) if nome is not None and (pedidas is None or nome in pedidas)]
+        nomes = [cabecalho[i] for i in posicoes]
+
+        bloco = []
+        vazias = 0
+        for linha in linhas:
+            # Como no pd.read_excel, linhas vazias só contam se vier uma linha preenchida depois delas
+            if all(valor is None for valor in linha):
+                vazias += 1
+                continue
+            bloco.extend([[None] * len(posicoes)] * vazias)
+            vazias = 0
+            bloco.append([linha[i] if i < len(linha) else None for i in posicoes])
+            if len(bloco) >= tamanho_bloco:
+                yield pd.DataFrame(bloco, columns=nomes, dtype=object)
+                bloco = []
+        if bloco:
+            yield pd.DataFrame(bloco, columns=nomes, dtype=object)
+    finally:
+        workbook.close()
+
+
+def ler_em_blocos(arquivo, nome_arquivo, colunas=None, tamanho_bloco=TAMANHO_BLOCO):
+    """Escolhe o leitor pela extensão do arquivo (.csv ou .xlsx)"""
+    if nome_arquivo.lower().endswith('.csv'):
+        return ler_csv_em_blocos(arquivo, colunas, tamanho_bloco)
+    if nome_arquivo.lower().endswith('.xlsx'):
+        return ler_xlsx_em_blocos(arquivo, colunas, tamanho_bloco)
+    raise ValueError(f"Formato não suportado no modo em blocos: {nome_arquivo}")
@@ -0,0 +1,109 @@
+"""
+Leitura de planilhas Excel compartilhada pelos dashboards (QA, bugs e sustentação).
+Lê só as colunas pedidas (usecols), aplica dicas de tipo às colunas de texto, usa o motor
+calamine quando instalado (bem mais rápido que o openpyxl) com volta automática ao motor
+padrão do pandas e guarda o resultado por hash do arquivo.
+"""
+import io
+import hashlib
+import importlib.util
+
+import pandas as pd
+import streamlit as st
+
+# Motores em ordem de preferência; None é o padrão do pandas (openpyxl no xlsx, xlrd no xls)
+MOTORES_EXCEL = (['calamine'] if importlib.util.find_spec('python_calamine') else []) + [None]
+
+CACHE_TTL_SEGUNDOS = 3600
+CACHE_MAX_ENTRADAS = 8
+
+# Dicas de tipo: colunas de texto lidas direto como texto, sem inferência célula a célula
+DTYPES_QA = {col: 'str' for col in [
+    'Nome da Task', 'Link da Task', 'Status', 'Time', 'Responsável', 'Ambiente',
+    'Responsavel pelo teste', 'Descrição',
+    'Motivo', 'Motivo2', 'Motivo3', 'Motivo4', 'Motivo5', 'Motivo6', 'Motivo7'
+]}
+DTYPES_BUGS = {col: 'str' for col in ['Status', 'Prioridade', 'Time', 'Encontrado por:']}
+DTYPES_TAREFAS = {col: 'str' for col in ['Tarefa', 'Responsável', 'Tipo de Tarefa', 'Status']}
+
+
+def hash_conteudo(conteudo):
+    return hashlib.sha256(conteudo).hexdigest()
+
+
+def ler_excel(origem, colunas=None, dtypes=None, sheet_name=0, nrows=None):
+    """
+    Lê uma aba com o motor mais rápido disponível (caminho, bytes ou arquivo enviado).
+    colunas=None lê todas; colunas ausentes na planilha são ignoradas. O motor usado fica em
+    df.attrs['motor_excel'].
+    """
+    usecols = None
+    if colunas is not None:
+        pedidas = set(colunas)
+        usecols = lambda coluna: coluna in pedidas
+
+    for posicao, motor in enumerate(MOTORES_EXCEL):
+        if isinstance(origem, (bytes, bytearray)):
+            fonte = io.BytesIO(origem)
+        else:
+            fonte = origem
+            if hasattr(fonte, 'seek'):
+                fonte.seek(0)
+        try:
+            df = pd.read_excel(fonte, sheet_name=sheet_name, usecols=usecols, dtype=dtypes, engine=motor, nrows=nrows)
+        except Exception:
+            # Motor rápido indisponível ou incompatível com o arquivo: tenta o próximo
+            if posicao == len(MOTORES_EXCEL) - 1:
+                raise
+            continue
+        df.attrs['motor_excel'] = motor or 'padrão'
+        return df
+
+
+def abrir_excel(origem):
+    """
+    Abre a pasta de trabalho uma única vez (pd.ExcelFile) com o motor mais rápido disponível,
+    para ler várias abas sem reabrir o arquivo
+    """
+    for posicao, motor in enumerate(MOTORES_EXCEL):
+        fonte = io.BytesIO(origem) if isinstance(origem, (bytes, bytearray)) else origem
+        if hasattr(fonte, 'seek'):
+            fonte.seek(0)
+        try:
+            return pd.ExcelFile(fonte, engine=motor)
+        except Exception:
+            if posicao == len(MOTORES_EXCEL) - 1:
+                raise
+
+
+def cabecalhos_abas(livro):
+    """Colunas de cada aba da pasta de trabalho, lendo só a linha de cabeçalho (nrows=0)"""
+    cabecalhos = {}
+    for aba in livro.sheet_names:
+        try:
+            cabecalhos[aba] = list(livro.parse(aba, nrows=0).columns)
+        except ValueError:
+            # Aba sem tabela (gráfico, aba vazia): fica de fora
+            continue
+    return cabecalhos
+
+
+@st.cache_data(ttl=CACHE_TTL_SEGUNDOS, max_entries=CACHE_MAX_ENTRADAS, show_spinner=False)
+def _ler_excel_em_cache(chave_conteudo, colunas, dtypes, sheet_name, _conteudo):
+    """Leitura guardada por hash do arquivo + parâmetros (os bytes não entram no hash do cache)"""
+    return ler_excel(_conteudo, colunas=colunas, dtypes=dict(dtypes) if dtypes else None, sheet_name=sheet_name)
+
+
+def ler_upload_excel(arquivo, colunas=None, dtypes=None, sheet_name=0):
+    """Lê um arquivo enviado pelo st.file_uploader uma única vez por conteúdo"""
+    conteudo = arquivo.getvalue()
+    chave = f"upload:{hash_conteudo(conteudo)}"
+    df = _ler_excel_em_cache(
+        chave,
+        tuple(colunas) if colunas is not None else None,
+        tuple(sorted(dtypes.items())) if dtypes else None,
+        sheet_name,
+        conteudo
+    )
+    df.attrs['chave_conteudo'] = chave
+    return df
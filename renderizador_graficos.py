@@ -0,0 +1,230 @@
+"""
+Renderização dos gráficos Plotly em PNG para os PDFs com um único Chromium (Kaleido) mantido
+aberto durante toda a vida do processo. Sem isso, cada fig.to_image do Kaleido 1.x abre e fecha
+um navegador novo, e um relatório com uma dúzia de gráficos leva minutos.
+
+Os lotes são renderizados em paralelo em até `processos` abas do mesmo navegador, com tempo
+limite por gráfico e a latência de cada gráfico registrada para o diagnóstico.
+"""
+import os
+import time
+import atexit
+import asyncio
+import threading
+from collections import deque
+
+try:
+    import kaleido
+    KALEIDO_PERSISTENTE = hasattr(kaleido, 'Kaleido')
+except ImportError:
+    kaleido = None
+    KALEIDO_PERSISTENTE = False
+
+# Erros do navegador (e não da figura): só eles fazem abrir um Chromium novo
+ERROS_NAVEGADOR = (TimeoutError, asyncio.TimeoutError, ConnectionError)
+try:
+    from kaleido.errors import BrowserClosedError, BrowserFailedError
+    ERROS_NAVEGADOR += (BrowserClosedError, BrowserFailedError)
+except ImportError:
+    pass
+
+RENDER_PROCESSOS = 2
+RENDER_TIMEOUT = 30
+RENDER_LARGURA = 700
+RENDER_ALTURA = 450
+RENDER_ESCALA = 1
+
+
+def _avisar(ao_concluir, resultado):
+    """Erro no callback de progresso não pode derrubar o lote"""
+    if ao_concluir is None:
+        return
+    try:
+        ao_concluir(resultado)
+    except Exception as e:
+        print(f"⚠️ Erro ao informar progresso do gráfico '{resultado['titulo']}': {e}")
+
+
+class RenderizadorGraficos:
+    """
+    Navegador do Kaleido aberto uma vez (no primeiro lote) em um event loop próprio, numa thread
+    em segundo plano. Com o Kaleido 0.2.x, que não tem a API persistente, cai para pio.to_image
+    (o 0.2.x já mantém o próprio subprocesso aberto entre chamadas).
+    """
+    def __init__(self, processos=RENDER_PROCESSOS, timeout=RENDER_TIMEOUT):
+        self.processos = max(int(processos), 1)
+        self.timeout = timeout
+        self.metricas = deque(maxlen=200)
+        self.lotes = 0
+        self.ultimo_lote = None
+        self.tempo_inicio = None
+        self.erro_inicio = None
+        self._loop = None
+        self._navegador = None
+        self._limite = None
+        self._fechar_na_saida = False
+        self._lock = threading.Lock()
+
+    @property
+    def ativo(self):
+        return self._navegador is not None
+
+    @property
+    def indisponivel(self):
+        """Já se sabe que não há como renderizar: Kaleido ausente ou navegador que não abriu"""
+        return kaleido is None or self.erro_inicio is not None
+
+    def _iniciar(self):
+        """
+        Abre o event loop e o Chromium uma única vez. Devolve (navegador, loop, limite) lidos
+        juntos sob a trava, para o lote usar essas referências mesmo que outra thread feche o
+        navegador em seguida, ou None se não for possível abrir.
+        """
+        with self._lock:
+            if self._navegador is not None:
+                return self._navegador, self._loop, self._limite
+            if self.erro_inicio is not None or not KALEIDO_PERSISTENTE:
+                return None
+
+            inicio = time.perf_counter()
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True, name='renderizador-kaleido').start()
+            try:
+                self._navegador = asyncio.run_coroutine_threadsafe(self._abrir(), loop).result(timeout=self.timeout * 2)
+            except Exception as e:
+                # Sem Chrome/Chromium no ambiente: o erro fica registrado e os próximos lotes falham na hora
+                self.erro_inicio = f"{type(e).__name__}: {e}"
+                loop.call_soon_threadsafe(loop.stop)
+                return None
+            self._loop = loop
+            self.tempo_inicio = time.perf_counter() - inicio
+            if not self._fechar_na_saida:
+                atexit.register(self.fechar)
+                self._fechar_na_saida = True
+            return self._navegador, self._loop, self._limite
+
+    async def _abrir(self):
+        opcoes = {}
+        # Caminho detectado pelo config_production (chromium-browser do packages.txt no Streamlit Cloud)
+        if os.environ.get('CHROME_EXECUTABLE'):
+            opcoes['path'] = os.environ['CHROME_EXECUTABLE']
+        self._limite = asyncio.Semaphore(self.processos)
+        return await kaleido.Kaleido(n=self.processos, timeout=self.timeout, **opcoes)
+
+    async def _renderizar(self, navegador, limite, titulo, figura, opcoes, ao_concluir, falhas_navegador):
+        async with limite:
+            inicio = time.perf_counter()
+            try:
+                png = await navegador.calc_fig(figura, opts=opcoes)
+                erro = None
+            except Exception as e:
+                png, erro = None, f"{type(e).__name__}: {e}"
+                if isinstance(e, ERROS_NAVEGADOR):
+                    falhas_navegador.append(erro)
+            resultado = {'titulo': titulo, 'png': png, 'erro': erro, 'segundos': time.perf_counter() - inicio}
+            _avisar(ao_concluir, resultado)
+            return resultado
+
+    async def _renderizar_lote(self, navegador, limite, itens, opcoes, ao_concluir, falhas_navegador):
+        return await asyncio.gather(*(
+            self._renderizar(navegador, limite, titulo, figura, opcoes, ao_concluir, falhas_navegador)
+            for titulo, figura in itens
+        ))
+
+    def _renderizar_sem_navegador(self, itens, opcoes, ao_concluir):
+        """Kaleido 0.2.x: pio.to_image um gráfico por vez"""
+        import plotly.io as pio
+
+        resultados = []
+        for titulo, figura in itens:
+            inicio = time.perf_counter()
+            try:
+                png = pio.to_image(figura, **opcoes)
+                erro = None
+            except Exception as e:
+                png, erro = None, f"{type(e).__name__}: {e}"
+            resultados.append({'titulo': titulo, 'png': png, 'erro': erro, 'segundos': time.perf_counter() - inicio})
+            _avisar(ao_concluir, resultados[-1])
+        return resultados
+
+    def renderizar_lote(self, figuras, largura=RENDER_LARGURA, altura=RENDER_ALTURA, escala=RENDER_ESCALA,
+                        ao_concluir=None, formato='png'):
+        """
+        Renderiza [(titulo, figura)] em PNG (ou no formato pedido, ex.: 'svg') e devolve um
+        resultado por figura, na mesma ordem: {'titulo', 'png' (bytes da imagem ou None), 'erro',
+        'segundos'}. ao_concluir(resultado), se informado, é chamado assim que cada gráfico
+        termina (para mostrar progresso).
+        """
+        itens = [(titulo, figura.to_dict() if hasattr(figura, 'to_dict') else figura) for titulo, figura in figuras]
+        if not itens:
+            return []
+        opcoes = {'format': formato, 'width': largura, 'height': altura, 'scale': escala}
+
+        inicio = time.perf_counter()
+        aberto = self._iniciar()
+        if aberto:
+            navegador, loop, limite = aberto
+            # Cada aba renderiza um gráfico por vez: o lote leva no máximo ~timeout por rodada de abas
+            rodadas = -(-len(itens) // self.processos)
+            falhas_navegador = []
+            futuro = None
+            try:
+                futuro = asyncio.run_coroutine_threadsafe(
+                    self._renderizar_lote(navegador, limite, itens, opcoes, ao_concluir, falhas_navegador), loop
+                )
+                resultados = futuro.result(timeout=self.timeout * rodadas + 10)
+            except Exception as e:
+                if futuro is not None:
+                    futuro.cancel()
+                erro = f"{type(e).__name__}: {e}"
+                falhas_navegador.append(erro)
+                resultados = [{'titulo': titulo, 'png': None, 'erro': erro, 'segundos': 0.0} for titulo, _ in itens]
+            if falhas_navegador:
+                # Navegador travado ou encerrado: o próximo lote abre um novo. Figuras que o
+                # Chromium não renderiza não fecham o navegador usado pelas outras sessões.
+                self.fechar(navegador)
+        elif not KALEIDO_PERSISTENTE and kaleido is not None:
+            resultados = self._renderizar_sem_navegador(itens, opcoes, ao_concluir)
+        else:
+            erro = self.erro_inicio or 'Kaleido não instalado'
+            resultados = [{'titulo': titulo, 'png': None, 'erro': erro, 'segundos': 0.0} for titulo, _ in itens]
+
+        self.lotes += 1
+        self.ultimo_lote = {'graficos': len(itens), 'segundos': time.perf_counter() - inicio}
+        self.metricas.extend(
+            {'titulo': r['titulo'], 'segundos': r['segundos'], 'ok': r['png'] is not None} for r in resultados
+        )
+        return resultados
+
+    def estatisticas(self):
+        """Resumo para o diagnóstico: navegador ativo, tempo de abertura e latência por gráfico"""
+        latencias = sorted(m['segundos'] for m in self.metricas if m['ok'])
+        return {
+            'ativo': self.ativo,
+            'persistente': KALEIDO_PERSISTENTE,
+            'processos': self.processos,
+            'tempo_inicio': self.tempo_inicio,
+            'erro_inicio': self.erro_inicio,
+            'lotes': self.lotes,
+            'graficos': len(self.metricas),
+            'falhas': sum(1 for m in self.metricas if not m['ok']),
+            'latencia_media': sum(latencias) / len(latencias) if latencias else None,
+            'latencia_max': latencias[-1] if latencias else None,
+            'ultimo_lote': self.ultimo_lote,
+            'recentes': list(self.metricas)[-12:]
+        }
+
+    def fechar(self, navegador=None):
+        """Fecha o navegador; com navegador informado, só se ele ainda for o atual (outra thread pode já ter aberto um novo)"""
+        with self._lock:
+            if navegador is not None and self._navegador is not navegador:
+                return
+            navegador, loop = self._navegador, self._loop
+            self._navegador = self._loop = None
+        if navegador is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(navegador.close(), loop).result(timeout=10)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
@@ -0,0 +1,155 @@
+"""
+Snapshots locais em Parquet dos dados de QA já processados.
+Cada carga processada com sucesso é gravada como um arquivo versionado (data/hora + chave de
+conteúdo). No boot o dashboard parte do snapshot mais recente em vez de baixar a planilha ou
+reprocessar o Excel com openpyxl, que é de longe o leitor mais lento.
+"""
+import os
+import json
+import hashlib
+from pathlib import Path
+from datetime import datetime
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_DISPONIVEL = True
+except ImportError:
+    PARQUET_DISPONIVEL = False
+
+SNAPSHOT_DIR = os.path.join('.cache', 'snapshots')
+SNAPSHOT_RETENCAO = 5
+_CHAVE_METADADOS = b'snapshot_qa'
+
+
+def _preparar_para_parquet(df):
+    """Parquet exige um tipo por coluna: colunas com números e textos misturados são gravadas como texto"""
+    df = df.copy(deep=False)
+    df.attrs = {}
+    for col in df.columns:
+        serie = df[col]
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            categorias = serie.cat.categories
+            if categorias.dtype == object and pd.api.types.infer_dtype(categorias) in ('mixed', 'mixed-integer'):
+                novas = list(dict.fromkeys(str(c) for c in categorias))
+                valores = serie.astype(object).map(str, na_action='ignore')
+                df[col] = pd.Categorical(valores, categories=novas, ordered=serie.cat.ordered)
+        elif serie.dtype == object and pd.api.types.infer_dtype(serie, skipna=True) in ('mixed', 'mixed-integer'):
+            df[col] = serie.map(str, na_action='ignore')
+    return df
+
+
+class SnapshotStore:
+    """
+    Pasta de snapshots Parquet versionados, mantendo só os `retencao` mais recentes.
+    O nome do arquivo (data/hora + hash da chave) ordena as versões; a chave de conteúdo e o
+    momento da gravação ficam nos metadados do Parquet.
+    """
+    def __init__(self, pasta=SNAPSHOT_DIR, retencao=SNAPSHOT_RETENCAO):
+        self.pasta = Path(pasta)
+        self.retencao = max(int(retencao), 1)
+        self.ultimo_erro = None
+
+    @staticmethod
+    def _hash(chave):
+        return hashlib.sha256(chave.encode()).hexdigest()[:16]
+
+    def arquivos(self):
+        """Snapshots existentes, do mais recente para o mais antigo"""
+        if not PARQUET_DISPONIVEL or not self.pasta.is_dir():
+            return []
+        return sorted(self.pasta.glob('*.parquet'), reverse=True)
+
+    @staticmethod
+    def _info(arquivo):
+        """Metadados do snapshot (chave, salvo_em, linhas, arquivo) ou None se o arquivo não for válido"""
+        try:
+            metadados = pq.read_schema(arquivo).metadata or {}
+            info = json.loads(metadados[_CHAVE_METADADOS])
+        except (OSError, KeyError, ValueError, pa.ArrowException):
+            return None
+        info['salvo_em'] = datetime.fromisoformat(info['salvo_em'])
+        info['arquivo'] = arquivo
+        return info
+
+    def listar(self):
+        """Metadados de cada snapshot válido, do mais recente para o mais antigo"""
+        return [info for info in map(self._info, self.arquivos()) if info is not None]
+
+    def salvar(self, df, chave):
+        """Grava o snapshot da chave (se ainda não existir) e aplica a retenção; devolve o caminho ou None"""
+        if not PARQUET_DISPONIVEL or not chave:
+            return None
+        existente = next(iter(self.pasta.glob(f'*_{self._hash(chave)}.parquet')), None) if self.pasta.is_dir() else None
+        if existente is not None:
+            return existente
+
+        agora = datetime.now()
+        arquivo = self.pasta / f"{agora.strftime('%Y%m%dT%H%M%S%f')}_{self._hash(chave)}.parquet"
+        temporario = arquivo.with_suffix('.tmp')
+        try:
+            tabela = pa.Table.from_pandas(_preparar_para_parquet(df))
+            info = {'chave': chave, 'salvo_em': agora.isoformat(), 'linhas': len(df)}
+            tabela = tabela.replace_schema_metadata({
+                **(tabela.schema.metadata or {}),
+                _CHAVE_METADADOS: json.dumps(info).encode()
+            })
+            self.pasta.mkdir(parents=True, exist_ok=True)
+            pq.write_table(tabela, temporario)
+            os.replace(temporario, arquivo)
+        except (OSError, ValueError, TypeError, pa.ArrowException) as e:
+            # Snapshot é só uma otimização: sem ele o dashboard continua carregando da origem
+            self.ultimo_erro = str(e)
+            temporario.unlink(missing_ok=True)
+            return None
+
+        self._aplicar_retencao()
+        return arquivo
+
+    def _aplicar_retencao(self):
+        for antigo in self.arquivos()[self.retencao:]:
+            try:
+                antigo.unlink()
+            except OSError:
+                pass
+
+    def _ler(self, info):
+        try:
+            tabela = pq.read_table(info['arquivo'])
+            df = tabela.to_pandas()
+            colunas_pandas = json.loads(tabela.schema.metadata[b'pandas'])['columns']
+        except (OSError, KeyError, ValueError, pa.ArrowException) as e:
+            self.ultimo_erro = str(e)
+            return None
+
+        # O Parquet só devolve como category as colunas de texto; as numéricas voltam a category aqui
+        for coluna in colunas_pandas:
+            nome = coluna['name']
+            if coluna['pandas_type'] == 'categorical' and nome in df.columns and \
+                    not isinstance(df[nome].dtype, pd.CategoricalDtype):
+                ordenada = bool((coluna.get('metadata') or {}).get('ordered'))
+                df[nome] = pd.Categorical(df[nome], ordered=ordenada)
+        df.attrs['chave_conteudo'] = info['chave']
+        df.attrs['snapshot_em'] = info['salvo_em']
+        return df
+
+    def carregar(self, chave):
+        """Snapshot da chave de conteúdo informada (None se não houver)"""
+        if not PARQUET_DISPONIVEL or not chave or not self.pasta.is_dir():
+            return None
+        for arquivo in sorted(self.pasta.glob(f'*_{self._hash(chave)}.parquet'), reverse=True):
+            info = self._info(arquivo)
+            if info is not None and info['chave'] == chave:
+                return self._ler(info)
+        return None
+
+    def mais_recente(self, prefixo=''):
+        """Snapshot mais recente cuja chave começa com o prefixo (ex.: 'sheets:<url>:<aba>:')"""
+        for info in self.listar():
+            if info['chave'].startswith(prefixo):
+                df = self._ler(info)
+                if df is not None:
+                    return df
+        return None
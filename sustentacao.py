@@ -5,6 +5,180 @@ import plotly.graph_objects as go
 import numpy as np
 from datetime import datetime, timedelta
 import io
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from leitura_excel import abrir_excel, cabecalhos_abas, hash_conteudo, DTYPES_TAREFAS
+
+# Colunas que identificam o tipo de cada aba
+COLUNAS_VELOCIDADE = ['Velocidade Planejada', 'Velocidade Real']
+COLUNAS_TAREFAS = ['Tarefa', 'Responsável']
+DTYPES_SUSTENTACAO = {'velocidade': None, 'tarefas': DTYPES_TAREFAS}
+
+# Processos para ler várias pastas de trabalho em paralelo
+PROCESSOS_LEITURA = max(1, min(4, os.cpu_count() or 1))
+
+def tipo_pelo_nome(nome_arquivo):
+    """Tipo sugerido pelo nome do arquivo ('Planilha sem título.xlsx', 'Planilha horas por dev.xlsx')"""
+    nome = nome_arquivo.lower()
+    if "sem título" in nome or "velocidade" in nome:
+        return 'velocidade'
+    if "horas" in nome or "dev" in nome:
+        return 'tarefas'
+    return None
+
+def classificar_aba(colunas):
+    """Identifica a aba como 'velocidade' ou 'tarefas' pelas colunas do cabeçalho (None se não reconhecida)"""
+    if all(col in colunas for col in COLUNAS_VELOCIDADE):
+        return 'velocidade'
+    if all(col in colunas for col in COLUNAS_TAREFAS):
+        return 'tarefas'
+    return None
+
+def ler_pasta_sustentacao(conteudo, nome_arquivo):
+    """
+    Abre a pasta de trabalho uma vez, lê só o cabeçalho de cada aba, classifica as abas e
+    converte apenas as reconhecidas. Abas do mesmo tipo são empilhadas.
+    Devolve ({tipo: DataFrame}, [(aba, tipo)]).
+    """
+    livro = abrir_excel(conteudo)
+    with livro:
+        cabecalhos = cabecalhos_abas(livro)
+        abas = [(aba, classificar_aba(colunas)) for aba, colunas in cabecalhos.items()]
+        abas = [(aba, tipo) for aba, tipo in abas if tipo is not None]
+        
+        # Sem aba reconhecida pelas colunas: vale o nome do arquivo para a primeira aba (comportamento anterior)
+        if not abas and cabecalhos and tipo_pelo_nome(nome_arquivo):
+            abas = [(next(iter(cabecalhos)), tipo_pelo_nome(nome_arquivo))]
+        
+        dados = {}
+        for tipo in dict.fromkeys(tipo for _, tipo in abas):
+            partes = [livro.parse(aba, dtype=DTYPES_SUSTENTACAO[tipo]) for aba, tipo_aba in abas if tipo_aba == tipo]
+            df = partes[0] if len(partes) == 1 else pd.concat(partes, ignore_index=True)
+            df.attrs['motor_excel'] = livro.engine
+            dados[tipo] = df
+    return dados, abas
+
+def ler_pasta_com_tempo(conteudo, nome_arquivo):
+    """
+    Leitura de um arquivo com tempo medido e erro capturado (roda nos processos do pool):
+    um arquivo com problema vira um resultado com 'erro' sem interromper os demais
+    """
+    inicio = time.perf_counter()
+    try:
+        dados, abas = ler_pasta_sustentacao(conteudo, nome_arquivo)
+        erro = None
+    except Exception as e:
+        dados, abas, erro = {}, [], str(e)
+    return {
+        'arquivo': nome_arquivo,
+        'dados': dados,
+        'abas': abas,
+        'erro': erro,
+        'tempo': time.perf_counter() - inicio,
+        'processo': os.getpid()
+    }
+
+@st.cache_resource(show_spinner=False)
+def obter_pool_leitura():
+    """Pool de processos compartilhado para ler várias pastas de trabalho ao mesmo tempo (openpyxl usa só CPU)"""
+    # spawn em vez de fork: o servidor do Streamlit tem várias threads e fork com threads pode travar o filho
+    return ProcessPoolExecutor(max_workers=PROCESSOS_LEITURA, mp_context=multiprocessing.get_context('spawn'))
+
+def _descartar_pool(pool):
+    """Desliga o pool quebrado e faz a próxima chamada de obter_pool_leitura criar outro"""
+    if obter_pool_leitura() is pool:
+        obter_pool_leitura.clear()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _ler_isolados(itens):
+    """
+    Lê cada arquivo [(conteudo, nome)] num processo só dele (pool de um processo, descartado no
+    fim), até PROCESSOS_LEITURA ao mesmo tempo. O arquivo que derrubar o processo (falta de
+    memória, falha nativa) vira um resultado com 'erro', sem ser lido no servidor nem levar os
+    outros junto.
+    """
+    contexto = multiprocessing.get_context('spawn')
+    resultados = []
+    for posicao in range(0, len(itens), PROCESSOS_LEITURA):
+        grupo = itens[posicao:posicao + PROCESSOS_LEITURA]
+        pools = [ProcessPoolExecutor(max_workers=1, mp_context=contexto) for _ in grupo]
+        try:
+            inicio = time.perf_counter()
+            futuros = [pool.submit(ler_pasta_com_tempo, conteudo, nome) for pool, (conteudo, nome) in zip(pools, grupo)]
+            for futuro, (_, nome) in zip(futuros, grupo):
+                try:
+                    resultados.append(futuro.result())
+                except BrokenProcessPool:
+                    resultados.append({
+                        'arquivo': nome,
+                        'dados': {},
+                        'abas': [],
+                        'erro': "o processo de leitura foi encerrado (arquivo grande demais ou corrompido?)",
+                        'tempo': time.perf_counter() - inicio,
+                        'processo': None
+                    })
+        finally:
+            for pool in pools:
+                pool.shutdown(wait=False, cancel_futures=True)
+    return resultados
+
+@st.cache_data(ttl=3600, max_entries=8, show_spinner=False)
+def _ler_pastas_sustentacao(chaves, _conteudos):
+    """
+    Lê os arquivos enviados (chaves = ((hash, nome), ...)) e devolve um resultado por arquivo.
+    Com mais de um arquivo a leitura é feita em paralelo no pool de processos. Se um processo
+    morrer (BrokenProcessPool) o pool é recriado e os arquivos que ficaram sem resultado são lidos
+    de novo, cada um num processo próprio: o que derrubou o processo vira erro só dele.
+    """
+    nomes = [nome for _, nome in chaves]
+    if len(_conteudos) == 1 or PROCESSOS_LEITURA == 1:
+        return [ler_pasta_com_tempo(conteudo, nome) for conteudo, nome in zip(_conteudos, nomes)]
+    
+    pool = obter_pool_leitura()
+    try:
+        futuros = [pool.submit(ler_pasta_com_tempo, conteudo, nome) for conteudo, nome in zip(_conteudos, nomes)]
+    except BrokenProcessPool:
+        futuros = [None] * len(_conteudos)
+    
+    resultados = [None] * len(_conteudos)
+    for posicao, futuro in enumerate(futuros):
+        try:
+            if futuro is not None:
+                resultados[posicao] = futuro.result()
+        except BrokenProcessPool:
+            pass
+    
+    sem_resultado = [posicao for posicao, resultado in enumerate(resultados) if resultado is None]
+    if sem_resultado:
+        _descartar_pool(pool)
+        isolados = _ler_isolados([(_conteudos[posicao], nomes[posicao]) for posicao in sem_resultado])
+        for posicao, resultado in zip(sem_resultado, isolados):
+            resultados[posicao] = resultado
+    return resultados
+
+def ler_pastas_enviadas(uploaded_files):
+    """Resultados de leitura dos arquivos enviados, guardados por conteúdo do conjunto de arquivos"""
+    conteudos = [arquivo.getvalue() for arquivo in uploaded_files]
+    chaves = tuple((hash_conteudo(conteudo), arquivo.name) for conteudo, arquivo in zip(conteudos, uploaded_files))
+    inicio = time.perf_counter()
+    resultados = _ler_pastas_sustentacao(chaves, conteudos)
+    return resultados, time.perf_counter() - inicio
+
+def exibir_tempos_leitura(resultados, tempo_total):
+    """Tempo de leitura de cada arquivo e o tempo total da carga"""
+    with st.expander(f"⏱️ Leitura dos arquivos: {tempo_total:.2f}s no total"):
+        st.dataframe(pd.DataFrame([{
+            'Arquivo': resultado['arquivo'],
+            'Abas lidas': ", ".join(aba for aba, _ in resultado['abas']) or '-',
+            'Tempo (s)': round(resultado['tempo'], 2),
+            'Situação': 'Erro' if resultado['erro'] else ('OK' if resultado['dados'] else 'Não reconhecida')
+        } for resultado in resultados]), use_container_width=True, hide_index=True)
+        soma = sum(resultado['tempo'] for resultado in resultados)
+        if len(resultados) > 1:
+            st.caption(f"Soma dos tempos por arquivo: {soma:.2f}s (leitura em paralelo em até {PROCESSOS_LEITURA} processos)")
 
 def carregar_dados_sustentacao():
     """
@@ -14,40 +188,30 @@ def carregar_dados_sustentacao():
         "Faça upload das planilhas de sustentação",
         type=['xlsx', 'xls'],
         accept_multiple_files=True,
-        help="Selecione as planilhas: 'Planilha sem título.xlsx' (velocidade) e 'Planilha horas por dev.xlsx' (tarefas)"
+        help="Selecione as planilhas: 'Planilha sem título.xlsx' (velocidade) e 'Planilha horas por dev.xlsx' (tarefas). "
+             "Todas as abas de cada arquivo são verificadas."
     )
     
     dados = {}
     
     if uploaded_files:
-        for uploaded_file in uploaded_files:
-            try:
-                if "sem título" in uploaded_file.name.lower() or "velocidade" in uploaded_file.name.lower():
-                    # Planilha de velocidade
-                    df = pd.read_excel(uploaded_file)
-                    dados['velocidade'] = df
-                    st.success(f"✅ Planilha de velocidade carregada: {uploaded_file.name}")
-                    
-                elif "horas" in uploaded_file.name.lower() or "dev" in uploaded_file.name.lower():
-                    # Planilha de tarefas/horas
-                    df = pd.read_excel(uploaded_file)
-                    dados['tarefas'] = df
-                    st.success(f"✅ Planilha de tarefas carregada: {uploaded_file.name}")
-                    
-                else:
-                    # Tentar identificar pela estrutura
-                    df = pd.read_excel(uploaded_file)
-                    if 'Velocidade Planejada' in df.columns and 'Velocidade Real' in df.columns:
-                        dados['velocidade'] = df
-                        st.success(f"✅ Planilha de velocidade identificada: {uploaded_file.name}")
-                    elif 'Tarefa' in df.columns and 'Responsável' in df.columns:
-                        dados['tarefas'] = df
-                        st.success(f"✅ Planilha de tarefas identificada: {uploaded_file.name}")
-                    else:
-                        st.warning(f"⚠️ Estrutura não reconhecida: {uploaded_file.name}")
-                        
-            except Exception as e:
-                st.error(f"❌ Erro ao carregar {uploaded_file.name}: {str(e)}")
+        with st.spinner("📥 Lendo as planilhas..."):
+            resultados, tempo_total = ler_pastas_enviadas(uploaded_files)
+        
+        for resultado in resultados:
+            if resultado['erro']:
+                st.error(f"❌ Erro ao carregar {resultado['arquivo']}: {resultado['erro']}")
+                continue
+            if not resultado['dados']:
+                st.warning(f"⚠️ Estrutura não reconhecida: {resultado['arquivo']}")
+                continue
+            
+            dados.update(resultado['dados'])
+            for tipo in resultado['dados']:
+                nomes_abas = ", ".join(f"'{aba}'" for aba, tipo_aba in resultado['abas'] if tipo_aba == tipo)
+                st.success(f"✅ Planilha de {tipo} carregada: {resultado['arquivo']} (aba {nomes_abas})")
+        
+        exibir_tempos_leitura(resultados, tempo_total)
     
     return dados
 
@@ -0,0 +1,108 @@
+"""
+Fila de geração de PDFs em segundo plano. O script do Streamlit só envia a tarefa e volta a
+desenhar a página; a geração (gráficos + ReportLab) roda numa thread do pool e informa o
+progresso por etapa, que a página consulta nas próximas execuções até o download ficar pronto.
+"""
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+TAREFAS_SIMULTANEAS = 2
+TAREFAS_GUARDADAS = 50
+
+NA_FILA = 'na fila'
+GERANDO = 'gerando'
+CONCLUIDA = 'concluída'
+FALHOU = 'falhou'
+
+
+class TarefaPDF:
+    """Estado de uma geração: progresso (0 a 1), etapa atual e, no fim, os bytes do PDF ou o erro"""
+    def __init__(self, nome):
+        self.id = uuid.uuid4().hex
+        self.nome = nome
+        self.estado = NA_FILA
+        self.progresso = 0.0
+        self.etapa = 'Aguardando na fila'
+        self.pdf = None
+        self.erro = None
+        self.criada_em = time.time()
+        self.inicio = None
+        self.fim = None
+        self._lock = threading.Lock()
+
+    @property
+    def terminada(self):
+        return self.estado in (CONCLUIDA, FALHOU)
+
+    @property
+    def segundos(self):
+        if self.inicio is None:
+            return 0.0
+        return (self.fim or time.time()) - self.inicio
+
+    def informar(self, progresso, etapa=None):
+        """Chamado por quem gera o PDF (de qualquer thread); o progresso nunca volta para trás"""
+        with self._lock:
+            self.progresso = min(max(progresso, self.progresso), 1.0)
+            if etapa:
+                self.etapa = etapa
+
+
+class FilaPDF:
+    """
+    Pool de threads com as tarefas guardadas por id (as mais antigas terminadas são descartadas
+    ao passar de `guardadas`). gerar(informar) roda no pool e devolve os bytes do PDF ou None.
+    """
+    def __init__(self, simultaneas=TAREFAS_SIMULTANEAS, guardadas=TAREFAS_GUARDADAS):
+        self.executor = ThreadPoolExecutor(max_workers=simultaneas, thread_name_prefix='pdf')
+        self.guardadas = guardadas
+        self.tarefas = OrderedDict()
+        self._lock = threading.Lock()
+
+    def enviar(self, nome, gerar):
+        tarefa = TarefaPDF(nome)
+        with self._lock:
+            self.tarefas[tarefa.id] = tarefa
+            self._descartar_antigas()
+        self.executor.submit(self._executar, tarefa, gerar)
+        return tarefa
+
+    def _executar(self, tarefa, gerar):
+        tarefa.estado = GERANDO
+        tarefa.inicio = time.time()
+        tarefa.informar(0.0, 'Iniciando')
+        try:
+            pdf = gerar(tarefa.informar)
+        except Exception as e:
+            pdf = None
+            tarefa.erro = f"{type(e).__name__}: {e}"
+        tarefa.fim = time.time()
+        if pdf:
+            tarefa.pdf = pdf
+            tarefa.informar(1.0, 'Concluído')
+            tarefa.estado = CONCLUIDA
+        else:
+            tarefa.erro = tarefa.erro or 'O relatório não gerou PDF'
+            tarefa.estado = FALHOU
+
+    def _descartar_antigas(self):
+        excesso = len(self.tarefas) - self.guardadas
+        for id_tarefa in [id_tarefa for id_tarefa, t in self.tarefas.items() if t.terminada][:max(excesso, 0)]:
+            del self.tarefas[id_tarefa]
+
+    def obter(self, id_tarefa):
+        with self._lock:
+            return self.tarefas.get(id_tarefa)
+
+    def estatisticas(self):
+        with self._lock:
+            tarefas = list(self.tarefas.values())
+        return {
+            'na_fila': sum(1 for t in tarefas if t.estado == NA_FILA),
+            'gerando': sum(1 for t in tarefas if t.estado == GERANDO),
+            'concluidas': sum(1 for t in tarefas if t.estado == CONCLUIDA),
+            'falhas': sum(1 for t in tarefas if t.estado == FALHOU)
+        }